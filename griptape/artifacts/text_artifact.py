@@ -20,6 +20,13 @@ class TextArtifact(BaseArtifact):
     def embedding(self) -> Optional[list[float]]:
         return None if len(self._embedding) == 0 else self._embedding
 
+    @embedding.setter
+    def embedding(self, value: Optional[list[float]]) -> None:
+        self._embedding.clear()
+
+        if value is not None:
+            self._embedding.extend(value)
+
     def __add__(self, other: BaseArtifact) -> TextArtifact:
         return TextArtifact(self.value + other.value)
 
@@ -1,6 +1,9 @@
 from __future__ import annotations
+import bisect
+import re
 from abc import ABC
 from typing import Optional
+from collections.abc import Iterable, Iterator
 from attrs import define, field, Factory
 from griptape.artifacts import TextArtifact
 from griptape.chunkers import ChunkSeparator
@@ -9,7 +12,26 @@ from griptape.tokenizers import BaseTokenizer, OpenAiTokenizer
 
 @define
 class BaseChunker(ABC):
+    """Splits text into chunks of at most `max_tokens` tokens.
+
+    Attributes:
+        separators: Separators to split on, from most to least preferred.
+        tokenizer: Tokenizer to count tokens with.
+        max_tokens: Maximum number of tokens in a chunk.
+        use_token_offsets: Encode the text once with `BaseTokenizer.token_offsets()` and fill each chunk up to
+            `max_tokens`, splitting on the most preferred separator that keeps the chunk at least `MIN_CHUNK_FRACTION`
+            of `max_tokens` long. This runs in linear time, while the default recursive algorithm re-counts tokens at
+            every level of recursion but balances chunk sizes.
+            Tokenizers that can't compute offsets locally, such as those that count tokens with an API request, use
+            the recursive algorithm instead.
+        lookahead_tokens: Tokens that `iter_chunks()` reads past the end of a chunk before yielding it, so that text
+            arriving later cannot change how the chunk is tokenized.
+    """
+
     DEFAULT_SEPARATORS = [ChunkSeparator(" ")]
+    DEFAULT_LOOKAHEAD_TOKENS = 64
+    MIN_CHUNK_FRACTION = 0.5
+    _NON_WHITESPACE_PATTERN = re.compile(r"\S")
 
     separators: list[ChunkSeparator] = field(
         default=Factory(lambda self: self.DEFAULT_SEPARATORS, takes_self=True), kw_only=True
@@ -20,6 +42,8 @@ class BaseChunker(ABC):
     max_tokens: int = field(
         default=Factory(lambda self: self.tokenizer.max_input_tokens, takes_self=True), kw_only=True
     )
+    use_token_offsets: bool = field(default=False, kw_only=True)
+    lookahead_tokens: int = field(default=DEFAULT_LOOKAHEAD_TOKENS, kw_only=True)
 
     @max_tokens.validator  # pyright: ignore
     def validate_max_tokens(self, _, max_tokens: int) -> None:
@@ -29,7 +53,138 @@ class BaseChunker(ABC):
     def chunk(self, text: TextArtifact | str) -> list[TextArtifact]:
         text = text.value if isinstance(text, TextArtifact) else text
 
-        return [TextArtifact(c) for c in self._chunk_recursively(text)]
+        offsets = self.tokenizer.token_offsets(text) if self.use_token_offsets else None
+
+        if offsets is not None:
+            chunks = self._chunk_by_token_offsets(text, offsets)[0]
+        else:
+            chunks = self._chunk_recursively(text)
+
+        return [TextArtifact(c) for c in chunks]
+
+    def iter_chunks(self, texts: Iterable[str]) -> Iterator[TextArtifact]:
+        """Chunks text that arrives in pieces, yielding each chunk as soon as its boundary is final.
+
+        Chunks are split like they are with `use_token_offsets`. Only the text that has not been chunked yet is
+        buffered, which is roughly one chunk plus `lookahead_tokens` tokens and the latest piece. Tokenizers that
+        can't compute offsets locally buffer the whole text and chunk it recursively.
+
+        Args:
+            texts: Consecutive pieces of the text, such as the lines of a file or the pages of a document.
+
+        Returns:
+            An iterator of chunks.
+        """
+        texts = iter(texts)
+        offsets: Optional[list[int]] = []
+        pieces = []
+        pending_length = 0
+        buffered_length = 0
+
+        for text in texts:
+            pieces.append(text)
+            pending_length += len(text)
+
+            # Re-tokenizing the buffer only once new text at least matches what is left over keeps this linear.
+            if pending_length > buffered_length:
+                buffer = "".join(pieces)
+                offsets = self.tokenizer.token_offsets(buffer)
+
+                if offsets is None:
+                    pieces.extend(texts)
+
+                    break
+
+                chunks, end = self._chunk_by_token_offsets(buffer, offsets, final=False)
+
+                yield from (TextArtifact(c) for c in chunks)
+
+                pieces = [buffer[end:]]
+                buffered_length = len(pieces[0])
+                pending_length = 0
+
+        text = "".join(pieces)
+
+        if offsets is not None:
+            offsets = self.tokenizer.token_offsets(text)
+
+        if offsets is not None:
+            chunks = self._chunk_by_token_offsets(text, offsets)[0]
+        else:
+            chunks = self._chunk_recursively(text)
+
+        yield from (TextArtifact(c) for c in chunks)
+
+    def _chunk_by_token_offsets(self, text: str, offsets: list[int], final: bool = True) -> tuple[list[str], int]:
+        """Chunks `text` by filling each chunk up to `max_tokens` tokens.
+
+        Args:
+            text: The text to chunk.
+            offsets: The token offsets of `text`, from `BaseTokenizer.token_offsets()`.
+            final: Whether `text` is complete. If not, chunking stops once fewer than `max_tokens` plus
+                `lookahead_tokens` tokens are left, since more text could still change where the next chunk ends.
+
+        Returns:
+            The chunks and the position in `text` up to which it was chunked.
+        """
+        max_tokens = max(self.max_tokens, 1)
+        chunks = []
+        start = 0
+
+        while (match := self._NON_WHITESPACE_PATTERN.search(text, start)) is not None:
+            # The token that contains the first character of the chunk.
+            first_token = max(bisect.bisect_right(offsets, match.start()) - 1, 0)
+
+            if not final and len(offsets) - first_token <= max_tokens + self.lookahead_tokens:
+                break
+
+            start = match.start()
+
+            if len(offsets) - first_token <= max_tokens:
+                end = len(text)
+            else:
+                end = self._find_split(text, start, offsets[first_token + max_tokens])
+
+            chunk = text[start:end].strip()
+
+            if chunk:
+                chunks.append(chunk)
+
+            start = end
+        else:
+            start = len(text)
+
+        return chunks, start
+
+    def _find_split(self, text: str, start: int, limit: int) -> int:
+        """Finds where to end a chunk that starts at `start` and must end at or before `limit`.
+
+        Returns:
+            The position after the last occurrence of the most preferred separator that leaves the chunk at least
+            `MIN_CHUNK_FRACTION` of the way from `start` to `limit`. If no separator occurs that late, the last occurrence
+            of the most preferred separator after `start`, or `limit` if none of the separators occur.
+        """
+        minimum = start + int((limit - start) * self.MIN_CHUNK_FRACTION)
+
+        for lowest in (minimum, start):
+            for separator in self.separators:
+                if separator.is_prefix:
+                    # Prefix separators start the next chunk.
+                    position = text.rfind(separator.value, max(lowest, start + 1), limit)
+
+                    if position != -1:
+                        # Keep runs of the separator together, such as the "###" that "##" matches the end of.
+                        while position > start + 1 and text.startswith(separator.value, position - 1):
+                            position -= 1
+
+                        return position
+                else:
+                    position = text.rfind(separator.value, lowest, limit)
+
+                    if position > start:
+                        return position + len(separator.value)
+
+        return max(limit, start + 1)
 
     def _chunk_recursively(self, chunk: str, current_separator: Optional[ChunkSeparator] = None) -> list[str]:
         token_count = self.tokenizer.count_tokens(chunk)
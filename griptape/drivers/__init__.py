@@ -28,8 +28,15 @@ from .embedding.google_embedding_driver import GoogleEmbeddingDriver
 from .embedding.dummy_embedding_driver import DummyEmbeddingDriver
 from .embedding.cohere_embedding_driver import CohereEmbeddingDriver
 
+from .embedding_cache.base_embedding_cache_driver import BaseEmbeddingCacheDriver
+from .embedding_cache.local_embedding_cache_driver import LocalEmbeddingCacheDriver
+from .embedding_cache.sqlite_embedding_cache_driver import SqliteEmbeddingCacheDriver
+
+from .embedding.caching_embedding_driver import CachingEmbeddingDriver
+
 from .vector.base_vector_store_driver import BaseVectorStoreDriver
 from .vector.local_vector_store_driver import LocalVectorStoreDriver
+from .vector.sharded_local_vector_store_driver import ShardedLocalVectorStoreDriver
 from .vector.pinecone_vector_store_driver import PineconeVectorStoreDriver
 from .vector.marqo_vector_store_driver import MarqoVectorStoreDriver
 from .vector.mongodb_atlas_vector_store_driver import MongoDbAtlasVectorStoreDriver
@@ -134,8 +141,13 @@ __all__ = [
     "GoogleEmbeddingDriver",
     "DummyEmbeddingDriver",
     "CohereEmbeddingDriver",
+    "CachingEmbeddingDriver",
+    "BaseEmbeddingCacheDriver",
+    "LocalEmbeddingCacheDriver",
+    "SqliteEmbeddingCacheDriver",
     "BaseVectorStoreDriver",
     "LocalVectorStoreDriver",
+    "ShardedLocalVectorStoreDriver",
     "PineconeVectorStoreDriver",
     "MarqoVectorStoreDriver",
     "MongoDbAtlasVectorStoreDriver",
@@ -1,8 +1,9 @@
 from __future__ import annotations
 import numpy as np
-from typing import Optional
+from concurrent import futures
+from typing import Any, Callable, Optional
 from abc import ABC, abstractmethod
-from attrs import define, field
+from attrs import define, field, Factory
 from griptape.artifacts import TextArtifact
 from griptape.mixins import ExponentialBackoffMixin
 from griptape.tokenizers import BaseTokenizer
@@ -16,18 +17,91 @@ class BaseEmbeddingDriver(SerializableMixin, ExponentialBackoffMixin, ABC):
     Attributes:
         model: The name of the model to use.
         tokenizer: An instance of `BaseTokenizer` to use when calculating tokens.
+        max_batch_size: Maximum number of strings to embed per batch.
+        max_batch_tokens: Maximum number of tokens to embed per batch. Only enforced when `tokenizer` is set.
+        futures_executor_fn: Creates the executor used by the default `try_embed_chunks` implementation.
     """
 
+    DEFAULT_MAX_BATCH_SIZE = 100
+
     model: str = field(kw_only=True, metadata={"serializable": True})
     tokenizer: Optional[BaseTokenizer] = field(default=None, kw_only=True)
+    max_batch_size: int = field(default=DEFAULT_MAX_BATCH_SIZE, kw_only=True)
+    max_batch_tokens: Optional[int] = field(default=None, kw_only=True)
+    futures_executor_fn: Callable[[], futures.Executor] = field(
+        default=Factory(lambda: lambda: futures.ThreadPoolExecutor()), kw_only=True
+    )
     chunker: Optional[BaseChunker] = field(init=False)
 
     def __attrs_post_init__(self) -> None:
         self.chunker = TextChunker(tokenizer=self.tokenizer) if self.tokenizer else None
 
+    @property
+    def embedding_params(self) -> dict[str, Any]:
+        """Driver-specific parameters other than `model` that change the embedding of a string.
+
+        Drivers whose embeddings depend on settings such as an input type should override this property, so that
+        embeddings generated with different settings are cached separately.
+        """
+        return {}
+
     def embed_text_artifact(self, artifact: TextArtifact) -> list[float]:
         return self.embed_string(artifact.to_text())
 
+    def embed_text_artifacts(self, artifacts: list[TextArtifact]) -> list[list[float]]:
+        """Embeds Text Artifacts in batches.
+
+        Only artifacts without an embedding are embedded. Generated embeddings are stored on their artifacts.
+
+        Returns:
+            Embeddings of all `artifacts`, in the same order.
+        """
+        pending = [artifact for artifact in artifacts if artifact.embedding is None]
+
+        for artifact, embedding in zip(pending, self.embed_strings([str(a.value) for a in pending])):
+            artifact.embedding = embedding
+
+        return [artifact.embedding or [] for artifact in artifacts]
+
+    def embed_strings(self, strings: list[str]) -> list[list[float]]:
+        """Embeds strings in batches of up to `max_batch_size` strings and `max_batch_tokens` tokens.
+
+        Strings that exceed the tokenizer's `max_input_tokens` are embedded individually with `embed_string`.
+
+        Returns:
+            Embeddings of `strings`, in the same order.
+        """
+        embeddings: list[list[float]] = [[] for _ in strings]
+        batches = []
+        batch = []
+        batch_tokens = 0
+
+        for i, string in enumerate(strings):
+            tokens = self.tokenizer.count_tokens(string) if self.tokenizer else 0
+
+            if self.tokenizer and tokens > self.tokenizer.max_input_tokens:
+                embeddings[i] = self.embed_string(string)
+            else:
+                if batch and (
+                    len(batch) >= self.max_batch_size
+                    or (self.max_batch_tokens is not None and batch_tokens + tokens > self.max_batch_tokens)
+                ):
+                    batches.append(batch)
+                    batch = []
+                    batch_tokens = 0
+
+                batch.append(i)
+                batch_tokens += tokens
+
+        if batch:
+            batches.append(batch)
+
+        for batch in batches:
+            for i, embedding in zip(batch, self._embed_batch([strings[i] for i in batch])):
+                embeddings[i] = embedding
+
+        return embeddings
+
     def embed_string(self, string: str) -> list[float]:
         for attempt in self.retrying():
             with attempt:
@@ -42,6 +116,23 @@ class BaseEmbeddingDriver(SerializableMixin, ExponentialBackoffMixin, ABC):
     @abstractmethod
     def try_embed_chunk(self, chunk: str) -> list[float]: ...
 
+    def try_embed_chunks(self, chunks: list[str]) -> list[list[float]]:
+        """Embeds a batch of chunks that each fit within the tokenizer's `max_input_tokens`.
+
+        Drivers whose API accepts multiple inputs per request should override this method to embed the batch in a
+        single request. This implementation calls `try_embed_chunk` for each chunk concurrently.
+        """
+        with self.futures_executor_fn() as executor:
+            return list(executor.map(self.try_embed_chunk, chunks))
+
+    def _embed_batch(self, chunks: list[str]) -> list[list[float]]:
+        for attempt in self.retrying():
+            with attempt:
+                return self.try_embed_chunks(chunks)
+
+        else:
+            raise RuntimeError("Failed to embed strings.")
+
     def _embed_long_string(self, string: str) -> list[float]:
         """Embeds a string that is too long to embed in one go.
 
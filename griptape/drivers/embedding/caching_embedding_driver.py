@@ -0,0 +1,82 @@
+from __future__ import annotations
+import json
+import threading
+from typing import Any, Optional
+from attrs import define, field, Factory
+from griptape import utils
+from griptape.drivers import BaseEmbeddingDriver, BaseEmbeddingCacheDriver, LocalEmbeddingCacheDriver
+from griptape.tokenizers import BaseTokenizer
+
+
+@define
+class CachingEmbeddingDriver(BaseEmbeddingDriver):
+    """Wraps an Embedding Driver and caches the embeddings it generates.
+
+    Embeddings are keyed by a sha256 hash of the model name, the `embedding_params` of `embedding_driver` and the
+    embedded string, so unchanged content is only embedded once per model and set of parameters, such as an input type.
+
+    Attributes:
+        embedding_driver: Embedding Driver that embeds strings missing from the cache.
+        cache_driver: Embedding Cache Driver that stores embeddings. Defaults to `LocalEmbeddingCacheDriver`.
+        model: Model name used in cache keys. Defaults to the model of `embedding_driver`.
+        tokenizer: Defaults to the tokenizer of `embedding_driver`.
+        hits: Number of strings whose embedding was loaded from the cache.
+        misses: Number of strings that were embedded by `embedding_driver`.
+    """
+
+    embedding_driver: BaseEmbeddingDriver = field(kw_only=True, metadata={"serializable": True})
+    cache_driver: BaseEmbeddingCacheDriver = field(default=Factory(lambda: LocalEmbeddingCacheDriver()), kw_only=True)
+    model: str = field(
+        default=Factory(lambda self: self.embedding_driver.model, takes_self=True),
+        kw_only=True,
+        metadata={"serializable": True},
+    )
+    tokenizer: Optional[BaseTokenizer] = field(
+        default=Factory(lambda self: self.embedding_driver.tokenizer, takes_self=True), kw_only=True
+    )
+    hits: int = field(default=0, init=False)
+    misses: int = field(default=0, init=False)
+    thread_lock: threading.Lock = field(default=Factory(lambda: threading.Lock()), kw_only=True)
+
+    def embed_string(self, string: str) -> list[float]:
+        return self.embed_strings([string])[0]
+
+    def embed_strings(self, strings: list[str]) -> list[list[float]]:
+        """Loads cached embeddings of `strings` and embeds the rest with `embedding_driver` in batches.
+
+        Returns:
+            Embeddings of `strings`, in the same order.
+        """
+        keys = [self.cache_key(string) for string in strings]
+        embeddings = self.cache_driver.load_embeddings(list(dict.fromkeys(keys)))
+        missing = {key: string for key, string in zip(keys, strings) if key not in embeddings}
+
+        if missing:
+            generated = dict(zip(missing.keys(), self.embedding_driver.embed_strings(list(missing.values()))))
+
+            self.cache_driver.store_embeddings(generated)
+            embeddings.update(generated)
+
+        with self.thread_lock:
+            self.hits += len(strings) - len(missing)
+            self.misses += len(missing)
+
+        return [embeddings[key] for key in keys]
+
+    def try_embed_chunk(self, chunk: str) -> list[float]:
+        return self.embedding_driver.try_embed_chunk(chunk)
+
+    def try_embed_chunks(self, chunks: list[str]) -> list[list[float]]:
+        return self.embedding_driver.try_embed_chunks(chunks)
+
+    @property
+    def embedding_params(self) -> dict[str, Any]:
+        return self.embedding_driver.embedding_params
+
+    def cache_key(self, string: str) -> str:
+        params = self.embedding_params
+
+        if params:
+            return utils.str_to_hash(f"{self.model}\n{json.dumps(params, sort_keys=True)}\n{string}")
+        else:
+            return utils.str_to_hash(f"{self.model}\n{string}")
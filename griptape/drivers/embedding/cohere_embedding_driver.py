@@ -1,5 +1,5 @@
 from __future__ import annotations
-from typing import TYPE_CHECKING
+from typing import Any, TYPE_CHECKING
 from attrs import define, field, Factory
 from griptape.drivers import BaseEmbeddingDriver
 from griptape.tokenizers import CohereTokenizer
@@ -18,9 +18,11 @@ class CohereEmbeddingDriver(BaseEmbeddingDriver):
         client: Custom `cohere.Client`.
         tokenizer: Custom `CohereTokenizer`.
         input_type: Cohere embedding input type.
+        max_batch_size: Maximum number of texts per request. Defaults to Cohere's limit of 96.
     """
 
     DEFAULT_MODEL = "models/embedding-001"
+    DEFAULT_MAX_BATCH_SIZE = 96
 
     api_key: str = field(kw_only=True, metadata={"serializable": False})
     client: Client = field(
@@ -33,11 +35,19 @@ class CohereEmbeddingDriver(BaseEmbeddingDriver):
     )
 
     input_type: str = field(kw_only=True, metadata={"serializable": True})
+    max_batch_size: int = field(default=DEFAULT_MAX_BATCH_SIZE, kw_only=True)
+
+    @property
+    def embedding_params(self) -> dict[str, Any]:
+        return {"input_type": self.input_type}
 
     def try_embed_chunk(self, chunk: str) -> list[float]:
-        result = self.client.embed(texts=[chunk], model=self.model, input_type=self.input_type)
+        return self.try_embed_chunks([chunk])[0]
+
+    def try_embed_chunks(self, chunks: list[str]) -> list[list[float]]:
+        result = self.client.embed(texts=chunks, model=self.model, input_type=self.input_type)
 
         if isinstance(result.embeddings, list):
-            return result.embeddings[0]
+            return result.embeddings
         else:
             raise ValueError("Non-float embeddings are not supported.")
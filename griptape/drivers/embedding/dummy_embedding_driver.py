@@ -9,3 +9,6 @@ class DummyEmbeddingDriver(BaseEmbeddingDriver):
 
     def try_embed_chunk(self, chunk: str) -> list[float]:
         raise DummyException(__class__.__name__, "try_embed_chunk")
+
+    def try_embed_chunks(self, chunks: list[str]) -> list[list[float]]:
+        raise DummyException(__class__.__name__, "try_embed_chunks")
@@ -1,5 +1,5 @@
 from __future__ import annotations
-from typing import Optional
+from typing import Any, Optional
 from attrs import define, field
 from griptape.drivers import BaseEmbeddingDriver
 from griptape.utils import import_optional_dependency
@@ -22,6 +22,10 @@ class GoogleEmbeddingDriver(BaseEmbeddingDriver):
     task_type: str = field(default="retrieval_document", kw_only=True, metadata={"serializable": True})
     title: Optional[str] = field(default=None, kw_only=True, metadata={"serializable": True})
 
+    @property
+    def embedding_params(self) -> dict[str, Any]:
+        return {"task_type": self.task_type, "title": self.title}
+
     def try_embed_chunk(self, chunk: str) -> list[float]:
         genai = import_optional_dependency("google.generativeai")
         genai.configure(api_key=self.api_key)
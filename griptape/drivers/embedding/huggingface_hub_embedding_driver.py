@@ -15,8 +15,12 @@ class HuggingFaceHubEmbeddingDriver(BaseEmbeddingDriver):
         api_token: Hugging Face Hub API token.
         model: Hugging Face Hub model name.
         client: Custom `InferenceApi`.
+        max_batch_size: Maximum number of inputs per request. Defaults to 32, the default client batch size of Hugging
+            Face Text Embeddings Inference.
     """
 
+    DEFAULT_MAX_BATCH_SIZE = 32
+
     api_token: str = field(kw_only=True, metadata={"serializable": True})
     client: InferenceClient = field(
         default=Factory(
@@ -28,7 +32,14 @@ class HuggingFaceHubEmbeddingDriver(BaseEmbeddingDriver):
         kw_only=True,
     )
 
+    max_batch_size: int = field(default=DEFAULT_MAX_BATCH_SIZE, kw_only=True)
+
     def try_embed_chunk(self, chunk: str) -> list[float]:
         response = self.client.feature_extraction(chunk)
 
         return response.flatten().tolist()
+
+    def try_embed_chunks(self, chunks: list[str]) -> list[list[float]]:
+        response = self.client.feature_extraction(chunks)
+
+        return response.reshape(len(chunks), -1).tolist()
@@ -21,9 +21,13 @@ class OpenAiEmbeddingDriver(BaseEmbeddingDriver):
         azure_ad_token: An optional Azure Active Directory token.
         azure_ad_token_provider: An optional Azure Active Directory token provider.
         api_version: An Azure OpenAi API version.
+        max_batch_size: Maximum number of inputs per request. Defaults to OpenAI's limit of 2048.
+        max_batch_tokens: Maximum number of tokens per request. Defaults to OpenAI's limit of 300,000.
     """
 
     DEFAULT_MODEL = "text-embedding-3-small"
+    DEFAULT_MAX_BATCH_SIZE = 2048
+    DEFAULT_MAX_BATCH_TOKENS = 300_000
 
     model: str = field(default=DEFAULT_MODEL, kw_only=True, metadata={"serializable": True})
     base_url: Optional[str] = field(default=None, kw_only=True, metadata={"serializable": True})
@@ -38,6 +42,8 @@ class OpenAiEmbeddingDriver(BaseEmbeddingDriver):
     tokenizer: OpenAiTokenizer = field(
         default=Factory(lambda self: OpenAiTokenizer(model=self.model), takes_self=True), kw_only=True
     )
+    max_batch_size: int = field(default=DEFAULT_MAX_BATCH_SIZE, kw_only=True)
+    max_batch_tokens: Optional[int] = field(default=DEFAULT_MAX_BATCH_TOKENS, kw_only=True)
 
     def try_embed_chunk(self, chunk: str) -> list[float]:
         # Address a performance issue in older ada models
@@ -46,5 +52,11 @@ class OpenAiEmbeddingDriver(BaseEmbeddingDriver):
             chunk = chunk.replace("\n", " ")
         return self.client.embeddings.create(**self._params(chunk)).data[0].embedding
 
-    def _params(self, chunk: str) -> dict:
+    def try_embed_chunks(self, chunks: list[str]) -> list[list[float]]:
+        if self.model.endswith("001"):
+            chunks = [chunk.replace("\n", " ") for chunk in chunks]
+
+        return [data.embedding for data in self.client.embeddings.create(**self._params(chunks)).data]
+
+    def _params(self, chunk: str | list[str]) -> dict:
         return {"input": chunk, "model": self.model}
@@ -15,9 +15,14 @@ class VoyageAiEmbeddingDriver(BaseEmbeddingDriver):
         tokenizer: Optionally provide custom `VoyageAiTokenizer`.
         client: Optionally provide custom VoyageAI `Client`.
         input_type: VoyageAI input type. Defaults to `document`.
+        max_batch_size: Maximum number of texts per request. Defaults to VoyageAI's limit of 128.
+        max_batch_tokens: Maximum number of tokens per request. Defaults to VoyageAI's limit of 120,000 for
+            `voyage-large-2`.
     """
 
     DEFAULT_MODEL = "voyage-large-2"
+    DEFAULT_MAX_BATCH_SIZE = 128
+    DEFAULT_MAX_BATCH_TOKENS = 120_000
 
     model: str = field(default=DEFAULT_MODEL, kw_only=True, metadata={"serializable": True})
     api_key: Optional[str] = field(default=None, kw_only=True, metadata={"serializable": False})
@@ -31,6 +36,15 @@ class VoyageAiEmbeddingDriver(BaseEmbeddingDriver):
         kw_only=True,
     )
     input_type: str = field(default="document", kw_only=True, metadata={"serializable": True})
+    max_batch_size: int = field(default=DEFAULT_MAX_BATCH_SIZE, kw_only=True)
+    max_batch_tokens: Optional[int] = field(default=DEFAULT_MAX_BATCH_TOKENS, kw_only=True)
+
+    @property
+    def embedding_params(self) -> dict[str, Any]:
+        return {"input_type": self.input_type}
 
     def try_embed_chunk(self, chunk: str) -> list[float]:
-        return self.client.embed([chunk], model=self.model, input_type=self.input_type).embeddings[0]
+        return self.try_embed_chunks([chunk])[0]
+
+    def try_embed_chunks(self, chunks: list[str]) -> list[list[float]]:
+        return self.client.embed(chunks, model=self.model, input_type=self.input_type).embeddings
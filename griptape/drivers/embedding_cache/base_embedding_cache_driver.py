@@ -0,0 +1,30 @@
+from __future__ import annotations
+from abc import ABC, abstractmethod
+from typing import Optional
+from attrs import define
+
+
+@define(kw_only=True)
+class BaseEmbeddingCacheDriver(ABC):
+    """Stores embeddings keyed by a hash of the content they were generated from."""
+
+    def load_embedding(self, key: str) -> Optional[list[float]]:
+        return self.load_embeddings([key]).get(key)
+
+    def store_embedding(self, key: str, embedding: list[float]) -> None:
+        self.store_embeddings({key: embedding})
+
+    @abstractmethod
+    def load_embeddings(self, keys: list[str]) -> dict[str, list[float]]:
+        """Loads cached embeddings.
+
+        Returns:
+            Embeddings keyed by cache key. Keys without a cached embedding are omitted.
+        """
+        ...
+
+    @abstractmethod
+    def store_embeddings(self, embeddings: dict[str, list[float]]) -> None: ...
+
+    @abstractmethod
+    def clear(self) -> None: ...
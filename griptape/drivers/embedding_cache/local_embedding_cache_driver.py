@@ -0,0 +1,64 @@
+from __future__ import annotations
+import threading
+from collections import OrderedDict
+from typing import Optional
+import numpy as np
+from attrs import define, field, Factory
+from griptape.drivers import BaseEmbeddingCacheDriver
+
+
+@define(kw_only=True)
+class LocalEmbeddingCacheDriver(BaseEmbeddingCacheDriver):
+    """Caches embeddings in memory as float32 arrays, evicting the least recently used ones when full.
+
+    Attributes:
+        max_bytes: Maximum combined size of the cached embeddings. Set to `None` to never evict embeddings.
+        size_bytes: Combined size of the cached embeddings.
+    """
+
+    DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+
+    max_bytes: Optional[int] = field(default=DEFAULT_MAX_BYTES)
+    size_bytes: int = field(default=0, init=False)
+    thread_lock: threading.Lock = field(default=Factory(lambda: threading.Lock()))
+    _embeddings: OrderedDict[str, np.ndarray] = field(factory=OrderedDict, init=False, eq=False)
+
+    def __len__(self) -> int:
+        return len(self._embeddings)
+
+    def load_embeddings(self, keys: list[str]) -> dict[str, list[float]]:
+        embeddings = {}
+
+        with self.thread_lock:
+            for key in keys:
+                embedding = self._embeddings.get(key)
+
+                if embedding is not None:
+                    self._embeddings.move_to_end(key)
+
+                    embeddings[key] = embedding.tolist()
+
+        return embeddings
+
+    def store_embeddings(self, embeddings: dict[str, list[float]]) -> None:
+        with self.thread_lock:
+            for key, embedding in embeddings.items():
+                array = np.asarray(embedding, dtype=np.float32)
+                previous = self._embeddings.pop(key, None)
+
+                if previous is not None:
+                    self.size_bytes -= previous.nbytes
+
+                self._embeddings[key] = array
+                self.size_bytes += array.nbytes
+
+            while self.max_bytes is not None and self.size_bytes > self.max_bytes and self._embeddings:
+                _, evicted = self._embeddings.popitem(last=False)
+
+                self.size_bytes -= evicted.nbytes
+
+    def clear(self) -> None:
+        with self.thread_lock:
+            self._embeddings.clear()
+
+            self.size_bytes = 0
@@ -0,0 +1,73 @@
+from __future__ import annotations
+import sqlite3
+import threading
+from typing import Optional
+import numpy as np
+from attrs import define, field, Factory
+from griptape.drivers import BaseEmbeddingCacheDriver
+
+
+@define(kw_only=True)
+class SqliteEmbeddingCacheDriver(BaseEmbeddingCacheDriver):
+    """Caches embeddings in a SQLite database as float32 blobs so that they survive restarts.
+
+    Attributes:
+        database_file: Path of the SQLite database file. Created if it does not exist.
+        table_name: Name of the table that holds the embeddings.
+    """
+
+    # Stay below SQLite's default limit on the number of variables per statement.
+    MAX_QUERY_VARIABLES = 500
+
+    database_file: str = field(default="griptape_embeddings.db")
+    table_name: str = field(default="embeddings")
+    thread_lock: threading.Lock = field(default=Factory(lambda: threading.Lock()))
+    _connection: Optional[sqlite3.Connection] = field(default=None, init=False)
+
+    @property
+    def connection(self) -> sqlite3.Connection:
+        if self._connection is None:
+            self._connection = sqlite3.connect(self.database_file, check_same_thread=False)
+
+            self._connection.execute("PRAGMA journal_mode=WAL")
+            self._connection.execute(
+                f"CREATE TABLE IF NOT EXISTS {self.table_name} (key TEXT PRIMARY KEY, embedding BLOB NOT NULL)"
+            )
+            self._connection.commit()
+
+        return self._connection
+
+    def load_embeddings(self, keys: list[str]) -> dict[str, list[float]]:
+        embeddings = {}
+
+        with self.thread_lock:
+            for i in range(0, len(keys), self.MAX_QUERY_VARIABLES):
+                batch = keys[i : i + self.MAX_QUERY_VARIABLES]
+                rows = self.connection.execute(
+                    f"SELECT key, embedding FROM {self.table_name} WHERE key IN ({', '.join('?' * len(batch))})", batch
+                )
+
+                for key, embedding in rows:
+                    embeddings[key] = np.frombuffer(embedding, dtype=np.float32).tolist()
+
+        return embeddings
+
+    def store_embeddings(self, embeddings: dict[str, list[float]]) -> None:
+        with self.thread_lock:
+            self.connection.executemany(
+                f"INSERT OR REPLACE INTO {self.table_name} (key, embedding) VALUES (?, ?)",
+                [(key, np.asarray(embedding, dtype=np.float32).tobytes()) for key, embedding in embeddings.items()],
+            )
+            self.connection.commit()
+
+    def clear(self) -> None:
+        with self.thread_lock:
+            self.connection.execute(f"DELETE FROM {self.table_name}")
+            self.connection.commit()
+
+    def close(self) -> None:
+        with self.thread_lock:
+            if self._connection is not None:
+                self._connection.close()
+
+                self._connection = None
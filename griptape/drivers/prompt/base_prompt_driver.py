@@ -1,6 +1,6 @@
 from __future__ import annotations
 from abc import ABC, abstractmethod
-from typing import TYPE_CHECKING, Optional
+from typing import TYPE_CHECKING, Optional, cast
 from collections.abc import Iterator
 from attrs import define, field, Factory
 from griptape.events import StartPromptEvent, FinishPromptEvent, CompletionChunkEvent
@@ -36,6 +36,7 @@ class BasePromptDriver(SerializableMixin, ExponentialBackoffMixin, ABC):
     model: str = field(metadata={"serializable": True})
     tokenizer: BaseTokenizer
     stream: bool = field(default=False, metadata={"serializable": True})
+    _token_overheads: dict[Optional[str], Optional[int]] = field(factory=dict, init=False, eq=False)
 
     def before_run(self, prompt_stack: PromptStack) -> None:
         if self.structure:
@@ -78,6 +79,30 @@ class BasePromptDriver(SerializableMixin, ExponentialBackoffMixin, ABC):
         else:
             raise Exception("prompt driver failed after all retry attempts")
 
+    def count_prompt_stack_tokens(self, prompt_stack: PromptStack) -> int:
+        """Estimates the number of tokens in `prompt_stack` as rendered by `prompt_stack_to_string()`.
+
+        Input token counts are cached on the inputs, and the tokens that `prompt_stack_to_string()` adds around each
+        input and at the end of the prompt are measured once per role, so the whole Prompt Stack is never re-encoded.
+        If the overhead can't be measured, for instance because a chat template rejects the Prompt Stacks used to
+        measure it, the whole Prompt Stack is rendered and counted instead.
+
+        Args:
+            prompt_stack: The Prompt Stack to count tokens for.
+
+        Returns:
+            The estimated token count.
+        """
+        input_overheads = {role: self._token_overhead(role) for role in {i.role for i in prompt_stack.inputs}}
+        prompt_overhead = self._token_overhead(None)
+
+        if prompt_overhead is None or None in input_overheads.values():
+            return self.tokenizer.count_tokens(self.prompt_stack_to_string(prompt_stack))
+
+        return prompt_stack.count_tokens(
+            self.tokenizer, input_overheads=cast(dict[str, int], input_overheads), prompt_overhead=prompt_overhead
+        )
+
     def prompt_stack_to_string(self, prompt_stack: PromptStack) -> str:
         """Converts a Prompt Stack to a string for token counting or model input.
         This base implementation is only a rough approximation, and should be overridden by subclasses with model-specific tokens.
@@ -102,6 +127,53 @@ class BasePromptDriver(SerializableMixin, ExponentialBackoffMixin, ABC):
 
         return "\n\n".join(prompt_lines)
 
+    def _token_overhead(self, role: Optional[str]) -> Optional[int]:
+        """Measures the tokens that `prompt_stack_to_string()` adds for an input with `role`, or once per prompt if `role` is `None`.
+
+        Overhead is measured with Prompt Stacks that start with a user input and alternate between user and assistant
+        inputs, which chat templates accept. Returns `None` if rendering them fails.
+        """
+        user, assistant = PromptStack.USER_ROLE, PromptStack.ASSISTANT_ROLE
+
+        if None not in self._token_overheads:
+            try:
+                user_prompt = self._count_empty_inputs_tokens([user])
+                pair_prompt = self._count_empty_inputs_tokens([user, assistant])
+                pair_overhead = self._count_empty_inputs_tokens([user, assistant, user, assistant]) - pair_prompt
+            except Exception:
+                self._token_overheads.update({None: None, user: None, assistant: None})
+            else:
+                user_overhead = pair_overhead - (pair_prompt - user_prompt)
+
+                self._token_overheads.update(
+                    {
+                        None: max(user_prompt - user_overhead, 0),
+                        user: max(user_overhead, 0),
+                        assistant: max(pair_prompt - user_prompt, 0),
+                    }
+                )
+
+        if role not in self._token_overheads:
+            prompt_overhead = self._token_overheads[None]
+            user_overhead = self._token_overheads[user]
+
+            if prompt_overhead is None or user_overhead is None:
+                self._token_overheads[role] = None
+            else:
+                try:
+                    overhead = self._count_empty_inputs_tokens([role, user]) - prompt_overhead - user_overhead
+                except Exception:
+                    self._token_overheads[role] = None
+                else:
+                    self._token_overheads[role] = max(overhead, 0)
+
+        return self._token_overheads[role]
+
+    def _count_empty_inputs_tokens(self, roles: list[str]) -> int:
+        prompt_stack = PromptStack(inputs=[PromptStack.Input("", role=role) for role in roles])
+
+        return self.tokenizer.count_tokens(self.prompt_stack_to_string(prompt_stack))
+
     @abstractmethod
     def try_run(self, prompt_stack: PromptStack) -> TextArtifact: ...
 
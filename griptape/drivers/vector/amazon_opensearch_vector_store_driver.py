@@ -67,3 +67,10 @@ class AmazonOpenSearchVectorStoreDriver(OpenSearchVectorStoreDriver):
             response = self.client.index(index=self.index_name, id=vector_id, body=doc)
 
         return response["_id"]
+
+    def _generate_bulk_action(self, vector_id: str, doc: dict) -> dict:
+        # OpenSearch Serverless vector collections do not support custom document IDs.
+        if self.service == "aoss":
+            return {"_op_type": "index", "_index": self.index_name, "_source": doc}
+        else:
+            return super()._generate_bulk_action(vector_id, doc)
@@ -1,8 +1,9 @@
 from __future__ import annotations
 from abc import ABC, abstractmethod
 from concurrent import futures
+import json
 from dataclasses import dataclass
-from typing import Any, Callable
+from typing import Any, Callable, Iterator
 from typing import Optional
 from attrs import define, field, Factory
 from griptape import utils
@@ -10,10 +11,14 @@ from griptape.artifacts import TextArtifact, BaseArtifact, ListArtifact
 from griptape.drivers import BaseEmbeddingDriver
 from griptape.mixins import SerializableMixin
 
+_TEXT_ARTIFACT_FIELDS = {"type", "id", "name", "value", "meta"}
+
 
 @define
 class BaseVectorStoreDriver(SerializableMixin, ABC):
     DEFAULT_QUERY_COUNT = 5
+    DEFAULT_UPSERT_BATCH_SIZE = 100
+    DEFAULT_PAGE_SIZE = 100
 
     @dataclass
     class Entry:
@@ -28,24 +33,78 @@ class BaseVectorStoreDriver(SerializableMixin, ABC):
             return BaseVectorStoreDriver.Entry(**data)
 
         def to_artifact(self) -> BaseArtifact:
-            return BaseArtifact.from_json(self.meta["artifact"])  # pyright: ignore[reportOptionalSubscript]
+            return BaseVectorStoreDriver.artifact_from_payload(
+                self.meta["artifact"]  # pyright: ignore[reportOptionalSubscript]
+            )
 
     embedding_driver: BaseEmbeddingDriver = field(kw_only=True, metadata={"serializable": True})
     futures_executor_fn: Callable[[], futures.Executor] = field(
         default=Factory(lambda: lambda: futures.ThreadPoolExecutor()), kw_only=True
     )
 
+    @property
+    def embeds_queries(self) -> bool:
+        """Whether the driver embeds query strings itself rather than with `embedding_driver`.
+
+        Query strings are then passed to `query` as is instead of being embedded by `query_many` and its callers.
+        Defaults to whether the driver only implements `query`. Drivers whose store embeds queries server-side should
+        return True.
+        """
+        return not self._implements_query_vector()
+
+    @staticmethod
+    def artifact_to_payload(artifact: BaseArtifact) -> str:
+        """Serializes an artifact for the `artifact` metadata field of an entry.
+
+        Text Artifacts are stored as compact JSON without a `type`, and with `name` and `meta` only when they aren't
+        their defaults. Other artifacts, including subclasses of Text Artifact, are stored with `to_json()`.
+        """
+        if type(artifact) is not TextArtifact:
+            return artifact.to_json()
+
+        payload = {"id": artifact.id, "value": artifact.value}
+
+        if artifact.name != artifact.id:
+            payload["name"] = artifact.name
+
+        if artifact.meta:
+            payload["meta"] = artifact.meta
+
+        return json.dumps(payload, separators=(",", ":"))
+
+    @staticmethod
+    def artifact_from_payload(payload: str) -> BaseArtifact:
+        """Deserializes the `artifact` metadata field of an entry.
+
+        Text Artifacts, in either the compact format of `artifact_to_payload()` or the full `to_json()` format, are
+        built directly instead of going through the polymorphic schema of `BaseArtifact.from_json()`.
+        """
+        data = json.loads(payload)
+
+        if data.get("type", TextArtifact.__name__) == TextArtifact.__name__ and data.keys() <= _TEXT_ARTIFACT_FIELDS:
+            return TextArtifact(
+                data["value"], **{k: data[k] for k in ("id", "name") if k in data}, meta=data.get("meta") or {}
+            )
+        else:
+            return BaseArtifact.from_dict(data)
+
     def upsert_text_artifacts(
         self, artifacts: dict[str, list[TextArtifact]], meta: Optional[dict] = None, **kwargs
     ) -> None:
-        with self.futures_executor_fn() as executor:
-            utils.execute_futures_dict(
-                {
-                    namespace: executor.submit(self.upsert_text_artifact, a, namespace, meta, **kwargs)
-                    for namespace, artifact_list in artifacts.items()
-                    for a in artifact_list
-                }
-            )
+        batch_size = kwargs.get("batch_size") or self.DEFAULT_UPSERT_BATCH_SIZE
+        pending = []
+
+        # Existence is checked with one `existing_ids()` call per batch of artifacts instead of one call per artifact.
+        for namespace, namespace_artifacts in artifacts.items():
+            for i in range(0, len(namespace_artifacts), batch_size):
+                batch = namespace_artifacts[i : i + batch_size]
+                vector_ids = [utils.str_to_hash(a.to_text()) for a in batch]
+                existing = self.existing_ids(vector_ids, namespace)
+
+                pending.extend((namespace, a) for a, vector_id in zip(batch, vector_ids) if vector_id not in existing)
+
+        self.embedding_driver.embed_text_artifacts([a for _, a in pending])
+        self.upsert_vectors([self._text_artifact_to_entry(a, namespace, meta) for namespace, a in pending], **kwargs)
 
     def upsert_text_artifact(
         self,
@@ -55,23 +114,16 @@ class BaseVectorStoreDriver(SerializableMixin, ABC):
         vector_id: Optional[str] = None,
         **kwargs,
     ) -> str:
-        meta = {} if meta is None else meta
         vector_id = utils.str_to_hash(artifact.to_text()) if vector_id is None else vector_id
 
         if self.does_entry_exist(vector_id, namespace):
             return vector_id
         else:
-            meta["artifact"] = artifact.to_json()
-
-            if artifact.embedding:
-                vector = artifact.embedding
-            else:
-                vector = artifact.generate_embedding(self.embedding_driver)
+            entry = self._text_artifact_to_entry(artifact, namespace, meta, vector_id)
 
-            if isinstance(vector, list):
-                return self.upsert_vector(vector, vector_id=vector_id, namespace=namespace, meta=meta, **kwargs)
-            else:
-                raise ValueError("Vector must be an instance of 'list'.")
+            return self.upsert_vector(
+                entry.vector, vector_id=entry.id, namespace=entry.namespace, meta=entry.meta, **kwargs
+            )
 
     def upsert_text(
         self,
@@ -100,14 +152,81 @@ class BaseVectorStoreDriver(SerializableMixin, ABC):
         except Exception:
             return False
 
+    def existing_ids(self, vector_ids: list[str], namespace: Optional[str] = None) -> set[str]:
+        """Returns the IDs in `vector_ids` that have an entry in `namespace`.
+
+        Drivers with a bulk lookup API should override this method to check every ID in a single request. This
+        implementation calls `does_entry_exist` for each ID concurrently.
+        """
+        with self.futures_executor_fn() as executor:
+            exists = utils.execute_futures_list(
+                [executor.submit(self.does_entry_exist, vector_id, namespace) for vector_id in vector_ids]
+            )
+
+        return {vector_id for vector_id, exist in zip(vector_ids, exists) if exist}
+
+    def load_entries_by_ids(self, vector_ids: list[str], namespace: Optional[str] = None) -> list[Entry]:
+        """Loads the entries of `vector_ids` in `namespace`.
+
+        Drivers with a bulk lookup API should override this method to load every entry in a single request. This
+        implementation calls `load_entry` for each ID concurrently.
+
+        Returns:
+            Entries that were found, in the same order as `vector_ids`.
+        """
+        with self.futures_executor_fn() as executor:
+            entries = utils.execute_futures_list(
+                [executor.submit(self.load_entry, vector_id, namespace) for vector_id in vector_ids]
+            )
+
+        return [entry for entry in entries if entry is not None]
+
     def load_artifacts(self, namespace: Optional[str] = None) -> ListArtifact:
-        result = self.load_entries(namespace)
-        artifacts = [r.to_artifact() for r in result]
+        artifacts = [e.to_artifact() for e in self.iter_entries(namespace)]
 
         return ListArtifact([a for a in artifacts if isinstance(a, TextArtifact)])
 
+    def upsert_vectors(self, entries: list[Entry], batch_size: Optional[int] = None, **kwargs) -> list[str]:
+        """Inserts or updates many vectors.
+
+        Drivers with a bulk API should override this method to write each batch in a single request. This
+        implementation upserts one vector at a time.
+
+        Args:
+            entries: Entries to upsert. Entries without an `id` get one generated by the driver.
+            batch_size: Maximum number of entries to write per request. Defaults to `DEFAULT_UPSERT_BATCH_SIZE`.
+
+        Returns:
+            IDs of the upserted vectors, in the same order as `entries`.
+        """
+        return [
+            self.upsert_vector(e.vector, vector_id=e.id, namespace=e.namespace, meta=e.meta, **kwargs) for e in entries
+        ]
+
+    def _text_artifact_to_entry(
+        self,
+        artifact: TextArtifact,
+        namespace: Optional[str] = None,
+        meta: Optional[dict] = None,
+        vector_id: Optional[str] = None,
+    ) -> Entry:
+        """Converts a Text Artifact into an Entry, generating its embedding if it does not have one."""
+        vector_id = utils.str_to_hash(artifact.to_text()) if vector_id is None else vector_id
+        meta = {} if meta is None else dict(meta)
+        meta["artifact"] = self.artifact_to_payload(artifact)
+
+        if artifact.embedding:
+            vector = artifact.embedding
+        else:
+            vector = artifact.generate_embedding(self.embedding_driver)
+
+        if isinstance(vector, list):
+            return self.Entry(id=vector_id, vector=vector, meta=meta, namespace=namespace)
+        else:
+            raise ValueError("Vector must be an instance of 'list'.")
+
     @abstractmethod
-    def delete_vector(self, vector_id: str) -> None: ...
+    def delete_vector(self, vector_id: str, namespace: Optional[str] = None) -> None: ...
 
     @abstractmethod
     def upsert_vector(
@@ -122,10 +241,28 @@ class BaseVectorStoreDriver(SerializableMixin, ABC):
     @abstractmethod
     def load_entry(self, vector_id: str, namespace: Optional[str] = None) -> Optional[Entry]: ...
 
-    @abstractmethod
-    def load_entries(self, namespace: Optional[str] = None) -> list[Entry]: ...
+    def load_entries(self, namespace: Optional[str] = None) -> list[Entry]:
+        """Loads every entry, optionally filtered by namespace, into a list.
+
+        Use `iter_entries` to go through large stores without loading every entry into memory.
+        """
+        return list(self.iter_entries(namespace))
+
+    def iter_entries(self, namespace: Optional[str] = None, page_size: Optional[int] = None) -> Iterator[Entry]:
+        """Yields every entry, optionally filtered by namespace, fetching one page of entries per request.
+
+        Only the current page is held in memory, so stores of any size can be read. Drivers should implement either
+        this method or `load_entries`. Drivers that only implement `load_entries` yield the list it loads.
+
+        Args:
+            namespace: Optional namespace to load entries from.
+            page_size: Number of entries to fetch per request. Defaults to `DEFAULT_PAGE_SIZE`.
+        """
+        if type(self).load_entries is BaseVectorStoreDriver.load_entries:
+            raise NotImplementedError(f"{self.__class__.__name__} must implement iter_entries or load_entries.")
+
+        return iter(self.load_entries(namespace))
 
-    @abstractmethod
     def query(
         self,
         query: str,
@@ -133,4 +270,91 @@ class BaseVectorStoreDriver(SerializableMixin, ABC):
         namespace: Optional[str] = None,
         include_vectors: bool = False,
         **kwargs,
-    ) -> list[Entry]: ...
+    ) -> list[Entry]:
+        """Embeds `query` and returns the entries whose vectors are most similar to it.
+
+        Args:
+            query: Query string to embed with `embedding_driver`.
+            count: Maximum number of entries to return.
+            namespace: Optional namespace to search in.
+            include_vectors: Whether to include the vectors of the entries.
+            kwargs: Driver-specific parameters passed to `query_vector`.
+        """
+        return self.query_vector(
+            self.embedding_driver.embed_string(query),
+            count=count,
+            namespace=namespace,
+            include_vectors=include_vectors,
+            **kwargs,
+        )
+
+    def query_many(
+        self,
+        queries: list[str] | list[list[float]],
+        count: Optional[int] = None,
+        namespace: Optional[str] = None,
+        include_vectors: bool = False,
+        **kwargs,
+    ) -> list[list[Entry]]:
+        """Runs many queries at once.
+
+        Query strings are embedded in batches with `embedding_driver`, and query vectors are used as is. Drivers with a
+        multi-search API should override this method to search in a single request. This implementation calls
+        `query_vector` for each query concurrently, or `query` for each query string if the driver `embeds_queries`.
+
+        Args:
+            queries: Query strings, query vectors, or a mix of both.
+            count: Maximum number of entries to return per query.
+            namespace: Optional namespace to search in.
+            include_vectors: Whether to include the vectors of the entries.
+            kwargs: Driver-specific parameters passed to `query_vector`.
+
+        Returns:
+            Results of every query, in the same order as `queries`.
+        """
+        if not self.embeds_queries:
+            queries = self._embed_queries(queries)
+
+        with self.futures_executor_fn() as executor:
+            return utils.execute_futures_list(
+                [
+                    executor.submit(
+                        self.query if isinstance(query, str) else self.query_vector,
+                        query,
+                        count=count,
+                        namespace=namespace,
+                        include_vectors=include_vectors,
+                        **kwargs,
+                    )
+                    for query in queries
+                ]
+            )
+
+    def _embed_queries(self, queries: list[str] | list[list[float]]) -> list[list[float]]:
+        """Embeds the query strings in `queries` in batches, keeping query vectors as they are."""
+        positions = [i for i, query in enumerate(queries) if isinstance(query, str)]
+        vectors: list = list(queries)
+
+        if positions:
+            for i, vector in zip(positions, self.embedding_driver.embed_strings([queries[i] for i in positions])):
+                vectors[i] = vector
+
+        return vectors
+
+    def query_vector(
+        self,
+        vector: list[float],
+        count: Optional[int] = None,
+        namespace: Optional[str] = None,
+        include_vectors: bool = False,
+        **kwargs,
+    ) -> list[Entry]:
+        """Returns the entries whose vectors are most similar to `vector`.
+
+        Drivers should implement this method, which `query` calls with the embedding of the query string. Drivers that
+        only implement `query` can't be queried by vector.
+        """
+        raise NotImplementedError(f"{self.__class__.__name__} does not support querying by vector.")
+
+    def _implements_query_vector(self) -> bool:
+        return type(self).query_vector is not BaseVectorStoreDriver.query_vector
@@ -1,5 +1,5 @@
 from attrs import field, define, Factory
-from typing import Optional
+from typing import Iterator, Optional
 from griptape.drivers import BaseVectorStoreDriver, BaseEmbeddingDriver, DummyEmbeddingDriver
 from griptape.exceptions import DummyException
 
@@ -10,7 +10,7 @@ class DummyVectorStoreDriver(BaseVectorStoreDriver):
         kw_only=True, default=Factory(lambda: DummyEmbeddingDriver()), metadata={"serializable": True}
     )
 
-    def delete_vector(self, vector_id: str) -> None:
+    def delete_vector(self, vector_id: str, namespace: Optional[str] = None) -> None:
         raise DummyException(__class__.__name__, "delete_vector")
 
     def upsert_vector(
@@ -23,12 +23,30 @@ class DummyVectorStoreDriver(BaseVectorStoreDriver):
     ) -> str:
         raise DummyException(__class__.__name__, "upsert_vector")
 
+    def upsert_vectors(
+        self, entries: list[BaseVectorStoreDriver.Entry], batch_size: Optional[int] = None, **kwargs
+    ) -> list[str]:
+        raise DummyException(__class__.__name__, "upsert_vectors")
+
     def load_entry(self, vector_id: str, namespace: Optional[str] = None) -> Optional[BaseVectorStoreDriver.Entry]:
         raise DummyException(__class__.__name__, "load_entry")
 
     def load_entries(self, namespace: Optional[str] = None) -> list[BaseVectorStoreDriver.Entry]:
         raise DummyException(__class__.__name__, "load_entries")
 
+    def load_entries_by_ids(
+        self, vector_ids: list[str], namespace: Optional[str] = None
+    ) -> list[BaseVectorStoreDriver.Entry]:
+        raise DummyException(__class__.__name__, "load_entries_by_ids")
+
+    def existing_ids(self, vector_ids: list[str], namespace: Optional[str] = None) -> set[str]:
+        raise DummyException(__class__.__name__, "existing_ids")
+
+    def iter_entries(
+        self, namespace: Optional[str] = None, page_size: Optional[int] = None
+    ) -> Iterator[BaseVectorStoreDriver.Entry]:
+        raise DummyException(__class__.__name__, "iter_entries")
+
     def query(
         self,
         query: str,
@@ -38,3 +56,13 @@ class DummyVectorStoreDriver(BaseVectorStoreDriver):
         **kwargs,
     ) -> list[BaseVectorStoreDriver.Entry]:
         raise DummyException(__class__.__name__, "query")
+
+    def query_vector(
+        self,
+        vector: list[float],
+        count: Optional[int] = None,
+        namespace: Optional[str] = None,
+        include_vectors: bool = False,
+        **kwargs,
+    ) -> list[BaseVectorStoreDriver.Entry]:
+        raise DummyException(__class__.__name__, "query_vector")
@@ -0,0 +1,209 @@
+from __future__ import annotations
+import math
+from typing import Optional
+import attrs
+import numpy as np
+from attrs import define, field
+
+
+@define
+class LocalIvfIndex:
+    """An inverted file index that narrows queries of a `LocalVectorIndex` down to the rows of the closest clusters.
+
+    Rows are clustered with spherical k-means, so clusters match cosine similarity. A query only scores the rows in the
+    `nprobe` clusters whose centroids are closest to the query vector. Rows that are inserted after training are
+    assigned to their closest cluster without retraining, and the index is retrained once it has grown by
+    `retrain_growth_factor`.
+
+    Queries read the rows of every cluster from arrays that are rebuilt when the cluster changes, so `snapshot()` can
+    share them with a read-only copy that later inserts do not modify. Inserts update the cluster assignments in place,
+    so the copy rebuilds its assignments from its clusters the first time they are read.
+
+    Attributes:
+        list_count: Number of clusters. Defaults to four times the square root of the number of rows at training time.
+        nprobe: Number of clusters to score per query. Higher values improve recall at the cost of latency.
+        min_train_size: Number of rows below which queries are exact and the index is not trained.
+        training_sample_size: Number of rows per cluster sampled to train the centroids.
+        iterations: Number of k-means iterations.
+        retrain_growth_factor: Growth of the number of rows since the last training that triggers retraining.
+        seed: Seed of the random number generator used to sample rows and initialize centroids.
+    """
+
+    BLOCK_SIZE = 65536
+
+    list_count: Optional[int] = field(default=None, kw_only=True)
+    nprobe: int = field(default=8, kw_only=True)
+    min_train_size: int = field(default=10_000, kw_only=True)
+    training_sample_size: int = field(default=64, kw_only=True)
+    iterations: int = field(default=10, kw_only=True)
+    retrain_growth_factor: float = field(default=4.0, kw_only=True)
+    seed: int = field(default=0, kw_only=True)
+    centroids: Optional[np.ndarray] = field(default=None, init=False, eq=False)
+    trained_size: int = field(default=0, init=False)
+    _assignments: Optional[np.ndarray] = field(init=False, eq=False, factory=lambda: np.empty(0, dtype=np.int32))
+    _lists: list[list[int]] = field(init=False, factory=list)
+    _arrays: list[np.ndarray] = field(init=False, eq=False, factory=list)
+    _dirty: set[int] = field(init=False, factory=set)
+
+    @property
+    def is_trained(self) -> bool:
+        return self.centroids is not None
+
+    @property
+    def assignments(self) -> np.ndarray:
+        """The cluster of every row, or -1 for rows that are not assigned."""
+        if self._assignments is None:
+            size = max((int(rows.max()) + 1 for rows in self._arrays if len(rows)), default=0)
+            assignments = np.full(size, -1, dtype=np.int32)
+
+            for label, rows in enumerate(self._arrays):
+                assignments[rows] = label
+
+            self._assignments = assignments
+
+        return self._assignments
+
+    def should_train(self, size: int) -> bool:
+        if self.is_trained:
+            return size >= self.trained_size * self.retrain_growth_factor
+        else:
+            return size >= self.min_train_size
+
+    def train(self, matrix: np.ndarray, norms: np.ndarray) -> None:
+        """Clusters `matrix` and assigns every row to its closest cluster.
+
+        Args:
+            matrix: Vectors to cluster, one per row.
+            norms: Norms of the rows of `matrix`.
+        """
+        rng = np.random.default_rng(self.seed)
+        list_count = min(self.list_count or max(1, int(4 * math.sqrt(len(matrix)))), len(matrix))
+        sample_size = min(len(matrix), list_count * self.training_sample_size)
+        sample_rows = np.sort(rng.choice(len(matrix), size=sample_size, replace=False))
+        sample = self._normalize(np.asarray(matrix[sample_rows], dtype=np.float32), norms[sample_rows])
+        centroids = sample[rng.choice(len(sample), size=list_count, replace=False)]
+
+        for _ in range(self.iterations):
+            labels = np.argmax(sample @ centroids.T, axis=1)
+            counts = np.bincount(labels, minlength=list_count)
+            # Summing one dimension at a time with bincount is much faster than np.add.at over rows.
+            sums = np.stack(
+                [np.bincount(labels, weights=sample[:, d], minlength=list_count) for d in range(sample.shape[1])],
+                axis=1,
+            ).astype(np.float32)
+
+            # Empty clusters are reseeded with random sample vectors.
+            empty = counts == 0
+            sums[empty] = sample[rng.choice(len(sample), size=int(empty.sum()), replace=False)]
+            centroids = self._normalize(sums, np.linalg.norm(sums, axis=1))
+
+        self.centroids = centroids.astype(np.float32)
+        self.load(self.centroids, self._closest_centroids(matrix, norms), len(matrix))
+
+    def add(self, rows: np.ndarray, vectors: np.ndarray, norms: np.ndarray) -> None:
+        """Assigns `rows` to their closest clusters, moving rows that were already assigned.
+
+        Args:
+            rows: Row indexes of `vectors`.
+            vectors: Vectors of `rows`.
+            norms: Norms of `vectors`.
+        """
+        if self.centroids is None or len(rows) == 0:
+            return
+
+        assignments = self.assignments
+
+        if rows.max() >= len(assignments):
+            assignments = np.full(max(rows.max() + 1, 2 * len(self.assignments)), -1, dtype=np.int32)
+            assignments[: len(self.assignments)] = self.assignments
+            self._assignments = assignments
+
+        labels = self._closest_centroids(vectors, norms)
+
+        for row, label in zip(rows.tolist(), labels.tolist()):
+            previous = assignments[row]
+
+            if previous == label:
+                continue
+            elif previous != -1:
+                self._lists[previous].remove(row)
+                self._dirty.add(previous)
+
+            assignments[row] = label
+            self._lists[label].append(row)
+            self._dirty.add(label)
+
+    def load(self, centroids: np.ndarray, assignments: np.ndarray, trained_size: int) -> None:
+        """Restores clusters that were previously trained.
+
+        Args:
+            centroids: Normalized centroids, one per row.
+            assignments: Cluster of every row, or -1 for rows that are not assigned.
+            trained_size: Number of rows the centroids were trained on.
+        """
+        self.centroids = np.asarray(centroids, dtype=np.float32)
+        self.trained_size = trained_size
+        self._assignments = np.array(assignments, dtype=np.int32)
+
+        # Rows that are not assigned sort first and are skipped by the boundaries of the first cluster.
+        order = np.argsort(self._assignments, kind="stable")
+        boundaries = np.searchsorted(self._assignments[order], np.arange(len(self.centroids) + 1))
+        self._arrays = [order[boundaries[i] : boundaries[i + 1]] for i in range(len(self.centroids))]
+        self._lists = [rows.tolist() for rows in self._arrays]
+        self._dirty = set()
+
+    def clear(self) -> None:
+        self.centroids = None
+        self.trained_size = 0
+        self._assignments = np.empty(0, dtype=np.int32)
+        self._lists = []
+        self._arrays = []
+        self._dirty = set()
+
+    def snapshot(self) -> LocalIvfIndex:
+        """Returns a read-only copy of the clusters that shares their rows with this index."""
+        self._refresh()
+
+        index = attrs.evolve(self)
+        index.centroids = self.centroids
+        index.trained_size = self.trained_size
+        index._assignments = None
+        index._arrays = list(self._arrays)
+
+        return index
+
+    def candidates(self, vector: list[float] | np.ndarray, nprobe: Optional[int] = None) -> np.ndarray:
+        """Returns the rows of the `nprobe` clusters closest to `vector`, in ascending order."""
+        if self.centroids is None:
+            raise ValueError("The index must be trained before it can be queried.")
+
+        query = np.asarray(vector, dtype=np.float32)
+        scores = self.centroids @ query
+        nprobe = min(nprobe or self.nprobe, len(self.centroids))
+        labels = np.argpartition(-scores, nprobe - 1)[:nprobe]
+        self._refresh()
+        rows = [self._arrays[label] for label in labels.tolist()]
+
+        return np.sort(np.concatenate(rows)) if rows else np.empty(0, dtype=np.int64)
+
+    def _refresh(self) -> None:
+        # Arrays are replaced rather than modified, since snapshots may still reference them.
+        for label in self._dirty:
+            self._arrays[label] = np.asarray(self._lists[label], dtype=np.int64)
+
+        self._dirty = set()
+
+    def _closest_centroids(self, vectors: np.ndarray, norms: np.ndarray) -> np.ndarray:
+        labels = np.empty(len(vectors), dtype=np.int32)
+
+        # Vectors are assigned in blocks to bound the size of the score matrix.
+        for start in range(0, len(vectors), self.BLOCK_SIZE):
+            block = np.asarray(vectors[start : start + self.BLOCK_SIZE], dtype=np.float32)
+            block = self._normalize(block, norms[start : start + self.BLOCK_SIZE])
+            labels[start : start + self.BLOCK_SIZE] = np.argmax(block @ self.centroids.T, axis=1)
+
+        return labels
+
+    @staticmethod
+    def _normalize(vectors: np.ndarray, norms: np.ndarray) -> np.ndarray:
+        return np.divide(vectors, norms[:, None], out=np.zeros_like(vectors), where=norms[:, None] != 0)
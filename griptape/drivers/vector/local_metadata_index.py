@@ -0,0 +1,134 @@
+from __future__ import annotations
+import json
+from typing import Any, Optional
+import numpy as np
+from attrs import define, field
+
+
+@define
+class LocalMetadataIndex:
+    """An inverted index from metadata values to the rows of a `LocalVectorIndex`.
+
+    For every indexed key, the index maps each value to the set of rows whose metadata holds that value. A filter is
+    resolved to a boolean bitmap of matching rows before any vector is scored.
+
+    Filters read the rows of every value from arrays that are rebuilt when the value changes, so `snapshot()` can share
+    them with a read-only copy that later changes do not modify.
+
+    Attributes:
+        keys: Metadata keys to index. Filters on other keys are checked against the metadata of candidate rows.
+    """
+
+    keys: list[str] = field(factory=list, kw_only=True)
+    _postings: dict[str, dict[Any, set[int]]] = field(init=False, factory=dict)
+    _arrays: dict[str, dict[Any, np.ndarray]] = field(init=False, eq=False, factory=dict)
+    _dirty: set[tuple[str, Any]] = field(init=False, factory=set)
+    _snapshot: Optional[LocalMetadataIndex] = field(default=None, init=False, eq=False, repr=False)
+
+    def __attrs_post_init__(self) -> None:
+        self.clear()
+
+    def add(self, row: int, meta: Optional[dict]) -> None:
+        for key, values in self._postings.items():
+            if meta is not None and key in meta:
+                value = self._hashable(meta[key])
+
+                values.setdefault(value, set()).add(row)
+                self._dirty.add((key, value))
+                self._snapshot = None
+
+    def remove(self, row: int, meta: Optional[dict]) -> None:
+        for key, values in self._postings.items():
+            if meta is not None and key in meta:
+                value = self._hashable(meta[key])
+                rows = values.get(value)
+
+                if rows is not None:
+                    rows.discard(row)
+                    self._dirty.add((key, value))
+                    self._snapshot = None
+
+                    if not rows:
+                        del values[value]
+
+    def clear(self) -> None:
+        self._postings = {key: {} for key in self.keys}
+        self._arrays = {key: {} for key in self.keys}
+        self._dirty = set()
+        self._snapshot = None
+
+    def is_indexed(self, key: str) -> bool:
+        return key in self._arrays
+
+    def snapshot(self) -> LocalMetadataIndex:
+        """Returns a read-only copy of the index. The copy is reused until the index changes."""
+        if self._snapshot is None:
+            self._refresh()
+
+            index = LocalMetadataIndex(keys=self.keys)
+            index._postings = {}
+            index._arrays = {key: dict(values) for key, values in self._arrays.items()}
+            self._snapshot = index
+
+        return self._snapshot
+
+    def bitmap(self, filter: dict[str, Any], size: int) -> Optional[np.ndarray]:
+        """Returns a bitmap of the rows whose metadata matches every indexed key of `filter`.
+
+        Args:
+            filter: Metadata values to match by equality.
+            size: Number of rows of the bitmap.
+
+        Returns:
+            A boolean array with one element per row, or `None` if `filter` has no indexed keys.
+        """
+        self._refresh()
+
+        bitmap = None
+        empty = np.empty(0, dtype=np.int64)
+
+        # The smallest postings are applied first so that the bitmap is built from the fewest rows.
+        postings = sorted(
+            (
+                self._arrays[key].get(self._hashable(value), empty)
+                for key, value in filter.items()
+                if key in self._arrays
+            ),
+            key=len,
+        )
+
+        for rows in postings:
+            matches = np.zeros(size, dtype=bool)
+            matches[rows] = True
+            bitmap = matches if bitmap is None else bitmap & matches
+
+            if not bitmap.any():
+                break
+
+        return bitmap
+
+    @staticmethod
+    def matches(meta: Optional[dict], filter: dict[str, Any]) -> bool:
+        """Returns whether `meta` holds every value of `filter`."""
+        return meta is not None and all(key in meta and meta[key] == value for key, value in filter.items())
+
+    def _refresh(self) -> None:
+        # Arrays are replaced rather than modified, since snapshots may still reference them.
+        for key, value in self._dirty:
+            rows = self._postings[key].get(value)
+
+            if rows:
+                self._arrays[key][value] = np.fromiter(rows, dtype=np.int64, count=len(rows))
+            else:
+                self._arrays[key].pop(value, None)
+
+        self._dirty = set()
+
+    @staticmethod
+    def _hashable(value: Any) -> Any:
+        try:
+            hash(value)
+
+            return value
+        except TypeError:
+            return json.dumps(value, sort_keys=True)
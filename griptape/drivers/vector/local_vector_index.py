@@ -0,0 +1,805 @@
+from __future__ import annotations
+import weakref
+from typing import Any, Iterator, Optional
+import attrs
+import numpy as np
+from attrs import define, field
+from griptape.drivers.vector.local_ivf_index import LocalIvfIndex
+
+
+@define
+class LocalVectorIndex:
+    """A contiguous matrix of vectors and their metadata addressed by string keys.
+
+    Vector norms are precomputed so that cosine similarity against every row can be computed with a single matrix-vector
+    product.
+
+    Vectors can be stored compressed to save memory. `float16` halves the size of the matrix, and `int8` quarters it by
+    scaling every vector so that its largest component maps to 127. Compressed rows are scored in blocks that are
+    converted to float32 on the fly, so the matrix is never decompressed as a whole. Norms are computed from the original
+    vectors, and every row can reference a row of a full precision `source` matrix, such as a memory-mapped vector file,
+    that is used to rescore the best candidates and to read vectors exactly. The norms of a loaded float32 matrix are
+    computed the first time they are read, and shared with the snapshots that were taken before.
+
+    Deleting a key only marks its row in a tombstone bitmap that queries skip, so deletes take constant time. Deleted
+    rows keep their place until the index is rebuilt with `compacted()`.
+
+    `snapshot()` returns a read-only view of the current rows for readers that do not hold a lock. The view shares the
+    arrays of the index, which stay valid because new rows are only written past the rows of the view, and before a row
+    that the view can read is overwritten or deleted in place, its previous values are recorded in the view. Views read
+    the rows of the shared arrays first and then replace the rows that changed with their recorded values, so a change
+    only copies the row it modifies. Views never train `ann_index`.
+
+    Attributes:
+        initial_capacity: Number of rows to allocate the first time a vector is inserted. Capacity doubles when full.
+        dimensions: Vector dimensions. Inferred from the first inserted vector if not provided.
+        ann_index: Optional approximate nearest neighbor index. Once trained, queries only score the rows it returns
+            instead of every row. It is trained by `train_ann_index()`, or by the first query of the index, but not of
+            its snapshots, once the index holds enough rows.
+        dtype: Storage type of the vectors, one of `float32`, `float16`, or `int8`.
+        rescore_factor: When vectors are compressed and a `source` is passed to `top_k`, `count * rescore_factor`
+            candidates are selected with compressed scores and rescored at full precision. `None` disables rescoring.
+    """
+
+    SCORE_BLOCK_SIZE = 2**24
+    DTYPES = {"float32": np.float32, "float16": np.float16, "int8": np.int8}
+
+    initial_capacity: int = field(default=1024, kw_only=True)
+    dimensions: Optional[int] = field(default=None, kw_only=True)
+    ann_index: Optional[LocalIvfIndex] = field(default=None, kw_only=True)
+    dtype: str = field(default="float32", kw_only=True)
+    rescore_factor: Optional[int] = field(default=None, kw_only=True)
+    _matrix: np.ndarray = field(init=False, eq=False, factory=lambda: np.empty((0, 0), dtype=np.float32))
+    _norms: Optional[np.ndarray] = field(init=False, eq=False, factory=lambda: np.empty(0, dtype=np.float32))
+    _scales: np.ndarray = field(init=False, eq=False, factory=lambda: np.empty(0, dtype=np.float32))
+    _source_rows: np.ndarray = field(init=False, eq=False, factory=lambda: np.empty(0, dtype=np.int64))
+    _deleted: np.ndarray = field(init=False, eq=False, factory=lambda: np.empty(0, dtype=bool))
+    deleted_count: int = field(default=0, init=False)
+    version: int = field(default=0, init=False, eq=False)
+    _keys: list[str] = field(init=False, factory=list)
+    _metas: list[Optional[dict]] = field(init=False, factory=list)
+    _rows: dict[str, int] = field(init=False, factory=dict)
+    _size: int = field(default=0, init=False)
+    _lazy_norms: Optional[_LazyNorms] = field(default=None, init=False, eq=False, repr=False)
+    _changes: Optional[_Changes] = field(default=None, init=False, eq=False, repr=False)
+    _views: list[weakref.ref[LocalVectorIndex]] = field(init=False, eq=False, repr=False, factory=list)
+    _snapshot: Optional[LocalVectorIndex] = field(default=None, init=False, eq=False, repr=False)
+
+    @dtype.validator  # pyright: ignore
+    def validate_dtype(self, _, dtype: str) -> None:
+        if dtype not in self.DTYPES:
+            raise ValueError(f"dtype must be one of {', '.join(self.DTYPES)}")
+
+    def __len__(self) -> int:
+        """Returns the number of rows, including deleted rows."""
+        return self._size
+
+    def __contains__(self, key: str) -> bool:
+        return self.row(key) is not None
+
+    @property
+    def keys(self) -> list[str]:
+        """The key of every row. Keys of deleted rows are kept so that rows keep their position."""
+        return self._keys if len(self._keys) == self._size else self._keys[: self._size]
+
+    @property
+    def metas(self) -> list[Optional[dict]]:
+        """The metadata of every row."""
+        if self._changes is None and len(self._metas) == self._size:
+            return self._metas
+        else:
+            return self._read("_metas", slice(0, self._size))
+
+    @property
+    def deleted(self) -> np.ndarray:
+        """The tombstone bitmap, `True` for every deleted row."""
+        return self._read("_deleted", slice(0, self._size))
+
+    @property
+    def live_rows(self) -> np.ndarray:
+        """The rows that are not deleted, in ascending order."""
+        return np.flatnonzero(~self.deleted)
+
+    @property
+    def tombstone_ratio(self) -> float:
+        return self.deleted_count / len(self) if len(self) else 0.0
+
+    @property
+    def is_compressed(self) -> bool:
+        return self.dtype != "float32"
+
+    @property
+    def matrix(self) -> np.ndarray:
+        """The stored rows, in the storage `dtype`. Snapshots return a copy."""
+        return self._read("_matrix", slice(0, self._size))
+
+    @property
+    def source_rows(self) -> np.ndarray:
+        """The full precision `source` row of every row, or -1 for rows without one."""
+        return self._read("_source_rows", slice(0, self._size))
+
+    @property
+    def norms(self) -> np.ndarray:
+        return self._read("_norms", slice(0, self._size))
+
+    def row(self, key: str) -> Optional[int]:
+        """Returns the row of `key`, or `None` if it is not present or deleted."""
+        row = self._rows.get(key)
+
+        if self._changes is not None:
+            row = self._changes.keys.get(key, row)
+
+        # A snapshot shares the key lookup of its index, which may hold rows that were added after the snapshot.
+        if row is None or row >= self._size or self._read_at("_deleted", row):
+            return None
+        else:
+            return row
+
+    def key_at(self, row: int) -> str:
+        return self._keys[row]
+
+    def meta_at(self, row: int) -> Optional[dict]:
+        return self._read_at("_metas", row)
+
+    def vector(self, key: str, source: Optional[np.ndarray] = None) -> Optional[list[float]]:
+        """Returns the vector of `key`, read from `source` when it is compressed and has a full precision row."""
+        row = self.row(key)
+
+        return None if row is None else self.vector_at(row, source)
+
+    def vector_at(self, row: int, source: Optional[np.ndarray] = None) -> list[float]:
+        """Returns the vector of `row`, read from `source` when it is compressed and has a full precision row."""
+        source_row = self._read_at("_source_rows", row)
+
+        if self.is_compressed and source is not None and 0 <= source_row < len(source):
+            return np.asarray(source[source_row], dtype=np.float32).tolist()
+        else:
+            return self.float32_rows(np.array([row]))[0].tolist()
+
+    def float32_rows(self, rows: np.ndarray | slice) -> np.ndarray:
+        """Returns `rows` converted to float32."""
+        if self.dtype == "int8":
+            return self._read("_matrix", rows).astype(np.float32) * self._read("_scales", rows)[:, None]
+        else:
+            return np.asarray(self._read("_matrix", rows), dtype=np.float32)
+
+    def iter_full_precision(self, source: Optional[np.ndarray] = None, block_size: int = 65536) -> Iterator[np.ndarray]:
+        """Yields every row as float32 in blocks, reading compressed rows from `source` when they have a row in it."""
+        for start in range(0, len(self), block_size):
+            rows = slice(start, min(start + block_size, len(self)))
+
+            if not self.is_compressed:
+                yield self._read("_matrix", rows)
+            else:
+                block = self.float32_rows(rows)
+
+                if source is not None:
+                    source_rows = self._read("_source_rows", rows)
+                    exact = (source_rows >= 0) & (source_rows < len(source))
+                    block[exact] = source[source_rows[exact]]
+
+                yield block
+
+    def upsert(self, key: str, vector: list[float], source_row: int = -1, meta: Optional[dict] = None) -> int:
+        """Inserts a vector under `key`, overwriting the existing row if the key is already present.
+
+        Args:
+            key: Key of the vector.
+            vector: Vector to insert.
+            source_row: Row of the vector in the full precision source, if any.
+            meta: Metadata of the vector.
+
+        Returns:
+            The row index of the vector.
+        """
+        array = np.asarray(vector, dtype=np.float32)
+
+        if self.dimensions is None:
+            self.dimensions = array.shape[0]
+        elif array.shape != (self.dimensions,):
+            raise ValueError(f"Expected a vector with {self.dimensions} dimensions, got {array.shape[0]}.")
+
+        norms = self._ensure_norms()
+        row = self._rows.get(key)
+
+        if row is None:
+            row = self._size
+
+            # New rows are written past the rows of existing snapshots, so they are not copied.
+            self._reserve(row + 1)
+            self._keys.append(key)
+            self._metas.append(meta)
+            self._rows[key] = row
+            self._size += 1
+            norms = self._norms
+        else:
+            if not self._matrix.flags.writeable:
+                # Rows loaded from a read-only memory map are copied before they are modified.
+                self._matrix = np.array(self._matrix)
+
+            self._preserve(row, *self._row_arrays())
+            self._metas[row] = meta
+
+        self._store(row, array[None])
+        self._source_rows[row] = source_row
+        norms[row] = np.linalg.norm(array)
+
+        if self.ann_index is not None:
+            self.ann_index.add(np.array([row]), array[None], norms[row : row + 1])
+
+        self.version += 1
+
+        return row
+
+    def delete(self, key: str) -> Optional[int]:
+        """Marks the row of `key` as deleted.
+
+        Returns:
+            The row index of the deleted vector, or `None` if `key` is not present.
+        """
+        row = self._rows.get(key)
+
+        if row is not None:
+            self._preserve(row, "_deleted", key=key)
+            del self._rows[key]
+            self._deleted[row] = True
+            self.deleted_count += 1
+            self.version += 1
+
+        return row
+
+    def compacted(self) -> LocalVectorIndex:
+        """Returns a copy of the index without its deleted rows.
+
+        Rows are copied in their storage `dtype`, and a trained `ann_index` keeps its clusters. The index itself is not
+        modified, so it can keep serving queries while the copy is built.
+        """
+        live_rows = self.live_rows
+        metas = self.metas
+        index = LocalVectorIndex(
+            initial_capacity=self.initial_capacity,
+            dimensions=self.dimensions,
+            ann_index=None if self.ann_index is None else attrs.evolve(self.ann_index),
+            dtype=self.dtype,
+            rescore_factor=self.rescore_factor,
+        )
+
+        index._keys = [self._keys[row] for row in live_rows.tolist()]
+        index._metas = [metas[row] for row in live_rows.tolist()]
+        index._rows = {key: row for row, key in enumerate(index._keys)}
+        index._size = len(index._keys)
+        index._matrix = self._read("_matrix", live_rows)
+        index._norms = self._read("_norms", live_rows)
+        index._scales = self._read("_scales", live_rows) if self.dtype == "int8" else np.empty(0, dtype=np.float32)
+        index._source_rows = self._read("_source_rows", live_rows)
+        index._deleted = np.zeros(len(live_rows), dtype=bool)
+
+        if index.ann_index is not None and self.ann_index is not None and self.ann_index.centroids is not None:
+            assignments = np.full(len(self), -1, dtype=np.int32)
+            assigned = min(len(self), len(self.ann_index.assignments))
+            assignments[:assigned] = self.ann_index.assignments[:assigned]
+
+            index.ann_index.load(self.ann_index.centroids, assignments[live_rows], self.ann_index.trained_size)
+
+        return index
+
+    def snapshot(self) -> LocalVectorIndex:
+        """Returns a read-only view of the current rows that later changes to the index do not modify.
+
+        The view is reused until the index changes.
+        """
+        if self._snapshot is None or self._snapshot.version != self.version:
+            index = LocalVectorIndex(
+                initial_capacity=self.initial_capacity,
+                dimensions=self.dimensions,
+                ann_index=None if self.ann_index is None else self.ann_index.snapshot(),
+                dtype=self.dtype,
+                rescore_factor=self.rescore_factor,
+            )
+
+            index._matrix = self._matrix
+            index._norms = self._norms
+            index._lazy_norms = self._lazy_norms
+            index._scales = self._scales
+            index._source_rows = self._source_rows
+            index._deleted = self._deleted
+            index._keys = self._keys
+            index._metas = self._metas
+            index._rows = self._rows
+            index._size = self._size
+            index.deleted_count = self.deleted_count
+            index.version = self.version
+            index._changes = _Changes()
+
+            # Snapshots that are no longer referenced by any reader stop recording changes.
+            self._views = [view for view in self._views if view() is not None]
+            self._views.append(weakref.ref(index))
+            self._snapshot = index
+
+        return self._snapshot
+
+    def load(
+        self,
+        keys: list[str],
+        matrix: np.ndarray,
+        source_rows: Optional[np.ndarray] = None,
+        metas: Optional[list[Optional[dict]]] = None,
+    ) -> None:
+        """Replaces the contents of the index with `matrix`, whose rows match `keys`.
+
+        A float32 `matrix` is used as is, so a memory-mapped matrix is not read until it is queried and norms are
+        computed lazily. Otherwise, `matrix` is compressed one block at a time.
+
+        Args:
+            keys: Keys of the rows of `matrix`.
+            matrix: Full precision vectors.
+            source_rows: Rows of `matrix` in the full precision source, if any.
+            metas: Metadata of the rows of `matrix`, if any.
+        """
+        self._keys = list(keys)
+        self._metas = [None] * len(keys) if metas is None else list(metas)
+        self._rows = {key: row for row, key in enumerate(self._keys)}
+        self._size = len(self._keys)
+        self._source_rows = (
+            np.full(len(keys), -1, dtype=np.int64)
+            if source_rows is None
+            else np.asarray(source_rows, dtype=np.int64).copy()
+        )
+        self._deleted = np.zeros(len(keys), dtype=bool)
+        self.deleted_count = 0
+        self.version += 1
+
+        if len(matrix):
+            self.dimensions = matrix.shape[1]
+
+        if not self.is_compressed:
+            self._matrix = matrix
+            self._norms = None
+            self._lazy_norms = _LazyNorms(matrix)
+        else:
+            self._matrix = np.empty((len(keys), self.dimensions or 0), dtype=self.DTYPES[self.dtype])
+            self._scales = np.empty(len(keys), dtype=np.float32)
+            self._norms = np.empty(len(keys), dtype=np.float32)
+            self._lazy_norms = None
+
+            for start in range(0, len(keys), 65536):
+                block = np.asarray(matrix[start : start + 65536], dtype=np.float32)
+
+                self._store(slice(start, start + len(block)), block)
+                self._norms[start : start + len(block)] = np.linalg.norm(block, axis=1)
+
+        if self.ann_index is not None:
+            self.ann_index.clear()
+
+    def load_ann_index(
+        self, keys: list[str], centroids: np.ndarray, assignments: np.ndarray, trained_size: int
+    ) -> None:
+        """Restores the clusters of a trained `ann_index` from the cluster assignments of `keys`.
+
+        Rows whose keys are not in `keys` are assigned to their closest cluster.
+        """
+        if self.ann_index is None:
+            return
+
+        row_assignments = np.full(len(self), -1, dtype=np.int32)
+
+        for key, assignment in zip(keys, assignments.tolist()):
+            row = self._rows.get(key)
+
+            if row is not None:
+                row_assignments[row] = assignment
+
+        self.ann_index.load(centroids, row_assignments, trained_size)
+
+        unassigned = np.flatnonzero(row_assignments == -1)
+        self.ann_index.add(unassigned, self.float32_rows(unassigned), self.norms[unassigned])
+        self.version += 1
+
+    def train_ann_index(self) -> bool:
+        """Trains `ann_index` if the index holds enough rows to train it, or to retrain it. Snapshots are not trained.
+
+        Returns:
+            Whether `ann_index` was trained.
+        """
+        if self._changes is not None or self.ann_index is None or not self.ann_index.should_train(len(self)):
+            return False
+
+        self.ann_index.train(self.matrix if not self.is_compressed else _Float32Rows(self), self.norms)
+        self.version += 1
+
+        return True
+
+    def set_source_rows(self, source_rows: np.ndarray) -> None:
+        """Replaces the full precision `source` row of every row, for example after the source was rewritten."""
+        self._source_rows = np.asarray(source_rows, dtype=np.int64).copy()
+        self.version += 1
+
+    def clear(self) -> None:
+        self._matrix = np.empty((0, 0), dtype=np.float32)
+        self._norms = np.empty(0, dtype=np.float32)
+        self._lazy_norms = None
+        self._scales = np.empty(0, dtype=np.float32)
+        self._source_rows = np.empty(0, dtype=np.int64)
+        self._deleted = np.empty(0, dtype=bool)
+        self.deleted_count = 0
+        self.version += 1
+        self._keys = []
+        self._metas = []
+        self._rows = {}
+        self._size = 0
+
+        if self.ann_index is not None:
+            self.ann_index.clear()
+
+    def scores(self, vector: list[float], rows: Optional[np.ndarray] = None) -> np.ndarray:
+        """Computes cosine similarity between `vector` and every row, or only `rows` when provided."""
+        return self._scores(np.asarray(vector, dtype=np.float32)[None], rows)[0]
+
+    def scores_many(self, vectors: list[list[float]] | np.ndarray) -> np.ndarray:
+        """Computes cosine similarity between every vector and every row with a single matrix-matrix product.
+
+        Returns:
+            A matrix with one row of scores per vector.
+        """
+        return self._scores(np.asarray(vectors, dtype=np.float32).reshape(len(vectors), -1))
+
+    def top_k_many(
+        self,
+        vectors: list[list[float]] | np.ndarray,
+        count: Optional[int] = None,
+        nprobe: Optional[int] = None,
+        source: Optional[np.ndarray] = None,
+        rows: Optional[np.ndarray] = None,
+    ) -> list[list[tuple[str, float]]]:
+        """Returns the results of `top_k` for every vector.
+
+        Exact queries are scored together with matrix-matrix products, in blocks of queries that bound the size of the
+        score matrix. Approximate queries are run one at a time since every query scores different rows. When `rows` is
+        provided, queries are exact and only score `rows`. Deleted rows are never returned.
+        """
+        return [
+            [(self._keys[row], score) for row, score in results]
+            for results in self.top_k_rows_many(vectors, count, nprobe=nprobe, source=source, rows=rows)
+        ]
+
+    def top_k_rows_many(
+        self,
+        vectors: list[list[float]] | np.ndarray,
+        count: Optional[int] = None,
+        nprobe: Optional[int] = None,
+        source: Optional[np.ndarray] = None,
+        rows: Optional[np.ndarray] = None,
+    ) -> list[list[tuple[int, float]]]:
+        """Returns the results of `top_k_many` with rows instead of keys."""
+        if rows is not None:
+            rows = self._live(rows)
+        elif self.ann_index is not None and (
+            self.ann_index.is_trained or (self._changes is None and self.ann_index.should_train(len(self)))
+        ):
+            return [self.top_k_rows(vector, count, nprobe=nprobe, source=source) for vector in vectors]
+
+        size = len(self) if rows is None else len(rows)
+        block_size = max(1, self.SCORE_BLOCK_SIZE // max(size, 1))
+        results = []
+
+        for start in range(0, len(vectors), block_size):
+            block = vectors[start : start + block_size]
+            queries = np.asarray(block, dtype=np.float32).reshape(len(block), -1)
+
+            for vector, scores in zip(block, self._scores(queries, rows)):
+                results.append(self._select(vector, scores, rows, count, source))
+
+        return results
+
+    def top_k(
+        self,
+        vector: list[float],
+        count: Optional[int] = None,
+        rows: Optional[np.ndarray] = None,
+        nprobe: Optional[int] = None,
+        source: Optional[np.ndarray] = None,
+    ) -> list[tuple[str, float]]:
+        """Returns up to `count` keys and their scores, ordered from most to least similar.
+
+        When `rows` is not provided and `ann_index` is set, the search is approximate once `ann_index` is trained and
+        only scores the rows of the `nprobe` closest clusters. When vectors are compressed, `source` is the full
+        precision matrix used to rescore the best candidates. Deleted rows are never returned.
+        """
+        return [
+            (self._keys[row], score)
+            for row, score in self.top_k_rows(vector, count, rows, nprobe=nprobe, source=source)
+        ]
+
+    def top_k_rows(
+        self,
+        vector: list[float],
+        count: Optional[int] = None,
+        rows: Optional[np.ndarray] = None,
+        nprobe: Optional[int] = None,
+        source: Optional[np.ndarray] = None,
+    ) -> list[tuple[int, float]]:
+        """Returns the results of `top_k` with rows instead of keys."""
+        if rows is None and self.ann_index is not None:
+            self.train_ann_index()
+
+            if self.ann_index.is_trained:
+                rows = self.ann_index.candidates(vector, nprobe)
+
+        if rows is not None:
+            rows = self._live(rows)
+
+        return self._select(vector, self.scores(vector, rows), rows, count, source)
+
+    @staticmethod
+    def top_k_positions(scores: np.ndarray, count: Optional[int] = None) -> np.ndarray:
+        """Returns the positions of the `count` highest scores in descending order without fully sorting `scores`."""
+        if count is not None and count < len(scores):
+            if count <= 0:
+                return np.empty(0, dtype=np.int64)
+
+            candidates = np.argpartition(-scores, count - 1)[:count]
+
+            return candidates[np.argsort(-scores[candidates], kind="stable")]
+        else:
+            return np.argsort(-scores, kind="stable")
+
+    def _select(
+        self,
+        vector: list[float],
+        scores: np.ndarray,
+        rows: Optional[np.ndarray],
+        count: Optional[int],
+        source: Optional[np.ndarray],
+    ) -> list[tuple[int, float]]:
+        rescore = self.is_compressed and self.rescore_factor and source is not None and count is not None
+        limit = count * self.rescore_factor if rescore else count
+
+        if rows is None and self.deleted_count:
+            # Deleted rows are scored along with the others and then sorted last, which is cheaper than skipping them.
+            scores = np.where(self.deleted, -np.inf, scores)
+            limit = len(self) - self.deleted_count if limit is None else min(limit, len(self) - self.deleted_count)
+
+        positions = self.top_k_positions(scores, limit)
+        candidates = positions if rows is None else rows[positions]
+        candidate_scores = scores[positions]
+
+        if rescore:
+            # Candidates with a full precision source row are rescored exactly, the others keep their compressed score.
+            source_rows = self._read("_source_rows", candidates)
+            exact = (source_rows >= 0) & (source_rows < len(source))
+
+            if exact.any():
+                query = np.asarray(vector, dtype=np.float32)
+                denominators = self._read("_norms", candidates[exact]) * np.linalg.norm(query)
+                candidate_scores = candidate_scores.copy()
+                candidate_scores[exact] = np.divide(
+                    np.asarray(source[source_rows[exact]], dtype=np.float32) @ query,
+                    denominators,
+                    out=np.zeros(len(denominators), dtype=np.float32),
+                    where=denominators != 0,
+                )
+
+            order = self.top_k_positions(candidate_scores, count)
+            candidates = candidates[order]
+            candidate_scores = candidate_scores[order]
+
+        return [(r, float(score)) for r, score in zip(candidates.tolist(), candidate_scores.tolist())]
+
+    def _live(self, rows: np.ndarray) -> np.ndarray:
+        return rows[~self._read("_deleted", rows)] if self.deleted_count else rows
+
+    def _scores(self, queries: np.ndarray, rows: Optional[np.ndarray] = None) -> np.ndarray:
+        size = len(self) if rows is None else len(rows)
+
+        if size == 0:
+            return np.empty((len(queries), 0), dtype=np.float32)
+
+        norms = self._read("_norms", slice(0, size) if rows is None else rows)
+        denominators = np.linalg.norm(queries, axis=1)[:, None] * norms[None, :]
+
+        return np.divide(
+            self._products(queries, rows),
+            denominators,
+            out=np.zeros(denominators.shape, dtype=np.float32),
+            where=denominators != 0,
+        )
+
+    def _products(self, queries: np.ndarray, rows: Optional[np.ndarray] = None) -> np.ndarray:
+        size = len(self) if rows is None else len(rows)
+
+        if not self.is_compressed:
+            products = queries @ (self._matrix[:size] if rows is None else self._matrix[rows]).T
+        else:
+            products = self._compressed_products(queries, rows, size)
+
+        if self._changes is not None:
+            # Snapshots score the rows that were overwritten after they were taken again, with their previous vectors.
+            positions, changes = self._changed("_matrix", slice(0, size) if rows is None else rows)
+
+            if len(positions):
+                vectors = np.array([change["_matrix"] for change in changes], dtype=np.float32)
+
+                if self.dtype == "int8":
+                    vectors *= np.array([change["_scales"] for change in changes], dtype=np.float32)[:, None]
+
+                products[:, positions] = queries @ vectors.T
+
+        return products
+
+    def _compressed_products(self, queries: np.ndarray, rows: Optional[np.ndarray], size: int) -> np.ndarray:
+        products = np.empty((len(queries), size), dtype=np.float32)
+        block_size = max(1, 2**18 // max(self.dimensions or 1, 1))
+
+        # Compressed rows are converted to float32 one block at a time to bound memory use.
+        for start in range(0, size, block_size):
+            block_rows = (
+                slice(start, min(start + block_size, size)) if rows is None else rows[start : start + block_size]
+            )
+            block = np.asarray(self._matrix[block_rows], dtype=np.float32)
+            products[:, start : start + len(block)] = queries @ block.T
+
+            if self.dtype == "int8":
+                products[:, start : start + len(block)] *= self._scales[block_rows]
+
+        return products
+
+    def _store(self, rows: int | slice, vectors: np.ndarray) -> None:
+        if isinstance(rows, (int, np.integer)):
+            rows = slice(rows, rows + 1)
+
+        if self.dtype == "int8":
+            scales = np.abs(vectors).max(axis=1) / 127
+            scales[scales == 0] = 1
+            self._matrix[rows] = np.rint(vectors / scales[:, None]).astype(np.int8)
+            self._scales[rows] = scales
+        else:
+            self._matrix[rows] = vectors
+
+    def _ensure_norms(self) -> np.ndarray:
+        if self._norms is None:
+            # Lazy norms are shared with snapshots, so whichever reads them first computes them for the others.
+            if self._lazy_norms is None:
+                self._lazy_norms = _LazyNorms(self._matrix)
+
+            self._norms = self._lazy_norms.get()
+
+        return self._norms
+
+    def _reserve(self, size: int) -> None:
+        capacity = len(self._matrix)
+
+        if size <= capacity:
+            return
+
+        new_capacity = max(size, capacity * 2, self.initial_capacity)
+        matrix = np.empty((new_capacity, self.dimensions), dtype=self.DTYPES[self.dtype])
+        norms = np.empty(new_capacity, dtype=np.float32)
+        scales = np.empty(new_capacity if self.dtype == "int8" else 0, dtype=np.float32)
+        source_rows = np.full(new_capacity, -1, dtype=np.int64)
+        deleted = np.zeros(new_capacity, dtype=bool)
+
+        if capacity:
+            matrix[:capacity] = self._matrix
+            norms[:capacity] = self._ensure_norms()
+            scales[: len(self._scales)] = self._scales
+            source_rows[: len(self._source_rows)] = self._source_rows
+            deleted[: len(self._deleted)] = self._deleted
+
+        self._matrix = matrix
+        self._norms = norms
+        self._scales = scales
+        self._source_rows = source_rows
+        self._deleted = deleted
+
+    def _preserve(self, row: int, *names: str, key: Optional[str] = None) -> None:
+        # Snapshots that can read `row` from an array of the index record its previous value before it is modified in
+        # place. The values of a row are recorded with a single update, so readers never see part of a change.
+        for ref in self._views:
+            view = ref()
+
+            if view is None or view._changes is None or row >= view._size:
+                continue
+
+            changes = view._changes.rows.get(row)
+            values = {
+                name: np.array(getattr(self, name)[row]) if name == "_matrix" else getattr(self, name)[row]
+                for name in names
+                if (changes is None or name not in changes) and view._shared_array(name) is getattr(self, name)
+            }
+
+            if changes is not None:
+                changes.update(values)
+            elif values:
+                view._changes.rows[row] = values
+
+            if key is not None and view._rows is self._rows:
+                view._changes.keys.setdefault(key, row)
+
+    def _row_arrays(self) -> tuple[str, ...]:
+        # The arrays that an overwrite modifies. Scales are only stored for int8 rows.
+        names = ("_matrix", "_norms", "_source_rows", "_metas")
+
+        return names + ("_scales",) if self.dtype == "int8" else names
+
+    def _shared_array(self, name: str) -> Any:
+        if name == "_norms" and self._norms is None and self._lazy_norms is not None:
+            return self._lazy_norms.values
+        else:
+            return getattr(self, name)
+
+    def _read(self, name: str, rows: np.ndarray | slice) -> Any:
+        # Snapshots read the shared array before the changes, so that a row that the index modifies in between is
+        # already recorded when the changes are read, and is replaced with its previous value.
+        values = (self._ensure_norms() if name == "_norms" else getattr(self, name))[rows]
+
+        if self._changes is None:
+            return values
+
+        values = values.copy()
+        positions, changes = self._changed(name, rows)
+
+        for position, change in zip(positions.tolist(), changes):
+            values[position] = change[name]
+
+        return values
+
+    def _read_at(self, name: str, row: int) -> Any:
+        value = getattr(self, name)[row]
+
+        return value if self._changes is None else self._changes.rows.get(row, {}).get(name, value)
+
+    def _changed(self, name: str, rows: np.ndarray | slice) -> tuple[np.ndarray, list[dict[str, Any]]]:
+        # Returns the positions in `rows` of the rows whose value in `name` changed after the snapshot, and the
+        # previous values of those rows.
+        changes = {} if self._changes is None else self._changes.rows.copy()
+        changes = {row: change for row, change in changes.items() if name in change}
+        changed = np.fromiter(changes, dtype=np.int64, count=len(changes))
+
+        if isinstance(rows, slice):
+            changed = changed[(changed >= rows.start) & (changed < rows.stop)]
+            positions = changed - rows.start
+        else:
+            positions = np.flatnonzero(np.isin(rows, changed))
+            changed = rows[positions]
+
+        return positions, [changes[row] for row in changed.tolist()]
+
+
+class _Changes:
+    """The previous values of the rows of a snapshot that its index modified in place after the snapshot was taken."""
+
+    def __init__(self) -> None:
+        self.rows: dict[int, dict[str, Any]] = {}
+        self.keys: dict[str, int] = {}
+
+
+class _LazyNorms:
+    """The norms of the rows of a matrix, computed the first time they are read by an index or by one of its snapshots."""
+
+    def __init__(self, matrix: np.ndarray) -> None:
+        self.matrix = matrix
+        self.values: Optional[np.ndarray] = None
+
+    def get(self) -> np.ndarray:
+        values = self.values
+
+        if values is None:
+            values = self.values = np.linalg.norm(self.matrix, axis=1).astype(np.float32)
+
+        return values
+
+
+class _Float32Rows:
+    """Reads the rows of a compressed `LocalVectorIndex` as float32 on demand, for training approximate indexes."""
+
+    def __init__(self, index: LocalVectorIndex) -> None:
+        self.index = index
+
+    def __len__(self) -> int:
+        return len(self.index)
+
+    def __getitem__(self, rows: np.ndarray | slice) -> np.ndarray:
+        if isinstance(rows, slice):
+            rows = slice(*rows.indices(len(self.index)))
+
+        return self.index.float32_rows(rows)
@@ -0,0 +1,335 @@
+from __future__ import annotations
+import json
+import os
+from typing import Any, Hashable, Iterable, Optional
+import numpy as np
+from attrs import define, field
+
+
+@define
+class LocalVectorLog:
+    """Append-only on-disk storage for vectors and their entries.
+
+    Vectors are appended as float32 rows to a `.npy` file that can be memory-mapped on load, and entries are appended as
+    JSON lines that reference their vector row. Upserting an existing key appends a new record, so the latest record for
+    a key wins and older rows become garbage until the log is compacted. Dropping a namespace appends a single record
+    that discards every earlier record in that namespace, and deleting a key appends a record that discards the earlier
+    records of that key.
+
+    Compaction is split into `write_compaction()`, which writes the compacted files next to the log and can run while
+    records are appended, and `finish_compaction()`, which carries over the records appended in the meantime and replaces
+    the log.
+
+    Attributes:
+        directory: Directory holding the log files.
+        entries_file_name: Name of the JSON lines file that holds entries.
+        vectors_file_name: Name of the `.npy` file that holds vectors.
+        ann_index_file_name: Name of the `.npz` file that holds the clusters of approximate nearest neighbor indexes.
+    """
+
+    HEADER_SIZE = 128
+
+    directory: str = field(kw_only=True)
+    entries_file_name: str = field(default="entries.jsonl", kw_only=True)
+    vectors_file_name: str = field(default="vectors.npy", kw_only=True)
+    ann_index_file_name: str = field(default="ann_index.npz", kw_only=True)
+    record_count: int = field(default=0, init=False)
+    row_count: int = field(default=0, init=False)
+    dimensions: Optional[int] = field(default=None, init=False)
+    _vectors: Optional[np.ndarray] = field(default=None, init=False, eq=False)
+
+    @property
+    def entries_path(self) -> str:
+        return os.path.join(self.directory, self.entries_file_name)
+
+    @property
+    def vectors_path(self) -> str:
+        return os.path.join(self.directory, self.vectors_file_name)
+
+    @property
+    def ann_index_path(self) -> str:
+        return os.path.join(self.directory, self.ann_index_file_name)
+
+    def load(self) -> tuple[dict[Hashable, dict[str, Any]], np.ndarray]:
+        """Loads the latest record for every key and the vectors they reference.
+
+        Keys are strings or lists, which are compared as tuples.
+
+        Returns:
+            Records keyed by entry key, in insertion order, and a matrix whose rows match the order of the records. The
+            matrix is memory-mapped when the log is compact.
+        """
+        os.makedirs(self.directory, exist_ok=True)
+
+        vectors = self._load_vectors()
+        records = {}
+        drops = {}
+        self.record_count = 0
+
+        if os.path.isfile(self.entries_path):
+            with open(self.entries_path) as file:
+                for line in file:
+                    try:
+                        record = json.loads(line)
+                    except json.JSONDecodeError:
+                        # A partially written trailing line from an interrupted append.
+                        continue
+
+                    if "drop_namespace" in record:
+                        self.record_count += 1
+                        drops[record["drop_namespace"]] = record["row"]
+                    elif "delete" in record:
+                        self.record_count += 1
+                        records.pop(self._key(record["delete"]), None)
+                    elif record["row"] < len(vectors):
+                        self.record_count += 1
+                        key = self._key(record["key"])
+                        records.pop(key, None)
+                        records[key] = record
+
+        if drops:
+            # Rows only grow, so a drop discards the records of its namespace whose rows were appended before it.
+            records = {k: r for k, r in records.items() if r["row"] >= drops.get(r.get("namespace"), -1)}
+
+        rows = np.fromiter((r["row"] for r in records.values()), dtype=np.int64, count=len(records))
+
+        if np.array_equal(rows, np.arange(len(vectors))):
+            return records, vectors
+        else:
+            return records, np.ascontiguousarray(vectors[rows])
+
+    def append(self, records: list[dict[str, Any]], vectors: list[list[float]]) -> None:
+        """Appends vectors to the vector file and then their records to the entries file.
+
+        Args:
+            records: Records to append. Each record is assigned the `row` of its vector.
+            vectors: Vectors matching `records`.
+        """
+        if not records:
+            return
+
+        matrix = np.asarray(vectors, dtype=np.float32)
+
+        if self.dimensions is None:
+            self.dimensions = matrix.shape[1]
+        elif matrix.shape[1] != self.dimensions:
+            raise ValueError(f"Expected vectors with {self.dimensions} dimensions, got {matrix.shape[1]}.")
+
+        for i, record in enumerate(records):
+            record["row"] = self.row_count + i
+
+        mode = "r+b" if os.path.isfile(self.vectors_path) else "w+b"
+
+        with open(self.vectors_path, mode) as file:
+            file.seek(self.HEADER_SIZE + self.row_count * self.dimensions * 4)
+            file.write(matrix.tobytes())
+            file.seek(0)
+            file.write(self._header(self.row_count + len(matrix)))
+
+        self.row_count += len(matrix)
+
+        with open(self.entries_path, "a") as file:
+            file.writelines(json.dumps(record) + "\n" for record in records)
+
+        self.record_count += len(records)
+
+    def append_drop(self, namespace: Optional[str]) -> None:
+        """Appends a record that drops every earlier record whose `namespace` matches."""
+        with open(self.entries_path, "a") as file:
+            file.write(json.dumps({"drop_namespace": namespace, "row": self.row_count}) + "\n")
+
+        self.record_count += 1
+
+    def append_delete(self, keys: list[Any]) -> None:
+        """Appends a record for every key in `keys` that discards the earlier records of that key."""
+        with open(self.entries_path, "a") as file:
+            file.writelines(json.dumps({"delete": key}) + "\n" for key in keys)
+
+        self.record_count += len(keys)
+
+    def position(self) -> tuple[int, int]:
+        """Returns the size of the entries file and the number of rows, which mark the end of the log."""
+        size = os.path.getsize(self.entries_path) if os.path.isfile(self.entries_path) else 0
+
+        return size, self.row_count
+
+    def compact(self, records: list[dict[str, Any]], vectors: np.ndarray | Iterable[np.ndarray]) -> None:
+        """Atomically rewrites the log so that it only holds `records` and their `vectors`.
+
+        Args:
+            records: Records to keep. Each record is assigned the `row` of its vector.
+            vectors: Vectors matching `records`, as a matrix or as blocks of rows that are written one at a time.
+        """
+        self.finish_compaction(self.position(), self.write_compaction(records, vectors))
+
+    def write_compaction(self, records: list[dict[str, Any]], vectors: np.ndarray | Iterable[np.ndarray]) -> int:
+        """Writes `records` and their `vectors` to temporary files without modifying the log.
+
+        Args:
+            records: Records to keep. Each record is assigned the `row` of its vector.
+            vectors: Vectors matching `records`, as a matrix or as blocks of rows that are written one at a time.
+
+        Returns:
+            The number of rows written.
+        """
+        blocks = [vectors] if isinstance(vectors, np.ndarray) else vectors
+        dimensions = self.dimensions
+        row_count = 0
+
+        with open(f"{self.vectors_path}.tmp", "wb") as file:
+            file.write(self._header(len(records), dimensions))
+
+            for block in blocks:
+                if len(block):
+                    dimensions = block.shape[1]
+                    row_count += len(block)
+
+                    file.write(np.ascontiguousarray(block, dtype=np.float32).tobytes())
+
+            if row_count != len(records):
+                raise ValueError(f"Expected {len(records)} vectors, got {row_count}.")
+
+            # The header is rewritten in case the dimensions were only known once the first block was read.
+            file.seek(0)
+            file.write(self._header(len(records), dimensions))
+
+        with open(f"{self.entries_path}.tmp", "w") as file:
+            file.writelines(json.dumps(record | {"row": row}) + "\n" for row, record in enumerate(records))
+
+        if self.dimensions is None:
+            self.dimensions = dimensions
+
+        return row_count
+
+    def finish_compaction(self, position: tuple[int, int], row_count: int) -> None:
+        """Replaces the log with the files written by `write_compaction()`.
+
+        Records and vectors appended after `position` are copied after the compacted ones, and their rows are shifted
+        accordingly. Rows before `position` that were compacted are renumbered by the caller.
+
+        Args:
+            position: The `position()` of the log when the compacted records were read.
+            row_count: The number of rows returned by `write_compaction()`.
+        """
+        entries_size, position_row_count = position
+        vectors_path = f"{self.vectors_path}.tmp"
+        record_count = row_count
+
+        if self.row_count > position_row_count:
+            with open(self.vectors_path, "rb") as source, open(vectors_path, "r+b") as file:
+                source.seek(self.HEADER_SIZE + position_row_count * self.dimensions * 4)
+                file.seek(self.HEADER_SIZE + row_count * self.dimensions * 4)
+                file.write(source.read())
+
+        if os.path.isfile(self.entries_path):
+            with open(self.entries_path) as source, open(f"{self.entries_path}.tmp", "a") as file:
+                source.seek(entries_size)
+
+                for line in source:
+                    try:
+                        record = json.loads(line)
+                    except json.JSONDecodeError:
+                        continue
+
+                    if "row" in record:
+                        record["row"] += row_count - position_row_count
+
+                    record_count += 1
+                    file.write(json.dumps(record) + "\n")
+
+        row_count += self.row_count - position_row_count
+
+        with open(vectors_path, "r+b") as file:
+            file.write(self._header(row_count))
+
+        os.replace(vectors_path, self.vectors_path)
+        os.replace(f"{self.entries_path}.tmp", self.entries_path)
+
+        self.record_count = record_count
+        self.row_count = row_count
+        self._vectors = None
+
+    def vectors(self) -> np.ndarray:
+        """Returns a read-only memory map of every vector in the vector file, including superseded ones."""
+        if self.row_count == 0:
+            return np.empty((0, self.dimensions or 0), dtype=np.float32)
+
+        if self._vectors is None or len(self._vectors) != self.row_count:
+            self._vectors = np.memmap(
+                self.vectors_path,
+                dtype=np.float32,
+                mode="r",
+                offset=self.HEADER_SIZE,
+                shape=(self.row_count, self.dimensions),
+            )
+
+        return self._vectors
+
+    def save_ann_indexes(self, states: dict[Optional[str], tuple[list[str], np.ndarray, np.ndarray, int]]) -> None:
+        """Atomically rewrites the approximate nearest neighbor index file.
+
+        Args:
+            states: Keys, centroids, cluster assignments of the keys, and training size of every trained index, keyed by
+                namespace. Assignments are stored by key so that they remain valid when the log is compacted.
+        """
+        metadata = [
+            {"namespace": namespace, "keys": keys, "trained_size": trained_size}
+            for namespace, (keys, _, _, trained_size) in states.items()
+        ]
+        arrays = {}
+
+        for i, (_, centroids, assignments, _) in enumerate(states.values()):
+            arrays[f"centroids_{i}"] = centroids
+            arrays[f"assignments_{i}"] = assignments
+
+        path = f"{self.ann_index_path}.tmp"
+
+        with open(path, "wb") as file:
+            np.savez(file, metadata=np.array(json.dumps(metadata)), **arrays)
+
+        os.replace(path, self.ann_index_path)
+
+    def load_ann_indexes(self) -> dict[Optional[str], tuple[list[str], np.ndarray, np.ndarray, int]]:
+        """Loads the states saved by `save_ann_indexes`, or an empty dictionary if there are none."""
+        if not os.path.isfile(self.ann_index_path):
+            return {}
+
+        with np.load(self.ann_index_path) as data:
+            return {
+                state["namespace"]: (
+                    state["keys"],
+                    data[f"centroids_{i}"],
+                    data[f"assignments_{i}"],
+                    state["trained_size"],
+                )
+                for i, state in enumerate(json.loads(str(data["metadata"])))
+            }
+
+    def _load_vectors(self) -> np.ndarray:
+        if not os.path.isfile(self.vectors_path):
+            self.row_count = 0
+
+            return np.empty((0, 0), dtype=np.float32)
+
+        with open(self.vectors_path, "rb") as file:
+            np.lib.format.read_magic(file)
+            shape, _, _ = np.lib.format.read_array_header_1_0(file)
+
+        self.row_count, self.dimensions = shape
+
+        if self.row_count == 0:
+            return np.empty(shape, dtype=np.float32)
+        else:
+            return np.load(self.vectors_path, mmap_mode="r")
+
+    def _key(self, key: str | list) -> Hashable:
+        return tuple(key) if isinstance(key, list) else key
+
+    def _header(self, rows: int, dimensions: Optional[int] = None) -> bytes:
+        # The header is padded to a fixed size so the shape can be rewritten in place as rows are appended.
+        magic = np.lib.format.magic(1, 0)
+        shape = (rows, self.dimensions if dimensions is None else dimensions)
+        text = repr({"descr": "<f4", "fortran_order": False, "shape": shape})
+        header_length = self.HEADER_SIZE - len(magic) - 2
+
+        return magic + header_length.to_bytes(2, "little") + text.ljust(header_length - 1).encode("latin1") + b"\n"
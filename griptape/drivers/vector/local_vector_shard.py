@@ -0,0 +1,269 @@
+from __future__ import annotations
+import os
+import threading
+import uuid
+from typing import Optional
+import numpy as np
+from attrs import define, field
+from griptape.drivers.vector.local_vector_index import LocalVectorIndex
+
+# Memory maps of the shard files opened by this process, keyed by shard path, with the shard uid and generation they
+# map. A new shard at the same path, such as one created by another driver, has a different uid and is mapped again.
+_maps: dict[str, tuple[tuple[str, int], tuple[np.ndarray, np.ndarray, np.ndarray]]] = {}
+_maps_lock = threading.Lock()
+
+
+@define
+class LocalVectorShard:
+    """A block of float32 vectors in memory-mapped files that worker processes score without copying them.
+
+    The shard is made of three `.npy` files: the vectors, their precomputed norms, and a label per row that holds the
+    namespace code of the row, or `DELETED`. Files are allocated with spare capacity so that appends write in place,
+    and are reallocated under a new `generation` when full. `view()` describes the current files and size, and can be
+    sent to another process to score the shard with `LocalVectorShardView.top_k_many()`. Every view holds a lease on
+    the files of its generation, which are only removed once the shard has moved to a newer generation and every view
+    of them has been passed to `release()`. File names include a `uid` unique to the shard, so shards that share a
+    directory and name, or that a process mapped before, never read each other's files.
+
+    Attributes:
+        directory: Directory of the shard files. Files in a shared memory directory such as `/dev/shm` are never written
+            to disk.
+        name: Prefix of the shard file names.
+        initial_capacity: Number of rows to allocate the first time vectors are appended. Capacity doubles when full.
+    """
+
+    DELETED = -1
+
+    directory: str = field(kw_only=True)
+    name: str = field(kw_only=True)
+    initial_capacity: int = field(default=1024, kw_only=True)
+    dimensions: Optional[int] = field(default=None, init=False)
+    size: int = field(default=0, init=False)
+    generation: int = field(default=0, init=False)
+    uid: str = field(factory=lambda: uuid.uuid4().hex, init=False)
+    _matrix: Optional[np.ndarray] = field(default=None, init=False, eq=False)
+    _norms: Optional[np.ndarray] = field(default=None, init=False, eq=False)
+    _labels: Optional[np.ndarray] = field(default=None, init=False, eq=False)
+    _leases: dict[int, int] = field(factory=dict, init=False)
+    _retired: set[int] = field(factory=set, init=False)
+
+    @property
+    def path(self) -> str:
+        return os.path.join(self.directory, self.name)
+
+    @property
+    def is_leased(self) -> bool:
+        """Whether views of any generation of the shard files have not been released yet."""
+        return bool(self._leases)
+
+    def append(self, vectors: np.ndarray, labels: np.ndarray) -> np.ndarray:
+        """Appends `vectors` with their namespace `labels` and returns their rows."""
+        matrix = self._validate(vectors)
+        rows = np.arange(self.size, self.size + len(matrix))
+
+        self._reserve(self.size + len(matrix))
+        self.write(rows, matrix, labels)
+        self.size += len(matrix)
+
+        return rows
+
+    def write(self, rows: np.ndarray, vectors: np.ndarray, labels: np.ndarray) -> None:
+        """Overwrites the vectors and namespace `labels` of `rows`."""
+        matrix = self._validate(vectors)
+
+        if self._matrix is None or self._norms is None or self._labels is None:
+            raise ValueError("Rows must be appended before they can be written.")
+
+        self._matrix[rows] = matrix
+        self._norms[rows] = np.linalg.norm(matrix, axis=1)
+        self._labels[rows] = labels
+
+    def delete(self, rows: np.ndarray) -> None:
+        """Labels `rows` as deleted so that queries skip them. Deleted rows keep their place until they are written again."""
+        if self._labels is not None:
+            self._labels[rows] = self.DELETED
+
+    def vector(self, row: int) -> list[float]:
+        if self._matrix is None:
+            raise ValueError("The shard is empty.")
+
+        return self._matrix[row].tolist()
+
+    def view(self) -> LocalVectorShardView:
+        """Returns the current files and size of the shard. The files are kept until the view is passed to `release()`."""
+        self._leases[self.generation] = self._leases.get(self.generation, 0) + 1
+
+        return LocalVectorShardView(path=self.path, uid=self.uid, generation=self.generation, size=self.size)
+
+    def release(self, view: LocalVectorShardView) -> None:
+        """Releases the lease of `view`, removing its files if it was the last view of a previous generation."""
+        leases = self._leases.get(view.generation, 0) - 1
+
+        if leases > 0:
+            self._leases[view.generation] = leases
+        else:
+            self._leases.pop(view.generation, None)
+
+            if view.generation in self._retired:
+                self._retired.discard(view.generation)
+                self._remove_files(view.generation)
+
+    def close(self) -> None:
+        """Removes the shard files, including the files of previous generations that views still hold."""
+        if self._matrix is not None:
+            self._remove_files(self.generation)
+
+        for generation in self._retired:
+            self._remove_files(generation)
+
+        self._leases = {}
+        self._retired = set()
+        self._matrix = None
+        self._norms = None
+        self._labels = None
+        self.size = 0
+
+    def _validate(self, vectors: np.ndarray) -> np.ndarray:
+        matrix = np.asarray(vectors, dtype=np.float32).reshape(len(vectors), -1)
+
+        if self.dimensions is None:
+            self.dimensions = matrix.shape[1]
+        elif matrix.shape[1] != self.dimensions:
+            raise ValueError(f"Expected vectors with {self.dimensions} dimensions, got {matrix.shape[1]}.")
+
+        return matrix
+
+    def _reserve(self, size: int) -> None:
+        capacity = 0 if self._matrix is None else len(self._matrix)
+
+        if size <= capacity:
+            return
+
+        new_capacity = max(size, capacity * 2, self.initial_capacity)
+        generation = self.generation + (1 if self._matrix is not None else 0)
+        paths = LocalVectorShardView.file_paths(self.path, self.uid, generation)
+        matrix = np.lib.format.open_memmap(paths[0], mode="w+", dtype=np.float32, shape=(new_capacity, self.dimensions))
+        norms = np.lib.format.open_memmap(paths[1], mode="w+", dtype=np.float32, shape=(new_capacity,))
+        labels = np.lib.format.open_memmap(paths[2], mode="w+", dtype=np.int32, shape=(new_capacity,))
+        labels[:] = self.DELETED
+
+        if self._matrix is not None and self._norms is not None and self._labels is not None:
+            matrix[: self.size] = self._matrix[: self.size]
+            norms[: self.size] = self._norms[: self.size]
+            labels[: self.size] = self._labels[: self.size]
+
+            # Views of the previous files may still be scored, so the files are only removed once they are released.
+            if self._leases.get(self.generation):
+                self._retired.add(self.generation)
+            else:
+                self._remove_files(self.generation)
+
+        self._matrix = matrix
+        self._norms = norms
+        self._labels = labels
+        self.generation = generation
+
+    def _remove_files(self, generation: int) -> None:
+        for path in LocalVectorShardView.file_paths(self.path, self.uid, generation):
+            if os.path.isfile(path):
+                os.remove(path)
+
+
+@define(frozen=True)
+class LocalVectorShardView:
+    """The files and size of a `LocalVectorShard` at one point in time, sent to worker processes to score the shard.
+
+    Workers memory-map the files of a shard once and reuse the mapping until the shard moves to a new generation.
+
+    Attributes:
+        path: Path prefix of the shard files.
+        uid: Unique identifier of the shard that the files belong to.
+        generation: Generation of the shard files.
+        size: Number of rows to score.
+    """
+
+    path: str = field(kw_only=True)
+    uid: str = field(kw_only=True)
+    generation: int = field(kw_only=True)
+    size: int = field(kw_only=True)
+
+    @staticmethod
+    def file_paths(path: str, uid: str, generation: int) -> tuple[str, str, str]:
+        prefix = f"{path}-{uid}-{generation}"
+
+        return (f"{prefix}.vectors.npy", f"{prefix}.norms.npy", f"{prefix}.labels.npy")
+
+    def top_k_many(
+        self,
+        vectors: np.ndarray,
+        count: Optional[int] = None,
+        label: Optional[int] = None,
+        rows: Optional[np.ndarray] = None,
+    ) -> list[list[tuple[int, float]]]:
+        """Returns the rows of the shard most similar to every vector and their cosine similarity, best first.
+
+        Args:
+            vectors: Query vectors, one per row.
+            count: Maximum number of rows to return per query.
+            label: Namespace code of the rows to score. Defaults to every row that is not deleted.
+            rows: Rows to score instead of every row.
+        """
+        if self.size == 0:
+            return [[] for _ in vectors]
+
+        matrix, norms, labels = self._open()
+        excluded = None
+
+        if rows is None:
+            # Every row is scored and rows of other namespaces are sorted last, which avoids copying the matrix.
+            matrix = matrix[: self.size]
+            norms = norms[: self.size]
+            matches = labels[: self.size] >= 0 if label is None else labels[: self.size] == label
+            excluded = None if matches.all() else ~matches
+            limit = int(matches.sum()) if count is None else min(count, int(matches.sum()))
+        else:
+            rows = rows[rows < self.size]
+            rows = rows[labels[rows] >= 0 if label is None else labels[rows] == label]
+            matrix = matrix[rows]
+            norms = norms[rows]
+            limit = count
+
+        block_size = max(1, LocalVectorIndex.SCORE_BLOCK_SIZE // max(len(matrix), 1))
+        queries = np.asarray(vectors, dtype=np.float32).reshape(len(vectors), -1)
+        results = []
+
+        for start in range(0, len(queries), block_size):
+            block = queries[start : start + block_size]
+            denominators = np.linalg.norm(block, axis=1)[:, None] * norms[None, :]
+            scores = np.divide(
+                block @ matrix.T,
+                denominators,
+                out=np.zeros(denominators.shape, dtype=np.float32),
+                where=denominators != 0,
+            )
+
+            if excluded is not None:
+                scores[:, excluded] = -np.inf
+
+            for query_scores in scores:
+                positions = LocalVectorIndex.top_k_positions(query_scores, limit)
+                candidates = positions if rows is None else rows[positions]
+
+                results.append(list(zip(candidates.tolist(), query_scores[positions].tolist())))
+
+        return results
+
+    def _open(self) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        with _maps_lock:
+            identity, maps = _maps.get(self.path, (None, None))
+
+            if identity != (self.uid, self.generation) or maps is None:
+                paths = self.file_paths(self.path, self.uid, self.generation)
+                maps = (
+                    np.load(paths[0], mmap_mode="r"),
+                    np.load(paths[1], mmap_mode="r"),
+                    np.load(paths[2], mmap_mode="r"),
+                )
+                _maps[self.path] = ((self.uid, self.generation), maps)
+
+            return maps
@@ -1,23 +1,114 @@
+from __future__ import annotations
+import dataclasses
 import json
 import os
 import threading
+from concurrent import futures
 from dataclasses import asdict
-from typing import Optional, Callable, TextIO
+from typing import Iterator, Optional, Callable, TextIO
+import numpy as np
 from attrs import define, field, Factory
-from numpy import dot
-from numpy.linalg import norm
 from griptape import utils
 from griptape.drivers import BaseVectorStoreDriver
+from griptape.drivers.vector.local_ivf_index import LocalIvfIndex
+from griptape.drivers.vector.local_metadata_index import LocalMetadataIndex
+from griptape.drivers.vector.local_vector_index import LocalVectorIndex
+from griptape.drivers.vector.local_vector_log import LocalVectorLog
+
+
+@define(frozen=True)
+class _LocalSnapshot:
+    """An immutable view of every namespace of a `LocalVectorStoreDriver` that readers query without the lock."""
+
+    partitions: dict[Optional[str], tuple[LocalVectorIndex, LocalMetadataIndex]] = field(factory=dict)
+    source: Optional[np.ndarray] = field(default=None)
 
 
 @define(kw_only=True)
 class LocalVectorStoreDriver(BaseVectorStoreDriver):
-    entries: dict[str, BaseVectorStoreDriver.Entry] = field(factory=dict)
+    """A Vector Store Driver that keeps vectors in memory, optionally persisting them to disk.
+
+    Every namespace is a partition with its own contiguous float32 vector matrix and precomputed norms, so a namespaced
+    query is scored with a single matrix-vector product over that namespace only, and dropping a namespace discards its
+    partition. Partitions hold the IDs and metadata of their rows next to the matrix, and vectors are read from the
+    matrix when entries are loaded.
+
+    Reads do not take the lock. Every write ends by publishing an immutable snapshot of the partitions, which readers pick
+    up with a single reference read, so queries and loads run concurrently with writes and always see whole batches.
+    Snapshots share the arrays of the partitions: appended rows are written past the rows of published snapshots, and
+    an overwrite or a delete only copies the previous values of the rows it changes into the snapshots that can read
+    them.
+
+    Deleting an entry marks its row with a tombstone that queries skip. Once the fraction of deleted rows of a namespace
+    exceeds `tombstone_threshold`, the namespace is rebuilt without them in the background, along with the `persist_dir`
+    log, and only swapped in under the lock so that queries are not blocked while the rebuild runs. Compactions run on
+    an executor created once with `futures_executor_fn`. Call `wait_for_compaction()` to wait for the running
+    compaction, and `close()` to also shut the executor down.
+
+    Attributes:
+        entries: Entries keyed by namespaced vector ID. Reading it returns a new dictionary of every entry, with its
+            vector, and assigning it replaces every entry. Entries whose namespaced IDs collide, such as ID `b-c` in
+            namespace `a` and ID `c` in namespace `a-b`, are only in the dictionary once, so use `iter_entries()` to
+            read every entry.
+        persist_file: Optional path of a JSON file that all entries are rewritten to on every upsert. Entries are keyed
+            by `[namespace, id]`, like in the `persist_dir` log.
+        persist_dir: Optional directory to persist entries to as an append-only log and a memory-mapped `.npy` vector
+            file. Upserts only append to the log, and vectors are memory-mapped instead of read when the driver starts.
+        compaction_threshold: Fraction of superseded records in the `persist_dir` log above which the log is compacted.
+            Set to `None` to only compact when calling `compact()`.
+        tombstone_threshold: Fraction of deleted rows in a namespace above which the namespace and the `persist_dir`
+            log are compacted in the background. Set to `None` to only compact when calling `compact()`.
+        relatedness_fn: Optional function used to score a query vector against an entry vector. Setting it disables
+            vectorized scoring and calls the function once per entry.
+        ann_index_fn: Optional function that creates an approximate nearest neighbor index for every namespace. Once a
+            namespace holds `min_train_size` entries, its index is trained by the write that published the entries and
+            queries only score the entries of the `nprobe` closest clusters. Pass `nprobe` to `query()` to override it per query. With
+            `persist_dir`, trained clusters are saved next to the vector file. Ignored when `relatedness_fn` is set.
+        vector_dtype: Type vectors are stored as in memory: `float32`, `float16` to halve memory use, or `int8` to
+            quarter it. Compressed vectors are scored without decompressing the whole matrix, and loaded entries hold
+            approximate vectors unless `persist_dir` is set, in which case vectors are read from the vector file.
+        rescore_factor: With a compressed `vector_dtype` and `persist_dir`, queries select `count * rescore_factor`
+            candidates with compressed scores and rescore them with the full precision vectors of the vector file. Set
+            to `None` to return compressed scores.
+        indexed_meta_keys: Metadata keys to maintain an inverted index over. Pass a `filter` dictionary of metadata
+            values to `query()` to only score the entries whose metadata holds every value. Filters on indexed keys
+            select candidate rows before any vector is scored, while other keys are checked against the metadata of
+            every candidate.
+    """
+
+    _initial_entries: dict[str, BaseVectorStoreDriver.Entry] = field(factory=dict, alias="entries")
     persist_file: Optional[str] = field(default=None)
-    relatedness_fn: Callable = field(default=lambda x, y: dot(x, y) / (norm(x) * norm(y)))
+    persist_dir: Optional[str] = field(default=None)
+    compaction_threshold: Optional[float] = field(default=0.5)
+    tombstone_threshold: Optional[float] = field(default=0.25)
+    relatedness_fn: Optional[Callable] = field(default=None)
+    ann_index_fn: Optional[Callable[[], LocalIvfIndex]] = field(default=None)
+    vector_dtype: str = field(default="float32")
+    rescore_factor: Optional[int] = field(default=4)
+    indexed_meta_keys: list[str] = field(factory=list)
     thread_lock: threading.Lock = field(default=Factory(lambda: threading.Lock()))
+    _indexes: dict[Optional[str], LocalVectorIndex] = field(factory=dict, init=False)
+    _meta_indexes: dict[Optional[str], LocalMetadataIndex] = field(factory=dict, init=False)
+    _log: Optional[LocalVectorLog] = field(default=None, init=False)
+    _compaction_lock: threading.Lock = field(factory=threading.Lock, init=False)
+    _compaction_executor: Optional[futures.Executor] = field(default=None, init=False)
+    _compaction_future: Optional[futures.Future] = field(default=None, init=False)
+    _snapshot: _LocalSnapshot = field(factory=_LocalSnapshot, init=False)
+
+    @persist_dir.validator  # pyright: ignore
+    def validate_persist_dir(self, _, persist_dir: Optional[str]) -> None:
+        if persist_dir is not None and self.persist_file is not None:
+            raise ValueError("Only one of persist_file and persist_dir can be set")
 
     def __attrs_post_init__(self) -> None:
+        initial_entries = list(self._initial_entries.values())
+
+        for entry in initial_entries:
+            self._upsert_entry(entry)
+
+        self._initial_entries = {}
+        self._publish()
+
         if self.persist_file is not None:
             directory = os.path.dirname(self.persist_file)
 
@@ -30,20 +121,86 @@ class LocalVectorStoreDriver(BaseVectorStoreDriver):
 
             with open(self.persist_file, "r+") as file:
                 if os.path.getsize(self.persist_file) > 0:
-                    self.entries = self.load_entries_from_file(file)
+                    self._indexes = {}
+                    self._meta_indexes = {}
+
+                    for entry in self.load_entries_from_file(file).values():
+                        self._upsert_entry(entry)
+
+                    self._publish()
                 else:
                     self.save_entries_to_file(file)
 
+        if self.persist_dir is not None:
+            self._log = LocalVectorLog(directory=self.persist_dir)
+            records, vectors = self._log.load()
+
+            if records:
+                self._indexes = {}
+                self._meta_indexes = {}
+                self._load_records(list(records.values()), vectors)
+                self._load_ann_indexes()
+            elif initial_entries:
+                # Initial entries are appended to the log so that their full precision vectors are persisted.
+                self._indexes = {}
+                self._meta_indexes = {}
+                self.upsert_vectors(initial_entries)
+
+            self._publish()
+
+    @property
+    def entries(self) -> dict[str, BaseVectorStoreDriver.Entry]:
+        return {
+            self._namespaced_vector_id(entry.id, entry.namespace): entry
+            for entry in self._iter_entries(self._snapshot, None)
+        }
+
+    @entries.setter
+    def entries(self, entries: dict[str, BaseVectorStoreDriver.Entry]) -> None:
+        with self.thread_lock:
+            for namespace in list(self._indexes.keys()):
+                self._drop_namespace(namespace)
+
+            self._upsert_entries(list(entries.values()))
+
+            if self._log is not None:
+                self._compact_if_needed()
+
+            self._publish()
+
+        self._persist_file()
+
+    @property
+    def namespaces(self) -> list[Optional[str]]:
+        return list(self._snapshot.partitions.keys())
+
     def save_entries_to_file(self, json_file: TextIO) -> None:
+        # The lock is only held so that concurrent writes to the file do not interleave.
         with self.thread_lock:
-            serialized_data = {k: asdict(v) for k, v in self.entries.items()}
+            # Entries are keyed by [namespace, id] like the records of the `persist_dir` log, since namespaces and
+            # IDs can contain any character.
+            serialized_data = [
+                [[entry.namespace, entry.id], asdict(entry)] for entry in self._iter_entries(self._snapshot, None)
+            ]
 
             json.dump(serialized_data, json_file)
 
-    def load_entries_from_file(self, json_file: TextIO) -> dict[str, BaseVectorStoreDriver.Entry]:
+    def load_entries_from_file(self, json_file: TextIO) -> dict[tuple[Optional[str], str], BaseVectorStoreDriver.Entry]:
+        """Loads the entries of a `persist_file`, keyed by `(namespace, id)`.
+
+        Files written before entries were keyed by `[namespace, id]` hold an object keyed by namespaced vector ID, and
+        their entries are keyed by their own namespace and ID.
+        """
         data = json.load(json_file)
 
-        return {k: BaseVectorStoreDriver.Entry.from_dict(v) for k, v in data.items()}
+        if isinstance(data, dict):
+            entries = [BaseVectorStoreDriver.Entry.from_dict(v) for v in data.values()]
+
+            return {(e.namespace, e.id): e for e in entries}
+        else:
+            return {
+                (namespace, vector_id): BaseVectorStoreDriver.Entry.from_dict(v) for (namespace, vector_id), v in data
+            }
 
     def upsert_vector(
         self,
@@ -53,62 +210,506 @@ class LocalVectorStoreDriver(BaseVectorStoreDriver):
         meta: Optional[dict] = None,
         **kwargs,
     ) -> str:
-        vector_id = vector_id if vector_id else utils.str_to_hash(str(vector))
+        return self.upsert_vectors([self.Entry(id=vector_id, vector=vector, namespace=namespace, meta=meta)])[0]
 
+    def upsert_vectors(
+        self, entries: list[BaseVectorStoreDriver.Entry], batch_size: Optional[int] = None, **kwargs
+    ) -> list[str]:
+        # Vectors are kept in memory, so every entry is written at once regardless of batch_size.
         with self.thread_lock:
-            self.entries[self._namespaced_vector_id(vector_id, namespace)] = self.Entry(
-                id=vector_id, vector=vector, meta=meta, namespace=namespace
-            )
+            vector_ids = self._upsert_entries(entries)
 
-        if self.persist_file is not None:
-            # TODO: optimize later since it reserializes all entries from memory and stores them in the JSON file
-            #  every time a new vector is inserted
-            with open(self.persist_file, "w") as file:
-                self.save_entries_to_file(file)
+            if self._log is not None:
+                self._compact_if_needed()
+
+            self._publish()
+
+        self._persist_file()
+
+        return vector_ids
+
+    def drop_namespace(self, namespace: Optional[str]) -> None:
+        """Deletes every entry in `namespace` by discarding its partition."""
+        with self.thread_lock:
+            if not self._drop_namespace(namespace):
+                return
 
-        return vector_id
+            if self._log is not None:
+                self._compact_if_needed()
+
+            self._publish()
+
+        self._persist_file()
+
+    def compact(self) -> None:
+        """Rewrites the `persist_dir` log so that it only holds the latest record of every entry.
+
+        Deleted rows are removed from every namespace. Waits for a background compaction to finish first.
+        """
+        if self._log is None:
+            raise ValueError("Compaction requires persist_dir to be set")
+
+        with self._compaction_lock, self.thread_lock:
+            self._compact()
+            self._publish()
+
+    def wait_for_compaction(self) -> None:
+        """Waits for the background compaction started by `delete_vector()`, if any, and raises its exception."""
+        future = self._compaction_future
+
+        if future is not None:
+            future.result()
+
+    def close(self) -> None:
+        """Waits for the background compaction, if any, and shuts down the executor that runs compactions.
+
+        The driver can still be used. A later compaction creates a new executor with `futures_executor_fn`.
+        """
+        # The lock isn't held while waiting, since the compaction takes it to swap its results in.
+        with self.thread_lock:
+            executor = self._compaction_executor
+            self._compaction_executor = None
+
+        if executor is not None:
+            executor.shutdown(wait=True)
 
     def load_entry(self, vector_id: str, namespace: Optional[str] = None) -> Optional[BaseVectorStoreDriver.Entry]:
-        return self.entries.get(self._namespaced_vector_id(vector_id, namespace), None)
+        snapshot = self._snapshot
+        partition = snapshot.partitions.get(namespace)
+        row = None if partition is None else partition[0].row(vector_id)
+
+        return None if row is None else self._load_row(snapshot, namespace, row)
+
+    def load_entries_by_ids(
+        self, vector_ids: list[str], namespace: Optional[str] = None
+    ) -> list[BaseVectorStoreDriver.Entry]:
+        snapshot = self._snapshot
+        partition = snapshot.partitions.get(namespace)
+        rows = [] if partition is None else [partition[0].row(vector_id) for vector_id in vector_ids]
+
+        return [self._load_row(snapshot, namespace, row) for row in rows if row is not None]
 
-    def load_entries(self, namespace: Optional[str] = None) -> list[BaseVectorStoreDriver.Entry]:
-        return [entry for key, entry in self.entries.items() if namespace is None or entry.namespace == namespace]
+    def existing_ids(self, vector_ids: list[str], namespace: Optional[str] = None) -> set[str]:
+        partition = self._snapshot.partitions.get(namespace)
 
-    def query(
+        return set() if partition is None else {i for i in vector_ids if partition[0].row(i) is not None}
+
+    def iter_entries(
+        self, namespace: Optional[str] = None, page_size: Optional[int] = None
+    ) -> Iterator[BaseVectorStoreDriver.Entry]:
+        """Yields the entries of the current snapshot one at a time. Entries are in memory, so `page_size` is unused."""
+        return self._iter_entries(self._snapshot, namespace)
+
+    def query_vector(
         self,
-        query: str,
+        vector: list[float],
         count: Optional[int] = None,
         namespace: Optional[str] = None,
         include_vectors: bool = False,
         **kwargs,
     ) -> list[BaseVectorStoreDriver.Entry]:
-        query_embedding = self.embedding_driver.embed_string(query)
+        return self._query_vectors(
+            [vector], count, namespace, include_vectors, kwargs.get("nprobe"), kwargs.get("filter")
+        )[0]
+
+    def query_many(
+        self,
+        queries: list[str] | list[list[float]],
+        count: Optional[int] = None,
+        namespace: Optional[str] = None,
+        include_vectors: bool = False,
+        **kwargs,
+    ) -> list[list[BaseVectorStoreDriver.Entry]]:
+        """Runs many queries at once, scoring every namespace against all query vectors with one matrix product."""
+        return self._query_vectors(
+            self._embed_queries(queries), count, namespace, include_vectors, kwargs.get("nprobe"), kwargs.get("filter")
+        )
+
+    def delete_vector(self, vector_id: str, namespace: Optional[str] = None) -> None:
+        """Deletes the entry of `vector_id` in `namespace` by marking its row as deleted."""
+        with self.thread_lock:
+            index = self._indexes.get(namespace)
+            row = None if index is None else index.delete(vector_id)
+
+            if index is None or row is None:
+                return
+
+            self._meta_indexes[namespace].remove(row, index.meta_at(row))
+
+            if self._log is not None:
+                self._log.append_delete([[namespace, vector_id]])
+
+            if self.tombstone_threshold is not None and any(
+                index.tombstone_ratio > self.tombstone_threshold for index in self._indexes.values()
+            ):
+                self._schedule_compaction()
+
+            self._publish()
+
+        self._persist_file()
+
+    def _query_vectors(
+        self,
+        vectors: list[list[float]],
+        count: Optional[int],
+        namespace: Optional[str],
+        include_vectors: bool,
+        nprobe: Optional[int],
+        filter: Optional[dict] = None,
+    ) -> list[list[BaseVectorStoreDriver.Entry]]:
+        snapshot = self._snapshot
 
         if namespace:
-            entries = {k: v for (k, v) in self.entries.items() if k.startswith(f"{namespace}-")}
+            namespaces = [namespace] if namespace in snapshot.partitions else []
         else:
-            entries = self.entries
+            namespaces = list(snapshot.partitions.keys())
+
+        results: list[list[tuple[Optional[str], int, float]]] = [[] for _ in vectors]
+
+        for n in namespaces:
+            index, meta_index = snapshot.partitions[n]
+            rows = self._filter_rows(index, meta_index, filter) if filter else None
+
+            if rows is not None and len(rows) == 0:
+                continue
+
+            for i, namespace_results in enumerate(
+                self._top_k_many(index, vectors, count, nprobe, snapshot.source, rows)
+            ):
+                results[i].extend((n, row, score) for row, score in namespace_results)
+
+        if len(namespaces) > 1:
+            results = [sorted(r, key=lambda r: -r[2])[:count] for r in results]
 
-        entries_and_relatednesses = [
-            (entry, self.relatedness_fn(query_embedding, entry.vector)) for entry in entries.values()
+        return [
+            [
+                BaseVectorStoreDriver.Entry(
+                    id=snapshot.partitions[n][0].key_at(row),
+                    vector=snapshot.partitions[n][0].vector_at(row, snapshot.source) if include_vectors else [],
+                    score=score,
+                    meta=snapshot.partitions[n][0].meta_at(row),
+                    namespace=n,
+                )
+                for n, row, score in query_results
+            ]
+            for query_results in results
         ]
-        entries_and_relatednesses.sort(key=lambda x: x[1], reverse=True)
 
-        result = [
-            BaseVectorStoreDriver.Entry(id=er[0].id, vector=er[0].vector, score=er[1], meta=er[0].meta)
-            for er in entries_and_relatednesses
-        ][:count]
+    def _top_k_many(
+        self,
+        index: LocalVectorIndex,
+        vectors: list[list[float]],
+        count: Optional[int],
+        nprobe: Optional[int] = None,
+        source: Optional[np.ndarray] = None,
+        rows: Optional[np.ndarray] = None,
+    ) -> list[list[tuple[int, float]]]:
+        if self.relatedness_fn is None:
+            return index.top_k_rows_many(vectors, count, nprobe=nprobe, source=source, rows=rows)
+        else:
+            if rows is None:
+                rows = index.live_rows
+
+            results = []
+
+            for vector in vectors:
+                scores = np.array(
+                    [self.relatedness_fn(vector, index.vector_at(row, source)) for row in rows.tolist()],
+                    dtype=np.float32,
+                )
+                results.append(
+                    [(int(rows[p]), float(scores[p])) for p in LocalVectorIndex.top_k_positions(scores, count)]
+                )
+
+            return results
+
+    def _filter_rows(self, index: LocalVectorIndex, meta_index: LocalMetadataIndex, filter: dict) -> np.ndarray:
+        bitmap = meta_index.bitmap(filter, len(index))
+        rows = index.live_rows if bitmap is None else np.flatnonzero(bitmap)
+        unindexed_filter = {key: value for key, value in filter.items() if not meta_index.is_indexed(key)}
+
+        if unindexed_filter:
+            rows = np.fromiter(
+                (row for row in rows.tolist() if LocalMetadataIndex.matches(index.meta_at(row), unindexed_filter)),
+                dtype=np.int64,
+            )
+
+        return rows
+
+    def _upsert_entries(self, entries: list[BaseVectorStoreDriver.Entry]) -> list[str]:
+        records = []
+
+        for i, entry in enumerate(entries):
+            vector_id = entry.id if entry.id else utils.str_to_hash(str(entry.vector))
+            # The log appends every vector of the batch, in order, after its current rows.
+            source_row = -1 if self._log is None else self._log.row_count + i
+
+            self._upsert_entry(dataclasses.replace(entry, id=vector_id), source_row)
+            records.append(self._record(vector_id, entry.namespace, entry.meta))
+
+        if self._log is not None:
+            self._log.append(records, [e.vector for e in entries])
+
+        return [r["id"] for r in records]
+
+    def _drop_namespace(self, namespace: Optional[str]) -> bool:
+        if self._indexes.pop(namespace, None) is None:
+            return False
+
+        self._meta_indexes.pop(namespace)
+
+        if self._log is not None:
+            self._log.append_drop(namespace)
+            self._save_ann_indexes()
+
+        return True
+
+    def _upsert_entry(self, entry: BaseVectorStoreDriver.Entry, source_row: int = -1) -> None:
+        if entry.namespace not in self._indexes:
+            self._indexes[entry.namespace] = self._create_index()
+            self._meta_indexes[entry.namespace] = LocalMetadataIndex(keys=self.indexed_meta_keys)
 
-        if include_vectors:
-            return result
+        index = self._indexes[entry.namespace]
+        meta_index = self._meta_indexes[entry.namespace]
+        previous_row = index.row(entry.id)
+
+        if previous_row is not None:
+            meta_index.remove(previous_row, index.meta_at(previous_row))
+
+        meta_index.add(index.upsert(entry.id, entry.vector, source_row, entry.meta), entry.meta)
+
+    def _iter_entries(
+        self, snapshot: _LocalSnapshot, namespace: Optional[str]
+    ) -> Iterator[BaseVectorStoreDriver.Entry]:
+        if namespace is None:
+            namespaces = list(snapshot.partitions.keys())
         else:
-            return [
-                BaseVectorStoreDriver.Entry(id=r.id, vector=[], score=r.score, meta=r.meta, namespace=r.namespace)
-                for r in result
-            ]
+            namespaces = [namespace] if namespace in snapshot.partitions else []
+
+        for n in namespaces:
+            for row in snapshot.partitions[n][0].live_rows.tolist():
+                yield self._load_row(snapshot, n, row)
+
+    def _load_row(self, snapshot: _LocalSnapshot, namespace: Optional[str], row: int) -> BaseVectorStoreDriver.Entry:
+        index = snapshot.partitions[namespace][0]
+
+        return self.Entry(
+            id=index.key_at(row),
+            vector=index.vector_at(row, snapshot.source),
+            meta=index.meta_at(row),
+            namespace=namespace,
+        )
+
+    def _load_records(self, records: list[dict], vectors: np.ndarray) -> None:
+        positions_by_namespace = {}
+
+        for position, record in enumerate(records):
+            positions_by_namespace.setdefault(record["namespace"], []).append(position)
+
+        for namespace, positions in positions_by_namespace.items():
+            if positions[-1] - positions[0] == len(positions) - 1:
+                # The rows of a namespace written in one batch, or by compaction, are a view of the memory map.
+                matrix = vectors[positions[0] : positions[-1] + 1]
+            else:
+                matrix = vectors[positions]
+
+            index = self._create_index()
+            index.load(
+                [records[p]["id"] for p in positions],
+                matrix,
+                np.array([records[p]["row"] for p in positions]),
+                [records[p]["meta"] for p in positions],
+            )
+
+            self._replace_index(namespace, index)
+
+    def _replace_index(self, namespace: Optional[str], index: LocalVectorIndex) -> None:
+        # The metadata index references rows, so it is rebuilt in the order of the new index.
+        meta_index = LocalMetadataIndex(keys=self.indexed_meta_keys)
+
+        for row in index.live_rows.tolist():
+            meta_index.add(row, index.meta_at(row))
+
+        self._indexes[namespace] = index
+        self._meta_indexes[namespace] = meta_index
+
+    def _publish(self) -> None:
+        # Approximate indexes are trained before the snapshot is taken, so that readers never train them.
+        if any([index.train_ann_index() for index in self._indexes.values()]):
+            self._save_ann_indexes()
+
+        self._snapshot = _LocalSnapshot(
+            partitions={
+                namespace: (index.snapshot(), self._meta_indexes[namespace].snapshot())
+                for namespace, index in self._indexes.items()
+            },
+            source=self._source(),
+        )
+
+    def _create_index(self) -> LocalVectorIndex:
+        return LocalVectorIndex(
+            ann_index=None if self.ann_index_fn is None else self.ann_index_fn(),
+            dtype=self.vector_dtype,
+            rescore_factor=self.rescore_factor,
+        )
+
+    def _source(self) -> Optional[np.ndarray]:
+        # The vector file holds full precision vectors, which are only needed when vectors are compressed in memory.
+        if self._log is None or self.vector_dtype == "float32":
+            return None
+        else:
+            return self._log.vectors()
+
+    def _load_ann_indexes(self) -> None:
+        for namespace, (keys, centroids, assignments, trained_size) in self._log.load_ann_indexes().items():
+            index = self._indexes.get(namespace)
+
+            if index is not None and index.ann_index is not None:
+                index.load_ann_index(keys, centroids, assignments, trained_size)
+
+    def _save_ann_indexes(self) -> None:
+        if self._log is None or self.ann_index_fn is None:
+            return
+
+        self._log.save_ann_indexes(
+            {
+                namespace: (
+                    index.keys,
+                    index.ann_index.centroids,
+                    index.ann_index.assignments[: len(index)],
+                    index.ann_index.trained_size,
+                )
+                for namespace, index in self._indexes.items()
+                if index.ann_index is not None and index.ann_index.is_trained
+            }
+        )
+
+    def _persist_file(self) -> None:
+        if self.persist_file is not None:
+            # TODO: optimize later since it reserializes all entries from memory and stores them in the JSON file
+            #  every time vectors are inserted
+            with open(self.persist_file, "w") as file:
+                self.save_entries_to_file(file)
+
+    def _should_compact(self) -> bool:
+        if self._log is None or self.compaction_threshold is None or self._log.record_count == 0:
+            return False
+
+        entry_count = sum(len(index) - index.deleted_count for index in self._indexes.values())
+
+        return (self._log.record_count - entry_count) / self._log.record_count > self.compaction_threshold
+
+    def _compact_if_needed(self) -> None:
+        # Compaction is skipped while a background compaction holds the compaction lock, since it compacts the log too.
+        if self._should_compact() and self._compaction_lock.acquire(blocking=False):
+            try:
+                self._compact()
+            finally:
+                self._compaction_lock.release()
+
+    def _compact(self) -> None:
+        for namespace, index in list(self._indexes.items()):
+            if index.deleted_count:
+                self._replace_index(namespace, index.compacted())
+
+        position, records, vectors, source_rows = self._log_snapshot()
+        row_count = self._log.write_compaction(records, self._log_blocks(vectors, source_rows))
+
+        self._finish_log_compaction(position, row_count, source_rows)
+
+    def _schedule_compaction(self) -> None:
+        if self._compaction_future is None or self._compaction_future.done():
+            if self._compaction_executor is None:
+                self._compaction_executor = self.futures_executor_fn()
+
+            self._compaction_future = self._compaction_executor.submit(self._compact_in_background)
+
+    def _compact_in_background(self) -> None:
+        # Copies of the indexes and of the log are built without holding the thread lock, which is only held to take
+        # snapshots and to swap the results in, so queries and upserts keep running during the rebuild.
+        with self._compaction_lock:
+            with self.thread_lock:
+                snapshots = {
+                    namespace: (index, index.version, index.snapshot())
+                    for namespace, index in self._indexes.items()
+                    if index.deleted_count
+                }
+
+            compacted = {namespace: snapshot.compacted() for namespace, (_, _, snapshot) in snapshots.items()}
+
+            with self.thread_lock:
+                for namespace, (index, version, _) in snapshots.items():
+                    # Indexes modified during the rebuild keep their tombstones until the next compaction.
+                    if self._indexes.get(namespace) is index and index.version == version:
+                        self._replace_index(namespace, compacted[namespace])
+
+                self._publish()
+
+                if self._log is None:
+                    return
+
+                position, records, vectors, source_rows = self._log_snapshot()
+
+            row_count = self._log.write_compaction(records, self._log_blocks(vectors, source_rows))
+
+            with self.thread_lock:
+                self._finish_log_compaction(position, row_count, source_rows)
+                self._publish()
+
+    def _log_snapshot(self) -> tuple[tuple[int, int], list[dict], np.ndarray, np.ndarray]:
+        # Records are grouped by namespace so that every namespace is a contiguous slice of the compacted vector file.
+        records = []
+        source_rows = []
+
+        for namespace, index in self._indexes.items():
+            live_rows = index.live_rows
+
+            records.extend(self._record(index.key_at(row), namespace, index.meta_at(row)) for row in live_rows.tolist())
+            source_rows.append(index.source_rows[live_rows])
+
+        return (
+            self._log.position(),
+            records,
+            self._log.vectors(),
+            np.concatenate(source_rows) if source_rows else np.empty(0, dtype=np.int64),
+        )
+
+    def _log_blocks(
+        self, vectors: np.ndarray, source_rows: np.ndarray, block_size: int = 65536
+    ) -> Iterator[np.ndarray]:
+        # Rows that were appended before the snapshot are never modified, so they can be read without the lock.
+        for start in range(0, len(source_rows), block_size):
+            yield vectors[source_rows[start : start + block_size]]
+
+    def _finish_log_compaction(self, position: tuple[int, int], row_count: int, source_rows: np.ndarray) -> None:
+        self._log.finish_compaction(position, row_count)
+
+        # Rows written before the snapshot move to their compacted position, or to -1 if they were not compacted, and
+        # rows appended since move after the compacted rows.
+        _, snapshot_row_count = position
+        positions = np.full(snapshot_row_count + 1, -1, dtype=np.int64)
+        positions[source_rows] = np.arange(len(source_rows))
+
+        for index in self._indexes.values():
+            rows = index.source_rows
+            index.set_source_rows(
+                np.where(
+                    rows >= snapshot_row_count,
+                    rows - snapshot_row_count + row_count,
+                    positions[np.minimum(rows, snapshot_row_count)],
+                )
+            )
+
+        self._save_ann_indexes()
 
-    def delete_vector(self, vector_id: str):
-        raise NotImplementedError(f"{self.__class__.__name__} does not support deletion.")
+    def _record(self, vector_id: str, namespace: Optional[str], meta: Optional[dict]) -> dict:
+        return {
+            # Namespaces and IDs can contain any character, so they aren't joined into a single string.
+            "key": [namespace, vector_id],
+            "id": vector_id,
+            "namespace": namespace,
+            "meta": meta,
+        }
 
     def _namespaced_vector_id(self, vector_id: str, namespace: Optional[str]):
         return vector_id if namespace is None else f"{namespace}-{vector_id}"
@@ -1,5 +1,5 @@
 from __future__ import annotations
-from typing import Optional, Any, TYPE_CHECKING
+from typing import Iterator, Optional, Any, TYPE_CHECKING
 from griptape import utils
 from griptape.utils import import_optional_dependency
 from griptape.drivers import BaseVectorStoreDriver
@@ -65,6 +65,37 @@ class MarqoVectorStoreDriver(BaseVectorStoreDriver):
         else:
             raise ValueError(f"Failed to upsert text: {response}")
 
+    def upsert_text_artifacts(
+        self,
+        artifacts: dict[str, list[TextArtifact]],
+        meta: Optional[dict] = None,
+        batch_size: Optional[int] = None,
+        **kwargs,
+    ) -> None:
+        """Upsert text artifacts into the Marqo index, sending up to `batch_size` documents per request.
+
+        Marqo generates embeddings on the server, so artifacts are sent as documents rather than vectors.
+
+        Args:
+            artifacts: Text artifacts to be indexed, keyed by namespace.
+            meta: Unused. Marqo does not store metadata for artifacts.
+            batch_size: Maximum number of documents to send per request. Defaults to `DEFAULT_UPSERT_BATCH_SIZE`.
+        """
+        batch_size = batch_size if batch_size else self.DEFAULT_UPSERT_BATCH_SIZE
+        docs = [
+            self._text_artifact_to_doc(artifact, namespace)
+            for namespace, artifact_list in artifacts.items()
+            for artifact in artifact_list
+        ]
+
+        for i in range(0, len(docs), batch_size):
+            response = self.mq.index(self.index).add_documents(
+                docs[i : i + batch_size], tensor_fields=["Description", "artifact"]
+            )
+
+            if not (isinstance(response, dict) and "items" in response and response["items"]):
+                raise ValueError(f"Failed to upsert text: {response}")
+
     def upsert_text_artifact(
         self,
         artifact: TextArtifact,
@@ -85,15 +116,7 @@ class MarqoVectorStoreDriver(BaseVectorStoreDriver):
             str: The ID of the artifact that was added.
         """
 
-        artifact_json = artifact.to_json()
-        vector_id = utils.str_to_hash(artifact.value) if vector_id is None else vector_id
-
-        doc = {
-            "_id": vector_id,
-            "Description": artifact.value,  # Description will be treated as tensor field
-            "artifact": str(artifact_json),
-            "namespace": namespace,
-        }
+        doc = self._text_artifact_to_doc(artifact, namespace, vector_id)
 
         response = self.mq.index(self.index).add_documents([doc], tensor_fields=["Description", "artifact"])
         if isinstance(response, dict) and "items" in response and response["items"]:
@@ -122,43 +145,92 @@ class MarqoVectorStoreDriver(BaseVectorStoreDriver):
         else:
             return None
 
-    def load_entries(self, namespace: Optional[str] = None) -> list[BaseVectorStoreDriver.Entry]:
-        """Load all document entries from the Marqo index.
+    def load_entries_by_ids(
+        self, vector_ids: list[str], namespace: Optional[str] = None
+    ) -> list[BaseVectorStoreDriver.Entry]:
+        """Load the document entries of the given IDs from the Marqo index with a single request.
 
         Args:
+            vector_ids: The IDs of the documents to load.
             namespace: The namespace to filter entries by.
 
         Returns:
-            The list of loaded Entries.
+            The loaded Entries, in the same order as `vector_ids`.
         """
+        documents = self.mq.index(self.index).get_documents(document_ids=vector_ids, expose_facets=True)
+
+        # for each document, if it's found, create an Entry object
+        return [
+            BaseVectorStoreDriver.Entry(
+                id=doc["_id"],
+                vector=doc["_tensor_facets"][0]["_embedding"],
+                meta={k: v for k, v in doc.items() if k not in ["_id", "_tensor_facets", "_found"]},
+                namespace=doc.get("namespace"),
+            )
+            for doc in documents["results"]
+            if doc["_found"] and (not namespace or doc.get("namespace") == namespace)
+        ]
 
-        filter_string = f"namespace:{namespace}" if namespace else None
+    def existing_ids(self, vector_ids: list[str], namespace: Optional[str] = None) -> set[str]:
+        """Check which of the given IDs have a document in the Marqo index with a single request.
 
-        if filter_string is not None:
-            results = self.mq.index(self.index).search("", limit=10000, filter_string=filter_string)
-        else:
-            results = self.mq.index(self.index).search("", limit=10000)
+        Documents are fetched without their embeddings.
 
-        # get all _id's from search results
-        ids = [r["_id"] for r in results["hits"]]
+        Args:
+            vector_ids: The IDs of the documents to check.
+            namespace: The namespace to filter documents by.
 
-        # get documents corresponding to the ids
-        documents = self.mq.index(self.index).get_documents(document_ids=ids, expose_facets=True)
+        Returns:
+            The IDs of the documents that were found.
+        """
+        documents = self.mq.index(self.index).get_documents(document_ids=vector_ids)
 
-        # for each document, if it's found, create an Entry object
-        entries = []
-        for doc in documents["results"]:
-            if doc["_found"]:
-                entries.append(
-                    BaseVectorStoreDriver.Entry(
-                        id=doc["_id"],
-                        vector=doc["_tensor_facets"][0]["_embedding"],
-                        meta={k: v for k, v in doc.items() if k not in ["_id", "_tensor_facets", "_found"]},
-                        namespace=doc.get("namespace"),
-                    )
-                )
-
-        return entries
+        return {
+            doc["_id"]
+            for doc in documents["results"]
+            if doc["_found"] and (not namespace or doc.get("namespace") == namespace)
+        }
+
+    def iter_entries(
+        self, namespace: Optional[str] = None, page_size: Optional[int] = None
+    ) -> Iterator[BaseVectorStoreDriver.Entry]:
+        """Yield all document entries from the Marqo index, one page of documents per request.
+
+        Marqo has no scroll API, so pages are read with the offset of a search. The number of documents a search can
+        reach is bounded by the `MARQO_MAX_RETRIEVABLE_DOCS` setting of the Marqo server.
+
+        Args:
+            namespace: The namespace to filter entries by.
+            page_size: The number of documents to fetch per request.
+
+        Returns:
+            An iterator over the loaded Entries.
+        """
+        page_size = page_size if page_size else BaseVectorStoreDriver.DEFAULT_PAGE_SIZE
+        filter_kwargs = {"filter_string": f"namespace:{namespace}"} if namespace else {}
+        offset = 0
+
+        while True:
+            results = self.mq.index(self.index).search("", limit=page_size, offset=offset, **filter_kwargs)
+
+            # get all _id's from search results
+            ids = [r["_id"] for r in results["hits"]]
+
+            if not ids:
+                break
+
+            # get documents corresponding to the ids
+            yield from self.load_entries_by_ids(ids)
+
+            if len(ids) < page_size:
+                break
+
+            offset += len(ids)
+
+    @property
+    def embeds_queries(self) -> bool:
+        """Marqo embeds query strings server-side with the model of the index."""
+        return True
 
     def query(
         self,
@@ -171,6 +243,8 @@ class MarqoVectorStoreDriver(BaseVectorStoreDriver):
     ) -> list[BaseVectorStoreDriver.Entry]:
         """Query the Marqo index for documents.
 
+        The query string is embedded by Marqo rather than by `embedding_driver`.
+
         Args:
             query: The query string.
             count: The maximum number of results to return.
@@ -182,28 +256,33 @@ class MarqoVectorStoreDriver(BaseVectorStoreDriver):
             The list of query results.
         """
 
-        params = {
-            "limit": count if count else BaseVectorStoreDriver.DEFAULT_QUERY_COUNT,
-            "attributes_to_retrieve": ["*"] if include_metadata else ["_id"],
-            "filter_string": f"namespace:{namespace}" if namespace else None,
-        } | kwargs
+        return self._search(query, None, count, namespace, include_vectors, include_metadata, **kwargs)
 
-        results = self.mq.index(self.index).search(query, **params)
+    def query_vector(
+        self,
+        vector: list[float],
+        count: Optional[int] = None,
+        namespace: Optional[str] = None,
+        include_vectors: bool = False,
+        include_metadata: bool = True,
+        **kwargs,
+    ) -> list[BaseVectorStoreDriver.Entry]:
+        """Query the Marqo index for documents similar to a vector.
 
-        if include_vectors:
-            results["hits"] = [
-                {**r, **self.mq.index(self.index).get_document(r["_id"], expose_facets=True)} for r in results["hits"]
-            ]
+        Args:
+            vector: The query vector.
+            count: The maximum number of results to return.
+            namespace: The namespace to filter results by.
+            include_vectors: Whether to include vector data in the results.
+            include_metadata: Whether to include metadata in the results.
 
-        return [
-            BaseVectorStoreDriver.Entry(
-                id=r["_id"],
-                vector=r["_tensor_facets"][0]["_embedding"] if include_vectors else [],
-                score=r["_score"],
-                meta={k: v for k, v in r.items() if k not in ["_score", "_tensor_facets"]},
-            )
-            for r in results["hits"]
-        ]
+        Returns:
+            The list of query results.
+        """
+
+        context = {"tensor": [{"vector": vector, "weight": 1}]}
+
+        return self._search(None, context, count, namespace, include_vectors, include_metadata, **kwargs)
 
     def delete_index(self, name: str) -> dict[str, Any]:
         """Delete an index in the Marqo client.
@@ -248,5 +327,51 @@ class MarqoVectorStoreDriver(BaseVectorStoreDriver):
 
         raise NotImplementedError(f"{self.__class__.__name__} does not support upserting a vector.")
 
-    def delete_vector(self, vector_id: str):
+    def _text_artifact_to_doc(
+        self, artifact: TextArtifact, namespace: Optional[str] = None, vector_id: Optional[str] = None
+    ) -> dict[str, Any]:
+        return {
+            "_id": utils.str_to_hash(artifact.value) if vector_id is None else vector_id,
+            "Description": artifact.value,  # Description will be treated as tensor field
+            "artifact": str(artifact.to_json()),
+            "namespace": namespace,
+        }
+
+    def _search(
+        self,
+        query: Optional[str],
+        context: Optional[dict],
+        count: Optional[int],
+        namespace: Optional[str],
+        include_vectors: bool,
+        include_metadata: bool,
+        **kwargs,
+    ) -> list[BaseVectorStoreDriver.Entry]:
+        params = {
+            "limit": count if count else BaseVectorStoreDriver.DEFAULT_QUERY_COUNT,
+            "attributes_to_retrieve": ["*"] if include_metadata else ["_id"],
+            "filter_string": f"namespace:{namespace}" if namespace else None,
+        } | kwargs
+
+        if context is not None:
+            params["context"] = context
+
+        results = self.mq.index(self.index).search(query, **params)
+
+        if include_vectors:
+            results["hits"] = [
+                {**r, **self.mq.index(self.index).get_document(r["_id"], expose_facets=True)} for r in results["hits"]
+            ]
+
+        return [
+            BaseVectorStoreDriver.Entry(
+                id=r["_id"],
+                vector=r["_tensor_facets"][0]["_embedding"] if include_vectors else [],
+                score=r["_score"],
+                meta={k: v for k, v in r.items() if k not in ["_score", "_tensor_facets"]},
+            )
+            for r in results["hits"]
+        ]
+
+    def delete_vector(self, vector_id: str, namespace: Optional[str] = None) -> None:
         raise NotImplementedError(f"{self.__class__.__name__} does not support deletion.")
@@ -1,5 +1,5 @@
 from __future__ import annotations
-from typing import TYPE_CHECKING, Optional
+from typing import TYPE_CHECKING, Iterator, Optional
 from attrs import define, field, Factory
 from griptape.drivers import BaseVectorStoreDriver
 from griptape.utils import import_optional_dependency
@@ -65,6 +65,32 @@ class MongoDbAtlasVectorStoreDriver(BaseVectorStoreDriver):
             )
         return vector_id
 
+    def upsert_vectors(
+        self, entries: list[BaseVectorStoreDriver.Entry], batch_size: Optional[int] = None, **kwargs
+    ) -> list[str]:
+        """Inserts or updates many vectors in the collection with one `bulk_write` per batch.
+
+        Entries without an ID are inserted and get an ID generated by MongoDB.
+        """
+        pymongo = import_optional_dependency("pymongo")
+        collection = self.get_collection()
+        batch_size = batch_size if batch_size else BaseVectorStoreDriver.DEFAULT_UPSERT_BATCH_SIZE
+        docs = [{self.vector_path: e.vector, "namespace": e.namespace, "meta": e.meta} for e in entries]
+
+        for i in range(0, len(entries), batch_size):
+            collection.bulk_write(
+                [
+                    pymongo.InsertOne(doc)
+                    if entry.id is None
+                    else pymongo.ReplaceOne({"_id": entry.id}, doc, upsert=True)
+                    for entry, doc in zip(entries[i : i + batch_size], docs[i : i + batch_size])
+                ],
+                ordered=False,
+            )
+
+        # InsertOne sets the generated _id on the inserted document.
+        return [str(doc["_id"]) if entry.id is None else entry.id for entry, doc in zip(entries, docs)]
+
     def load_entry(self, vector_id: str, namespace: Optional[str] = None) -> Optional[BaseVectorStoreDriver.Entry]:
         """Loads a document entry from the MongoDB collection based on the vector ID.
 
@@ -84,42 +110,72 @@ class MongoDbAtlasVectorStoreDriver(BaseVectorStoreDriver):
                 id=str(doc["_id"]), vector=doc[self.vector_path], namespace=doc["namespace"], meta=doc["meta"]
             )
 
-    def load_entries(self, namespace: Optional[str] = None) -> list[BaseVectorStoreDriver.Entry]:
-        """Loads all document entries from the MongoDB collection.
+    def load_entries_by_ids(
+        self, vector_ids: list[str], namespace: Optional[str] = None
+    ) -> list[BaseVectorStoreDriver.Entry]:
+        """Loads the document entries of the given vector IDs from the MongoDB collection with a single `$in` query.
 
-        Entries can optionally be filtered by namespace.
+        Returns:
+            The loaded Entries, in the same order as `vector_ids`.
         """
         collection = self.get_collection()
-        if namespace is None:
-            cursor = collection.find()
-        else:
-            cursor = collection.find({"namespace": namespace})
+        docs = {doc["_id"]: doc for doc in collection.find(self._ids_filter(vector_ids, namespace))}
 
         return [
             BaseVectorStoreDriver.Entry(
                 id=str(doc["_id"]), vector=doc[self.vector_path], namespace=doc["namespace"], meta=doc["meta"]
             )
-            for doc in cursor
+            for doc in (docs.get(vector_id) for vector_id in vector_ids)
+            if doc is not None
         ]
 
-    def query(
+    def existing_ids(self, vector_ids: list[str], namespace: Optional[str] = None) -> set[str]:
+        """Returns the vector IDs that have a document in the MongoDB collection with a single `$in` query.
+
+        Only the `_id` of every document is fetched.
+        """
+        collection = self.get_collection()
+
+        return {str(doc["_id"]) for doc in collection.find(self._ids_filter(vector_ids, namespace), {"_id": 1})}
+
+    def iter_entries(
+        self, namespace: Optional[str] = None, page_size: Optional[int] = None
+    ) -> Iterator[BaseVectorStoreDriver.Entry]:
+        """Yields all document entries from the MongoDB collection.
+
+        Entries can optionally be filtered by namespace. The cursor fetches `page_size` documents per round trip.
+        """
+        collection = self.get_collection()
+        cursor = collection.find({} if namespace is None else {"namespace": namespace}).batch_size(
+            page_size if page_size else BaseVectorStoreDriver.DEFAULT_PAGE_SIZE
+        )
+
+        for doc in cursor:
+            yield BaseVectorStoreDriver.Entry(
+                id=str(doc["_id"]), vector=doc[self.vector_path], namespace=doc["namespace"], meta=doc["meta"]
+            )
+
+    def _ids_filter(self, vector_ids: list[str], namespace: Optional[str]) -> dict:
+        if namespace:
+            return {"_id": {"$in": vector_ids}, "namespace": namespace}
+        else:
+            return {"_id": {"$in": vector_ids}}
+
+    def query_vector(
         self,
-        query: str,
+        vector: list[float],
         count: Optional[int] = None,
         namespace: Optional[str] = None,
         include_vectors: bool = False,
         offset: Optional[int] = None,
         **kwargs,
     ) -> list[BaseVectorStoreDriver.Entry]:
-        """Queries the MongoDB collection for documents that match the provided query string.
+        """Queries the MongoDB collection for documents whose vectors are similar to the provided vector.
 
         Results can be customized based on parameters like count, namespace, inclusion of vectors, offset, and index.
         """
         collection = self.get_collection()
 
-        # Using the embedding driver to convert the query string into a vector
-        vector = self.embedding_driver.embed_string(query)
-
         count = count if count else BaseVectorStoreDriver.DEFAULT_QUERY_COUNT
         offset = offset if offset else 0
 
@@ -160,7 +216,11 @@ class MongoDbAtlasVectorStoreDriver(BaseVectorStoreDriver):
 
         return results
 
-    def delete_vector(self, vector_id: str):
-        """Deletes the vector from the collection."""
+    def delete_vector(self, vector_id: str, namespace: Optional[str] = None) -> None:
+        """Deletes the vector from the collection, if it is in `namespace` when one is given."""
         collection = self.get_collection()
-        collection.delete_one({"_id": vector_id})
+
+        if namespace:
+            collection.delete_one({"_id": vector_id, "namespace": namespace})
+        else:
+            collection.delete_one({"_id": vector_id})
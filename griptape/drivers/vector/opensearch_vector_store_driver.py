@@ -1,5 +1,5 @@
 from __future__ import annotations
-from typing import Optional, TYPE_CHECKING
+from typing import Iterator, Optional, TYPE_CHECKING
 from griptape import utils
 import logging
 from griptape.utils import import_optional_dependency
@@ -64,6 +64,32 @@ class OpenSearchVectorStoreDriver(BaseVectorStoreDriver):
 
         return response["_id"]
 
+    def upsert_vectors(
+        self, entries: list[BaseVectorStoreDriver.Entry], batch_size: Optional[int] = None, **kwargs
+    ) -> list[str]:
+        """Inserts or updates many vectors in OpenSearch using the bulk API.
+
+        Returns:
+            IDs of the upserted vectors, as reported by OpenSearch.
+        """
+        streaming_bulk = import_optional_dependency("opensearchpy.helpers").streaming_bulk
+        actions = [
+            self._generate_bulk_action(
+                e.id if e.id else utils.str_to_hash(str(e.vector)),
+                {"vector": e.vector, "namespace": e.namespace, "metadata": e.meta} | kwargs,
+            )
+            for e in entries
+        ]
+
+        return [
+            item["index"]["_id"]
+            for _, item in streaming_bulk(
+                self.client,
+                actions,
+                chunk_size=batch_size if batch_size else BaseVectorStoreDriver.DEFAULT_UPSERT_BATCH_SIZE,
+            )
+        ]
+
     def load_entry(self, vector_id: str, namespace: Optional[str] = None) -> Optional[BaseVectorStoreDriver.Entry]:
         """Retrieves a specific vector entry from OpenSearch based on its identifier and optional namespace.
 
@@ -71,56 +97,82 @@ class OpenSearchVectorStoreDriver(BaseVectorStoreDriver):
             If the entry is found, it returns an instance of BaseVectorStoreDriver.Entry; otherwise, None is returned.
         """
         try:
-            query = {"bool": {"must": [{"term": {"_id": vector_id}}]}}
-
-            if namespace:
-                query["bool"]["must"].append({"term": {"namespace": namespace}})
-
-            response = self.client.search(index=self.index_name, body={"query": query, "size": 1})
-
-            if response["hits"]["total"]["value"] > 0:
-                vector_data = response["hits"]["hits"][0]["_source"]
-                entry = BaseVectorStoreDriver.Entry(
-                    id=vector_id,
-                    meta=vector_data.get("metadata"),
-                    vector=vector_data.get("vector"),
-                    namespace=vector_data.get("namespace"),
-                )
-                return entry
-            else:
-                return None
+            entries = self.load_entries_by_ids([vector_id], namespace)
+
+            return entries[0] if entries else None
         except Exception as e:
             logging.error(f"Error while loading entry: {e}")
             return None
 
-    def load_entries(self, namespace: Optional[str] = None) -> list[BaseVectorStoreDriver.Entry]:
-        """Retrieves all vector entries from OpenSearch that match the optional namespace.
+    def load_entries_by_ids(
+        self, vector_ids: list[str], namespace: Optional[str] = None
+    ) -> list[BaseVectorStoreDriver.Entry]:
+        """Retrieves the vector entries of the given identifiers and optional namespace with a single `mget` request.
 
         Returns:
-            A list of BaseVectorStoreDriver.Entry objects.
+            The entries that were found, in the same order as `vector_ids`.
+        """
+        response = self.client.mget(index=self.index_name, body={"ids": vector_ids})
+
+        return [
+            BaseVectorStoreDriver.Entry(
+                id=doc["_id"],
+                meta=doc["_source"].get("metadata"),
+                vector=doc["_source"].get("vector"),
+                namespace=doc["_source"].get("namespace"),
+            )
+            for doc in response["docs"]
+            if doc.get("found") and (not namespace or doc["_source"].get("namespace") == namespace)
+        ]
+
+    def existing_ids(self, vector_ids: list[str], namespace: Optional[str] = None) -> set[str]:
+        """Checks which of the given identifiers have an entry in the optional namespace with a single `mget` request.
+
+        Only the namespace of every document is fetched, not its vector.
         """
+        response = self.client.mget(
+            index=self.index_name,
+            body={
+                "docs": [
+                    {"_id": vector_id, "_source": ["namespace"] if namespace else False} for vector_id in vector_ids
+                ]
+            },
+        )
 
-        query_body = {"size": 10000, "query": {"match_all": {}}}
+        return {
+            doc["_id"]
+            for doc in response["docs"]
+            if doc.get("found") and (not namespace or doc["_source"].get("namespace") == namespace)
+        }
 
-        if namespace:
-            query_body["query"] = {"match": {"namespace": namespace}}
+    def iter_entries(
+        self, namespace: Optional[str] = None, page_size: Optional[int] = None
+    ) -> Iterator[BaseVectorStoreDriver.Entry]:
+        """Yields every vector entry in OpenSearch that matches the optional namespace.
+
+        Entries are read with a scroll, one page per request, so the index is not limited to the 10,000 results of a
+        single search.
+        """
+        scan = import_optional_dependency("opensearchpy.helpers").scan
 
-        response = self.client.search(index=self.index_name, body=query_body)
+        query = {"query": {"match": {"namespace": namespace}}} if namespace else {"query": {"match_all": {}}}
 
-        entries = [
-            BaseVectorStoreDriver.Entry(
+        for hit in scan(
+            self.client,
+            query=query,
+            index=self.index_name,
+            size=page_size if page_size else BaseVectorStoreDriver.DEFAULT_PAGE_SIZE,
+        ):
+            yield BaseVectorStoreDriver.Entry(
                 id=hit["_id"],
                 vector=hit["_source"].get("vector"),
                 meta=hit["_source"].get("metadata"),
                 namespace=hit["_source"].get("namespace"),
             )
-            for hit in response["hits"]["hits"]
-        ]
-        return entries
 
-    def query(
+    def query_vector(
         self,
-        query: str,
+        vector: list[float],
         count: Optional[int] = None,
         namespace: Optional[str] = None,
         include_vectors: bool = False,
@@ -128,15 +180,62 @@ class OpenSearchVectorStoreDriver(BaseVectorStoreDriver):
         field_name: str = "vector",
         **kwargs,
     ) -> list[BaseVectorStoreDriver.Entry]:
-        """Performs a nearest neighbor search on OpenSearch to find vectors similar to the provided query string.
+        """Performs a nearest neighbor search on OpenSearch to find vectors similar to the provided vector.
 
         Results can be limited using the count parameter and optionally filtered by a namespace.
 
         Returns:
             A list of BaseVectorStoreDriver.Entry objects, each encapsulating the retrieved vector, its similarity score, metadata, and namespace.
         """
+        response = self.client.search(
+            index=self.index_name, body=self._generate_query_body(vector, count, namespace, field_name)
+        )
+
+        return self._hits_to_entries(response["hits"]["hits"], namespace, include_vectors, include_metadata)
+
+    def query_many(
+        self,
+        queries: list[str] | list[list[float]],
+        count: Optional[int] = None,
+        namespace: Optional[str] = None,
+        include_vectors: bool = False,
+        include_metadata=True,
+        field_name: str = "vector",
+        **kwargs,
+    ) -> list[list[BaseVectorStoreDriver.Entry]]:
+        """Performs many nearest neighbor searches on OpenSearch in a single multi-search request.
+
+        Returns:
+            The results of every query, in the same order as `queries`.
+        """
+        vectors = self._embed_queries(queries)
+
+        if not vectors:
+            return []
+
+        body = []
+
+        for vector in vectors:
+            body.append({"index": self.index_name})
+            body.append(self._generate_query_body(vector, count, namespace, field_name))
+
+        response = self.client.msearch(body=body)
+
+        results = []
+
+        for item in response["responses"]:
+            if "error" in item:
+                raise RuntimeError(f"OpenSearch multi-search query failed: {item['error']}")
+
+            results.append(self._hits_to_entries(item["hits"]["hits"], namespace, include_vectors, include_metadata))
+
+        return results
+
+    def _generate_query_body(
+        self, vector: list[float], count: Optional[int], namespace: Optional[str], field_name: str
+    ) -> dict:
+        """Generates the body of a k-NN search for `vector`, filtered by `namespace` when provided."""
         count = count if count else BaseVectorStoreDriver.DEFAULT_QUERY_COUNT
-        vector = self.embedding_driver.embed_string(query)
         # Base k-NN query
         query_body = {"size": count, "query": {"knn": {field_name: {"vector": vector, "k": count}}}}
 
@@ -147,8 +246,11 @@ class OpenSearchVectorStoreDriver(BaseVectorStoreDriver):
                 }
             }
 
-        response = self.client.search(index=self.index_name, body=query_body)
+        return query_body
 
+    def _hits_to_entries(
+        self, hits: list[dict], namespace: Optional[str], include_vectors: bool, include_metadata: bool
+    ) -> list[BaseVectorStoreDriver.Entry]:
         return [
             BaseVectorStoreDriver.Entry(
                 id=hit["_id"],
@@ -157,8 +259,12 @@ class OpenSearchVectorStoreDriver(BaseVectorStoreDriver):
                 vector=hit["_source"].get("vector") if include_vectors else None,
                 meta=hit["_source"].get("metadata") if include_metadata else None,
             )
-            for hit in response["hits"]["hits"]
+            for hit in hits
         ]
 
-    def delete_vector(self, vector_id: str):
+    def _generate_bulk_action(self, vector_id: str, doc: dict) -> dict:
+        """Generates a bulk API action that indexes `doc` under `vector_id`."""
+        return {"_op_type": "index", "_index": self.index_name, "_id": vector_id, "_source": doc}
+
+    def delete_vector(self, vector_id: str, namespace: Optional[str] = None) -> None:
         raise NotImplementedError(f"{self.__class__.__name__} does not support deletion.")
@@ -1,13 +1,13 @@
 import uuid
-from typing import Optional, Any, cast
+from typing import Iterator, Optional, Any, cast
 from attrs import define, field, Factory
 from dataclasses import dataclass
 from griptape.drivers import BaseVectorStoreDriver
 from griptape.utils import import_optional_dependency
 from sqlalchemy.engine import Engine
-from sqlalchemy import create_engine, Column, String, JSON
+from sqlalchemy import create_engine, delete, any_, bindparam, func, select, Column, String, JSON
 from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.dialects.postgresql import ARRAY, UUID, insert
 from sqlalchemy.orm import Session
 from collections import OrderedDict
 
@@ -21,12 +21,28 @@ class PgVectorVectorStoreDriver(BaseVectorStoreDriver):
         create_engine_params: Additional configuration params passed when creating the database connection.
         engine: An optional sqlalchemy Postgres engine to use.
         table_name: Optionally specify the name of the table to used to store vectors.
+        dimensions: Number of dimensions of the vector column. Required to create approximate nearest neighbor indexes.
+        pool_size: Number of connections kept open by the engine created from `connection_string`.
+        max_overflow: Number of connections the engine may open beyond `pool_size` under load.
+        ef_search: Size of the candidate list of HNSW index scans (`hnsw.ef_search`). Defaults to the server setting.
+        probes: Number of lists scanned by IVFFlat index scans (`ivfflat.probes`). Defaults to the server setting.
     """
 
+    DISTANCE_METRIC_OPS = {
+        "cosine_distance": "vector_cosine_ops",
+        "l2_distance": "vector_l2_ops",
+        "inner_product": "vector_ip_ops",
+    }
+
     connection_string: Optional[str] = field(default=None, kw_only=True, metadata={"serializable": True})
     create_engine_params: dict = field(factory=dict, kw_only=True, metadata={"serializable": True})
     engine: Optional[Engine] = field(default=None, kw_only=True)
     table_name: str = field(kw_only=True, metadata={"serializable": True})
+    dimensions: Optional[int] = field(default=None, kw_only=True, metadata={"serializable": True})
+    pool_size: int = field(default=5, kw_only=True, metadata={"serializable": True})
+    max_overflow: int = field(default=10, kw_only=True, metadata={"serializable": True})
+    ef_search: Optional[int] = field(default=None, kw_only=True, metadata={"serializable": True})
+    probes: Optional[int] = field(default=None, kw_only=True, metadata={"serializable": True})
     _model: Any = field(default=Factory(lambda self: self.default_vector_model(), takes_self=True))
 
     @connection_string.validator  # pyright: ignore
@@ -57,12 +73,30 @@ class PgVectorVectorStoreDriver(BaseVectorStoreDriver):
         If not, a connection string is used to create a new database connection here.
         """
         if self.engine is None:
-            self.engine = cast(Engine, create_engine(self.connection_string, **self.create_engine_params))
+            self.engine = cast(
+                Engine,
+                create_engine(
+                    self.connection_string,
+                    **({"pool_size": self.pool_size, "max_overflow": self.max_overflow} | self.create_engine_params),
+                ),
+            )
 
     def setup(
-        self, create_schema: bool = True, install_uuid_extension: bool = True, install_vector_extension: bool = True
+        self,
+        create_schema: bool = True,
+        install_uuid_extension: bool = True,
+        install_vector_extension: bool = True,
+        index_type: Optional[str] = None,
+        distance_metrics: Optional[list[str]] = None,
+        m: int = 16,
+        ef_construction: int = 64,
+        lists: int = 100,
     ) -> None:
-        """Provides a mechanism to initialize the database schema and extensions."""
+        """Provides a mechanism to initialize the database schema and extensions.
+
+        Without an index, queries scan and sort every row. Pass `index_type` to also create approximate nearest
+        neighbor indexes with `create_index()`.
+        """
         if install_uuid_extension:
             self.engine.execute('CREATE EXTENSION IF NOT EXISTS "uuid-ossp";')
 
@@ -72,6 +106,37 @@ class PgVectorVectorStoreDriver(BaseVectorStoreDriver):
         if create_schema:
             self._model.metadata.create_all(self.engine)
 
+        if index_type is not None:
+            self.create_index(index_type, distance_metrics, m=m, ef_construction=ef_construction, lists=lists)
+
+    def create_index(
+        self,
+        index_type: str = "hnsw",
+        distance_metrics: Optional[list[str]] = None,
+        m: int = 16,
+        ef_construction: int = 64,
+        lists: int = 100,
+    ) -> None:
+        """Creates an approximate nearest neighbor index on the vector column for each distance metric, unless it exists.
+
+        A query only uses the index of the distance metric it is run with.
+
+        Args:
+            index_type: `hnsw`, which has better recall and query speed, or `ivfflat`, which builds faster and uses less
+                memory. IVFFlat lists are computed from the rows in the table, so create the index after loading data.
+            distance_metrics: Distance metrics to index, from `cosine_distance`, `l2_distance`, and `inner_product`.
+                Defaults to `cosine_distance`.
+            m: Maximum number of connections per HNSW node.
+            ef_construction: Size of the candidate list used to build the HNSW graph.
+            lists: Number of IVFFlat lists. pgvector suggests rows / 1000 for up to 1M rows, and sqrt(rows) above.
+        """
+        for distance_metric in distance_metrics if distance_metrics else ["cosine_distance"]:
+            self.engine.execute(
+                self._create_index_statement(
+                    index_type, distance_metric, m=m, ef_construction=ef_construction, lists=lists
+                )
+            )
+
     def upsert_vector(
         self,
         vector: list[float],
@@ -80,14 +145,40 @@ class PgVectorVectorStoreDriver(BaseVectorStoreDriver):
         meta: Optional[dict] = None,
         **kwargs,
     ) -> str:
-        """Inserts or updates a vector in the collection."""
+        """Inserts or updates a vector in the collection with a single `INSERT ... ON CONFLICT` statement."""
+        return self.upsert_vectors(
+            [BaseVectorStoreDriver.Entry(id=vector_id, vector=vector, namespace=namespace, meta=meta)], **kwargs
+        )[0]
+
+    def upsert_vectors(
+        self, entries: list[BaseVectorStoreDriver.Entry], batch_size: Optional[int] = None, **kwargs
+    ) -> list[str]:
+        """Inserts or updates many vectors with one multi-row `INSERT ... ON CONFLICT` per batch and a single commit."""
+        batch_size = batch_size if batch_size else BaseVectorStoreDriver.DEFAULT_UPSERT_BATCH_SIZE
+        rows = [
+            {
+                "id": entry.id if entry.id is not None else str(uuid.uuid4()),
+                "vector": entry.vector,
+                "namespace": entry.namespace,
+                "meta": entry.meta,
+                **kwargs,
+            }
+            for entry in entries
+        ]
+
         with Session(self.engine) as session:
-            obj = self._model(id=vector_id, vector=vector, namespace=namespace, meta=meta, **kwargs)
+            for i in range(0, len(rows), batch_size):
+                statement = insert(self._model).values(rows[i : i + batch_size])
+                statement = statement.on_conflict_do_update(
+                    index_elements=["id"],
+                    set_={column: statement.excluded[column] for column in rows[0] if column != "id"},
+                )
+
+                session.execute(statement)
 
-            obj = session.merge(obj)
             session.commit()
 
-            return str(getattr(obj, "id"))
+        return [str(row["id"]) for row in rows]
 
     def load_entry(self, vector_id: str, namespace: Optional[str] = None) -> BaseVectorStoreDriver.Entry:
         """Retrieves a specific vector entry from the collection based on its identifier and optional namespace."""
@@ -101,35 +192,72 @@ class PgVectorVectorStoreDriver(BaseVectorStoreDriver):
                 meta=getattr(result, "meta"),
             )
 
-    def load_entries(self, namespace: Optional[str] = None) -> list[BaseVectorStoreDriver.Entry]:
-        """Retrieves all vector entries from the collection, optionally filtering to only
-        those that match the provided namespace.
+    def load_entries_by_ids(
+        self, vector_ids: list[str], namespace: Optional[str] = None
+    ) -> list[BaseVectorStoreDriver.Entry]:
+        """Retrieves the vector entries of the given identifiers with a single `WHERE id = ANY(...)` query, optionally
+        filtering to only those that match the provided namespace.
         """
         with Session(self.engine) as session:
-            query = session.query(self._model)
+            query = session.query(self._model).filter(self._ids_clause(vector_ids))
             if namespace:
                 query = query.filter_by(namespace=namespace)
 
-            results = query.all()
+            results = {str(result.id): result for result in query.all()}
 
             return [
                 BaseVectorStoreDriver.Entry(
                     id=str(result.id), vector=result.vector, namespace=result.namespace, meta=result.meta
                 )
-                for result in results
+                for result in (results.get(vector_id) for vector_id in vector_ids)
+                if result is not None
             ]
 
-    def query(
+    def existing_ids(self, vector_ids: list[str], namespace: Optional[str] = None) -> set[str]:
+        """Returns the given identifiers that have a row, selecting only the `id` column with a single
+        `WHERE id = ANY(...)` query.
+        """
+        with Session(self.engine) as session:
+            query = session.query(self._model.id).filter(self._ids_clause(vector_ids))
+            if namespace:
+                query = query.filter_by(namespace=namespace)
+
+            return {str(row.id) for row in query.all()}
+
+    def iter_entries(
+        self, namespace: Optional[str] = None, page_size: Optional[int] = None
+    ) -> Iterator[BaseVectorStoreDriver.Entry]:
+        """Yields all vector entries from the collection, optionally filtering to only
+        those that match the provided namespace.
+
+        Rows are streamed from a server-side cursor, `page_size` rows at a time.
+        """
+        with Session(self.engine) as session:
+            query = session.query(self._model)
+            if namespace:
+                query = query.filter_by(namespace=namespace)
+
+            for result in query.yield_per(page_size if page_size else BaseVectorStoreDriver.DEFAULT_PAGE_SIZE):
+                yield BaseVectorStoreDriver.Entry(
+                    id=str(result.id), vector=result.vector, namespace=result.namespace, meta=result.meta
+                )
+
+    def query_vector(
         self,
-        query: str,
+        vector: list[float],
         count: Optional[int] = BaseVectorStoreDriver.DEFAULT_QUERY_COUNT,
         namespace: Optional[str] = None,
         include_vectors: bool = False,
         distance_metric: str = "cosine_distance",
+        ef_search: Optional[int] = None,
+        probes: Optional[int] = None,
         **kwargs,
     ) -> list[BaseVectorStoreDriver.Entry]:
         """Performs a search on the collection to find vectors similar to the provided input vector,
         optionally filtering to only those that match the provided namespace.
+
+        `ef_search` and `probes` override `PgVectorVectorStoreDriver.ef_search` and `PgVectorVectorStoreDriver.probes`
+        for this query. They trade recall for speed when the query uses an HNSW or IVFFlat index.
         """
         distance_metrics = {
             "cosine_distance": self._model.vector.cosine_distance,
@@ -142,8 +270,16 @@ class PgVectorVectorStoreDriver(BaseVectorStoreDriver):
 
         op = distance_metrics[distance_metric]
 
+        ef_search = ef_search if ef_search is not None else self.ef_search
+        probes = probes if probes is not None else self.probes
+
         with Session(self.engine) as session:
-            vector = self.embedding_driver.embed_string(query)
+            # Settings are local to the transaction of the query, so they don't leak to other uses of the connection.
+            if ef_search is not None:
+                session.execute(select(func.set_config("hnsw.ef_search", str(ef_search), True)))
+
+            if probes is not None:
+                session.execute(select(func.set_config("ivfflat.probes", str(probes), True)))
 
             # The query should return both the vector and the distance metric score.
             query_result = session.query(self._model, op(vector).label("score")).order_by(op(vector))  # pyright: ignore
@@ -173,6 +309,34 @@ class PgVectorVectorStoreDriver(BaseVectorStoreDriver):
                 for result in results
             ]
 
+    def _ids_clause(self, vector_ids: list[str]) -> Any:
+        # The identifiers are bound as a single array parameter, so the statement is the same for any number of them.
+        return self._model.id == any_(bindparam("vector_ids", vector_ids, type_=ARRAY(self._model.id.type)))
+
+    def _create_index_statement(
+        self, index_type: str, distance_metric: str, m: int, ef_construction: int, lists: int
+    ) -> str:
+        if index_type not in ["hnsw", "ivfflat"]:
+            raise ValueError("Invalid index type provided")
+
+        if distance_metric not in self.DISTANCE_METRIC_OPS:
+            raise ValueError("Invalid distance metric provided")
+
+        if getattr(self._model.vector.type, "dim", None) is None:
+            raise ValueError("Vector indexes require a vector column with dimensions")
+
+        ops = self.DISTANCE_METRIC_OPS[distance_metric]
+        params = (
+            f"m = {int(m)}, ef_construction = {int(ef_construction)}"
+            if index_type == "hnsw"
+            else f"lists = {int(lists)}"
+        )
+
+        return (
+            f'CREATE INDEX IF NOT EXISTS "{self.table_name}_vector_{ops}_{index_type}_idx" '
+            f'ON "{self.table_name}" USING {index_type} (vector {ops}) WITH ({params});'
+        )
+
     def default_vector_model(self) -> Any:
         Vector = import_optional_dependency("pgvector.sqlalchemy").Vector
         Base = declarative_base()
@@ -182,11 +346,19 @@ class PgVectorVectorStoreDriver(BaseVectorStoreDriver):
             __tablename__ = self.table_name
 
             id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4, unique=True, nullable=False)
-            vector = Column(Vector())
+            vector = Column(Vector(self.dimensions))
             namespace = Column(String)
             meta = Column(JSON)
 
         return VectorModel
 
-    def delete_vector(self, vector_id: str):
-        raise NotImplementedError(f"{self.__class__.__name__} does not support deletion.")
+    def delete_vector(self, vector_id: str, namespace: Optional[str] = None) -> None:
+        """Deletes the vector with the given identifier from the collection, if it is in `namespace` when one is given."""
+        statement = delete(self._model).where(self._model.id == vector_id)
+
+        if namespace:
+            statement = statement.where(self._model.namespace == namespace)
+
+        with Session(self.engine) as session:
+            session.execute(statement)
+            session.commit()
@@ -1,5 +1,5 @@
 from __future__ import annotations
-from typing import Optional, TYPE_CHECKING, Any
+from typing import Iterator, Optional, TYPE_CHECKING, Any
 from griptape.utils import str_to_hash, import_optional_dependency
 from griptape.drivers import BaseVectorStoreDriver
 from attrs import define, field
@@ -39,38 +39,65 @@ class PineconeVectorStoreDriver(BaseVectorStoreDriver):
 
         return vector_id
 
+    def upsert_vectors(
+        self, entries: list[BaseVectorStoreDriver.Entry], batch_size: Optional[int] = None, **kwargs
+    ) -> list[str]:
+        batch_size = batch_size if batch_size else BaseVectorStoreDriver.DEFAULT_UPSERT_BATCH_SIZE
+        vector_ids = [e.id if e.id else str_to_hash(str(e.vector)) for e in entries]
+        vectors_by_namespace: dict[Optional[str], list[tuple]] = {}
+
+        for vector_id, entry in zip(vector_ids, entries):
+            vectors_by_namespace.setdefault(entry.namespace, []).append((vector_id, entry.vector, entry.meta))
+
+        for namespace, vectors in vectors_by_namespace.items():
+            params: dict[str, Any] = {"namespace": namespace} | kwargs
+
+            for i in range(0, len(vectors), batch_size):
+                self.index.upsert(vectors=vectors[i : i + batch_size], **params)
+
+        return vector_ids
+
     def load_entry(self, vector_id: str, namespace: Optional[str] = None) -> Optional[BaseVectorStoreDriver.Entry]:
-        result = self.index.fetch(ids=[vector_id], namespace=namespace).to_dict()
-        vectors = list(result["vectors"].values())
+        entries = self.load_entries_by_ids([vector_id], namespace)
 
-        if len(vectors) > 0:
-            vector = vectors[0]
+        return entries[0] if entries else None
 
-            return BaseVectorStoreDriver.Entry(
-                id=vector["id"], meta=vector["metadata"], vector=vector["values"], namespace=result["namespace"]
+    def load_entries_by_ids(
+        self, vector_ids: list[str], namespace: Optional[str] = None
+    ) -> list[BaseVectorStoreDriver.Entry]:
+        # IDs are sent in the query string of fetch requests, so they are fetched in pages to bound the URL length.
+        entries = []
+
+        for i in range(0, len(vector_ids), BaseVectorStoreDriver.DEFAULT_PAGE_SIZE):
+            page = vector_ids[i : i + BaseVectorStoreDriver.DEFAULT_PAGE_SIZE]
+            result = self.index.fetch(ids=page, namespace=namespace).to_dict()
+
+            entries.extend(
+                BaseVectorStoreDriver.Entry(
+                    id=vector["id"], vector=vector["values"], meta=vector.get("metadata"), namespace=result["namespace"]
+                )
+                for vector in (result["vectors"].get(vector_id) for vector_id in page)
+                if vector is not None
             )
-        else:
-            return None
 
-    def load_entries(self, namespace: Optional[str] = None) -> list[BaseVectorStoreDriver.Entry]:
-        # This is a hacky way to query up to 10,000 values from Pinecone. Waiting on an official API for fetching
-        # all values from a namespace:
-        # https://community.pinecone.io/t/is-there-a-way-to-query-all-the-vectors-and-or-metadata-from-a-namespace/797/5
+        return entries
 
-        results = self.index.query(
-            vector=self.embedding_driver.embed_string(""), top_k=10000, include_metadata=True, namespace=namespace
-        )
+    def existing_ids(self, vector_ids: list[str], namespace: Optional[str] = None) -> set[str]:
+        return {entry.id for entry in self.load_entries_by_ids(vector_ids, namespace)}
 
-        return [
-            BaseVectorStoreDriver.Entry(
-                id=r["id"], vector=r["values"], meta=r["metadata"], namespace=results["namespace"]
-            )
-            for r in results["matches"]
-        ]
+    def iter_entries(
+        self, namespace: Optional[str] = None, page_size: Optional[int] = None
+    ) -> Iterator[BaseVectorStoreDriver.Entry]:
+        # Pages of IDs are listed from the namespace and the vectors of every page are fetched in a single request.
+        # Listing IDs is only supported by serverless indexes.
+        page_size = page_size if page_size else BaseVectorStoreDriver.DEFAULT_PAGE_SIZE
 
-    def query(
+        for ids in self.index.list(namespace=namespace, limit=page_size):
+            yield from self.load_entries_by_ids(ids, namespace)
+
+    def query_vector(
         self,
-        query: str,
+        vector: list[float],
         count: Optional[int] = None,
         namespace: Optional[str] = None,
         include_vectors: bool = False,
@@ -78,8 +105,6 @@ class PineconeVectorStoreDriver(BaseVectorStoreDriver):
         include_metadata=True,
         **kwargs,
     ) -> list[BaseVectorStoreDriver.Entry]:
-        vector = self.embedding_driver.embed_string(query)
-
         params = {
             "top_k": count if count else BaseVectorStoreDriver.DEFAULT_QUERY_COUNT,
             "namespace": namespace,
@@ -96,5 +121,5 @@ class PineconeVectorStoreDriver(BaseVectorStoreDriver):
             for r in results["matches"]
         ]
 
-    def delete_vector(self, vector_id: str):
+    def delete_vector(self, vector_id: str, namespace: Optional[str] = None) -> None:
         raise NotImplementedError(f"{self.__class__.__name__} does not support deletion.")
@@ -1,13 +1,15 @@
 from __future__ import annotations
+import itertools
 import json
 import numpy as np
 from griptape.utils import import_optional_dependency, str_to_hash
-from typing import Optional, TYPE_CHECKING
+from typing import Iterator, Optional, TYPE_CHECKING
 from attrs import define, field, Factory
 from griptape.drivers import BaseVectorStoreDriver
 
 if TYPE_CHECKING:
     from redis import Redis
+    from redis.commands.search.query import Query
 
 
 @define
@@ -15,7 +17,10 @@ class RedisVectorStoreDriver(BaseVectorStoreDriver):
     """A Vector Store Driver for Redis.
 
     This driver interfaces with a Redis instance and utilizes the Redis hashes and RediSearch module to store, retrieve, and query vectors in a structured manner.
-    Proper setup of the Redis instance and RediSearch is necessary for the driver to function correctly.
+    Proper setup of the Redis instance and RediSearch is necessary for the driver to function correctly; `create_index()` creates a suitable index.
+
+    Vectors are stored once, as float32 bytes in the `vector` field of their hash, and every operation on many keys is
+    sent in a single pipeline round trip.
 
     Attributes:
         host: The host of the Redis instance.
@@ -54,22 +59,32 @@ class RedisVectorStoreDriver(BaseVectorStoreDriver):
         Metadata associated with the vector can also be provided.
         """
         vector_id = vector_id if vector_id else str_to_hash(str(vector))
-        key = self._generate_key(vector_id, namespace)
-        bytes_vector = json.dumps(vector).encode("utf-8")
 
-        mapping = {}
-        mapping["vector"] = np.array(vector, dtype=np.float32).tobytes()
-        mapping["vec_string"] = bytes_vector
+        self.client.hset(
+            self._generate_key(vector_id, namespace), mapping=self._generate_mapping(vector, namespace, meta)
+        )
 
-        if namespace:
-            mapping["namespace"] = namespace
+        return vector_id
 
-        if meta:
-            mapping["metadata"] = json.dumps(meta)
+    def upsert_vectors(
+        self, entries: list[BaseVectorStoreDriver.Entry], batch_size: Optional[int] = None, **kwargs
+    ) -> list[str]:
+        """Inserts or updates many vectors in Redis, sending each batch in a single pipeline round trip."""
+        batch_size = batch_size if batch_size else BaseVectorStoreDriver.DEFAULT_UPSERT_BATCH_SIZE
+        vector_ids = [e.id if e.id else str_to_hash(str(e.vector)) for e in entries]
 
-        self.client.hset(key, mapping=mapping)
+        for i in range(0, len(entries), batch_size):
+            pipeline = self.client.pipeline(transaction=False)
 
-        return vector_id
+            for vector_id, entry in zip(vector_ids[i : i + batch_size], entries[i : i + batch_size]):
+                pipeline.hset(
+                    self._generate_key(vector_id, entry.namespace),
+                    mapping=self._generate_mapping(entry.vector, entry.namespace, entry.meta),
+                )
+
+            pipeline.execute()
+
+        return vector_ids
 
     def load_entry(self, vector_id: str, namespace: Optional[str] = None) -> Optional[BaseVectorStoreDriver.Entry]:
         """Retrieves a specific vector entry from Redis based on its identifier and optional namespace.
@@ -77,33 +92,69 @@ class RedisVectorStoreDriver(BaseVectorStoreDriver):
         Returns:
             If the entry is found, it returns an instance of BaseVectorStoreDriver.Entry; otherwise, None is returned.
         """
-        key = self._generate_key(vector_id, namespace)
-        result = self.client.hgetall(key)
-        vector = np.frombuffer(result[b"vector"], dtype=np.float32).tolist()
-        meta = json.loads(result[b"metadata"]) if b"metadata" in result else None
+        result = self.client.hgetall(self._generate_key(vector_id, namespace))
 
-        return BaseVectorStoreDriver.Entry(id=vector_id, meta=meta, vector=vector, namespace=namespace)
+        return self._hash_to_entry(vector_id, namespace, result) if b"vector" in result else None
 
-    def load_entries(self, namespace: Optional[str] = None) -> list[BaseVectorStoreDriver.Entry]:
-        """Retrieves all vector entries from Redis that match the optional namespace.
+    def load_entries_by_ids(
+        self, vector_ids: list[str], namespace: Optional[str] = None
+    ) -> list[BaseVectorStoreDriver.Entry]:
+        """Retrieves the vector entries of the given identifiers with one pipelined `HGETALL` per identifier.
 
         Returns:
-            A list of `BaseVectorStoreDriver.Entry` objects.
+            The entries that were found, in the same order as `vector_ids`.
         """
-        pattern = f"{namespace}:*" if namespace else "*"
-        keys = self.client.keys(pattern)
+        pipeline = self.client.pipeline(transaction=False)
 
-        entries = []
-        for key in keys:
-            entry = self.load_entry(key.decode("utf-8"), namespace)
-            if entry:
-                entries.append(entry)
+        for vector_id in vector_ids:
+            pipeline.hgetall(self._generate_key(vector_id, namespace))
 
-        return entries
+        return [
+            self._hash_to_entry(vector_id, namespace, result)
+            for vector_id, result in zip(vector_ids, pipeline.execute())
+            if b"vector" in result
+        ]
 
-    def query(
+    def existing_ids(self, vector_ids: list[str], namespace: Optional[str] = None) -> set[str]:
+        """Checks which of the given identifiers have a hash in Redis with one pipelined `EXISTS` per identifier."""
+        pipeline = self.client.pipeline(transaction=False)
+
+        for vector_id in vector_ids:
+            pipeline.exists(self._generate_key(vector_id, namespace))
+
+        return {vector_id for vector_id, exists in zip(vector_ids, pipeline.execute()) if exists}
+
+    def iter_entries(
+        self, namespace: Optional[str] = None, page_size: Optional[int] = None
+    ) -> Iterator[BaseVectorStoreDriver.Entry]:
+        """Yields every vector entry in Redis that matches the optional namespace.
+
+        Keys are walked with `SCAN`, which does not block the server like `KEYS`, and the hashes of every page of keys
+        are loaded in a single pipeline round trip.
+        """
+        page_size = page_size if page_size else BaseVectorStoreDriver.DEFAULT_PAGE_SIZE
+        keys = self.client.scan_iter(match=f"{self._get_doc_prefix(namespace)}*", count=page_size)
+
+        while page := list(itertools.islice(keys, page_size)):
+            pipeline = self.client.pipeline(transaction=False)
+
+            for key in page:
+                pipeline.hgetall(key)
+
+            for key, result in zip(page, pipeline.execute()):
+                # Keys that are not vector hashes, or were deleted since they were scanned, are skipped.
+                if b"vector" in result:
+                    key = key.decode("utf-8")
+
+                    yield self._hash_to_entry(
+                        key.split(":", 1)[1] if ":" in key else key,
+                        key.split(":", 1)[0] if ":" in key else None,
+                        result,
+                    )
+
+    def query_vector(
         self,
-        query: str,
+        vector: list[float],
         count: Optional[int] = None,
         namespace: Optional[str] = None,
         include_vectors: bool = False,
@@ -116,47 +167,139 @@ class RedisVectorStoreDriver(BaseVectorStoreDriver):
         Returns:
             A list of BaseVectorStoreDriver.Entry objects, each encapsulating the retrieved vector, its similarity score, metadata, and namespace.
         """
-        Query = import_optional_dependency("redis.commands.search.query").Query
+        return self._search([vector], count, namespace, include_vectors)[0]
 
-        vector = self.embedding_driver.embed_string(query)
+    def query_many(
+        self,
+        queries: list[str] | list[list[float]],
+        count: Optional[int] = None,
+        namespace: Optional[str] = None,
+        include_vectors: bool = False,
+        **kwargs,
+    ) -> list[list[BaseVectorStoreDriver.Entry]]:
+        """Performs many nearest neighbor searches on Redis in a single pipeline round trip.
+
+        Returns:
+            The results of every query, in the same order as `queries`.
+        """
+        return self._search(self._embed_queries(queries), count, namespace, include_vectors)
+
+    def create_index(
+        self,
+        dimensions: int,
+        algorithm: str = "HNSW",
+        distance_metric: str = "COSINE",
+        prefixes: Optional[list[str]] = None,
+        **algorithm_params,
+    ) -> None:
+        """Creates the RediSearch index of the driver over the hashes it writes.
+
+        Args:
+            dimensions: Number of dimensions of the vectors.
+            algorithm: Vector index algorithm, `HNSW` for approximate search or `FLAT` for exact search.
+            distance_metric: `COSINE`, `IP`, or `L2`. Query scores are distances in this metric, lower is closer.
+            prefixes: Key prefixes of the hashes to index, such as `"griptape:"` for the `griptape` namespace.
+                Defaults to every hash in the database.
+            algorithm_params: Parameters of the algorithm, such as `M`, `EF_CONSTRUCTION`, and `EF_RUNTIME` for
+                `HNSW`, or `BLOCK_SIZE` for `FLAT`.
+        """
+        fields = import_optional_dependency("redis.commands.search.field")
+        index_definition = import_optional_dependency("redis.commands.search.indexDefinition")
+
+        self.client.ft(self.index).create_index(
+            [
+                fields.TagField("namespace"),
+                fields.VectorField(
+                    "vector",
+                    algorithm,
+                    {"TYPE": "FLOAT32", "DIM": dimensions, "DISTANCE_METRIC": distance_metric} | algorithm_params,
+                ),
+            ],
+            definition=index_definition.IndexDefinition(
+                prefix=prefixes if prefixes else [], index_type=index_definition.IndexType.HASH
+            ),
+        )
+
+    def _search(
+        self, vectors: list[list[float]], count: Optional[int], namespace: Optional[str], include_vectors: bool
+    ) -> list[list[BaseVectorStoreDriver.Entry]]:
+        query = self._generate_query(count, namespace, include_vectors)
+        pipeline = self.client.ft(self.index).pipeline(transaction=False)
+
+        for vector in vectors:
+            pipeline.search(query, self._generate_query_params(vector))
+
+        # Pipelined searches return raw replies. They are parsed here rather than with `redis.commands.search.Result`,
+        # which decodes every field as text and would corrupt the binary vectors.
+        return [self._search_reply_to_entries(reply, include_vectors) for reply in pipeline.execute()]
+
+    def _generate_query(self, count: Optional[int], namespace: Optional[str], include_vectors: bool = False) -> Query:
+        """Generates a KNN query, filtered by `namespace` when provided."""
+        Query = import_optional_dependency("redis.commands.search.query").Query
 
         filter_expression = f"(@namespace:{{{namespace}}})" if namespace else "*"
-        query_expression = (
+        return_fields = ["score", "metadata", "vector"] if include_vectors else ["score", "metadata"]
+
+        return (
             Query(f"{filter_expression}=>[KNN {count or 10} @vector $vector as score]")
             .sort_by("score")
-            .return_fields("id", "score", "metadata", "vec_string")
+            .return_fields(*return_fields)
             .paging(0, count or 10)
             .dialect(2)
         )
 
-        query_params = {"vector": np.array(vector, dtype=np.float32).tobytes()}
+    def _generate_query_params(self, vector: list[float]) -> dict:
+        return {"vector": np.array(vector, dtype=np.float32).tobytes()}
 
-        results = self.client.ft(self.index).search(query_expression, query_params).docs  # pyright: ignore
+    def _search_reply_to_entries(self, reply: list, include_vectors: bool) -> list[BaseVectorStoreDriver.Entry]:
+        """Parses a raw `FT.SEARCH` reply, which holds the total count followed by every key and its list of fields."""
+        entries = []
 
-        query_results = []
-        for document in results:
-            metadata = json.loads(document.metadata) if hasattr(document, "metadata") else None
-            namespace = document.id.split(":")[0] if ":" in document.id else None
-            vector_id = document.id.split(":")[1] if ":" in document.id else document.id
-            vector_float_list = json.loads(document.vec_string) if include_vectors else None
-            query_results.append(
+        for key, values in zip(reply[1::2], reply[2::2]):
+            key = key.decode("utf-8")
+            fields = dict(zip(values[::2], values[1::2]))
+
+            entries.append(
                 BaseVectorStoreDriver.Entry(
-                    id=vector_id,
-                    vector=vector_float_list,
-                    score=float(document.score),
-                    meta=metadata,
-                    namespace=namespace,
+                    id=key.split(":", 1)[1] if ":" in key else key,
+                    vector=np.frombuffer(fields[b"vector"], dtype=np.float32).tolist() if include_vectors else None,
+                    score=float(fields[b"score"]),
+                    meta=json.loads(fields[b"metadata"]) if b"metadata" in fields else None,
+                    namespace=key.split(":", 1)[0] if ":" in key else None,
                 )
             )
-        return query_results
+
+        return entries
+
+    def _hash_to_entry(self, vector_id: str, namespace: Optional[str], result: dict) -> BaseVectorStoreDriver.Entry:
+        return BaseVectorStoreDriver.Entry(
+            id=vector_id,
+            vector=np.frombuffer(result[b"vector"], dtype=np.float32).tolist(),
+            meta=json.loads(result[b"metadata"]) if b"metadata" in result else None,
+            namespace=namespace,
+        )
 
     def _generate_key(self, vector_id: str, namespace: Optional[str] = None) -> str:
         """Generates a Redis key using the provided vector ID and optionally a namespace."""
         return f"{namespace}:{vector_id}" if namespace else vector_id
 
+    def _generate_mapping(self, vector: list[float], namespace: Optional[str], meta: Optional[dict]) -> dict:
+        """Generates the Redis hash fields for a vector."""
+        mapping = {}
+        mapping["vector"] = np.array(vector, dtype=np.float32).tobytes()
+
+        if namespace:
+            mapping["namespace"] = namespace
+
+        if meta:
+            mapping["metadata"] = json.dumps(meta)
+
+        return mapping
+
     def _get_doc_prefix(self, namespace: Optional[str] = None) -> str:
         """Get the document prefix based on the provided namespace."""
         return f"{namespace}:" if namespace else ""
 
-    def delete_vector(self, vector_id: str):
-        raise NotImplementedError(f"{self.__class__.__name__} does not support deletion.")
+    def delete_vector(self, vector_id: str, namespace: Optional[str] = None) -> None:
+        """Deletes the hash of the vector with the given identifier and optional namespace from Redis."""
+        self.client.delete(self._generate_key(vector_id, namespace))
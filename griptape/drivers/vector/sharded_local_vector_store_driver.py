@@ -0,0 +1,359 @@
+from __future__ import annotations
+import dataclasses
+import heapq
+import itertools
+import os
+import tempfile
+import threading
+from concurrent import futures
+from typing import Callable, Iterator, Optional
+import numpy as np
+from attrs import define, field, Factory
+from griptape import utils
+from griptape.drivers import BaseVectorStoreDriver
+from griptape.drivers.vector.local_metadata_index import LocalMetadataIndex
+from griptape.drivers.vector.local_vector_shard import LocalVectorShard
+
+
+@define(kw_only=True)
+class ShardedLocalVectorStoreDriver(BaseVectorStoreDriver):
+    """A Vector Store Driver that partitions vectors across shards that a pool of worker processes scores in parallel.
+
+    Vectors are spread evenly across `shard_count` shards of memory-mapped float32 files, which worker processes map
+    once and score in place, so a query is scored by every shard at the same time instead of by one core. Every shard
+    returns its top `count` rows, and the per-shard results are merged into the overall top `count`. Entry IDs,
+    namespaces, and metadata are kept in memory by the driver, which maps the rows returned by the shards back to
+    entries.
+
+    Deleting an entry labels its row as deleted so that shards skip it. Upserting an existing entry overwrites its row.
+    A query holds a lease on the shard files it scores until its results are built, so files that a growing shard
+    replaces are only removed once every query that reads them is done. Rows of deleted entries are reused by new
+    entries once no query holds a lease on their shard, so a query never returns a row that was reused while it ran.
+
+    Attributes:
+        shard_count: Number of shards. Defaults to the number of CPUs.
+        shard_dir: Directory of the shard files. Defaults to a temporary directory in shared memory (`/dev/shm`) when
+            available, which is removed along with the driver.
+        initial_shard_capacity: Number of rows allocated per shard the first time vectors are inserted. Capacity
+            doubles when full.
+        query_executor_fn: Function that creates the executor that scores shards. Defaults to a process pool with one
+            worker per shard. The executor is created by the first query and reused until `close()` is called.
+        indexed_meta_keys: Metadata keys to maintain an inverted index over in every shard. Filters on indexed keys
+            select candidate rows without reading the metadata of every entry, while other keys are checked against
+            the metadata of every candidate.
+    """
+
+    shard_count: int = field(default=Factory(lambda: os.cpu_count() or 1))
+    shard_dir: Optional[str] = field(default=None)
+    initial_shard_capacity: int = field(default=1024)
+    query_executor_fn: Callable[[], futures.Executor] = field(
+        default=Factory(lambda self: lambda: futures.ProcessPoolExecutor(max_workers=self.shard_count), takes_self=True)
+    )
+    indexed_meta_keys: list[str] = field(factory=list)
+    thread_lock: threading.Lock = field(default=Factory(lambda: threading.Lock()))
+    _shards: list[LocalVectorShard] = field(factory=list, init=False)
+    _meta_indexes: list[LocalMetadataIndex] = field(factory=list, init=False)
+    _shard_entries: list[list[BaseVectorStoreDriver.Entry]] = field(factory=list, init=False)
+    _rows: dict[tuple[Optional[str], str], tuple[int, int]] = field(factory=dict, init=False)
+    _free_rows: list[list[int]] = field(factory=list, init=False)
+    _labels: dict[Optional[str], int] = field(factory=dict, init=False)
+    _temp_dir: Optional[tempfile.TemporaryDirectory] = field(default=None, init=False)
+    _query_executor: Optional[futures.Executor] = field(default=None, init=False)
+
+    @shard_count.validator  # pyright: ignore
+    def validate_shard_count(self, _, shard_count: int) -> None:
+        if shard_count < 1:
+            raise ValueError("shard_count must be at least 1")
+
+    def __attrs_post_init__(self) -> None:
+        if self.shard_dir is None:
+            self._temp_dir = tempfile.TemporaryDirectory(
+                prefix="griptape-shards-", dir="/dev/shm" if os.path.isdir("/dev/shm") else None
+            )
+            directory = self._temp_dir.name
+        else:
+            directory = self.shard_dir
+
+            os.makedirs(directory, exist_ok=True)
+
+        self._shards = [
+            LocalVectorShard(directory=directory, name=f"shard-{i}", initial_capacity=self.initial_shard_capacity)
+            for i in range(self.shard_count)
+        ]
+        self._shard_entries = [[] for _ in range(self.shard_count)]
+        self._free_rows = [[] for _ in range(self.shard_count)]
+        self._meta_indexes = [LocalMetadataIndex(keys=self.indexed_meta_keys) for _ in range(self.shard_count)]
+
+    @property
+    def namespaces(self) -> list[Optional[str]]:
+        with self.thread_lock:
+            return list(dict.fromkeys(namespace for namespace, _ in self._rows))
+
+    def upsert_vector(
+        self,
+        vector: list[float],
+        vector_id: Optional[str] = None,
+        namespace: Optional[str] = None,
+        meta: Optional[dict] = None,
+        **kwargs,
+    ) -> str:
+        return self.upsert_vectors([self.Entry(id=vector_id, vector=vector, namespace=namespace, meta=meta)])[0]
+
+    def upsert_vectors(
+        self, entries: list[BaseVectorStoreDriver.Entry], batch_size: Optional[int] = None, **kwargs
+    ) -> list[str]:
+        # Vectors are written to the shard files directly, so every entry is written at once regardless of batch_size.
+        entries = [
+            dataclasses.replace(entry, id=entry.id if entry.id else utils.str_to_hash(str(entry.vector)))
+            for entry in entries
+        ]
+
+        with self.thread_lock:
+            appends: list[list[BaseVectorStoreDriver.Entry]] = [[] for _ in self._shards]
+            writes: list[dict[int, BaseVectorStoreDriver.Entry]] = [{} for _ in self._shards]
+            new_rows: dict[tuple[Optional[str], str], tuple[int, int]] = {}
+            added = [0 for _ in self._shards]
+
+            for entry in entries:
+                key = (entry.namespace, entry.id)
+                location = new_rows.get(key, self._rows.get(key))
+
+                if location is None:
+                    # New entries go to the shard with the fewest live rows so that shards stay balanced.
+                    shard = min(range(len(self._shards)), key=lambda s: self._live_row_count(s) + added[s])
+                    added[shard] += 1
+
+                    # Queries map the rows they score back to entries, so rows are only reused while none is running.
+                    if self._free_rows[shard] and not self._shards[shard].is_leased:
+                        row = self._free_rows[shard].pop()
+                        new_rows[key] = (shard, row)
+                        writes[shard][row] = entry
+                    else:
+                        new_rows[key] = (shard, len(self._shard_entries[shard]) + len(appends[shard]))
+                        appends[shard].append(entry)
+                else:
+                    shard, row = location
+
+                    # Entries repeated in the batch replace the pending append of their first occurrence.
+                    if row >= len(self._shard_entries[shard]):
+                        appends[shard][row - len(self._shard_entries[shard])] = entry
+                    else:
+                        writes[shard][row] = entry
+
+            for shard, (shard_appends, shard_writes) in enumerate(zip(appends, writes)):
+                if shard_writes:
+                    self._shards[shard].write(
+                        np.array(list(shard_writes.keys())),
+                        np.array([e.vector for e in shard_writes.values()]),
+                        np.array([self._label(e.namespace) for e in shard_writes.values()]),
+                    )
+
+                    for row, entry in shard_writes.items():
+                        self._meta_indexes[shard].remove(row, self._shard_entries[shard][row].meta)
+                        self._meta_indexes[shard].add(row, entry.meta)
+                        self._shard_entries[shard][row] = self._stored_entry(entry)
+
+                if shard_appends:
+                    rows = self._shards[shard].append(
+                        np.array([e.vector for e in shard_appends]),
+                        np.array([self._label(e.namespace) for e in shard_appends]),
+                    )
+
+                    for row, entry in zip(rows.tolist(), shard_appends):
+                        self._meta_indexes[shard].add(row, entry.meta)
+
+                    self._shard_entries[shard].extend(self._stored_entry(e) for e in shard_appends)
+
+            self._rows.update(new_rows)
+
+        return [entry.id for entry in entries]
+
+    def load_entry(self, vector_id: str, namespace: Optional[str] = None) -> Optional[BaseVectorStoreDriver.Entry]:
+        with self.thread_lock:
+            location = self._rows.get((namespace, vector_id))
+
+            return None if location is None else self._load_row(*location)
+
+    def load_entries_by_ids(
+        self, vector_ids: list[str], namespace: Optional[str] = None
+    ) -> list[BaseVectorStoreDriver.Entry]:
+        with self.thread_lock:
+            locations = [self._rows.get((namespace, vector_id)) for vector_id in vector_ids]
+
+            return [self._load_row(*location) for location in locations if location is not None]
+
+    def existing_ids(self, vector_ids: list[str], namespace: Optional[str] = None) -> set[str]:
+        with self.thread_lock:
+            return {vector_id for vector_id in vector_ids if (namespace, vector_id) in self._rows}
+
+    def iter_entries(
+        self, namespace: Optional[str] = None, page_size: Optional[int] = None
+    ) -> Iterator[BaseVectorStoreDriver.Entry]:
+        """Yields the entries stored when iteration starts, reading `page_size` vectors from the shards at a time.
+
+        The lock is only held while a page is read, so writes are not blocked for the whole iteration.
+        """
+        page_size = page_size if page_size else BaseVectorStoreDriver.DEFAULT_PAGE_SIZE
+
+        with self.thread_lock:
+            keys = [key for key in self._rows if namespace is None or key[0] == namespace]
+
+        for start in range(0, len(keys), page_size):
+            with self.thread_lock:
+                locations = [self._rows.get(key) for key in keys[start : start + page_size]]
+                page = [self._load_row(*location) for location in locations if location is not None]
+
+            yield from page
+
+    def query_vector(
+        self,
+        vector: list[float],
+        count: Optional[int] = None,
+        namespace: Optional[str] = None,
+        include_vectors: bool = False,
+        **kwargs,
+    ) -> list[BaseVectorStoreDriver.Entry]:
+        return self._query_vectors([vector], count, namespace, include_vectors, kwargs.get("filter"))[0]
+
+    def query_many(
+        self,
+        queries: list[str] | list[list[float]],
+        count: Optional[int] = None,
+        namespace: Optional[str] = None,
+        include_vectors: bool = False,
+        **kwargs,
+    ) -> list[list[BaseVectorStoreDriver.Entry]]:
+        """Runs many queries at once, scoring every shard against all query vectors with one matrix product."""
+        return self._query_vectors(
+            self._embed_queries(queries), count, namespace, include_vectors, kwargs.get("filter")
+        )
+
+    def delete_vector(self, vector_id: str, namespace: Optional[str] = None) -> None:
+        """Deletes the entry of `vector_id` in `namespace` by labeling its row as deleted, to be reused by new entries."""
+        with self.thread_lock:
+            location = self._rows.pop((namespace, vector_id), None)
+
+            if location is not None:
+                shard, row = location
+
+                self._shards[shard].delete(np.array([row]))
+                self._meta_indexes[shard].remove(row, self._shard_entries[shard][row].meta)
+                self._free_rows[shard].append(row)
+
+    def close(self) -> None:
+        """Shuts down the query executor and removes the shard files."""
+        with self.thread_lock:
+            if self._query_executor is not None:
+                self._query_executor.shutdown()
+                self._query_executor = None
+
+            for shard, meta_index in zip(self._shards, self._meta_indexes):
+                shard.close()
+                meta_index.clear()
+
+            self._shard_entries = [[] for _ in self._shards]
+            self._free_rows = [[] for _ in self._shards]
+            self._rows = {}
+
+            if self._temp_dir is not None:
+                self._temp_dir.cleanup()
+
+    def _query_vectors(
+        self,
+        vectors: list[list[float]],
+        count: Optional[int],
+        namespace: Optional[str],
+        include_vectors: bool,
+        filter: Optional[dict] = None,
+    ) -> list[list[BaseVectorStoreDriver.Entry]]:
+        with self.thread_lock:
+            if namespace and namespace not in self._labels:
+                return [[] for _ in vectors]
+
+            label = self._labels[namespace] if namespace else None
+            tasks = [
+                (i, shard.view(), self._filter_rows(i, filter) if filter else None)
+                for i, shard in enumerate(self._shards)
+                if shard.size
+            ]
+
+            if self._query_executor is None:
+                self._query_executor = self.query_executor_fn()
+
+            executor = self._query_executor
+
+        try:
+            scored_tasks = [(shard, view, rows) for shard, view, rows in tasks if rows is None or len(rows)]
+            queries = np.asarray(vectors, dtype=np.float32).reshape(len(vectors), -1)
+            shard_results = utils.execute_futures_list(
+                [executor.submit(view.top_k_many, queries, count, label, rows) for _, view, rows in scored_tasks]
+            )
+
+            # Results are built before the views are released, so the rows that were scored can't be reused yet.
+            with self.thread_lock:
+                return [
+                    self._merge_results(
+                        [(shard, r[i]) for (shard, _, _), r in zip(scored_tasks, shard_results)], count, include_vectors
+                    )
+                    for i in range(len(vectors))
+                ]
+        finally:
+            # Shard files that were replaced while they were scored are removed once their last view is released.
+            with self.thread_lock:
+                for shard, view, _ in tasks:
+                    self._shards[shard].release(view)
+
+    def _merge_results(
+        self, shard_results: list[tuple[int, list[tuple[int, float]]]], count: Optional[int], include_vectors: bool
+    ) -> list[BaseVectorStoreDriver.Entry]:
+        # Every shard returns its rows best first, so merging them yields the overall top rows.
+        merged = heapq.merge(
+            *[[(shard, row, score) for row, score in rows] for shard, rows in shard_results], key=lambda r: -r[2]
+        )
+        # Rows whose entries were deleted while the shards were scored are skipped.
+        live = (
+            (shard, row, score)
+            for shard, row, score in merged
+            if self._rows.get(self._row_key(shard, row)) == (shard, row)
+        )
+
+        return [
+            dataclasses.replace(
+                self._shard_entries[shard][row],
+                vector=self._shards[shard].vector(row) if include_vectors else [],
+                score=score,
+            )
+            for shard, row, score in itertools.islice(live, count)
+        ]
+
+    def _filter_rows(self, shard: int, filter: dict) -> np.ndarray:
+        entries = self._shard_entries[shard]
+        meta_index = self._meta_indexes[shard]
+        bitmap = meta_index.bitmap(filter, len(entries))
+        rows = np.arange(len(entries)) if bitmap is None else np.flatnonzero(bitmap)
+        unindexed_filter = {key: value for key, value in filter.items() if not meta_index.is_indexed(key)}
+
+        if unindexed_filter:
+            rows = np.fromiter(
+                (row for row in rows.tolist() if LocalMetadataIndex.matches(entries[row].meta, unindexed_filter)),
+                dtype=np.int64,
+            )
+
+        return rows
+
+    def _live_row_count(self, shard: int) -> int:
+        return len(self._shard_entries[shard]) - len(self._free_rows[shard])
+
+    def _row_key(self, shard: int, row: int) -> tuple[Optional[str], str]:
+        entry = self._shard_entries[shard][row]
+
+        return entry.namespace, str(entry.id)
+
+    def _load_row(self, shard: int, row: int) -> BaseVectorStoreDriver.Entry:
+        return dataclasses.replace(self._shard_entries[shard][row], vector=self._shards[shard].vector(row))
+
+    def _label(self, namespace: Optional[str]) -> int:
+        return self._labels.setdefault(namespace, len(self._labels))
+
+    def _stored_entry(self, entry: BaseVectorStoreDriver.Entry) -> BaseVectorStoreDriver.Entry:
+        return self.Entry(id=entry.id, meta=entry.meta, namespace=entry.namespace)
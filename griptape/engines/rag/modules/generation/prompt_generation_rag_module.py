@@ -21,28 +21,55 @@ class PromptGenerationRagModule(BaseGenerationRagModule):
         text_artifact_chunks = context.text_chunks
 
         if query:
-            tokenizer = self.prompt_driver.tokenizer
-            text_chunks = []
-            system_prompt = ""
+            text_chunks = self._fit_text_chunks(
+                query, [artifact.value for artifact in text_artifact_chunks], before_query, after_query
+            )
+            system_prompt = self.generate_system_template(text_chunks, before_query, after_query)
 
-            for artifact in text_artifact_chunks:
-                text_chunks.append(artifact.value)
+            # Token counts of chunks don't always add up exactly to the count of the rendered prompt.
+            while text_chunks and not self._fits(self._count_prompt_tokens(query, system_prompt)):
+                text_chunks.pop()
 
                 system_prompt = self.generate_system_template(text_chunks, before_query, after_query)
-                message_token_count = self.prompt_driver.tokenizer.count_tokens(
-                    self.prompt_driver.prompt_stack_to_string(self.generate_query_prompt_stack(system_prompt, query))
-                )
 
-                if message_token_count + self.answer_token_offset >= tokenizer.max_input_tokens:
-                    text_chunks.pop()
+            context.output = self.prompt_driver.run(self.generate_query_prompt_stack(system_prompt, query))
 
-                    system_prompt = self.generate_system_template(text_chunks, before_query, after_query)
+        return context
 
-                    break
+    def _fit_text_chunks(
+        self, query: str, text_chunks: list[str], before_query: list[str], after_query: list[str]
+    ) -> list[str]:
+        """Returns the longest prefix of `text_chunks` that fits in the prompt, in a single pass.
 
-            context.output = self.prompt_driver.run(self.generate_query_prompt_stack(system_prompt, query))
+        The prompt is rendered without chunks and with one empty chunk to count the tokens of the template and the
+        tokens the template adds around each chunk. The prompt size is then estimated by adding the token count of
+        each chunk, instead of rendering and counting the whole prompt again for each chunk.
+        """
+        tokenizer = self.prompt_driver.tokenizer
+        base_token_count = self._count_prompt_tokens(
+            query, self.generate_system_template([], before_query, after_query)
+        )
+        chunk_token_overhead = (
+            self._count_prompt_tokens(query, self.generate_system_template([""], before_query, after_query))
+            - base_token_count
+        )
+        token_count = base_token_count
 
-        return context
+        for i, text_chunk in enumerate(text_chunks):
+            token_count += chunk_token_overhead + tokenizer.count_tokens(text_chunk)
+
+            if not self._fits(token_count):
+                return text_chunks[:i]
+
+        return list(text_chunks)
+
+    def _count_prompt_tokens(self, query: str, system_prompt: str) -> int:
+        return self.prompt_driver.tokenizer.count_tokens(
+            self.prompt_driver.prompt_stack_to_string(self.generate_query_prompt_stack(system_prompt, query))
+        )
+
+    def _fits(self, token_count: int) -> bool:
+        return token_count + self.answer_token_offset < self.prompt_driver.tokenizer.max_input_tokens
 
     def default_system_template_generator(
         self, text_chunks: list[str], before_system_prompt: list, after_system_prompt: list
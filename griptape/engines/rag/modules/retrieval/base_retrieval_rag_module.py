@@ -1,12 +1,24 @@
+from __future__ import annotations
 from abc import ABC, abstractmethod
-from typing import Sequence
+from typing import TYPE_CHECKING, Optional, Sequence
 from attrs import define
 from griptape.artifacts import BaseArtifact
 from griptape.engines.rag import RagContext
 from griptape.engines.rag.modules import BaseRagModule
 
+if TYPE_CHECKING:
+    from griptape.drivers import BaseEmbeddingDriver
+
 
 @define(kw_only=True)
 class BaseRetrievalRagModule(BaseRagModule, ABC):
+    @property
+    def query_embedding_driver(self) -> Optional[BaseEmbeddingDriver]:
+        """Embedding driver that the module embeds queries with through `RagContext.embed_queries()`, if any.
+
+        `RetrievalRagStage` embeds the queries of every module's driver in one batch before running the modules.
+        """
+        return None
+
     @abstractmethod
     def run(self, context: RagContext) -> Sequence[BaseArtifact]: ...
@@ -2,13 +2,12 @@ from __future__ import annotations
 import itertools
 from typing import TYPE_CHECKING, Optional, Sequence
 from attrs import define, field
-from griptape import utils
 from griptape.artifacts import TextArtifact
 from griptape.engines.rag import RagContext
 from griptape.engines.rag.modules import BaseRetrievalRagModule
 
 if TYPE_CHECKING:
-    from griptape.drivers import BaseVectorStoreDriver
+    from griptape.drivers import BaseEmbeddingDriver, BaseVectorStoreDriver
 
 
 @define(kw_only=True)
@@ -17,17 +16,22 @@ class TextRetrievalRagModule(BaseRetrievalRagModule):
     namespace: Optional[str] = field(default=None)
     top_n: Optional[int] = field(default=None)
 
+    @property
+    def query_embedding_driver(self) -> Optional[BaseEmbeddingDriver]:
+        # Drivers that embed queries themselves, such as Marqo, are queried with the query strings.
+        if self.vector_store_driver.embeds_queries:
+            return None
+
+        return self.vector_store_driver.embedding_driver
+
     def run(self, context: RagContext) -> Sequence[TextArtifact]:
-        all_queries = [context.initial_query] + context.alternative_queries
+        embedding_driver = self.query_embedding_driver
+        queries = (
+            context.queries if embedding_driver is None else context.embed_queries(embedding_driver, context.queries)
+        )
         namespace = self.namespace or context.namespace
 
-        with self.futures_executor_fn() as executor:
-            results = utils.execute_futures_list(
-                [
-                    executor.submit(self.vector_store_driver.query, query, self.top_n, namespace, False)
-                    for query in all_queries
-                ]
-            )
+        results = self.vector_store_driver.query_many(queries, self.top_n, namespace, False)
 
         return [
             artifact
@@ -1,7 +1,11 @@
-from typing import Optional
+from __future__ import annotations
+from typing import TYPE_CHECKING, Optional
 from attrs import define, field
 from griptape.artifacts import TextArtifact
 
+if TYPE_CHECKING:
+    from griptape.drivers import BaseEmbeddingDriver
+
 
 @define(kw_only=True)
 class RagContext:
@@ -27,3 +31,22 @@ class RagContext:
     after_query: list[str] = field(factory=list)
     text_chunks: list[TextArtifact] = field(factory=list)
     output: Optional[TextArtifact] = field(default=None)
+    _query_embeddings: dict[int, tuple[BaseEmbeddingDriver, dict[str, list[float]]]] = field(factory=dict, init=False)
+
+    @property
+    def queries(self) -> list[str]:
+        """The initial query followed by the alternative queries."""
+        return [self.initial_query] + self.alternative_queries
+
+    def embed_queries(self, embedding_driver: BaseEmbeddingDriver, queries: list[str]) -> list[list[float]]:
+        """Returns the embeddings of `queries`, embedding those that `embedding_driver` hasn't embedded yet in a
+        single batch.
+        """
+        # The driver is kept with its embeddings so that its ID can't be reused by another driver.
+        _, embeddings = self._query_embeddings.setdefault(id(embedding_driver), (embedding_driver, {}))
+        missing = list(dict.fromkeys(q for q in queries if q not in embeddings))
+
+        if missing:
+            embeddings.update(zip(missing, embedding_driver.embed_strings(missing)))
+
+        return [embeddings[q] for q in queries]
@@ -17,6 +17,11 @@ class RetrievalRagStage(BaseRagStage):
     max_chunks: Optional[int] = field(default=None)
 
     def run(self, context: RagContext) -> RagContext:
+        # Queries are embedded once per embedding driver here, so that modules sharing a driver reuse the embeddings.
+        for module in self.retrieval_modules:
+            if module.query_embedding_driver is not None:
+                context.embed_queries(module.query_embedding_driver, context.queries)
+
         logging.info(f"RetrievalStage: running {len(self.retrieval_modules)} retrieval modules in parallel")
 
         with self.futures_executor_fn() as executor:
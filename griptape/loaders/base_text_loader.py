@@ -1,7 +1,9 @@
 from __future__ import annotations
 
+import itertools
 from abc import ABC
 from typing import Any, Optional, Union, cast
+from collections.abc import Iterable, Iterator
 
 from attrs import define, field, Factory
 
@@ -38,6 +40,39 @@ class BaseTextLoader(BaseLoader, ABC):
             dict[str, Union[ErrorArtifact, list[TextArtifact]]], super().load_collection(sources, *args, **kwargs)
         )
 
+    def iter_load(self, source: Any, *args, **kwargs) -> Iterator[TextArtifact]:
+        """Loads `source`, yielding Text Artifacts one at a time.
+
+        This base implementation calls `load()` first. Loaders that can read their source incrementally override it to
+        keep memory bounded.
+
+        Raises:
+            ValueError: If `load()` returns an `ErrorArtifact`.
+        """
+        artifacts = self.load(source, *args, **kwargs)
+
+        if isinstance(artifacts, ErrorArtifact):
+            raise ValueError(artifacts.value)
+
+        yield from artifacts
+
+    def _iter_text_to_artifacts(self, texts: Iterable[str]) -> Iterator[TextArtifact]:
+        if self.chunker:
+            chunks = self.chunker.iter_chunks(texts)
+        else:
+            chunks = iter([TextArtifact("".join(texts))])
+
+        batch_size = self.embedding_driver.max_batch_size if self.embedding_driver else 1
+
+        while batch := list(itertools.islice(chunks, batch_size)):
+            if self.embedding_driver:
+                self.embedding_driver.embed_text_artifacts(batch)
+
+            for chunk in batch:
+                chunk.encoding = self.encoding
+
+                yield chunk
+
     def _text_to_artifacts(self, text: str) -> list[TextArtifact]:
         artifacts = []
 
@@ -47,8 +82,7 @@ class BaseTextLoader(BaseLoader, ABC):
             chunks = [TextArtifact(text)]
 
         if self.embedding_driver:
-            for chunk in chunks:
-                chunk.generate_embedding(self.embedding_driver)
+            self.embedding_driver.embed_text_artifacts(chunks)
 
         for chunk in chunks:
             chunk.encoding = self.encoding
@@ -31,8 +31,7 @@ class CsvLoader(BaseLoader):
         chunks = [CsvRowArtifact(row) for row in reader]
 
         if self.embedding_driver:
-            for chunk in chunks:
-                chunk.generate_embedding(self.embedding_driver)
+            self.embedding_driver.embed_text_artifacts(chunks)
 
         for chunk in chunks:
             artifacts.append(chunk)
@@ -24,8 +24,7 @@ class DataFrameLoader(BaseLoader):
         chunks = [CsvRowArtifact(row) for row in source.to_dict(orient="records")]
 
         if self.embedding_driver:
-            for chunk in chunks:
-                chunk.generate_embedding(self.embedding_driver)
+            self.embedding_driver.embed_text_artifacts(chunks)
 
         for chunk in chunks:
             artifacts.append(chunk)
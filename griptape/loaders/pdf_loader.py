@@ -3,6 +3,7 @@ from io import BytesIO
 
 from attrs import define, field, Factory
 from typing import Optional, Union, cast
+from collections.abc import Iterator
 
 from griptape.artifacts.error_artifact import ErrorArtifact
 from griptape.loaders import BaseTextLoader
@@ -26,6 +27,14 @@ class PdfLoader(BaseTextLoader):
         reader = PdfReader(BytesIO(source), strict=True, password=password)
         return self._text_to_artifacts("\n".join([p.extract_text() for p in reader.pages]))
 
+    def iter_load(self, source: bytes, password: Optional[str] = None, *args, **kwargs) -> Iterator[TextArtifact]:
+        """Loads a PDF one page at a time, yielding Text Artifacts as soon as they are chunked."""
+        PdfReader = import_optional_dependency("pypdf").PdfReader
+        reader = PdfReader(BytesIO(source), strict=True, password=password)
+        pages = (p.extract_text() for p in reader.pages)
+
+        yield from self._iter_text_to_artifacts(text if i == 0 else "\n" + text for i, text in enumerate(pages))
+
     def load_collection(self, sources: list[bytes], *args, **kwargs) -> dict[str, ErrorArtifact | list[TextArtifact]]:
         return cast(
             dict[str, Union[ErrorArtifact, list[TextArtifact]]], super().load_collection(sources, *args, **kwargs)
@@ -22,8 +22,7 @@ class SqlLoader(BaseLoader):
             chunks = []
 
         if self.embedding_driver:
-            for chunk in chunks:
-                chunk.generate_embedding(self.embedding_driver)
+            self.embedding_driver.embed_text_artifacts(chunks)
 
         for chunk in chunks:
             artifacts.append(chunk)
@@ -1,6 +1,8 @@
 from __future__ import annotations
 
+import codecs
 from typing import Optional, Union, cast
+from collections.abc import Iterable, Iterator
 
 from attrs import field, define, Factory
 
@@ -43,6 +45,31 @@ class TextLoader(BaseTextLoader):
 
         return self._text_to_artifacts(source)
 
+    def iter_load(self, source: bytes | str | Iterable[bytes | str], *args, **kwargs) -> Iterator[TextArtifact]:
+        """Loads text incrementally, yielding Text Artifacts as soon as they are chunked.
+
+        Args:
+            source: Text, bytes, or an iterable of text or bytes pieces, such as a file object.
+
+        Raises:
+            ValueError: If the source type is not supported.
+            UnicodeDecodeError: If bytes can't be decoded with `encoding`.
+        """
+        if isinstance(source, (bytearray, memoryview)):
+            raise ValueError(f"Unsupported source type: {type(source)}")
+        elif isinstance(source, (bytes, str)):
+            source = [source]
+
+        yield from self._iter_text_to_artifacts(self._decode(source))
+
+    def _decode(self, pieces: Iterable[bytes | str]) -> Iterator[str]:
+        decoder = codecs.getincrementaldecoder(self.encoding)()
+
+        for piece in pieces:
+            yield decoder.decode(piece) if isinstance(piece, bytes) else piece
+
+        yield decoder.decode(b"", final=True)
+
     def load_collection(
         self, sources: list[bytes | str], *args, **kwargs
     ) -> dict[str, ErrorArtifact | list[TextArtifact]]:
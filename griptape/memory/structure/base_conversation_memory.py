@@ -60,31 +60,46 @@ class BaseConversationMemory(SerializableMixin, ABC):
         num_runs_to_fit_in_prompt = len(self.runs)
 
         if self.autoprune and hasattr(self, "structure"):
-            should_prune = True
             prompt_driver = self.structure.config.prompt_driver
-            temp_stack = PromptStack()
+            # Memory inputs are shared between attempts so that each one's token count is only computed once.
+            shared_inputs = {}
 
-            # Try to determine how many Conversation Memory runs we can
-            # fit into the Prompt Stack without exceeding the token limit.
-            while should_prune and num_runs_to_fit_in_prompt > 0:
-                temp_stack.inputs = prompt_stack.inputs.copy()
-
-                # Add n runs from Conversation Memory.
+            def fits(num_runs: int, exact: bool = False) -> bool:
                 # Where we insert into the Prompt Stack doesn't matter here
                 # since we only care about the total token count.
-                memory_inputs = self.to_prompt_stack(num_runs_to_fit_in_prompt).inputs
-                temp_stack.inputs.extend(memory_inputs)
-
-                # Convert the prompt stack into tokens left.
-                tokens_left = prompt_driver.tokenizer.count_input_tokens_left(
-                    prompt_driver.prompt_stack_to_string(temp_stack)
-                )
-                if tokens_left > 0:
-                    # There are still tokens left, no need to prune.
-                    should_prune = False
+                memory_inputs = [
+                    shared_inputs.setdefault((i.role, i.content), i) for i in self.to_prompt_stack(num_runs).inputs
+                ]
+                temp_stack = PromptStack(inputs=prompt_stack.inputs + memory_inputs)
+
+                if exact:
+                    tokens = prompt_driver.tokenizer.count_tokens(prompt_driver.prompt_stack_to_string(temp_stack))
                 else:
-                    # There were not any tokens left, prune one run and try again.
-                    num_runs_to_fit_in_prompt -= 1
+                    tokens = prompt_driver.count_prompt_stack_tokens(temp_stack)
+
+                return prompt_driver.tokenizer.max_input_tokens - tokens > 0
+
+            def most_runs_that_fit(high: int, exact: bool = False) -> int:
+                # The token count grows with the number of runs, so binary search
+                # for the most runs that fit without exceeding the token limit.
+                low = 0
+
+                while low < high:
+                    middle = (low + high + 1) // 2
+
+                    if fits(middle, exact):
+                        low = middle
+                    else:
+                        high = middle - 1
+
+                return low
+
+            num_runs_to_fit_in_prompt = most_runs_that_fit(num_runs_to_fit_in_prompt)
+
+            # Summed token counts can fall short of the rendered Prompt Stack, so the runs that fit by estimate are
+            # checked once against the exact count, and only searched again with exact counts if they don't fit.
+            if num_runs_to_fit_in_prompt and not fits(num_runs_to_fit_in_prompt, exact=True):
+                num_runs_to_fit_in_prompt = most_runs_that_fit(num_runs_to_fit_in_prompt - 1, exact=True)
 
         if num_runs_to_fit_in_prompt:
             memory_inputs = self.to_prompt_stack(num_runs_to_fit_in_prompt).inputs
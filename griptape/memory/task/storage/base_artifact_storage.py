@@ -10,6 +10,10 @@ class BaseArtifactStorage(ABC):
     @abstractmethod
     def store_artifact(self, namespace: str, artifact: BaseArtifact) -> None: ...
 
+    def store_artifacts(self, namespace: str, artifacts: list[BaseArtifact]) -> None:
+        for artifact in artifacts:
+            self.store_artifact(namespace, artifact)
+
     @abstractmethod
     def load_artifacts(self, namespace: str) -> ListArtifact: ...
 
@@ -1,5 +1,5 @@
 from __future__ import annotations
-from typing import TYPE_CHECKING, Any, Optional
+from typing import TYPE_CHECKING, Any, Optional, cast
 from attrs import define, field
 from griptape.artifacts import TextArtifact, BaseArtifact, ListArtifact, InfoArtifact
 from griptape.drivers import BaseVectorStoreDriver
@@ -27,6 +27,12 @@ class TextArtifactStorage(BaseArtifactStorage):
         else:
             raise ValueError("Artifact must be of instance TextArtifact")
 
+    def store_artifacts(self, namespace: str, artifacts: list[BaseArtifact]) -> None:
+        if all(isinstance(artifact, TextArtifact) for artifact in artifacts):
+            self.vector_store_driver.upsert_text_artifacts({namespace: cast(list[TextArtifact], artifacts)})
+        else:
+            raise ValueError("Artifacts must be of instance TextArtifact")
+
     def load_artifacts(self, namespace: str) -> ListArtifact:
         return self.vector_store_driver.load_artifacts(namespace)
 
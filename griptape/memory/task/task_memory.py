@@ -85,8 +85,7 @@ class TaskMemory(ActivityMixin):
         else:
             if storage:
                 if isinstance(artifact, ListArtifact):
-                    for a in artifact.value:
-                        storage.store_artifact(namespace, a)
+                    storage.store_artifacts(namespace, artifact.value)
 
                     self.namespace_storage[namespace] = storage
 
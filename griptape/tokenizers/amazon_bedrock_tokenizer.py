@@ -38,3 +38,6 @@ class AmazonBedrockTokenizer(BaseTokenizer):
         num_tokens = (len(text) + self.characters_per_token - 1) // self.characters_per_token
 
         return num_tokens
+
+    def token_offsets(self, text: str) -> list[int]:
+        return list(range(0, len(text), self.characters_per_token))
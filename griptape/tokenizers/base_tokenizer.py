@@ -1,6 +1,8 @@
 from __future__ import annotations
 import logging
+import re
 from abc import ABC
+from typing import Optional
 from attrs import define, field, Factory
 
 
@@ -42,6 +44,35 @@ class BaseTokenizer(ABC):
 
     def count_tokens(self, text: str) -> int: ...
 
+    def token_offsets(self, text: str) -> Optional[list[int]]:
+        """Returns the character offset at which each token of `text` starts.
+
+        Tokenizers that count tokens locally should override this, for instance with `_word_token_offsets()`. This
+        base implementation returns `None`, because counting tokens may take a request per call, such as an API
+        request, and chunkers then count tokens of whole candidate chunks instead.
+
+        Args:
+            text: The text to tokenize.
+
+        Returns:
+            Non-decreasing character offsets, one per token, or `None` if the tokenizer can't compute them locally.
+        """
+        return None
+
+    def _word_token_offsets(self, text: str) -> list[int]:
+        """Approximates token offsets by counting the tokens of each whitespace-delimited word and spreading them
+        evenly over the word's characters, so offsets inside a word are approximate.
+        """
+        offsets = []
+
+        for match in re.finditer(r"\s*\S+|\s+", text):
+            start, end = match.span()
+            count = self.count_tokens(match.group())
+
+            offsets.extend(start + (end - start) * i // count for i in range(count))
+
+        return offsets
+
     def _default_max_input_tokens(self) -> int:
         tokens = next((v for k, v in self.MODEL_PREFIXES_TO_MAX_INPUT_TOKENS.items() if self.model.startswith(k)), None)
 
@@ -24,3 +24,12 @@ class HuggingFaceTokenizer(BaseTokenizer):
 
     def count_tokens(self, text: str) -> int:
         return len(self.tokenizer.encode(text))
+
+    def token_offsets(self, text: str) -> list[int]:
+        # Only fast tokenizers can map tokens back to characters.
+        if self.tokenizer.is_fast:
+            encoding = self.tokenizer(text, add_special_tokens=False, return_offsets_mapping=True)
+
+            return [start for start, _ in encoding["offset_mapping"]]
+        else:
+            return self._word_token_offsets(text)
@@ -1,13 +1,37 @@
 from __future__ import annotations
+import functools
 import logging
+import threading
+from collections import OrderedDict
 from attrs import define, field, Factory
 import tiktoken
 from typing import Optional
+from griptape import utils
 from griptape.tokenizers import BaseTokenizer
 
 
+@functools.lru_cache(maxsize=None)
+def _encoding_for_model(model: str) -> tiktoken.Encoding:
+    # Resolving an encoding matches the model name against tiktoken's model prefixes, so the result is cached per model
+    # for the whole process.
+    try:
+        return tiktoken.encoding_for_model(model)
+    except KeyError:
+        logging.warning(f"Model {model} not found. Using {OpenAiTokenizer.DEFAULT_ENCODING} encoding.")
+
+        return tiktoken.get_encoding(OpenAiTokenizer.DEFAULT_ENCODING)
+
+
 @define()
 class OpenAiTokenizer(BaseTokenizer):
+    """
+    Attributes:
+        count_cache_size: Maximum number of token counts of strings to keep in an LRU cache. Useful when the same
+            strings, such as system prompts and rulesets, are counted repeatedly. Disabled by default.
+        count_cache_hits: Number of token counts served from the cache.
+        count_cache_misses: Number of token counts computed while the cache is enabled.
+    """
+
     DEFAULT_OPENAI_GPT_3_COMPLETION_MODEL = "gpt-3.5-turbo-instruct"
     DEFAULT_OPENAI_GPT_3_CHAT_MODEL = "gpt-3.5-turbo"
     DEFAULT_OPENAI_GPT_4_MODEL = "gpt-4o"
@@ -47,13 +71,15 @@ class OpenAiTokenizer(BaseTokenizer):
     max_output_tokens: int = field(
         kw_only=True, default=Factory(lambda self: self._default_max_output_tokens(), takes_self=True)
     )
+    count_cache_size: Optional[int] = field(default=None, kw_only=True)
+    count_cache_hits: int = field(default=0, init=False)
+    count_cache_misses: int = field(default=0, init=False)
+    _count_cache: OrderedDict[str, int] = field(factory=OrderedDict, init=False, eq=False)
+    _count_cache_lock: threading.Lock = field(factory=threading.Lock, init=False, eq=False)
 
     @property
     def encoding(self) -> tiktoken.Encoding:
-        try:
-            return tiktoken.encoding_for_model(self.model)
-        except KeyError:
-            return tiktoken.get_encoding(self.DEFAULT_ENCODING)
+        return _encoding_for_model(self.model)
 
     def _default_max_input_tokens(self) -> int:
         tokens = next((v for k, v in self.MODEL_PREFIXES_TO_MAX_INPUT_TOKENS.items() if self.model.startswith(k)), None)
@@ -79,12 +105,7 @@ class OpenAiTokenizer(BaseTokenizer):
         if isinstance(text, list):
             model = model if model else self.model
 
-            try:
-                encoding = tiktoken.encoding_for_model(model)
-            except KeyError:
-                logging.warning("model not found. Using cl100k_base encoding.")
-
-                encoding = tiktoken.get_encoding("cl100k_base")
+            encoding = _encoding_for_model(model)
 
             if model in {
                 "gpt-3.5-turbo-0613",
@@ -131,5 +152,42 @@ class OpenAiTokenizer(BaseTokenizer):
             num_tokens += 3
 
             return num_tokens
+        elif self.count_cache_size:
+            key = utils.str_to_hash(f"{self.model}\n{text}")
+
+            with self._count_cache_lock:
+                count = self._count_cache.get(key)
+
+                if count is not None:
+                    self._count_cache.move_to_end(key)
+                    self.count_cache_hits += 1
+
+                    return count
+
+            count = self._encode_count(text)
+
+            with self._count_cache_lock:
+                self._count_cache[key] = count
+                self.count_cache_misses += 1
+
+                while len(self._count_cache) > self.count_cache_size:
+                    self._count_cache.popitem(last=False)
+
+            return count
         else:
-            return len(self.encoding.encode(text, allowed_special=set(self.stop_sequences)))
+            return self._encode_count(text)
+
+    def token_offsets(self, text: str) -> list[int]:
+        tokens = self.encoding.encode(text, allowed_special=set(self.stop_sequences))
+
+        return self.encoding.decode_with_offsets(tokens)[1]
+
+    def clear_count_cache(self) -> None:
+        with self._count_cache_lock:
+            self._count_cache.clear()
+
+            self.count_cache_hits = 0
+            self.count_cache_misses = 0
+
+    def _encode_count(self, text: str) -> int:
+        return len(self.encoding.encode(text, allowed_special=set(self.stop_sequences)))
@@ -12,3 +12,6 @@ class SimpleTokenizer(BaseTokenizer):
         num_tokens = (len(text) + self.characters_per_token - 1) // self.characters_per_token
 
         return num_tokens
+
+    def token_offsets(self, text: str) -> list[int]:
+        return list(range(0, len(text), self.characters_per_token))
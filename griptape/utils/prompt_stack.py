@@ -1,8 +1,12 @@
 from __future__ import annotations
+from typing import TYPE_CHECKING, Optional
 from attrs import define, field
 
 from griptape.mixins import SerializableMixin
 
+if TYPE_CHECKING:
+    from griptape.tokenizers import BaseTokenizer
+
 
 @define
 class PromptStack(SerializableMixin):
@@ -10,11 +14,28 @@ class PromptStack(SerializableMixin):
     USER_ROLE = "user"
     ASSISTANT_ROLE = "assistant"
     SYSTEM_ROLE = "system"
+    DEFAULT_INPUT_OVERHEAD = 3
+    DEFAULT_PROMPT_OVERHEAD = 3
 
     @define
     class Input(SerializableMixin):
         content: str = field(metadata={"serializable": True})
         role: str = field(metadata={"serializable": True})
+        _token_counts: dict[tuple[str, str], tuple[str, int]] = field(factory=dict, init=False, eq=False)
+
+        def token_count(self, tokenizer: BaseTokenizer) -> int:
+            """Counts the tokens in the Input's content.
+
+            The count is cached per tokenizer and recomputed only if the content changes.
+            """
+            key = (type(tokenizer).__name__, tokenizer.model)
+            cached = self._token_counts.get(key)
+
+            if cached is None or cached[0] != self.content:
+                cached = (self.content, tokenizer.count_tokens(self.content))
+                self._token_counts[key] = cached
+
+            return cached[1]
 
         def is_generic(self) -> bool:
             return self.role == PromptStack.GENERIC_ROLE
@@ -30,6 +51,29 @@ class PromptStack(SerializableMixin):
 
     inputs: list[Input] = field(factory=list, kw_only=True, metadata={"serializable": True})
 
+    def count_tokens(
+        self,
+        tokenizer: BaseTokenizer,
+        input_overheads: Optional[dict[str, int]] = None,
+        prompt_overhead: int = DEFAULT_PROMPT_OVERHEAD,
+    ) -> int:
+        """Estimates the number of tokens in the Prompt Stack without rendering it.
+
+        Args:
+            tokenizer: The tokenizer to count the content of each input with.
+            input_overheads: Tokens that the prompt format adds around each input, keyed by role. Roles that are missing
+                default to `DEFAULT_INPUT_OVERHEAD`.
+            prompt_overhead: Tokens that the prompt format adds once, such as the generation prompt.
+
+        Returns:
+            The sum of the cached token counts of the inputs plus the per-input and per-prompt overhead.
+        """
+        input_overheads = input_overheads or {}
+
+        return prompt_overhead + sum(
+            i.token_count(tokenizer) + input_overheads.get(i.role, self.DEFAULT_INPUT_OVERHEAD) for i in self.inputs
+        )
+
     def add_input(self, content: str, role: str) -> Input:
         self.inputs.append(self.Input(content=content, role=role))
 
@@ -0,0 +1,46 @@
+"""Compares the size and decoding latency of full and compact artifact payloads in vector entry metadata.
+
+Usage:
+    python -m tests.benchmarks.benchmark_artifact_payload --hits 50 --chunk-size 1000
+"""
+
+from __future__ import annotations
+import argparse
+import time
+from griptape.artifacts import BaseArtifact, TextArtifact
+from griptape.drivers import BaseVectorStoreDriver
+
+
+def timed(name: str, fn, repeat: int) -> None:
+    start = time.perf_counter()
+
+    for _ in range(repeat):
+        fn()
+
+    print(f"{name:>24}: {(time.perf_counter() - start) / repeat * 1000:10.3f}ms")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--hits", type=int, default=50)
+    parser.add_argument("--chunk-size", type=int, default=1000, help="number of characters per artifact")
+    parser.add_argument("--repeat", type=int, default=100)
+    args = parser.parse_args()
+
+    artifacts = [TextArtifact("x" * args.chunk_size) for _ in range(args.hits)]
+    full = [a.to_json() for a in artifacts]
+    compact = [BaseVectorStoreDriver.artifact_to_payload(a) for a in artifacts]
+
+    print(f"{args.hits} hits of {args.chunk_size} characters")
+    print(f"{'full payload':>24}: {sum(map(len, full)) / args.hits:10.0f} bytes")
+    print(f"{'compact payload':>24}: {sum(map(len, compact)) / args.hits:10.0f} bytes")
+
+    timed("BaseArtifact.from_json", lambda: [BaseArtifact.from_json(p) for p in full], args.repeat)
+    timed("from_payload (full)", lambda: [BaseVectorStoreDriver.artifact_from_payload(p) for p in full], args.repeat)
+    timed(
+        "from_payload (compact)", lambda: [BaseVectorStoreDriver.artifact_from_payload(p) for p in compact], args.repeat
+    )
+
+
+if __name__ == "__main__":
+    main()
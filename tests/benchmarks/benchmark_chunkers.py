@@ -0,0 +1,75 @@
+"""Compares the recursive chunking algorithm with the token offset algorithm.
+
+Usage:
+    python -m tests.benchmarks.benchmark_chunkers --pages 300
+"""
+
+from __future__ import annotations
+import argparse
+import random
+import time
+from griptape.chunkers import BaseChunker, PdfChunker, TextChunker
+from griptape.tokenizers import BaseTokenizer, OpenAiTokenizer, SimpleTokenizer
+
+WORDS = ["griptape", "structure", "agent", "memory", "vector", "driver", "token", "chunk", "prompt", "pipeline"]
+
+
+def gen_document(pages: int, seed: int = 0) -> str:
+    """Generates roughly 500 words per page, in paragraphs of sentences."""
+    rng = random.Random(seed)
+    paragraphs = []
+
+    for _ in range(pages * 5):
+        sentences = []
+
+        for _ in range(rng.randint(3, 8)):
+            words = rng.choices(WORDS, k=rng.randint(8, 20))
+            sentences.append(" ".join(words).capitalize() + rng.choice([".", "!", "?"]))
+
+        paragraphs.append(" ".join(sentences))
+
+    return "\n\n".join(paragraphs)
+
+
+def run(chunker: BaseChunker, text: str) -> tuple[float, list[int]]:
+    start = time.perf_counter()
+    chunks = chunker.chunk(text)
+    elapsed = time.perf_counter() - start
+
+    return elapsed, [chunker.tokenizer.count_tokens(c.value) for c in chunks]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--pages", type=int, default=300)
+    parser.add_argument("--max-tokens", type=int, default=512)
+    parser.add_argument("--chunker", choices=["text", "pdf"], default="text")
+    parser.add_argument(
+        "--tokenizer", choices=["openai", "simple"], default="openai", help="simple does not need tiktoken encodings"
+    )
+    args = parser.parse_args()
+
+    tokenizer: BaseTokenizer
+    if args.tokenizer == "openai":
+        tokenizer = OpenAiTokenizer(model=OpenAiTokenizer.DEFAULT_OPENAI_GPT_3_CHAT_MODEL)
+    else:
+        tokenizer = SimpleTokenizer(characters_per_token=4)
+
+    chunker_class = TextChunker if args.chunker == "text" else PdfChunker
+    text = gen_document(args.pages)
+
+    print(f"{args.pages} pages, {len(text):,} characters, {tokenizer.count_tokens(text):,} tokens")
+
+    for use_token_offsets in (False, True):
+        chunker = chunker_class(tokenizer=tokenizer, max_tokens=args.max_tokens, use_token_offsets=use_token_offsets)
+        elapsed, counts = run(chunker, text)
+        name = "token offsets" if use_token_offsets else "recursive"
+
+        print(
+            f"{name:>14}: {elapsed:8.3f}s, {len(counts):5} chunks, "
+            f"{sum(counts) / len(counts):6.1f} mean tokens, {max(counts):4} max tokens"
+        )
+
+
+if __name__ == "__main__":
+    main()
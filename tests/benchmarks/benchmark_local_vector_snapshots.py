@@ -0,0 +1,57 @@
+"""Measures the cost of the first delete and overwrite after every snapshot of a LocalVectorIndex.
+
+Usage:
+    python -m tests.benchmarks.benchmark_local_vector_snapshots --rows 200000 --dimensions 128
+"""
+
+from __future__ import annotations
+import argparse
+import time
+import numpy as np
+from griptape.drivers.vector.local_vector_index import LocalVectorIndex
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=200_000)
+    parser.add_argument("--dimensions", type=int, default=128)
+    parser.add_argument("--writes", type=int, default=200)
+    parser.add_argument("--count", type=int, default=10)
+    args = parser.parse_args()
+
+    vectors = np.random.default_rng(0).normal(size=(args.rows, args.dimensions)).astype(np.float32)
+    keys = [str(i) for i in range(args.rows)]
+    index = LocalVectorIndex()
+    index.load(keys, vectors.copy())
+    index.upsert(keys[-1], vectors[-1])
+
+    print(f"{args.rows:,} rows, {args.dimensions} dimensions")
+
+    for name, write in [
+        ("delete", lambda i: index.delete(keys[i])),
+        ("overwrite", lambda i: index.upsert(keys[args.writes + i], vectors[i])),
+    ]:
+        elapsed = 0.0
+
+        for i in range(args.writes):
+            # Every write follows a new snapshot, as it does in LocalVectorStoreDriver.
+            snapshot = index.snapshot()
+            start = time.perf_counter()
+            write(i)
+            elapsed += time.perf_counter() - start
+
+        print(f"{name:>24}: {elapsed / args.writes * 1e6:10.1f}us after every snapshot")
+
+    query = vectors[0]
+
+    for name, target in [("index query", index), ("snapshot query", snapshot)]:
+        start = time.perf_counter()
+
+        for _ in range(20):
+            target.top_k(query, args.count)
+
+        print(f"{name:>24}: {(time.perf_counter() - start) / 20 * 1000:10.3f}ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,68 @@
+"""Compares the recall and latency of approximate IVF queries with exact queries in LocalVectorIndex.
+
+Usage:
+    python -m tests.benchmarks.benchmark_local_vector_store --rows 200000 --dimensions 384
+"""
+
+from __future__ import annotations
+import argparse
+import time
+import numpy as np
+from griptape.drivers.vector.local_ivf_index import LocalIvfIndex
+from griptape.drivers.vector.local_vector_index import LocalVectorIndex
+
+
+def gen_vectors(rows: int, dimensions: int, clusters: int, seed: int = 0) -> np.ndarray:
+    """Generates vectors around random topic centers, which is closer to real embeddings than uniform noise."""
+    rng = np.random.default_rng(seed)
+    centers = rng.normal(size=(clusters, dimensions))
+    labels = rng.integers(clusters, size=rows)
+
+    return (centers[labels] + rng.normal(scale=1.5, size=(rows, dimensions))).astype(np.float32)
+
+
+def run(index: LocalVectorIndex, queries: np.ndarray, count: int, nprobe: int | None = None) -> tuple[float, list]:
+    start = time.perf_counter()
+    results = [[k for k, _ in index.top_k(q, count, nprobe=nprobe)] for q in queries]
+
+    return (time.perf_counter() - start) / len(queries), results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=200_000)
+    parser.add_argument("--dimensions", type=int, default=384)
+    parser.add_argument("--clusters", type=int, default=1000, help="number of topic centers in the generated data")
+    parser.add_argument("--queries", type=int, default=200)
+    parser.add_argument("--count", type=int, default=10)
+    parser.add_argument("--nprobe", type=int, nargs="+", default=[1, 4, 8, 16, 32, 64])
+    args = parser.parse_args()
+
+    vectors = gen_vectors(args.rows + args.queries, args.dimensions, args.clusters)
+    keys = [str(i) for i in range(args.rows)]
+    queries = vectors[args.rows :]
+
+    exact = LocalVectorIndex()
+    exact.load(keys, vectors[: args.rows])
+    approximate = LocalVectorIndex(ann_index=LocalIvfIndex(min_train_size=0))
+    approximate.load(keys, vectors[: args.rows])
+
+    start = time.perf_counter()
+    approximate.top_k(queries[0], args.count)
+    print(f"{args.rows:,} rows, {args.dimensions} dimensions, trained in {time.perf_counter() - start:.2f}s")
+
+    exact_latency, expected = run(exact, queries, args.count)
+    print(f"{'exact':>10}: {exact_latency * 1000:8.3f}ms per query, recall@{args.count} 1.000")
+
+    for nprobe in args.nprobe:
+        latency, results = run(approximate, queries, args.count, nprobe)
+        recall = np.mean([len(set(r) & set(e)) / len(e) for r, e in zip(results, expected)])
+
+        print(
+            f"{f'nprobe {nprobe}':>10}: {latency * 1000:8.3f}ms per query, recall@{args.count} {recall:.3f}, "
+            f"{exact_latency / latency:5.1f}x faster"
+        )
+
+
+if __name__ == "__main__":
+    main()
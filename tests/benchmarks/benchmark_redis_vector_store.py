@@ -0,0 +1,76 @@
+"""Measures the latency of RedisVectorStoreDriver ingestion, lookups, full loads, and queries.
+
+Requires Redis with the RediSearch module, such as a local redis-stack container:
+    docker run -d -p 6379:6379 redis/redis-stack-server:latest
+
+Usage:
+    python -m tests.benchmarks.benchmark_redis_vector_store --rows 10000 --dimensions 1536
+
+The benchmark creates its own index and keys under a random namespace, and drops both when done.
+"""
+
+from __future__ import annotations
+import argparse
+import time
+import uuid
+from griptape.drivers import RedisVectorStoreDriver
+from tests.benchmarks.benchmark_local_vector_store import gen_vectors
+from tests.mocks.mock_embedding_driver import MockEmbeddingDriver
+
+
+def timed(name: str, fn, repeat: int = 1) -> None:
+    start = time.perf_counter()
+
+    for _ in range(repeat):
+        fn()
+
+    print(f"{name:>28}: {(time.perf_counter() - start) / repeat * 1000:10.2f}ms")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--host", default="localhost")
+    parser.add_argument("--port", type=int, default=6379)
+    parser.add_argument("--rows", type=int, default=10_000)
+    parser.add_argument("--dimensions", type=int, default=1536)
+    parser.add_argument("--queries", type=int, default=100)
+    parser.add_argument("--count", type=int, default=10)
+    parser.add_argument("--algorithm", default="HNSW", choices=["HNSW", "FLAT"])
+    args = parser.parse_args()
+
+    namespace = f"benchmark-{uuid.uuid4().hex[:8]}"
+    driver = RedisVectorStoreDriver(
+        host=args.host, port=args.port, index=namespace, embedding_driver=MockEmbeddingDriver()
+    )
+    vectors = gen_vectors(args.rows + args.queries, args.dimensions, max(1, args.rows // 100))
+    entries = [
+        RedisVectorStoreDriver.Entry(id=str(i), vector=v.tolist(), namespace=namespace, meta={"row": i})
+        for i, v in enumerate(vectors[: args.rows])
+    ]
+    queries = vectors[args.rows :].tolist()
+    ids = [str(i) for i in range(0, args.rows, max(1, args.rows // 100))]
+
+    driver.create_index(args.dimensions, algorithm=args.algorithm, prefixes=[f"{namespace}:"])
+
+    print(f"{args.rows:,} rows, {args.dimensions} dimensions, {args.algorithm} index")
+
+    try:
+        timed("upsert_vectors", lambda: driver.upsert_vectors(entries))
+        timed(f"existing_ids ({len(ids)} ids)", lambda: driver.existing_ids(ids, namespace), repeat=10)
+        timed(f"load_entries_by_ids ({len(ids)} ids)", lambda: driver.load_entries_by_ids(ids, namespace), repeat=10)
+        timed("load_entries", lambda: driver.load_entries(namespace))
+        timed(
+            f"query_vector x{len(queries)}",
+            lambda: [driver.query_vector(q, count=args.count, namespace=namespace) for q in queries],
+        )
+        timed(f"query_many ({len(queries)})", lambda: driver.query_many(queries, count=args.count, namespace=namespace))
+        timed(
+            f"query_many ({len(queries)}) + vectors",
+            lambda: driver.query_many(queries, count=args.count, namespace=namespace, include_vectors=True),
+        )
+    finally:
+        driver.client.ft(driver.index).dropindex(delete_documents=True)
+
+
+if __name__ == "__main__":
+    main()
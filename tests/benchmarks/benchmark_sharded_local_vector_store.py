@@ -0,0 +1,64 @@
+"""Compares the query latency of ShardedLocalVectorStoreDriver for several shard counts with LocalVectorStoreDriver.
+
+Usage:
+    python -m tests.benchmarks.benchmark_sharded_local_vector_store --rows 1000000 --dimensions 384
+"""
+
+from __future__ import annotations
+import argparse
+import time
+import numpy as np
+from griptape.drivers import BaseVectorStoreDriver, LocalVectorStoreDriver, ShardedLocalVectorStoreDriver
+from tests.benchmarks.benchmark_local_vector_store import gen_vectors
+from tests.mocks.mock_embedding_driver import MockEmbeddingDriver
+
+
+def run(driver: BaseVectorStoreDriver, queries: np.ndarray, count: int) -> tuple[float, list]:
+    # The first query is not timed since it starts the worker processes.
+    driver.query_vector(queries[0].tolist(), count)
+
+    start = time.perf_counter()
+    results = [[e.id for e in driver.query_vector(q.tolist(), count)] for q in queries]
+
+    return (time.perf_counter() - start) / len(queries), results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    parser.add_argument("--dimensions", type=int, default=384)
+    parser.add_argument("--clusters", type=int, default=1000, help="number of topic centers in the generated data")
+    parser.add_argument("--queries", type=int, default=50)
+    parser.add_argument("--count", type=int, default=10)
+    parser.add_argument("--shards", type=int, nargs="+", default=[1, 2, 4, 8])
+    args = parser.parse_args()
+
+    vectors = gen_vectors(args.rows + args.queries, args.dimensions, args.clusters)
+    entries = [BaseVectorStoreDriver.Entry(id=str(i), vector=vectors[i].tolist()) for i in range(args.rows)]
+    queries = vectors[args.rows :]
+
+    local = LocalVectorStoreDriver(embedding_driver=MockEmbeddingDriver())
+    local.upsert_vectors(entries)
+    local_latency, expected = run(local, queries, args.count)
+
+    print(f"{args.rows:,} rows, {args.dimensions} dimensions")
+    print(f"{'local':>10}: {local_latency * 1000:8.3f}ms per query")
+
+    for shard_count in args.shards:
+        driver = ShardedLocalVectorStoreDriver(embedding_driver=MockEmbeddingDriver(), shard_count=shard_count)
+
+        try:
+            driver.upsert_vectors(entries)
+            latency, results = run(driver, queries, args.count)
+            matches = np.mean([r == e for r, e in zip(results, expected)])
+
+            print(
+                f"{f'{shard_count} shards':>10}: {latency * 1000:8.3f}ms per query, "
+                f"{local_latency / latency:5.2f}x, {matches:.0%} identical results"
+            )
+        finally:
+            driver.close()
+
+
+if __name__ == "__main__":
+    main()
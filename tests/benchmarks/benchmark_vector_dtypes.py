@@ -0,0 +1,76 @@
+"""Compares the memory use, recall, and latency of LocalVectorIndex storage types.
+
+Recall is measured against float32 results. Rescoring reads full precision vectors from a memory-mapped file, like
+LocalVectorStoreDriver does with persist_dir.
+
+Usage:
+    python -m tests.benchmarks.benchmark_vector_dtypes --rows 100000 --dimensions 1536
+"""
+
+from __future__ import annotations
+import argparse
+import os
+import tempfile
+import time
+import numpy as np
+from griptape.drivers.vector.local_vector_index import LocalVectorIndex
+from tests.benchmarks.benchmark_local_vector_store import gen_vectors
+
+
+def index_bytes(index: LocalVectorIndex) -> int:
+    return index.matrix.nbytes + index.norms.nbytes + index._scales.nbytes + index.source_rows.nbytes
+
+
+def run(index: LocalVectorIndex, queries: np.ndarray, count: int, source: np.ndarray | None) -> tuple[float, list]:
+    start = time.perf_counter()
+    results = [[k for k, _ in index.top_k(q, count, source=source)] for q in queries]
+
+    return (time.perf_counter() - start) / len(queries), results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=100_000)
+    parser.add_argument("--dimensions", type=int, default=1536)
+    parser.add_argument("--clusters", type=int, default=1000, help="number of topic centers in the generated data")
+    parser.add_argument("--queries", type=int, default=100)
+    parser.add_argument("--count", type=int, default=10)
+    parser.add_argument("--rescore-factor", type=int, default=4)
+    args = parser.parse_args()
+
+    vectors = gen_vectors(args.rows + args.queries, args.dimensions, args.clusters)
+    keys = [str(i) for i in range(args.rows)]
+    queries = vectors[args.rows :]
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "vectors.npy")
+        np.save(path, vectors[: args.rows])
+        source = np.load(path, mmap_mode="r")
+
+        exact = LocalVectorIndex()
+        exact.load(keys, np.array(source))
+        exact_latency, expected = run(exact, queries, args.count, None)
+
+        print(
+            f"{args.rows:,} rows, {args.dimensions} dimensions, "
+            f"list[float] entries would take ~{args.rows * args.dimensions * 32 / 2**20:,.0f} MiB"
+        )
+        print(f"{'float32':>16}: {index_bytes(exact) / 2**20:9,.1f} MiB, {exact_latency * 1000:8.3f}ms per query")
+
+        for dtype in ("float16", "int8"):
+            index = LocalVectorIndex(dtype=dtype, rescore_factor=args.rescore_factor)
+            index.load(keys, source, np.arange(args.rows))
+
+            for rescore in (False, True):
+                latency, results = run(index, queries, args.count, source if rescore else None)
+                recall = np.mean([len(set(r) & set(e)) / len(e) for r, e in zip(results, expected)])
+                name = f"{dtype}{' rescored' if rescore else ''}"
+
+                print(
+                    f"{name:>16}: {index_bytes(index) / 2**20:9,.1f} MiB, {latency * 1000:8.3f}ms per query, "
+                    f"recall@{args.count} {recall:.3f}"
+                )
+
+
+if __name__ == "__main__":
+    main()
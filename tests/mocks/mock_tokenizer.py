@@ -7,3 +7,6 @@ from griptape.tokenizers import BaseTokenizer
 class MockTokenizer(BaseTokenizer):
     def count_tokens(self, text: str) -> int:
         return len(text)
+
+    def token_offsets(self, text: str) -> list[int]:
+        return list(range(len(text)))
@@ -23,6 +23,15 @@ class TestTextArtifact:
         assert artifact.generate_embedding(MockEmbeddingDriver()) == [0, 1]
         assert artifact.embedding == [0, 1]
 
+    def test_embedding_setter(self):
+        artifact = TextArtifact("foobar")
+
+        artifact.embedding = [0, 1]
+        assert artifact.embedding == [0, 1]
+
+        artifact.embedding = None
+        assert artifact.embedding is None
+
     def test_to_text(self):
         assert TextArtifact("foobar").to_text() == "foobar"
 
@@ -1,6 +1,7 @@
 import pytest
 from griptape.chunkers import MarkdownChunker
 from tests.unit.chunkers.test_text_chunker import gen_paragraph
+from tests.mocks.mock_tokenizer import MockTokenizer
 
 MAX_TOKENS = 50
 
@@ -41,3 +42,9 @@ class TestTextChunker:
         assert chunks[3].value.endswith(". foo-8.")
         assert chunks[4].value.endswith(". foo-14.")
         assert chunks[5].value.endswith(". foo-24.")
+
+    def test_chunk_with_token_offsets(self):
+        chunker = MarkdownChunker(tokenizer=MockTokenizer(model="foo"), max_tokens=20, use_token_offsets=True)
+        chunks = chunker.chunk("## A\nfoo bar baz.\n## B\nqux quux.\n### C\nmore text here")
+
+        assert [c.value for c in chunks] == ["## A\nfoo bar baz.", "## B\nqux quux.", "### C\nmore text here"]
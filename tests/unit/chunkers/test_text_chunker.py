@@ -1,6 +1,8 @@
 import pytest
 from griptape.artifacts import TextArtifact
 from griptape.chunkers import TextChunker
+from griptape.tokenizers import SimpleTokenizer
+from tests.mocks.mock_tokenizer import MockTokenizer
 from tests.unit.chunkers.utils import gen_paragraph
 
 MAX_TOKENS = 50
@@ -110,3 +112,96 @@ class TestTextChunker:
     def test_chunk_with_max_tokens(self, chunker):
         with pytest.raises(ValueError):
             TextChunker(max_tokens=-1)
+
+    def test_chunk_with_token_offsets(self):
+        tokenizer = SimpleTokenizer(characters_per_token=4)
+        chunker = TextChunker(tokenizer=tokenizer, max_tokens=MAX_TOKENS, use_token_offsets=True)
+        paragraph = gen_paragraph(int(MAX_TOKENS * 2.8), tokenizer, ". ")
+        chunks = chunker.chunk("\n\n".join([paragraph, paragraph]))
+
+        assert len(chunks) == 6
+
+        for chunk in chunks:
+            assert 0 < tokenizer.count_tokens(chunk.value) <= MAX_TOKENS
+            assert chunk.value == chunk.value.strip()
+            assert chunk.value.startswith("foo-")
+            assert chunk.value.endswith(".")
+
+        # The paragraph break is preferred over sentence breaks.
+        assert chunks[2].value.endswith(paragraph.split()[-1])
+        assert chunks[3].value.startswith("foo-0.")
+
+    def test_chunk_with_token_offsets_chunk_sizes(self):
+        tokenizer = SimpleTokenizer(characters_per_token=4)
+        chunker = TextChunker(tokenizer=tokenizer, max_tokens=MAX_TOKENS, use_token_offsets=True)
+        paragraph = gen_paragraph(MAX_TOKENS * 3, tokenizer, ". ")
+        chunks = chunker.chunk("\n\n".join(f"Title {i}\n\n{paragraph}" for i in range(3)))
+        sizes = [tokenizer.count_tokens(chunk.value) for chunk in chunks]
+
+        # Paragraph breaks right after the start of a chunk, or right after a title, don't split off tiny chunks.
+        assert chunks[0].value.startswith("Title 0\n\nfoo-0.")
+        assert all(MAX_TOKENS * chunker.MIN_CHUNK_FRACTION <= size <= MAX_TOKENS for size in sizes[:-1])
+
+    def test_chunk_with_token_offsets_without_separators(self):
+        tokenizer = SimpleTokenizer(characters_per_token=1)
+        chunker = TextChunker(tokenizer=tokenizer, max_tokens=4, use_token_offsets=True)
+
+        assert [c.value for c in chunker.chunk("abcdefghij klm")] == ["abcd", "efgh", "ij", "klm"]
+
+    def test_chunk_with_token_offsets_fills_chunks(self):
+        tokenizer = SimpleTokenizer(characters_per_token=4)
+        text = gen_paragraph(MAX_TOKENS * 10, tokenizer, "? ")
+
+        recursive_chunks = TextChunker(tokenizer=tokenizer, max_tokens=MAX_TOKENS).chunk(text)
+        linear_chunks = TextChunker(tokenizer=tokenizer, max_tokens=MAX_TOKENS, use_token_offsets=True).chunk(text)
+
+        assert len(linear_chunks) <= len(recursive_chunks)
+
+        for chunk in linear_chunks:
+            assert tokenizer.count_tokens(chunk.value) <= MAX_TOKENS
+
+    def test_iter_chunks(self):
+        tokenizer = MockTokenizer(model="foo")
+        chunker = TextChunker(tokenizer=tokenizer, max_tokens=MAX_TOKENS, lookahead_tokens=10, use_token_offsets=True)
+        text = "\n\n".join([gen_paragraph(MAX_TOKENS * 3, tokenizer, ". ")] * 5)
+        pieces = (text[i : i + 7] for i in range(0, len(text), 7))
+
+        assert [c.value for c in chunker.iter_chunks(pieces)] == [c.value for c in chunker.chunk(text)]
+
+    def test_iter_chunks_is_lazy(self):
+        tokenizer = MockTokenizer(model="foo")
+        chunker = TextChunker(tokenizer=tokenizer, max_tokens=MAX_TOKENS, lookahead_tokens=10)
+        read = []
+
+        def pieces():
+            for i in range(100):
+                read.append(i)
+
+                yield f"foo-{i}. "
+
+        chunks = chunker.iter_chunks(pieces())
+
+        assert next(chunks).value.startswith("foo-0.")
+        assert len(read) < 100
+        assert all(tokenizer.count_tokens(c.value) <= MAX_TOKENS for c in chunks)
+        assert len(read) == 100
+
+    def test_iter_chunks_empty(self):
+        chunker = TextChunker(tokenizer=MockTokenizer(model="foo"), max_tokens=MAX_TOKENS)
+
+        assert list(chunker.iter_chunks([])) == []
+        assert list(chunker.iter_chunks([" ", "\n"])) == []
+
+    def test_chunk_with_token_offsets_without_local_offsets(self, mocker):
+        tokenizer = MockTokenizer(model="foo")
+        mocker.patch.object(MockTokenizer, "token_offsets", return_value=None)
+        text = gen_paragraph(MAX_TOKENS * 3, tokenizer, ". ")
+
+        recursive_chunks = [c.value for c in TextChunker(tokenizer=tokenizer, max_tokens=MAX_TOKENS).chunk(text)]
+        chunker = TextChunker(tokenizer=tokenizer, max_tokens=MAX_TOKENS, use_token_offsets=True)
+
+        assert [c.value for c in chunker.chunk(text)] == recursive_chunks
+        assert [
+            c.value for c in chunker.iter_chunks(text[i : i + 7] for i in range(0, len(text), 7))
+        ] == recursive_chunks
+        assert MockTokenizer.token_offsets.call_count == 2
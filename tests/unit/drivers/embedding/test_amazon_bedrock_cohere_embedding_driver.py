@@ -1,3 +1,4 @@
+import json
 import pytest
 from unittest import mock
 from griptape.drivers import AmazonBedrockCohereEmbeddingDriver
@@ -19,8 +20,16 @@ class TestAmazonBedrockCohereEmbeddingDriver:
         mock_session_object.client.return_value = mock_client
         mock_session_class.return_value = mock_session_object
 
+        return mock_client
+
     def test_init(self):
         assert AmazonBedrockCohereEmbeddingDriver()
 
     def test_try_embed_chunk(self):
         assert AmazonBedrockCohereEmbeddingDriver().try_embed_chunk("foobar") == [0, 1, 0]
+
+    def test_try_embed_chunks(self, mock_session):
+        mock_session.invoke_model.return_value.get().read.return_value = '{"embeddings": [[0, 1, 0], [1, 0, 0]] }'
+
+        assert AmazonBedrockCohereEmbeddingDriver().try_embed_chunks(["foo", "bar"]) == [[0, 1, 0], [1, 0, 0]]
+        assert json.loads(mock_session.invoke_model.call_args.kwargs["body"])["texts"] == ["foo", "bar"]
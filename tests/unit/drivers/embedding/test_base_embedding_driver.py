@@ -39,3 +39,65 @@ class TestBaseEmbeddingDriver:
             driver.embed_string("foobar")
 
         assert e.value.args[0] == "nope"
+
+    def test_embed_text_artifacts(self, driver):
+        embedded = TextArtifact("foo")
+        embedded.embedding = [1, 0]
+        artifacts = [TextArtifact("bar"), embedded, TextArtifact("baz")]
+
+        with patch.object(driver, "embed_strings", wraps=driver.embed_strings) as embed_strings:
+            assert driver.embed_text_artifacts(artifacts) == [[0, 1], [1, 0], [0, 1]]
+
+        embed_strings.assert_called_once_with(["bar", "baz"])
+        assert artifacts[0].embedding == [0, 1]
+
+    def test_embed_strings(self, driver):
+        assert driver.embed_strings(["foo", "bar"]) == [[0, 1], [0, 1]]
+        assert driver.embed_strings([]) == []
+
+    def test_embed_strings_batches_by_size(self, driver):
+        driver.max_batch_size = 2
+
+        with patch.object(driver, "_embed_batch", side_effect=lambda chunks: [[len(c)] for c in chunks]) as embed:
+            assert driver.embed_strings(["a", "bb", "ccc", "dddd", "eeeee"]) == [[1], [2], [3], [4], [5]]
+
+        assert [c.args[0] for c in embed.call_args_list] == [["a", "bb"], ["ccc", "dddd"], ["eeeee"]]
+
+    def test_embed_strings_batches_by_tokens(self, driver):
+        driver.max_batch_tokens = 5
+
+        with patch.object(driver, "_embed_batch", side_effect=lambda chunks: [[len(c)] for c in chunks]) as embed:
+            assert driver.embed_strings(["aa", "bbb", "cccccc", "d"]) == [[2], [3], [6], [1]]
+
+        # MockTokenizer counts one token per character.
+        assert [c.args[0] for c in embed.call_args_list] == [["aa", "bbb"], ["cccccc"], ["d"]]
+
+    def test_embed_strings_embeds_long_strings_individually(self, driver):
+        long_string = "foobar" * 5000
+
+        with patch.object(driver, "_embed_batch", side_effect=lambda chunks: [[len(c)] for c in chunks]) as embed:
+            assert driver.embed_strings(["foo", long_string]) == [[3], [0, 1]]
+
+        embed.assert_called_once_with(["foo"])
+
+    def test_try_embed_chunks(self, driver):
+        assert driver.try_embed_chunks(["foo", "bar"]) == [[0, 1], [0, 1]]
+
+    @patch.object(MockEmbeddingDriver, "try_embed_chunks")
+    def test_embed_strings_retries_batches(self, try_embed_chunks, driver):
+        driver.max_attempts = 2
+        driver.min_retry_delay = 0
+        driver.max_retry_delay = 0
+        try_embed_chunks.side_effect = [Exception("nope"), [[0, 1], [1, 0]]]
+
+        assert driver.embed_strings(["foo", "bar"]) == [[0, 1], [1, 0]]
+        assert try_embed_chunks.call_count == 2
+
+    @patch.object(MockEmbeddingDriver, "try_embed_chunks")
+    def test_embed_strings_throws_when_retries_exhausted(self, try_embed_chunks, driver):
+        try_embed_chunks.side_effect = Exception("nope")
+
+        with pytest.raises(Exception) as e:
+            driver.embed_strings(["foo", "bar"])
+
+        assert e.value.args[0] == "nope"
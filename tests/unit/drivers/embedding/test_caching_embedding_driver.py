@@ -0,0 +1,98 @@
+import pytest
+from unittest.mock import Mock, patch
+from griptape import utils
+from griptape.artifacts import TextArtifact
+from griptape.drivers import (
+    CachingEmbeddingDriver,
+    CohereEmbeddingDriver,
+    LocalEmbeddingCacheDriver,
+    SqliteEmbeddingCacheDriver,
+)
+from tests.mocks.mock_embedding_driver import MockEmbeddingDriver
+
+
+class TestCachingEmbeddingDriver:
+    @pytest.fixture
+    def embedding_driver(self):
+        return MockEmbeddingDriver()
+
+    @pytest.fixture
+    def driver(self, embedding_driver):
+        return CachingEmbeddingDriver(embedding_driver=embedding_driver)
+
+    def test_init(self, driver, embedding_driver):
+        assert driver.model == embedding_driver.model
+        assert driver.tokenizer == embedding_driver.tokenizer
+        assert isinstance(driver.cache_driver, LocalEmbeddingCacheDriver)
+
+    def test_cache_key(self, driver):
+        assert driver.cache_key("foo") == utils.str_to_hash("foo\nfoo")
+        assert driver.cache_key("foo") != CachingEmbeddingDriver(
+            embedding_driver=MockEmbeddingDriver(model="bar")
+        ).cache_key("foo")
+
+    def test_cache_key_input_type(self):
+        client = Mock()
+        client.tokenize.return_value.tokens = []
+        client.embed.side_effect = lambda texts, model, input_type: Mock(embeddings=[[len(input_type)]] * len(texts))
+        cache_driver = LocalEmbeddingCacheDriver()
+        document_driver, query_driver = [
+            CachingEmbeddingDriver(
+                embedding_driver=CohereEmbeddingDriver(
+                    model="embed-english-v3.0", api_key="foo", client=client, input_type=input_type
+                ),
+                cache_driver=cache_driver,
+            )
+            for input_type in ["search_document", "search_query"]
+        ]
+
+        assert document_driver.embed_string("foo") == [15]
+        assert query_driver.embed_string("foo") == [12]
+        assert document_driver.cache_key("foo") != query_driver.cache_key("foo")
+        assert query_driver.misses == 1
+
+    def test_embed_string(self, driver, embedding_driver):
+        with patch.object(embedding_driver, "try_embed_chunk", return_value=[0, 1]) as try_embed_chunk:
+            assert driver.embed_string("foo") == [0, 1]
+            assert driver.embed_string("foo") == [0, 1]
+
+        try_embed_chunk.assert_called_once_with("foo")
+        assert driver.hits == 1
+        assert driver.misses == 1
+
+    def test_embed_strings(self, driver, embedding_driver):
+        driver.embed_string("foo")
+
+        with patch.object(embedding_driver, "embed_strings", wraps=embedding_driver.embed_strings) as embed_strings:
+            assert driver.embed_strings(["foo", "bar", "baz", "bar"]) == [[0, 1]] * 4
+
+        embed_strings.assert_called_once_with(["bar", "baz"])
+        assert driver.hits == 2
+        assert driver.misses == 3
+
+    def test_embed_text_artifacts(self, driver, embedding_driver):
+        driver.embed_text_artifacts([TextArtifact("foo")])
+
+        with patch.object(embedding_driver, "embed_strings") as embed_strings:
+            assert driver.embed_text_artifacts([TextArtifact("foo")]) == [[0, 1]]
+
+        embed_strings.assert_not_called()
+
+    def test_warm_restart(self, tmp_path, embedding_driver):
+        database_file = str(tmp_path / "embeddings.db")
+        driver = CachingEmbeddingDriver(
+            embedding_driver=embedding_driver, cache_driver=SqliteEmbeddingCacheDriver(database_file=database_file)
+        )
+        driver.embed_strings(["foo", "bar"])
+        driver.cache_driver.close()
+
+        driver = CachingEmbeddingDriver(
+            embedding_driver=embedding_driver, cache_driver=SqliteEmbeddingCacheDriver(database_file=database_file)
+        )
+
+        with patch.object(embedding_driver, "try_embed_chunks") as try_embed_chunks:
+            assert driver.embed_strings(["foo", "bar"]) == [[0, 1], [0, 1]]
+
+        try_embed_chunks.assert_not_called()
+        assert driver.hits == 2
+        assert driver.misses == 0
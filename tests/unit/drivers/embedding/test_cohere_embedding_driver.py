@@ -19,3 +19,11 @@ class TestCohereEmbeddingDriver:
         assert CohereEmbeddingDriver(
             model="embed-english-v3.0", api_key="bar", input_type="search_document"
         ).try_embed_chunk("foobar") == [0, 1, 0]
+
+    def test_try_embed_chunks(self, mock_client):
+        mock_client.embed.return_value = Mock(embeddings=[[0, 1, 0], [1, 0, 0]])
+
+        assert CohereEmbeddingDriver(
+            model="embed-english-v3.0", api_key="bar", input_type="search_document"
+        ).try_embed_chunks(["foo", "bar"]) == [[0, 1, 0], [1, 0, 0]]
+        assert mock_client.embed.call_args.kwargs["texts"] == ["foo", "bar"]
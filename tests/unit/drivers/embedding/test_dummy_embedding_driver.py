@@ -15,3 +15,7 @@ class TestDummyEmbeddingDriver:
     def test_try_embed_chunk(self, embedding_driver):
         with pytest.raises(DummyException):
             embedding_driver.try_embed_chunk("prompt-stack")
+
+    def test_try_embed_chunks(self, embedding_driver):
+        with pytest.raises(DummyException):
+            embedding_driver.try_embed_chunks(["prompt-stack"])
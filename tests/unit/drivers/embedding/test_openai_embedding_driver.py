@@ -2,6 +2,7 @@ from unittest.mock import Mock, MagicMock
 import pytest
 from griptape.drivers import OpenAiEmbeddingDriver
 from griptape.tokenizers import OpenAiTokenizer
+from tests.mocks.mock_tokenizer import MockTokenizer
 
 
 class TestOpenAiEmbeddingDriver:
@@ -28,3 +29,16 @@ class TestOpenAiEmbeddingDriver:
     def test_try_embed_chunk_replaces_newlines_in_older_ada_models(self, model, mock_openai):
         OpenAiEmbeddingDriver(model=model).try_embed_chunk("foo\nbar")
         assert mock_openai.call_args.kwargs["input"] == "foo bar" if model.endswith("001") else "foo\nbar"
+
+    def test_try_embed_chunks(self, mock_openai):
+        mock_openai.return_value.data = [Mock(embedding=[0, 1, 0]), Mock(embedding=[1, 0, 0])]
+
+        assert OpenAiEmbeddingDriver().try_embed_chunks(["foo", "bar"]) == [[0, 1, 0], [1, 0, 0]]
+        assert mock_openai.call_args.kwargs["input"] == ["foo", "bar"]
+
+    def test_embed_strings_uses_one_request_per_batch(self, mock_openai):
+        mock_openai.return_value.data = [Mock(embedding=[0, 1, 0]), Mock(embedding=[1, 0, 0])]
+        driver = OpenAiEmbeddingDriver(tokenizer=MockTokenizer(model="foo"), max_batch_size=2)
+
+        assert driver.embed_strings(["foo", "bar", "baz", "qux"]) == [[0, 1, 0], [1, 0, 0], [0, 1, 0], [1, 0, 0]]
+        assert mock_openai.call_count == 2
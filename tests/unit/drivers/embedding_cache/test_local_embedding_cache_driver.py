@@ -0,0 +1,40 @@
+import pytest
+from griptape.drivers import LocalEmbeddingCacheDriver
+
+
+class TestLocalEmbeddingCacheDriver:
+    @pytest.fixture
+    def driver(self):
+        return LocalEmbeddingCacheDriver()
+
+    def test_store_embedding(self, driver):
+        driver.store_embedding("foo", [0, 1])
+
+        assert driver.load_embedding("foo") == [0, 1]
+        assert driver.load_embedding("bar") is None
+        assert driver.size_bytes == 8
+
+    def test_store_embeddings(self, driver):
+        driver.store_embeddings({"foo": [0, 1], "bar": [1, 0]})
+        driver.store_embeddings({"foo": [0.5, 0.5]})
+
+        assert driver.load_embeddings(["foo", "bar", "baz"]) == {"foo": [0.5, 0.5], "bar": [1, 0]}
+        assert len(driver) == 2
+        assert driver.size_bytes == 16
+
+    def test_evicts_least_recently_used(self):
+        driver = LocalEmbeddingCacheDriver(max_bytes=16)
+
+        driver.store_embeddings({"foo": [0, 1], "bar": [1, 0]})
+        driver.load_embedding("foo")
+        driver.store_embedding("baz", [1, 1])
+
+        assert driver.load_embeddings(["foo", "bar", "baz"]) == {"foo": [0, 1], "baz": [1, 1]}
+        assert driver.size_bytes == 16
+
+    def test_clear(self, driver):
+        driver.store_embedding("foo", [0, 1])
+        driver.clear()
+
+        assert driver.load_embedding("foo") is None
+        assert driver.size_bytes == 0
@@ -0,0 +1,47 @@
+import pytest
+from griptape.drivers import SqliteEmbeddingCacheDriver
+
+
+class TestSqliteEmbeddingCacheDriver:
+    @pytest.fixture
+    def database_file(self, tmp_path):
+        return str(tmp_path / "embeddings.db")
+
+    @pytest.fixture
+    def driver(self, database_file):
+        driver = SqliteEmbeddingCacheDriver(database_file=database_file)
+
+        yield driver
+
+        driver.close()
+
+    def test_store_embedding(self, driver):
+        driver.store_embedding("foo", [0, 1])
+
+        assert driver.load_embedding("foo") == [0, 1]
+        assert driver.load_embedding("bar") is None
+
+    def test_store_embeddings(self, driver):
+        driver.store_embeddings({"foo": [0, 1], "bar": [1, 0]})
+        driver.store_embeddings({"foo": [0.5, 0.5]})
+
+        assert driver.load_embeddings(["foo", "bar", "baz"]) == {"foo": [0.5, 0.5], "bar": [1, 0]}
+
+    def test_load_many_embeddings(self, driver):
+        keys = [str(i) for i in range(SqliteEmbeddingCacheDriver.MAX_QUERY_VARIABLES * 2 + 1)]
+
+        driver.store_embeddings({key: [float(key)] for key in keys})
+
+        assert driver.load_embeddings(keys) == {key: [float(key)] for key in keys}
+
+    def test_persistence(self, driver, database_file):
+        driver.store_embedding("foo", [0, 1])
+        driver.close()
+
+        assert SqliteEmbeddingCacheDriver(database_file=database_file).load_embedding("foo") == [0, 1]
+
+    def test_clear(self, driver):
+        driver.store_embedding("foo", [0, 1])
+        driver.clear()
+
+        assert driver.load_embedding("foo") is None
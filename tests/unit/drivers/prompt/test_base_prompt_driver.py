@@ -1,3 +1,4 @@
+from attrs import define
 from griptape.events import FinishPromptEvent, StartPromptEvent
 from griptape.utils import PromptStack
 from tests.mocks.mock_prompt_driver import MockPromptDriver
@@ -39,6 +40,61 @@ class TestBasePromptDriver:
     def test_run(self):
         assert isinstance(MockPromptDriver().run(PromptStack(inputs=[])), TextArtifact)
 
+    def test_count_prompt_stack_tokens(self):
+        driver = MockPromptDriver()
+        prompt_stack = PromptStack()
+        prompt_stack.add_system_input("fizz")
+        prompt_stack.add_user_input("foo")
+        prompt_stack.add_assistant_input("bar")
+        prompt_stack.add_generic_input("baz")
+
+        assert driver.count_prompt_stack_tokens(prompt_stack) == driver.tokenizer.count_tokens(
+            driver.prompt_stack_to_string(prompt_stack)
+        )
+        assert driver.count_prompt_stack_tokens(PromptStack()) == driver.tokenizer.count_tokens(
+            driver.prompt_stack_to_string(PromptStack())
+        )
+
+    def test_count_prompt_stack_tokens_with_alternating_template(self):
+        driver = MockAlternatingPromptDriver()
+        prompt_stack = PromptStack()
+        prompt_stack.add_system_input("fizz")
+        prompt_stack.add_user_input("foo")
+        prompt_stack.add_assistant_input("bar")
+        prompt_stack.add_user_input("baz")
+
+        assert driver.count_prompt_stack_tokens(prompt_stack) == driver.tokenizer.count_tokens(
+            driver.prompt_stack_to_string(prompt_stack)
+        )
+
+    def test_count_prompt_stack_tokens_falls_back_to_rendering(self):
+        driver = MockAlternatingPromptDriver(reject_empty_inputs=True)
+        prompt_stack = PromptStack()
+        prompt_stack.add_user_input("foo")
+        prompt_stack.add_assistant_input("bar")
+
+        assert driver.count_prompt_stack_tokens(prompt_stack) == driver.tokenizer.count_tokens(
+            driver.prompt_stack_to_string(prompt_stack)
+        )
+
+
+@define
+class MockAlternatingPromptDriver(MockPromptDriver):
+    """Renders like chat templates that require user and assistant inputs to alternate, starting with a user input."""
+
+    reject_empty_inputs: bool = False
+
+    def prompt_stack_to_string(self, prompt_stack: PromptStack) -> str:
+        inputs = [i for i in prompt_stack.inputs if not i.is_system()]
+
+        if not inputs or any(i.is_user() != (n % 2 == 0) for n, i in enumerate(inputs)):
+            raise ValueError("Conversation roles must alternate user/assistant/user/assistant/...")
+
+        if self.reject_empty_inputs and any(not i.content for i in prompt_stack.inputs):
+            raise ValueError("Conversation inputs must have content")
+
+        return "".join(f"<{i.role}>{i.content}</{i.role}>" for i in prompt_stack.inputs) + "<assistant>"
+
 
 def instance_count(instances, clazz):
     return len([instance for instance in instances if isinstance(instance, clazz)])
@@ -1,8 +1,11 @@
 from abc import ABC, abstractmethod
+import threading
 import pytest
 from unittest.mock import patch
 from griptape.artifacts import TextArtifact
 from griptape.artifacts.csv_row_artifact import CsvRowArtifact
+from griptape.drivers import BaseVectorStoreDriver
+from griptape.drivers.vector.local_vector_index import LocalVectorIndex
 
 
 class BaseLocalVectorStoreDriver(ABC):
@@ -48,6 +51,62 @@ class BaseLocalVectorStoreDriver(ABC):
         assert foo_entries[0].to_artifact().value == "foo"
         assert bar_entries[0].to_artifact().value == "bar"
 
+    def test_upsert_multiple_embeds_in_batches(self, driver):
+        driver.upsert_text_artifact(TextArtifact("foo"), namespace="foo")
+
+        with patch.object(driver.embedding_driver, "_embed_batch", wraps=driver.embedding_driver._embed_batch) as embed:
+            driver.upsert_text_artifacts(
+                {"foo": [TextArtifact("foo"), TextArtifact("bar")], "bar": [TextArtifact("baz")]}, meta={"foo": "bar"}
+            )
+
+        embed.assert_called_once_with(["bar", "baz"])
+        assert len(driver.entries) == 3
+        assert driver.load_entries("bar")[0].meta["foo"] == "bar"
+        assert driver.load_entries("bar")[0].to_artifact().value == "baz"
+
+    def test_upsert_multiple_checks_existence_per_batch(self, driver):
+        driver.upsert_text_artifact(TextArtifact("foo"), namespace="foo")
+
+        with patch.object(driver.__class__, "existing_ids", wraps=driver.existing_ids) as existing_ids:
+            driver.upsert_text_artifacts(
+                {"foo": [TextArtifact("foo"), TextArtifact("bar"), TextArtifact("baz")], "bar": [TextArtifact("qux")]},
+                batch_size=2,
+            )
+
+        assert existing_ids.call_count == 3
+        assert [e.to_artifact().value for e in driver.load_entries("foo")] == ["foo", "bar", "baz"]
+        assert [e.to_artifact().value for e in driver.load_entries("bar")] == ["qux"]
+
+    def test_entries(self, driver):
+        driver.upsert_vector([1.0, 0.0], vector_id="foo", namespace="a", meta={"foo": "bar"})
+        driver.upsert_vector([0.0, 1.0], vector_id="bar")
+
+        assert driver.entries == {
+            "a-foo": BaseVectorStoreDriver.Entry(id="foo", vector=[1.0, 0.0], meta={"foo": "bar"}, namespace="a"),
+            "bar": BaseVectorStoreDriver.Entry(id="bar", vector=[0.0, 1.0]),
+        }
+
+        driver.entries = {"baz": BaseVectorStoreDriver.Entry(id="baz", vector=[1.0, 1.0], namespace="b")}
+
+        assert [(e.id, e.vector, e.namespace) for e in driver.load_entries()] == [("baz", [1.0, 1.0], "b")]
+        assert driver.namespaces == ["b"]
+        assert [r.id for r in driver.query_vector([1.0, 0.0])] == ["baz"]
+
+    def test_upsert_vectors(self, driver):
+        ids = driver.upsert_vectors(
+            [
+                BaseVectorStoreDriver.Entry(id="foo", vector=[0, 1], namespace="a"),
+                BaseVectorStoreDriver.Entry(id="bar", vector=[1, 0], namespace="b", meta={"foo": "bar"}),
+                BaseVectorStoreDriver.Entry(id=None, vector=[1, 1]),
+            ]
+        )
+
+        assert ids[:2] == ["foo", "bar"]
+        assert len(driver.entries) == 3
+        assert driver.load_entry("bar", namespace="b").vector == [1, 0]
+        assert driver.load_entry("bar", namespace="b").meta == {"foo": "bar"}
+        assert driver.load_entry(ids[2]).vector == [1, 1]
+
     def test_query(self, driver):
         vector_id = driver.upsert_text_artifact(TextArtifact("foobar"), namespace="test-namespace")
 
@@ -59,6 +118,60 @@ class BaseLocalVectorStoreDriver(ABC):
         assert driver.query("foobar")[0].to_artifact().value == "foobar"
         assert driver.query("foobar")[0].id == vector_id
 
+    def test_query_ranking(self, driver):
+        driver.upsert_vector([1.0, 0.0], vector_id="orthogonal")
+        driver.upsert_vector([0.0, 1.0], vector_id="same")
+        driver.upsert_vector([1.0, 1.0], vector_id="diagonal")
+
+        results = driver.query("foobar", count=2)
+
+        assert [r.id for r in results] == ["same", "diagonal"]
+        assert results[0].score == pytest.approx(1.0)
+        assert results[1].score == pytest.approx(0.7071, abs=1e-4)
+        assert len(driver.query("foobar")) == 3
+
+    def test_query_vector(self, driver):
+        driver.upsert_vector([1.0, 0.0], vector_id="orthogonal")
+        driver.upsert_vector([0.0, 1.0], vector_id="same")
+
+        assert [r.id for r in driver.query_vector([1.0, 0.1], count=1)] == ["orthogonal"]
+
+    def test_query_many(self, driver, mocker):
+        driver.upsert_vector([1.0, 0.0], vector_id="orthogonal", namespace="a")
+        driver.upsert_vector([0.0, 1.0], vector_id="same", namespace="b")
+        driver.upsert_vector([1.0, 1.0], vector_id="diagonal")
+        embed_strings = mocker.spy(driver.embedding_driver.__class__, "embed_strings")
+
+        results = driver.query_many(["foo", [1.0, 0.0], "bar"], count=2)
+
+        assert embed_strings.call_count == 1
+        assert [[r.id for r in query_results] for query_results in results] == [
+            ["same", "diagonal"],
+            ["orthogonal", "diagonal"],
+            ["same", "diagonal"],
+        ]
+        assert [r.id for r in driver.query_many([[1.0, 0.0]], namespace="b")[0]] == ["same"]
+        assert driver.query_many([]) == []
+
+    def test_query_many_with_relatedness_fn(self, driver):
+        driver.relatedness_fn = lambda x, y: -abs(x[0] - y[0])
+        driver.upsert_vector([1.0, 0.0], vector_id="foo")
+        driver.upsert_vector([2.0, 0.0], vector_id="bar")
+
+        results = driver.query_many([[1.0, 0.0], [2.0, 0.0]], count=1)
+
+        assert [[r.id for r in query_results] for query_results in results] == [["foo"], ["bar"]]
+
+    def test_query_with_relatedness_fn(self, driver):
+        driver.relatedness_fn = lambda x, y: -y[0]
+        driver.upsert_vector([1.0, 0.0], vector_id="foo")
+        driver.upsert_vector([2.0, 0.0], vector_id="bar")
+
+        results = driver.query("foobar", count=1)
+
+        assert [r.id for r in results] == ["foo"]
+        assert results[0].score == -1.0
+
     def test_load_entry(self, driver):
         vector_id = driver.upsert_text_artifact(TextArtifact("foobar"), namespace="test-namespace")
 
@@ -73,6 +186,17 @@ class BaseLocalVectorStoreDriver(ABC):
         assert len(driver.load_entries("test-namespace-1")) == 2
         assert len(driver.load_entries("test-namespace-2")) == 1
 
+    def test_iter_entries(self, driver):
+        driver.upsert_vector([1.0, 0.0], vector_id="foo", namespace="a")
+        driver.upsert_vector([0.0, 1.0], vector_id="bar", namespace="b")
+        entries = driver.iter_entries("a", page_size=1)
+
+        driver.upsert_vector([1.0, 1.0], vector_id="baz", namespace="a")
+
+        # Iteration reads the snapshot that was current when it started.
+        assert [(e.id, e.vector, e.namespace) for e in entries] == [("foo", [1.0, 0.0], "a")]
+        assert [e.id for e in driver.iter_entries()] == ["foo", "baz", "bar"]
+
     def test_load_artifacts(self, driver):
         driver.upsert_text_artifact(TextArtifact("foobar 1"), namespace="test-namespace-1")
         driver.upsert_text_artifact(TextArtifact("foobar 2"), namespace="test-namespace-1")
@@ -82,6 +206,238 @@ class BaseLocalVectorStoreDriver(ABC):
         assert len(driver.load_artifacts("test-namespace-1")) == 2
         assert len(driver.load_artifacts("test-namespace-2")) == 1
 
+    def test_load_entries_by_ids(self, driver):
+        driver.upsert_vector([1.0, 0.0], vector_id="foo", namespace="a", meta={"foo": "bar"})
+        driver.upsert_vector([0.0, 1.0], vector_id="bar", namespace="a")
+        driver.upsert_vector([1.0, 1.0], vector_id="baz", namespace="b")
+
+        entries = driver.load_entries_by_ids(["bar", "baz", "foo"], namespace="a")
+
+        assert [(e.id, e.vector, e.namespace) for e in entries] == [("bar", [0.0, 1.0], "a"), ("foo", [1.0, 0.0], "a")]
+        assert entries[1].meta == {"foo": "bar"}
+        assert driver.load_entries_by_ids(["foo"], namespace="c") == []
+
+    def test_existing_ids(self, driver):
+        driver.upsert_vector([1.0, 0.0], vector_id="foo", namespace="a")
+        driver.upsert_vector([0.0, 1.0], vector_id="bar", namespace="a")
+        driver.upsert_vector([1.0, 1.0], vector_id="baz", namespace="b")
+        driver.delete_vector("bar", namespace="a")
+        driver.wait_for_compaction()
+
+        assert driver.existing_ids(["foo", "bar", "baz"], namespace="a") == {"foo"}
+        assert driver.existing_ids(["foo"], namespace="c") == set()
+
     def test_does_entry_exist_exception(self, driver):
         with patch.object(driver, "load_entry", side_effect=Exception):
             assert driver.does_entry_exist("does_not_exist") is False
+
+    def test_query_namespace_prefix(self, driver):
+        driver.upsert_vector([0.0, 1.0], vector_id="foo", namespace="test")
+        driver.upsert_vector([0.0, 1.0], vector_id="bar", namespace="test-namespace")
+
+        assert [r.id for r in driver.query("foobar", namespace="test")] == ["foo"]
+        assert [r.id for r in driver.query("foobar", namespace="test-namespace")] == ["bar"]
+        assert [e.id for e in driver.load_entries("test")] == ["foo"]
+
+    def test_query_across_namespaces(self, driver):
+        driver.upsert_vector([1.0, 0.0], vector_id="orthogonal", namespace="a")
+        driver.upsert_vector([0.0, 1.0], vector_id="same", namespace="b")
+        driver.upsert_vector([1.0, 1.0], vector_id="diagonal")
+
+        results = driver.query("foobar", count=2)
+
+        assert [(r.id, r.namespace) for r in results] == [("same", "b"), ("diagonal", None)]
+        assert driver.query("foobar", namespace="a", include_vectors=True)[0].vector == [1.0, 0.0]
+
+    def test_drop_namespace(self, driver):
+        driver.upsert_vector([1.0, 0.0], vector_id="foo", namespace="a")
+        driver.upsert_vector([0.0, 1.0], vector_id="bar", namespace="a")
+        driver.upsert_vector([1.0, 1.0], vector_id="foo", namespace="b")
+
+        driver.drop_namespace("a")
+        driver.drop_namespace("does-not-exist")
+
+        assert driver.namespaces == ["b"]
+        assert driver.load_entries("a") == []
+        assert driver.load_entry("foo", namespace="a") is None
+        assert [r.id for r in driver.query("foobar")] == ["foo"]
+        assert len(driver.entries) == 1
+
+        driver.upsert_vector([1.0, 0.0], vector_id="baz", namespace="a")
+
+        assert [e.id for e in driver.load_entries("a")] == ["baz"]
+
+    def test_query_with_filter(self, driver):
+        driver.indexed_meta_keys = ["type"]
+        driver.upsert_vector([1.0, 0.0], vector_id="foo", meta={"type": "a", "tags": ["x"]})
+        driver.upsert_vector([0.0, 1.0], vector_id="bar", meta={"type": "b", "tags": ["x"]})
+        driver.upsert_vector([1.0, 1.0], vector_id="baz", meta={"type": "a", "tags": ["y"]})
+        driver.upsert_vector([1.0, 1.0], vector_id="qux")
+
+        assert [r.id for r in driver.query("foobar", filter={"type": "a"})] == ["baz", "foo"]
+        assert [r.id for r in driver.query("foobar", filter={"tags": ["x"]})] == ["bar", "foo"]
+        assert [r.id for r in driver.query("foobar", filter={"type": "a", "tags": ["x"]})] == ["foo"]
+        assert driver.query("foobar", filter={"type": "c"}) == []
+        assert driver.query_many([[1.0, 0.0]], filter={"type": "b"})[0][0].id == "bar"
+        assert len(driver.query("foobar", filter={})) == 4
+
+    def test_query_with_filter_after_update(self, driver):
+        driver.indexed_meta_keys = ["type"]
+        driver.upsert_vector([1.0, 0.0], vector_id="foo", meta={"type": "a"})
+        driver.upsert_vector([1.0, 0.0], vector_id="foo", meta={"type": "b"})
+
+        assert driver.query("foobar", filter={"type": "a"}) == []
+        assert [r.id for r in driver.query("foobar", filter={"type": "b"})] == ["foo"]
+
+    def test_query_with_filter_only_scores_matching_rows(self, driver, mocker):
+        driver.indexed_meta_keys = ["type"]
+        driver.upsert_vectors(
+            [
+                BaseVectorStoreDriver.Entry(id=str(i), vector=[1.0, float(i)], meta={"type": "a" if i < 2 else "b"})
+                for i in range(100)
+            ]
+        )
+        scores = mocker.spy(LocalVectorIndex, "_scores")
+
+        results = driver.query("foobar", filter={"type": "a"})
+
+        assert [r.id for r in results] == ["1", "0"]
+        assert scores.call_args.args[2].tolist() == [0, 1]
+
+    def test_query_with_filter_and_relatedness_fn(self, driver):
+        driver.indexed_meta_keys = ["type"]
+        driver.relatedness_fn = lambda x, y: -y[0]
+        driver.upsert_vector([1.0, 0.0], vector_id="foo", meta={"type": "a"})
+        driver.upsert_vector([2.0, 0.0], vector_id="bar", meta={"type": "b"})
+
+        assert [r.id for r in driver.query("foobar", filter={"type": "b"})] == ["bar"]
+
+    def test_delete_vector(self, driver):
+        driver.tombstone_threshold = None
+        driver.indexed_meta_keys = ["type"]
+        driver.upsert_vector([1.0, 0.0], vector_id="foo", namespace="a", meta={"type": "a"})
+        driver.upsert_vector([0.0, 1.0], vector_id="bar", namespace="a", meta={"type": "a"})
+        driver.upsert_vector([1.0, 1.0], vector_id="foo", namespace="b")
+
+        driver.delete_vector("foo", namespace="a")
+        driver.delete_vector("does-not-exist", namespace="a")
+
+        assert driver.load_entry("foo", namespace="a") is None
+        assert [e.id for e in driver.load_entries("a")] == ["bar"]
+        assert [(r.id, r.namespace) for r in driver.query("foobar")] == [("bar", "a"), ("foo", "b")]
+        assert [r.id for r in driver.query("foobar", filter={"type": "a"})] == ["bar"]
+        assert len(driver.entries) == 2
+
+        driver.upsert_vector([1.0, 0.0], vector_id="foo", namespace="a", meta={"type": "a"})
+
+        assert [r.id for r in driver.query("foobar", namespace="a", filter={"type": "a"})] == ["bar", "foo"]
+
+    def test_delete_vector_with_relatedness_fn(self, driver):
+        driver.tombstone_threshold = None
+        driver.relatedness_fn = lambda x, y: -y[0]
+        driver.upsert_vector([1.0, 0.0], vector_id="foo")
+        driver.upsert_vector([2.0, 0.0], vector_id="bar")
+
+        driver.delete_vector("foo")
+
+        assert [r.id for r in driver.query("foobar")] == ["bar"]
+
+    def test_delete_vector_compacts_in_background(self, driver, mocker):
+        driver.upsert_vector([1.0, 0.0], vector_id="foo")
+        driver.upsert_vector([0.0, 1.0], vector_id="bar")
+        driver.upsert_vector([1.0, 1.0], vector_id="baz")
+        driver.upsert_vector([1.0, 2.0], vector_id="qux")
+
+        futures_executor_fn = mocker.patch.object(driver, "futures_executor_fn", wraps=driver.futures_executor_fn)
+        driver.delete_vector("foo")
+
+        futures_executor_fn.assert_not_called()
+
+        driver.delete_vector("baz")
+        driver.wait_for_compaction()
+
+        assert [r.id for r in driver.query("foobar")] == ["bar", "qux"]
+        assert driver.load_entry("qux").vector == [1.0, 2.0]
+        assert [e.id for e in driver.load_entries()] == ["bar", "qux"]
+
+        driver.delete_vector("bar")
+        driver.wait_for_compaction()
+
+        # Every compaction runs on the executor created by the first one.
+        futures_executor_fn.assert_called_once()
+        assert [e.id for e in driver.load_entries()] == ["qux"]
+
+    def test_close(self, driver):
+        driver.upsert_vector([1.0, 0.0], vector_id="foo")
+        driver.delete_vector("foo")
+        executor = driver._compaction_executor
+
+        driver.close()
+
+        assert driver._compaction_future.done()
+        assert driver._compaction_executor is None
+        with pytest.raises(RuntimeError):
+            executor.submit(print)
+
+        driver.upsert_vector([0.0, 1.0], vector_id="bar")
+        driver.delete_vector("bar")
+        driver.wait_for_compaction()
+
+        assert driver.load_entries() == []
+
+    def test_snapshot_isolation(self, driver):
+        driver.upsert_vector([1.0, 0.0], vector_id="foo", meta={"foo": 1})
+        driver.upsert_vector([0.0, 1.0], vector_id="bar")
+        snapshot = driver._snapshot
+
+        driver.upsert_vector([1.0, 1.0], vector_id="foo", meta={"foo": 2})
+        driver.upsert_vector([1.0, 2.0], vector_id="baz")
+        driver.delete_vector("bar")
+        driver.wait_for_compaction()
+
+        assert [(e.id, e.vector, e.meta) for e in driver._iter_entries(snapshot, None)] == [
+            ("foo", [1.0, 0.0], {"foo": 1}),
+            ("bar", [0.0, 1.0], None),
+        ]
+        assert [(e.id, e.vector) for e in driver.load_entries()] == [("foo", [1.0, 1.0]), ("baz", [1.0, 2.0])]
+
+    def test_concurrent_queries_and_upserts(self, driver):
+        driver.tombstone_threshold = None
+        errors = []
+        done = threading.Event()
+
+        def read():
+            try:
+                while not done.is_set():
+                    entries = driver.load_entries()
+                    results = driver.query_vector([1.0, 1.0], count=5)
+
+                    # Every batch is published at once, so readers never see half of one.
+                    assert len(entries) % 2 == 0
+                    assert all(r.id is not None for r in results)
+            except Exception as e:
+                errors.append(e)
+
+        readers = [threading.Thread(target=read) for _ in range(4)]
+
+        for reader in readers:
+            reader.start()
+
+        for i in range(50):
+            driver.upsert_vectors(
+                [
+                    BaseVectorStoreDriver.Entry(id=f"{i}-a", vector=[float(i), 1.0]),
+                    BaseVectorStoreDriver.Entry(id=f"{i}-b", vector=[1.0, float(i)]),
+                ]
+            )
+
+            if i % 5 == 0:
+                driver.upsert_vector([2.0, float(i)], vector_id=f"{i}-a")
+
+        done.set()
+
+        for reader in readers:
+            reader.join()
+
+        assert errors == []
+        assert len(driver.load_entries()) == 100
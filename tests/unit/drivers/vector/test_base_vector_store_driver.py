@@ -0,0 +1,62 @@
+from typing import Optional
+import pytest
+from attrs import define
+from griptape.drivers import BaseVectorStoreDriver, LocalVectorStoreDriver
+from tests.mocks.mock_embedding_driver import MockEmbeddingDriver
+
+
+@define
+class QueryOnlyVectorStoreDriver(BaseVectorStoreDriver):
+    """A driver that implements `query` and `load_entries` but not `query_vector` and `iter_entries`."""
+
+    def delete_vector(self, vector_id: str, namespace: Optional[str] = None) -> None: ...
+
+    def upsert_vector(self, vector, vector_id=None, namespace=None, meta=None, **kwargs) -> str:
+        return vector_id
+
+    def load_entry(self, vector_id: str, namespace: Optional[str] = None) -> Optional[BaseVectorStoreDriver.Entry]:
+        return None
+
+    def load_entries(self, namespace: Optional[str] = None) -> list[BaseVectorStoreDriver.Entry]:
+        return [BaseVectorStoreDriver.Entry(id="foo", namespace=namespace)]
+
+    def query(self, query: str, count=None, namespace=None, include_vectors=False, **kwargs):
+        return [BaseVectorStoreDriver.Entry(id=query, namespace=namespace)]
+
+
+class TestBaseVectorStoreDriver:
+    @pytest.fixture
+    def driver(self):
+        return QueryOnlyVectorStoreDriver(embedding_driver=MockEmbeddingDriver())
+
+    def test_iter_entries(self, driver):
+        assert [(e.id, e.namespace) for e in driver.iter_entries("bar")] == [("foo", "bar")]
+
+    def test_iter_entries_without_load_entries(self):
+        @define
+        class NoEntriesVectorStoreDriver(QueryOnlyVectorStoreDriver):
+            load_entries = BaseVectorStoreDriver.load_entries
+
+        with pytest.raises(NotImplementedError):
+            NoEntriesVectorStoreDriver(embedding_driver=MockEmbeddingDriver()).load_entries()
+
+    def test_query_vector(self, driver):
+        with pytest.raises(NotImplementedError):
+            driver.query_vector([0.0, 1.0])
+
+    def test_embeds_queries(self, driver):
+        assert driver.embeds_queries
+        assert not LocalVectorStoreDriver(embedding_driver=MockEmbeddingDriver()).embeds_queries
+
+    def test_query_many(self, driver, mocker):
+        embed_strings = mocker.spy(MockEmbeddingDriver, "embed_strings")
+        results = driver.query_many(["foo", "bar"], namespace="baz")
+
+        assert [[(r.id, r.namespace) for r in query_results] for query_results in results] == [
+            [("foo", "baz")],
+            [("bar", "baz")],
+        ]
+        embed_strings.assert_not_called()
+
+        with pytest.raises(NotImplementedError):
+            driver.query_many([[0.0, 1.0]])
@@ -16,6 +16,10 @@ class TestDummyVectorStoreDriver:
         with pytest.raises(DummyException):
             vector_store_driver.upsert_vector("foo bar huzzah")
 
+    def test_upsert_vectors(self, vector_store_driver):
+        with pytest.raises(DummyException):
+            vector_store_driver.upsert_vectors([])
+
     def test_load_entry(self, vector_store_driver):
         with pytest.raises(DummyException):
             vector_store_driver.load_entry("foo bar huzzah")
@@ -24,6 +28,22 @@ class TestDummyVectorStoreDriver:
         with pytest.raises(DummyException):
             vector_store_driver.load_entries("foo bar huzzah")
 
+    def test_load_entries_by_ids(self, vector_store_driver):
+        with pytest.raises(DummyException):
+            vector_store_driver.load_entries_by_ids(["foo bar huzzah"])
+
+    def test_existing_ids(self, vector_store_driver):
+        with pytest.raises(DummyException):
+            vector_store_driver.existing_ids(["foo bar huzzah"])
+
+    def test_iter_entries(self, vector_store_driver):
+        with pytest.raises(DummyException):
+            vector_store_driver.iter_entries("foo bar huzzah")
+
     def test_query(self, vector_store_driver):
         with pytest.raises(DummyException):
             vector_store_driver.query("foo bar huzzah")
+
+    def test_query_vector(self, vector_store_driver):
+        with pytest.raises(DummyException):
+            vector_store_driver.query_vector([0.0, 1.0])
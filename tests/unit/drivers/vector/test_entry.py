@@ -1,4 +1,6 @@
-from griptape.artifacts import TextArtifact
+import json
+from unittest.mock import patch
+from griptape.artifacts import BaseArtifact, CsvRowArtifact, TextArtifact
 from griptape.drivers import BaseVectorStoreDriver
 
 
@@ -10,3 +12,36 @@ class TestEntry:
     def test_to_artifact(self):
         entry = BaseVectorStoreDriver.Entry(id="test", vector=[], meta={"artifact": TextArtifact("foo").to_json()})
         assert entry.to_artifact().value == "foo"
+
+    def test_to_artifact_compact(self):
+        artifact = TextArtifact("foo", name="bar", meta={"baz": 1})
+        entry = BaseVectorStoreDriver.Entry(
+            id="test", meta={"artifact": BaseVectorStoreDriver.artifact_to_payload(artifact)}
+        )
+
+        assert entry.to_artifact() == artifact
+
+    def test_artifact_to_payload(self):
+        artifact = TextArtifact("foo", id="1")
+
+        assert BaseVectorStoreDriver.artifact_to_payload(artifact) == '{"id":"1","value":"foo"}'
+        assert json.loads(BaseVectorStoreDriver.artifact_to_payload(TextArtifact("foo", id="1", name="bar"))) == {
+            "id": "1",
+            "value": "foo",
+            "name": "bar",
+        }
+
+    def test_artifact_to_payload_subclass(self):
+        artifact = CsvRowArtifact({"foo": "bar"})
+
+        assert BaseVectorStoreDriver.artifact_to_payload(artifact) == artifact.to_json()
+        assert isinstance(BaseVectorStoreDriver.artifact_from_payload(artifact.to_json()), CsvRowArtifact)
+
+    def test_artifact_from_payload_full(self):
+        artifact = TextArtifact("foo", name="bar", meta={"baz": 1})
+
+        with patch.object(BaseArtifact, "from_dict") as from_dict:
+            assert BaseVectorStoreDriver.artifact_from_payload(artifact.to_json()) == artifact
+            assert BaseVectorStoreDriver.artifact_from_payload(TextArtifact("foo", id="1").to_json()).name == "1"
+
+        from_dict.assert_not_called()
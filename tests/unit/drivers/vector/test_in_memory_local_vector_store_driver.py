@@ -7,4 +7,16 @@ from tests.unit.drivers.vector.test_base_local_vector_store_driver import BaseLo
 class TestInMemoryLocalVectorStoreDriver(BaseLocalVectorStoreDriver):
     @pytest.fixture
     def driver(self):
-        return LocalVectorStoreDriver(embedding_driver=MockEmbeddingDriver())
+        driver = LocalVectorStoreDriver(embedding_driver=MockEmbeddingDriver())
+
+        yield driver
+
+        driver.close()
+
+    def test_compressed_vectors(self):
+        driver = LocalVectorStoreDriver(embedding_driver=MockEmbeddingDriver(), vector_dtype="float16")
+        driver.upsert_vector([0.0, 1.0], vector_id="foo")
+        driver.upsert_vector([1.0, 0.0], vector_id="bar")
+
+        assert [r.id for r in driver.query("foo")] == ["foo", "bar"]
+        assert driver.load_entry("bar").vector == [1.0, 0.0]
@@ -0,0 +1,92 @@
+import numpy as np
+import pytest
+from griptape.drivers.vector.local_ivf_index import LocalIvfIndex
+
+
+class TestLocalIvfIndex:
+    @pytest.fixture
+    def matrix(self):
+        rng = np.random.default_rng(0)
+        centers = rng.normal(size=(4, 8))
+
+        return (np.repeat(centers, 50, axis=0) + rng.normal(scale=0.05, size=(200, 8))).astype(np.float32)
+
+    @pytest.fixture
+    def index(self):
+        return LocalIvfIndex(list_count=4, nprobe=1, min_train_size=100)
+
+    def test_should_train(self, index):
+        assert not index.should_train(99)
+        assert index.should_train(100)
+
+        index.load(np.eye(2, dtype=np.float32), np.zeros(100), 100)
+
+        assert not index.should_train(399)
+        assert index.should_train(400)
+
+    def test_train(self, index, matrix):
+        index.train(matrix, np.linalg.norm(matrix, axis=1))
+
+        assert index.is_trained
+        assert index.trained_size == 200
+        assert index.centroids.shape == (4, 8)
+        assert len(set(index.assignments.tolist())) == 4
+        # Rows generated around the same center end up in the same cluster.
+        assert all(len(set(index.assignments[i : i + 50].tolist())) == 1 for i in range(0, 200, 50))
+
+    def test_candidates(self, index, matrix):
+        index.train(matrix, np.linalg.norm(matrix, axis=1))
+
+        assert index.candidates(matrix[60]).tolist() == list(range(50, 100))
+        assert len(index.candidates(matrix[60], nprobe=2)) == 100
+        assert len(index.candidates(matrix[60], nprobe=10)) == 200
+
+    def test_candidates_untrained(self, index):
+        with pytest.raises(ValueError):
+            index.candidates([1.0, 0.0])
+
+    def test_add(self, index, matrix):
+        norms = np.linalg.norm(matrix, axis=1)
+        index.train(matrix[:100], norms[:100])
+        index.add(np.array([100, 0]), matrix[[150, 150]], norms[[150, 150]])
+
+        candidates = index.candidates(matrix[150]).tolist()
+
+        assert 100 in candidates
+        assert 0 in candidates
+        assert index.assignments[0] == index.assignments[100]
+        assert sum(0 in rows for rows in index._lists) == 1
+
+    def test_load(self, index):
+        index.load(np.eye(2, dtype=np.float32), np.array([1, -1, 0, 1]), 4)
+
+        assert index.candidates([1.0, 0.0]).tolist() == [2]
+        assert index.candidates([0.0, 1.0]).tolist() == [0, 3]
+
+    def test_clear(self, index, matrix):
+        index.train(matrix, np.linalg.norm(matrix, axis=1))
+        index.clear()
+
+        assert not index.is_trained
+        assert index.trained_size == 0
+
+    def test_snapshot(self, index, matrix):
+        norms = np.linalg.norm(matrix, axis=1)
+        index.train(matrix[:100], norms[:100])
+        snapshot = index.snapshot()
+        candidates = snapshot.candidates(matrix[150]).tolist()
+
+        index.add(np.array([100, 0]), matrix[[150, 150]], norms[[150, 150]])
+
+        assert snapshot.candidates(matrix[150]).tolist() == candidates
+        assert snapshot.assignments[0] != index.assignments[0]
+        assert 100 in index.candidates(matrix[150]).tolist()
+
+        # Assignments are modified in place, and snapshots rebuild theirs from their clusters.
+        assignments = index.assignments
+        second = index.snapshot()
+        index.add(np.array([1]), matrix[[150]], norms[[150]])
+
+        assert index.assignments is assignments
+        assert second.assignments[1] != index.assignments[1]
+        assert second.assignments[0] == index.assignments[0]
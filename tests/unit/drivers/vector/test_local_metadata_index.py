@@ -0,0 +1,54 @@
+import pytest
+from griptape.drivers.vector.local_metadata_index import LocalMetadataIndex
+
+
+class TestLocalMetadataIndex:
+    @pytest.fixture
+    def index(self):
+        index = LocalMetadataIndex(keys=["type", "tags"])
+        index.add(0, {"type": "a", "tags": ["x"]})
+        index.add(1, {"type": "b", "tags": ["x"]})
+        index.add(2, {"type": "a"})
+        index.add(3, None)
+
+        return index
+
+    def test_bitmap(self, index):
+        assert index.bitmap({"type": "a"}, 4).tolist() == [True, False, True, False]
+        assert index.bitmap({"tags": ["x"]}, 4).tolist() == [True, True, False, False]
+        assert index.bitmap({"type": "a", "tags": ["x"]}, 4).tolist() == [True, False, False, False]
+        assert not index.bitmap({"type": "c"}, 4).any()
+
+    def test_bitmap_unindexed(self, index):
+        assert index.bitmap({"other": "a"}, 4) is None
+        assert index.bitmap({"type": "b", "other": "a"}, 4).tolist() == [False, True, False, False]
+
+    def test_remove(self, index):
+        index.remove(0, {"type": "a", "tags": ["x"]})
+        index.remove(3, None)
+
+        assert index.bitmap({"type": "a"}, 4).tolist() == [False, False, True, False]
+        assert index.bitmap({"tags": ["x"]}, 4).tolist() == [False, True, False, False]
+
+    def test_clear(self, index):
+        index.clear()
+
+        assert not index.bitmap({"type": "a"}, 4).any()
+
+    def test_snapshot(self, index):
+        snapshot = index.snapshot()
+
+        assert index.snapshot() is snapshot
+
+        index.remove(0, {"type": "a", "tags": ["x"]})
+        index.add(4, {"type": "a"})
+
+        assert snapshot.bitmap({"type": "a"}, 5).tolist() == [True, False, True, False, False]
+        assert index.bitmap({"type": "a"}, 5).tolist() == [False, False, True, False, True]
+        assert index.snapshot() is not snapshot
+
+    def test_matches(self):
+        assert LocalMetadataIndex.matches({"type": "a", "other": 1}, {"type": "a"})
+        assert not LocalMetadataIndex.matches({"type": "a"}, {"type": "b"})
+        assert not LocalMetadataIndex.matches({}, {"type": "a"})
+        assert not LocalMetadataIndex.matches(None, {"type": "a"})
@@ -0,0 +1,341 @@
+import numpy as np
+import pytest
+from griptape.drivers.vector.local_ivf_index import LocalIvfIndex
+from griptape.drivers.vector.local_vector_index import LocalVectorIndex
+
+
+class TestLocalVectorIndex:
+    @pytest.fixture
+    def index(self):
+        return LocalVectorIndex(initial_capacity=2)
+
+    def test_upsert(self, index):
+        assert index.upsert("foo", [1.0, 0.0]) == 0
+        assert index.upsert("bar", [0.0, 1.0]) == 1
+        assert index.upsert("foo", [3.0, 4.0]) == 0
+
+        assert len(index) == 2
+        assert index.vector("foo") == [3.0, 4.0]
+        assert index.norms.tolist() == [5.0, 1.0]
+
+    def test_upsert_grows_capacity(self, index):
+        for i in range(5):
+            index.upsert(str(i), [float(i), 1.0])
+
+        assert len(index) == 5
+        assert index.matrix.shape == (5, 2)
+        assert index.vector("4") == [4.0, 1.0]
+
+    def test_upsert_wrong_dimensions(self, index):
+        index.upsert("foo", [1.0, 0.0])
+
+        with pytest.raises(ValueError):
+            index.upsert("bar", [1.0, 0.0, 0.0])
+
+    def test_top_k(self, index):
+        index.upsert("orthogonal", [1.0, 0.0])
+        index.upsert("same", [0.0, 1.0])
+        index.upsert("diagonal", [1.0, 1.0])
+        index.upsert("zero", [0.0, 0.0])
+
+        assert [k for k, _ in index.top_k([0.0, 2.0], 2)] == ["same", "diagonal"]
+        assert [k for k, _ in index.top_k([0.0, 2.0])] == ["same", "diagonal", "orthogonal", "zero"]
+        assert [k for k, _ in index.top_k([0.0, 2.0], 5, rows=np.array([0, 2]))] == ["diagonal", "orthogonal"]
+        assert index.top_k([0.0, 2.0], 0) == []
+
+    def test_clear(self, index):
+        index.upsert("foo", [1.0, 0.0])
+        index.clear()
+
+        assert len(index) == 0
+        assert "foo" not in index
+
+    def test_delete(self, index):
+        index.upsert("orthogonal", [1.0, 0.0])
+        index.upsert("same", [0.0, 1.0])
+        index.upsert("diagonal", [1.0, 1.0])
+
+        assert index.delete("same") == 1
+        assert index.delete("same") is None
+        assert "same" not in index
+        assert index.vector("same") is None
+        assert len(index) == 3
+        assert index.deleted_count == 1
+        assert index.live_rows.tolist() == [0, 2]
+        assert index.tombstone_ratio == pytest.approx(1 / 3)
+        assert [k for k, _ in index.top_k([0.0, 1.0])] == ["diagonal", "orthogonal"]
+        assert [k for k, _ in index.top_k([0.0, 1.0], 1)] == ["diagonal"]
+        assert [k for k, _ in index.top_k([0.0, 1.0], rows=np.array([1, 2]))] == ["diagonal"]
+        assert [[k for k, _ in r] for r in index.top_k_many([[0.0, 1.0]], 5)] == [["diagonal", "orthogonal"]]
+
+        assert index.upsert("same", [0.0, 1.0]) == 3
+        assert [k for k, _ in index.top_k([0.0, 1.0], 1)] == ["same"]
+
+    def test_snapshot(self, index):
+        index.upsert("foo", [1.0, 0.0], meta={"foo": 1})
+        index.upsert("bar", [0.0, 1.0])
+        snapshot = index.snapshot()
+
+        assert index.snapshot() is snapshot
+
+        index.upsert("foo", [3.0, 4.0], meta={"foo": 2})
+        index.upsert("baz", [1.0, 1.0])
+        index.upsert("qux", [1.0, 2.0])
+        index.delete("bar")
+
+        assert len(snapshot) == 2
+        assert snapshot.keys == ["foo", "bar"]
+        assert snapshot.vector("foo") == [1.0, 0.0]
+        assert snapshot.meta_at(0) == {"foo": 1}
+        assert "bar" in snapshot
+        assert "baz" not in snapshot
+        assert [k for k, _ in snapshot.top_k([0.0, 1.0])] == ["bar", "foo"]
+
+        assert index.vector("foo") == [3.0, 4.0]
+        assert index.meta_at(0) == {"foo": 2}
+        assert "bar" not in index
+        assert index.snapshot() is not snapshot
+
+    def test_snapshot_records_changed_rows(self, index):
+        index.upsert("foo", [1.0, 0.0], source_row=1, meta={"foo": 1})
+        index.upsert("bar", [0.0, 1.0], source_row=2)
+        index.upsert("baz", [1.0, 1.0], source_row=3)
+        snapshot = index.snapshot()
+        matrix = index._matrix
+        deleted = index._deleted
+
+        index.upsert("foo", [0.0, 3.0], source_row=4, meta={"foo": 2})
+        index.delete("bar")
+
+        # Rows are modified in place, and only their previous values are copied into the snapshot.
+        assert index._matrix is matrix
+        assert index._deleted is deleted
+        assert set(snapshot._changes.rows) == {0, 1}
+
+        assert snapshot.vector("foo") == [1.0, 0.0]
+        assert snapshot.meta_at(0) == {"foo": 1}
+        assert snapshot.metas == [{"foo": 1}, None, None]
+        assert snapshot.source_rows.tolist() == [1, 2, 3]
+        assert snapshot.norms.tolist() == pytest.approx([1.0, 1.0, 2**0.5])
+        assert snapshot.live_rows.tolist() == [0, 1, 2]
+        assert snapshot.row("bar") == 1
+        assert [k for k, _ in snapshot.top_k([1.0, 0.0])] == ["foo", "baz", "bar"]
+        assert snapshot.top_k([1.0, 0.0], 1)[0][1] == pytest.approx(1.0)
+        assert [k for k, _ in snapshot.top_k([1.0, 0.0], rows=np.array([1, 0]))] == ["foo", "bar"]
+        assert snapshot.compacted().vector("foo") == [1.0, 0.0]
+
+        assert index.vector("foo") == [0.0, 3.0]
+        assert [k for k, _ in index.top_k([1.0, 0.0])] == ["baz", "foo"]
+
+        second = index.snapshot()
+        index.upsert("foo", [2.0, 2.0])
+
+        assert snapshot.vector("foo") == [1.0, 0.0]
+        assert second.vector("foo") == [0.0, 3.0]
+        assert "bar" not in second
+
+    @pytest.mark.parametrize("dtype", ["float16", "int8"])
+    def test_snapshot_compressed(self, dtype):
+        index = LocalVectorIndex(dtype=dtype)
+        index.upsert("foo", [1.0, 0.0])
+        index.upsert("bar", [0.0, 1.0])
+        snapshot = index.snapshot()
+
+        index.upsert("foo", [0.0, 2.0])
+
+        assert snapshot.vector("foo") == pytest.approx([1.0, 0.0], abs=0.05)
+        assert [k for k, _ in snapshot.top_k([1.0, 0.0])] == ["foo", "bar"]
+        assert snapshot.top_k([1.0, 0.0])[0][1] == pytest.approx(1.0, abs=0.01)
+
+    def test_snapshot_shares_lazy_norms(self, index):
+        index.load(["foo", "bar"], np.array([[3.0, 4.0], [0.0, 1.0]], dtype=np.float32))
+        snapshot = index.snapshot()
+
+        assert index._norms is None
+        assert snapshot._norms is None
+        assert [k for k, _ in snapshot.top_k([1.0, 0.0])] == ["foo", "bar"]
+        assert index._ensure_norms() is snapshot._norms
+
+    def test_snapshot_does_not_train_ann_index(self):
+        index = LocalVectorIndex(ann_index=LocalIvfIndex(list_count=2, nprobe=1, min_train_size=4))
+
+        for key, vector in [("x", [1.0, 0.0]), ("y", [0.0, 1.0]), ("x2", [1.0, 0.1]), ("y2", [0.1, 1.0])]:
+            index.upsert(key, vector)
+
+        snapshot = index.snapshot()
+
+        assert [k for k, _ in snapshot.top_k([1.0, 0.0])] == ["x", "x2", "y2", "y"]
+        assert [[k for k, _ in r] for r in snapshot.top_k_many([[1.0, 0.0]], 1)] == [["x"]]
+        assert not snapshot.train_ann_index()
+        assert not snapshot.ann_index.is_trained
+        assert not index.ann_index.is_trained
+
+    def test_compacted(self, index):
+        index.upsert("orthogonal", [1.0, 0.0], source_row=5)
+        index.upsert("same", [0.0, 1.0], source_row=6)
+        index.upsert("diagonal", [1.0, 1.0], source_row=7)
+        index.delete("same")
+
+        compacted = index.compacted()
+
+        assert compacted.keys == ["orthogonal", "diagonal"]
+        assert compacted.deleted_count == 0
+        assert compacted.source_rows.tolist() == [5, 7]
+        assert compacted.vector("diagonal") == [1.0, 1.0]
+        assert [k for k, _ in compacted.top_k([0.0, 1.0])] == ["diagonal", "orthogonal"]
+        assert len(index) == 3
+
+        compacted.upsert("same", [0.0, 1.0])
+
+        assert compacted.row("same") == 2
+
+    def test_compacted_ann_index(self):
+        index = LocalVectorIndex(ann_index=LocalIvfIndex(list_count=2, nprobe=1, min_train_size=4))
+
+        for key, vector in [("x", [1.0, 0.0]), ("y", [0.0, 1.0]), ("x2", [1.0, 0.1]), ("y2", [0.1, 1.0])]:
+            index.upsert(key, vector)
+
+        index.top_k([1.0, 0.0])
+        index.delete("y")
+        compacted = index.compacted()
+
+        assert compacted.ann_index is not index.ann_index
+        assert compacted.ann_index.trained_size == 4
+        assert [k for k, _ in compacted.top_k([1.0, 0.0])] == ["x", "x2"]
+        assert [k for k, _ in compacted.top_k([0.0, 1.0])] == ["y2"]
+
+    @pytest.mark.parametrize("dtype", ["float16", "int8"])
+    def test_compacted_compressed(self, dtype):
+        index = LocalVectorIndex(dtype=dtype)
+        index.upsert("foo", [1.0, 2.0])
+        index.upsert("bar", [3.0, 4.0])
+        index.delete("foo")
+
+        assert index.compacted().vector("bar") == pytest.approx([3.0, 4.0], abs=0.05)
+
+    def test_top_k_many(self, index):
+        index.upsert("orthogonal", [1.0, 0.0])
+        index.upsert("same", [0.0, 1.0])
+        index.upsert("diagonal", [1.0, 1.0])
+        index.upsert("zero", [0.0, 0.0])
+
+        results = index.top_k_many([[0.0, 2.0], [3.0, 0.0], [0.0, 0.0]], 2)
+
+        assert results == [index.top_k([0.0, 2.0], 2), index.top_k([3.0, 0.0], 2), index.top_k([0.0, 0.0], 2)]
+        assert [k for k, _ in results[1]] == ["orthogonal", "diagonal"]
+
+    def test_top_k_many_blocks(self, index, mocker):
+        mocker.patch.object(LocalVectorIndex, "SCORE_BLOCK_SIZE", 2)
+        index.upsert("orthogonal", [1.0, 0.0])
+        index.upsert("same", [0.0, 1.0])
+
+        assert [r[0][0] for r in index.top_k_many([[0.0, 1.0], [1.0, 0.0], [0.0, 1.0]], 1)] == [
+            "same",
+            "orthogonal",
+            "same",
+        ]
+
+    def test_top_k_many_rows(self, index):
+        index.upsert("orthogonal", [1.0, 0.0])
+        index.upsert("same", [0.0, 1.0])
+        index.upsert("diagonal", [1.0, 1.0])
+
+        results = index.top_k_many([[0.0, 1.0], [1.0, 0.0]], rows=np.array([0, 2]))
+
+        assert [[k for k, _ in r] for r in results] == [["diagonal", "orthogonal"], ["orthogonal", "diagonal"]]
+
+    def test_scores_many_empty(self, index):
+        assert index.scores_many([[1.0, 0.0]]).shape == (1, 0)
+
+    def test_top_k_ann_index(self):
+        index = LocalVectorIndex(ann_index=LocalIvfIndex(list_count=2, nprobe=1, min_train_size=4))
+        index.upsert("x", [1.0, 0.0])
+        index.upsert("x2", [1.0, 0.1])
+        index.upsert("y", [0.0, 1.0])
+
+        assert [k for k, _ in index.top_k([1.0, 0.0])] == ["x", "x2", "y"]
+        assert not index.ann_index.is_trained
+
+        index.upsert("y2", [0.1, 1.0])
+
+        assert [k for k, _ in index.top_k([1.0, 0.0])] == ["x", "x2"]
+        assert [k for k, _ in index.top_k([1.0, 0.0], nprobe=2)] == ["x", "x2", "y2", "y"]
+        assert index.ann_index.trained_size == 4
+
+        index.upsert("x3", [1.0, 0.2])
+
+        assert [k for k, _ in index.top_k([1.0, 0.0])] == ["x", "x2", "x3"]
+
+    def test_load_ann_index(self):
+        index = LocalVectorIndex(ann_index=LocalIvfIndex(min_train_size=100))
+        index.load(["x", "y", "x2"], np.array([[1.0, 0.0], [0.0, 1.0], [1.0, 0.1]], dtype=np.float32))
+        index.load_ann_index(["y", "x", "missing"], np.eye(2, dtype=np.float32), np.array([1, 0, 1]), 2)
+
+        assert index.ann_index.assignments.tolist() == [0, 1, 0]
+        assert [k for k, _ in index.top_k([1.0, 0.0], nprobe=1)] == ["x", "x2"]
+
+    @pytest.mark.parametrize("dtype", ["float16", "int8"])
+    def test_compressed(self, dtype):
+        index = LocalVectorIndex(initial_capacity=2, dtype=dtype)
+        index.upsert("orthogonal", [1.0, 0.0])
+        index.upsert("same", [0.0, 1.0])
+        index.upsert("diagonal", [0.5, 0.5])
+        index.upsert("zero", [0.0, 0.0])
+
+        assert index.matrix.dtype == np.dtype(dtype)
+        assert index.vector("diagonal") == pytest.approx([0.5, 0.5], abs=1e-2)
+        assert index.norms.tolist() == pytest.approx([1.0, 1.0, 0.7071, 0.0], abs=1e-4)
+        assert [k for k, _ in index.top_k([0.0, 2.0], 2)] == ["same", "diagonal"]
+        assert [r[0][0] for r in index.top_k_many([[0.0, 2.0], [3.0, 0.1]], 1)] == ["same", "orthogonal"]
+
+    def test_compressed_int8_scales(self):
+        index = LocalVectorIndex(dtype="int8")
+        index.upsert("foo", [100.0, -50.0, 0.1])
+
+        assert index.matrix.tolist() == [[127, -64, 0]]
+        assert index.vector("foo") == pytest.approx([100.0, -50.0, 0.0], abs=0.5)
+
+    def test_compressed_load(self):
+        index = LocalVectorIndex(dtype="int8")
+        matrix = np.array([[1.0, 0.0], [0.0, 2.0]], dtype=np.float32)
+        index.load(["foo", "bar"], matrix, np.array([5, 6]))
+
+        assert index.matrix.dtype == np.int8
+        assert index.norms.tolist() == [1.0, 2.0]
+        assert index.source_rows.tolist() == [5, 6]
+        assert [k for k, _ in index.top_k([0.0, 1.0])] == ["bar", "foo"]
+
+    def test_compressed_rescore(self):
+        index = LocalVectorIndex(dtype="int8", rescore_factor=2)
+        source = np.array([[1.0, 0.001], [1.0, 0.002], [1.0, 0.0]], dtype=np.float32)
+
+        for i, vector in enumerate(source):
+            index.upsert(str(i), vector.tolist(), source_row=i)
+
+        # Every vector quantizes to [127, 0], so only full precision scores tell them apart.
+        assert [score for _, score in index.top_k([0.0, 1.0], 3)] == [0.0, 0.0, 0.0]
+        assert [k for k, _ in index.top_k([0.0, 1.0], 1, source=source)] == ["1"]
+        assert index.top_k([0.0, 1.0], 1, source=source)[0][1] == pytest.approx(0.002, abs=1e-4)
+        assert index.vector("1", source) == source[1].tolist()
+
+    def test_compressed_iter_full_precision(self):
+        index = LocalVectorIndex(dtype="float16")
+        source = np.array([[0.1234567, 1.0]], dtype=np.float32)
+        index.upsert("foo", source[0].tolist(), source_row=0)
+        index.upsert("bar", [2.0, 3.0])
+
+        blocks = list(index.iter_full_precision(source, block_size=1))
+
+        assert [b.tolist() for b in blocks] == [source.tolist(), [[2.0, 3.0]]]
+
+    def test_compressed_ann_index(self):
+        index = LocalVectorIndex(dtype="int8", ann_index=LocalIvfIndex(list_count=2, nprobe=1, min_train_size=4))
+
+        for key, vector in [("x", [1.0, 0.0]), ("x2", [1.0, 0.1]), ("y", [0.0, 1.0]), ("y2", [0.1, 1.0])]:
+            index.upsert(key, vector)
+
+        assert [k for k, _ in index.top_k([1.0, 0.0])] == ["x", "x2"]
+
+    def test_invalid_dtype(self):
+        with pytest.raises(ValueError):
+            LocalVectorIndex(dtype="float64")
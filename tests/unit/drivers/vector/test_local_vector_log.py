@@ -0,0 +1,153 @@
+import os
+import tempfile
+import numpy as np
+import pytest
+from griptape.drivers.vector.local_vector_log import LocalVectorLog
+
+
+class TestLocalVectorLog:
+    @pytest.fixture
+    def log(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            log = LocalVectorLog(directory=temp_dir)
+            log.load()
+
+            yield log
+
+    def test_append(self, log):
+        log.append([{"key": "foo"}, {"key": "bar"}], [[1.0, 2.0], [3.0, 4.0]])
+        log.append([{"key": "baz"}], [[5.0, 6.0]])
+
+        assert np.load(log.vectors_path).tolist() == [[1.0, 2.0], [3.0, 4.0], [5.0, 6.0]]
+        assert os.path.getsize(log.vectors_path) == LocalVectorLog.HEADER_SIZE + 3 * 2 * 4
+
+    def test_append_wrong_dimensions(self, log):
+        log.append([{"key": "foo"}], [[1.0, 2.0]])
+
+        with pytest.raises(ValueError):
+            log.append([{"key": "bar"}], [[1.0, 2.0, 3.0]])
+
+    def test_load(self, log):
+        log.append([{"key": "foo"}, {"key": "bar"}], [[1.0, 2.0], [3.0, 4.0]])
+
+        records, vectors = LocalVectorLog(directory=log.directory).load()
+
+        assert list(records.keys()) == ["foo", "bar"]
+        assert isinstance(vectors, np.memmap)
+        assert vectors.tolist() == [[1.0, 2.0], [3.0, 4.0]]
+
+    def test_load_superseded_records(self, log):
+        log.append([{"key": "foo"}, {"key": "bar"}], [[1.0, 2.0], [3.0, 4.0]])
+        log.append([{"key": "foo"}], [[5.0, 6.0]])
+
+        new_log = LocalVectorLog(directory=log.directory)
+        records, vectors = new_log.load()
+
+        assert list(records.keys()) == ["bar", "foo"]
+        assert vectors.tolist() == [[3.0, 4.0], [5.0, 6.0]]
+        assert new_log.record_count == 3
+
+    def test_load_list_keys(self, log):
+        log.append([{"key": ["a", "b-c"]}, {"key": ["a-b", "c"]}], [[1.0, 2.0], [3.0, 4.0]])
+        log.append([{"key": ["a", "b-c"]}], [[5.0, 6.0]])
+        log.append_delete([["a-b", "c"]])
+
+        records, vectors = LocalVectorLog(directory=log.directory).load()
+
+        assert list(records.keys()) == [("a", "b-c")]
+        assert vectors.tolist() == [[5.0, 6.0]]
+
+    def test_load_ignores_partial_records(self, log):
+        log.append([{"key": "foo"}], [[1.0, 2.0]])
+
+        with open(log.entries_path, "a") as file:
+            file.write('{"key": "ba')
+
+        records, _ = LocalVectorLog(directory=log.directory).load()
+
+        assert list(records.keys()) == ["foo"]
+
+    def test_compact(self, log):
+        log.append([{"key": "foo"}, {"key": "bar"}], [[1.0, 2.0], [3.0, 4.0]])
+        log.compact([{"key": "bar"}], np.array([[3.0, 4.0]], dtype=np.float32))
+
+        new_log = LocalVectorLog(directory=log.directory)
+        records, vectors = new_log.load()
+
+        assert records == {"bar": {"key": "bar", "row": 0}}
+        assert vectors.tolist() == [[3.0, 4.0]]
+        assert new_log.record_count == 1
+
+    def test_append_drop(self, log):
+        log.append([{"key": "foo", "namespace": "a"}, {"key": "bar", "namespace": "b"}], [[1.0, 2.0], [3.0, 4.0]])
+        log.append_drop("a")
+        log.append([{"key": "baz", "namespace": "a"}], [[5.0, 6.0]])
+
+        new_log = LocalVectorLog(directory=log.directory)
+        records, vectors = new_log.load()
+
+        assert list(records.keys()) == ["bar", "baz"]
+        assert vectors.tolist() == [[3.0, 4.0], [5.0, 6.0]]
+        assert new_log.record_count == 4
+
+    def test_append_delete(self, log):
+        log.append([{"key": "foo"}, {"key": "bar"}], [[1.0, 2.0], [3.0, 4.0]])
+        log.append_delete(["foo", "missing"])
+        log.append([{"key": "bar"}], [[5.0, 6.0]])
+
+        new_log = LocalVectorLog(directory=log.directory)
+        records, vectors = new_log.load()
+
+        assert list(records.keys()) == ["bar"]
+        assert vectors.tolist() == [[5.0, 6.0]]
+        assert new_log.record_count == 5
+
+    def test_compaction_keeps_appended_records(self, log):
+        log.append([{"key": "foo"}, {"key": "bar"}], [[1.0, 2.0], [3.0, 4.0]])
+        position = log.position()
+        row_count = log.write_compaction([{"key": "bar"}], np.array([[3.0, 4.0]], dtype=np.float32))
+
+        log.append([{"key": "baz"}], [[5.0, 6.0]])
+        log.append_delete(["bar"])
+        log.finish_compaction(position, row_count)
+
+        new_log = LocalVectorLog(directory=log.directory)
+        records, vectors = new_log.load()
+
+        assert records == {"baz": {"key": "baz", "row": 1}}
+        assert vectors.tolist() == [[5.0, 6.0]]
+        assert log.row_count == new_log.row_count == 2
+        assert log.record_count == new_log.record_count == 3
+        assert log.vectors().tolist() == [[3.0, 4.0], [5.0, 6.0]]
+
+    def test_ann_indexes(self, log):
+        assert log.load_ann_indexes() == {}
+
+        log.save_ann_indexes({None: (["foo", "bar"], np.eye(2, dtype=np.float32), np.array([1, 0]), 2)})
+        states = LocalVectorLog(directory=log.directory).load_ann_indexes()
+        keys, centroids, assignments, trained_size = states[None]
+
+        assert keys == ["foo", "bar"]
+        assert centroids.tolist() == [[1.0, 0.0], [0.0, 1.0]]
+        assert assignments.tolist() == [1, 0]
+        assert trained_size == 2
+
+    def test_compact_blocks(self, log):
+        log.compact([{"key": "foo"}, {"key": "bar"}], iter([np.array([[1.0, 2.0]]), np.array([[3.0, 4.0]])]))
+
+        records, vectors = LocalVectorLog(directory=log.directory).load()
+
+        assert list(records.keys()) == ["foo", "bar"]
+        assert vectors.tolist() == [[1.0, 2.0], [3.0, 4.0]]
+
+        with pytest.raises(ValueError):
+            log.compact([{"key": "foo"}], iter([np.array([[1.0, 2.0]]), np.array([[3.0, 4.0]])]))
+
+    def test_vectors(self, log):
+        assert len(log.vectors()) == 0
+
+        log.append([{"key": "foo"}], [[1.0, 2.0]])
+        log.append([{"key": "bar"}], [[3.0, 4.0]])
+
+        assert isinstance(log.vectors(), np.memmap)
+        assert log.vectors().tolist() == [[1.0, 2.0], [3.0, 4.0]]
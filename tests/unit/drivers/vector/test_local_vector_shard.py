@@ -0,0 +1,116 @@
+import os
+import tempfile
+import numpy as np
+import pytest
+from griptape.drivers.vector.local_vector_shard import LocalVectorShard, LocalVectorShardView
+
+
+class TestLocalVectorShard:
+    @pytest.fixture
+    def shard(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            yield LocalVectorShard(directory=temp_dir, name="shard", initial_capacity=2)
+
+    def test_append(self, shard):
+        assert shard.append(np.array([[1.0, 0.0], [0.0, 1.0]]), np.array([0, 1])).tolist() == [0, 1]
+        assert shard.append(np.array([[1.0, 1.0]]), np.array([0])).tolist() == [2]
+
+        assert shard.size == 3
+        assert shard.generation == 1
+        assert shard.vector(2) == [1.0, 1.0]
+
+    def test_append_wrong_dimensions(self, shard):
+        shard.append(np.array([[1.0, 0.0]]), np.array([0]))
+
+        with pytest.raises(ValueError):
+            shard.append(np.array([[1.0, 0.0, 0.0]]), np.array([0]))
+
+    def test_top_k_many(self, shard):
+        shard.append(np.array([[1.0, 0.0], [0.0, 1.0], [1.0, 1.0]]), np.array([0, 1, 0]))
+        view = shard.view()
+
+        assert [[r for r, _ in rows] for rows in view.top_k_many(np.array([[0.0, 1.0], [1.0, 0.0]]))] == [
+            [1, 2, 0],
+            [0, 2, 1],
+        ]
+        assert [r for r, _ in view.top_k_many(np.array([[0.0, 1.0]]), count=1)[0]] == [1]
+        assert [r for r, _ in view.top_k_many(np.array([[0.0, 1.0]]), label=0)[0]] == [2, 0]
+        assert [r for r, _ in view.top_k_many(np.array([[0.0, 1.0]]), rows=np.array([0, 1]), label=0)[0]] == [0]
+        assert view.top_k_many(np.array([[0.0, 1.0]]))[0][0][1] == pytest.approx(1.0)
+
+    def test_write_and_delete(self, shard):
+        shard.append(np.array([[1.0, 0.0], [0.0, 1.0]]), np.array([0, 0]))
+        shard.write(np.array([0]), np.array([[0.0, 2.0]]), np.array([0]))
+        shard.delete(np.array([1]))
+
+        assert shard.vector(0) == [0.0, 2.0]
+        assert shard.view().top_k_many(np.array([[0.0, 1.0]]))[0] == [(0, pytest.approx(1.0))]
+
+    def test_view_reads_new_generation(self, shard):
+        shard.append(np.array([[1.0, 0.0]]), np.array([0]))
+
+        assert [r for r, _ in shard.view().top_k_many(np.array([[0.0, 1.0]]))[0]] == [0]
+
+        shard.append(np.array([[0.0, 1.0], [1.0, 1.0]]), np.array([0, 0]))
+
+        assert [r for r, _ in shard.view().top_k_many(np.array([[0.0, 1.0]]))[0]] == [1, 2, 0]
+
+    def test_view_keeps_files_until_released(self, shard):
+        shard.append(np.array([[1.0, 0.0]]), np.array([0]))
+        view = shard.view()
+        shard.append(np.array([[0.0, 1.0], [1.0, 1.0]]), np.array([0, 0]))
+        paths = LocalVectorShardView.file_paths(shard.path, shard.uid, view.generation)
+
+        assert shard.generation == view.generation + 1
+        assert all(os.path.isfile(path) for path in paths)
+        assert [r for r, _ in view.top_k_many(np.array([[0.0, 1.0]]))[0]] == [0]
+
+        shard.release(view)
+
+        assert not any(os.path.isfile(path) for path in paths)
+
+        shard.release(shard.view())
+
+        assert all(
+            os.path.isfile(path) for path in LocalVectorShardView.file_paths(shard.path, shard.uid, shard.generation)
+        )
+
+    def test_view_of_new_shard_at_same_path(self, shard):
+        shard.append(np.array([[1.0, 0.0]]), np.array([0]))
+        shard.view().top_k_many(np.array([[1.0, 0.0]]))
+        shard.close()
+
+        # A new shard with the same directory, name, and generation must not read the files mapped for the old one.
+        new_shard = LocalVectorShard(directory=shard.directory, name=shard.name, initial_capacity=2)
+        new_shard.append(np.array([[0.0, 1.0]]), np.array([0]))
+
+        assert new_shard.generation == 0
+        assert new_shard.uid != shard.uid
+        assert new_shard.view().top_k_many(np.array([[0.0, 1.0]]))[0] == [(0, pytest.approx(1.0))]
+
+        new_shard.close()
+
+    def test_is_leased(self, shard):
+        shard.append(np.array([[1.0, 0.0]]), np.array([0]))
+        view = shard.view()
+
+        assert shard.is_leased
+
+        shard.release(view)
+
+        assert not shard.is_leased
+
+    def test_close_removes_released_generations(self, shard):
+        shard.append(np.array([[1.0, 0.0]]), np.array([0]))
+        shard.view()
+        shard.append(np.array([[0.0, 1.0], [1.0, 1.0]]), np.array([0, 0]))
+        shard.close()
+
+        assert os.listdir(shard.directory) == []
+
+    def test_close(self, shard):
+        shard.append(np.array([[1.0, 0.0]]), np.array([0]))
+        shard.close()
+
+        assert shard.size == 0
+        assert shard.view().top_k_many(np.array([[0.0, 1.0]])) == [[]]
@@ -1,6 +1,6 @@
 from collections import namedtuple
 import pytest
-from griptape.drivers import MarqoVectorStoreDriver
+from griptape.drivers import BaseVectorStoreDriver, MarqoVectorStoreDriver
 from griptape.artifacts import TextArtifact
 from tests.mocks.mock_embedding_driver import MockEmbeddingDriver
 
@@ -116,6 +116,17 @@ class TestMarqoVectorStorageDriver:
         }
         assert result == expected_return_value["items"][0]["_id"]
 
+    def test_upsert_text_artifacts(self, driver, mock_marqo):
+        driver.upsert_text_artifacts(
+            {"foo": [TextArtifact("foo"), TextArtifact("bar")], "bar": [TextArtifact("baz")]}, batch_size=2
+        )
+
+        calls = mock_marqo.index().add_documents.call_args_list
+        assert len(calls) == 2
+        assert [doc["Description"] for doc in calls[0].args[0]] == ["foo", "bar"]
+        assert [doc["namespace"] for doc in calls[1].args[0]] == ["bar"]
+        assert calls[0].kwargs["tensor_fields"] == ["Description", "artifact"]
+
     def test_search(self, driver, mock_marqo):
         results = driver.query("Test query")
         mock_marqo.index().search.assert_called()
@@ -193,7 +204,7 @@ class TestMarqoVectorStorageDriver:
 
         # Assert
         assert len(entries) == 1
-        mock_marqo.index().search.assert_called_once_with("", limit=10000)
+        mock_marqo.index().search.assert_called_once_with("", limit=BaseVectorStoreDriver.DEFAULT_PAGE_SIZE, offset=0)
         mock_marqo.index().get_documents.assert_called_once_with(
             document_ids=["5aed93eb-3878-4f12-bc92-0fda01c7d23d"], expose_facets=True
         )
@@ -201,3 +212,46 @@ class TestMarqoVectorStorageDriver:
         assert entries[0].vector == [0.1, 0.2, 0.3]
         assert entries[0].meta["Title"] == "Test Title"
         assert entries[0].meta["Description"] == "Test description"
+
+    def test_iter_entries(self, driver, mock_marqo):
+        mock_marqo.index().search.side_effect = [{"hits": [{"_id": "foo"}, {"_id": "bar"}]}, {"hits": [{"_id": "baz"}]}]
+        mock_marqo.index().get_documents.side_effect = lambda document_ids, expose_facets: {
+            "results": [
+                {"_id": i, "_found": i != "bar", "namespace": "a", "_tensor_facets": [{"_embedding": [0.1]}]}
+                for i in document_ids
+            ]
+        }
+
+        entries = list(driver.iter_entries(namespace="a", page_size=2))
+
+        assert [call.kwargs for call in mock_marqo.index().search.call_args_list] == [
+            {"limit": 2, "offset": 0, "filter_string": "namespace:a"},
+            {"limit": 2, "offset": 2, "filter_string": "namespace:a"},
+        ]
+        assert [e.id for e in entries] == ["foo", "baz"]
+        assert entries[0].namespace == "a"
+        assert entries[0].vector == [0.1]
+
+    def test_load_entries_by_ids(self, driver, mock_marqo):
+        mock_marqo.index().get_documents.return_value = {
+            "results": [
+                {"_id": "foo", "_found": True, "namespace": "a", "_tensor_facets": [{"_embedding": [0.1]}]},
+                {"_id": "bar", "_found": False},
+                {"_id": "baz", "_found": True, "namespace": "b", "_tensor_facets": [{"_embedding": [0.2]}]},
+            ]
+        }
+
+        entries = driver.load_entries_by_ids(["foo", "bar", "baz"], namespace="a")
+
+        mock_marqo.index().get_documents.assert_called_once_with(document_ids=["foo", "bar", "baz"], expose_facets=True)
+        assert [e.id for e in entries] == ["foo"]
+        assert entries[0].vector == [0.1]
+        assert entries[0].meta == {"namespace": "a"}
+
+    def test_existing_ids(self, driver, mock_marqo):
+        mock_marqo.index().get_documents.return_value = {
+            "results": [{"_id": "foo", "_found": True}, {"_id": "bar", "_found": False}]
+        }
+
+        assert driver.existing_ids(["foo", "bar"]) == {"foo"}
+        mock_marqo.index().get_documents.assert_called_once_with(document_ids=["foo", "bar"])
@@ -38,6 +38,23 @@ class TestMongoDbAtlasVectorStoreDriver:
         test_id = driver.upsert_text(text, vector_id=vector_id_str)
         assert test_id == vector_id_str
 
+    def test_upsert_vectors(self, driver):
+        entries = [
+            BaseVectorStoreDriver.Entry(id="foo", vector=[0.1, 0.2], namespace="a"),
+            BaseVectorStoreDriver.Entry(id=None, vector=[0.3, 0.4]),
+            BaseVectorStoreDriver.Entry(id="bar", vector=[0.5, 0.6], meta={"foo": "bar"}),
+        ]
+
+        with patch.object(driver.get_collection().__class__, "bulk_write") as bulk_write:
+            bulk_write.side_effect = lambda requests, **kwargs: [
+                request._doc.setdefault("_id", "generated") for request in requests
+            ]
+            ids = driver.upsert_vectors(entries, batch_size=2)
+
+        assert ids == ["foo", "generated", "bar"]
+        assert bulk_write.call_count == 2
+        assert bulk_write.call_args.kwargs["ordered"] is False
+
     def test_query(self, driver, monkeypatch):
         mock_query_result = [
             BaseVectorStoreDriver.Entry("foo", [0.5, 0.5, 0.5], score=0.0, meta={}, namespace=None),
@@ -68,6 +85,34 @@ class TestMongoDbAtlasVectorStoreDriver:
         results = list(driver.load_entries())
         assert results is not None and len(results) > 0
 
+    def test_iter_entries(self, driver):
+        driver.upsert_vector([0.5, 0.5, 0.5], vector_id="foo", namespace="a")
+        driver.upsert_vector([0.5, 0.5, 0.5], vector_id="bar", namespace="a")
+        driver.upsert_vector([0.5, 0.5, 0.5], vector_id="baz", namespace="b")
+
+        entries = list(driver.iter_entries(namespace="a", page_size=1))
+
+        assert sorted(e.id for e in entries) == ["bar", "foo"]
+        assert all(e.namespace == "a" for e in entries)
+        assert entries[0].vector == [0.5, 0.5, 0.5]
+
+    def test_load_entries_by_ids(self, driver):
+        driver.upsert_vector([0.1, 0.2], vector_id="foo", namespace="a", meta={"foo": "bar"})
+        driver.upsert_vector([0.3, 0.4], vector_id="bar", namespace="a")
+        driver.upsert_vector([0.5, 0.6], vector_id="baz", namespace="b")
+
+        entries = driver.load_entries_by_ids(["bar", "baz", "foo", "qux"], namespace="a")
+
+        assert [(e.id, e.vector, e.namespace) for e in entries] == [("bar", [0.3, 0.4], "a"), ("foo", [0.1, 0.2], "a")]
+        assert entries[1].meta == {"foo": "bar"}
+
+    def test_existing_ids(self, driver):
+        driver.upsert_vector([0.1, 0.2], vector_id="foo", namespace="a")
+        driver.upsert_vector([0.5, 0.6], vector_id="baz", namespace="b")
+
+        assert driver.existing_ids(["foo", "bar", "baz"], namespace="a") == {"foo"}
+        assert driver.existing_ids(["foo", "bar", "baz"]) == {"foo", "baz"}
+
     def test_delete(self, driver):
         vector_id_str = "123"
         vector = [0.5, 0.5, 0.5]
@@ -78,3 +123,12 @@ class TestMongoDbAtlasVectorStoreDriver:
         driver.delete_vector(vector_id_str)
         results = list(driver.load_entries())
         assert results is not None and len(results) == 0
+
+    def test_delete_in_namespace(self, driver):
+        driver.upsert_vector([0.5, 0.5, 0.5], vector_id="foo", namespace="a")
+
+        driver.delete_vector("foo", namespace="b")
+        assert driver.load_entry("foo", namespace="a") is not None
+
+        driver.delete_vector("foo", namespace="a")
+        assert driver.load_entry("foo", namespace="a") is None
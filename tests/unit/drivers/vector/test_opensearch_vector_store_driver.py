@@ -1,6 +1,7 @@
 import pytest
 from unittest.mock import patch, Mock, create_autospec
-from griptape.drivers import OpenSearchVectorStoreDriver
+from griptape.drivers import BaseVectorStoreDriver, OpenSearchVectorStoreDriver
+from tests.mocks.mock_embedding_driver import MockEmbeddingDriver
 import numpy as np
 
 
@@ -14,6 +15,27 @@ class TestOpenSearchVectorStoreDriver:
     def test_upsert_vector(self, driver):
         assert driver.upsert_vector([0.1, 0.2, 0.3], vector_id="foo", namespace="company") == "foo"
 
+    def test_upsert_vectors(self):
+        driver = OpenSearchVectorStoreDriver(
+            host="localhost", index_name="test", client=Mock(), embedding_driver=MockEmbeddingDriver()
+        )
+        entries = [
+            BaseVectorStoreDriver.Entry(id="foo", vector=[0.1, 0.2], namespace="company"),
+            BaseVectorStoreDriver.Entry(id="bar", vector=[0.3, 0.4]),
+        ]
+
+        with patch("opensearchpy.helpers.streaming_bulk") as streaming_bulk:
+            streaming_bulk.side_effect = lambda client, actions, **kwargs: [
+                (True, {"index": {"_id": action["_id"]}}) for action in actions
+            ]
+
+            assert driver.upsert_vectors(entries, batch_size=10) == ["foo", "bar"]
+
+            _, actions = streaming_bulk.call_args.args
+            assert streaming_bulk.call_args.kwargs["chunk_size"] == 10
+            assert actions[0]["_index"] == "test"
+            assert actions[0]["_source"] == {"vector": [0.1, 0.2], "namespace": "company", "metadata": None}
+
     def test_load_entry(self, driver):
         mock_entry = Mock()
         mock_entry.id = "foo2"
@@ -39,6 +61,89 @@ class TestOpenSearchVectorStoreDriver:
             assert np.allclose(entries[0].vector, [0.7, 0.8, 0.9], atol=1e-6)
             assert entries[0].meta is None
 
+    def test_load_entry_mget(self):
+        client = Mock()
+        client.mget.return_value = {
+            "docs": [{"_id": "foo", "found": True, "_source": {"vector": [0.1, 0.2], "namespace": "company"}}]
+        }
+        driver = OpenSearchVectorStoreDriver(
+            host="localhost", index_name="test", client=client, embedding_driver=MockEmbeddingDriver()
+        )
+
+        entry = driver.load_entry("foo", namespace="company")
+
+        client.mget.assert_called_once_with(index="test", body={"ids": ["foo"]})
+        client.search.assert_not_called()
+        assert entry.id == "foo"
+        assert entry.vector == [0.1, 0.2]
+        assert driver.load_entry("foo", namespace="other") is None
+
+    def test_load_entries_by_ids(self):
+        client = Mock()
+        client.mget.return_value = {
+            "docs": [
+                {"_id": "foo", "found": True, "_source": {"vector": [0.1, 0.2], "namespace": "company"}},
+                {"_id": "bar", "found": False},
+                {"_id": "baz", "found": True, "_source": {"vector": [0.3, 0.4], "namespace": "other"}},
+                {
+                    "_id": "qux",
+                    "found": True,
+                    "_source": {"vector": [0.5, 0.6], "namespace": "company", "metadata": {}},
+                },
+            ]
+        }
+        driver = OpenSearchVectorStoreDriver(
+            host="localhost", index_name="test", client=client, embedding_driver=MockEmbeddingDriver()
+        )
+
+        entries = driver.load_entries_by_ids(["foo", "bar", "baz", "qux"], namespace="company")
+
+        client.mget.assert_called_once_with(index="test", body={"ids": ["foo", "bar", "baz", "qux"]})
+        assert [e.id for e in entries] == ["foo", "qux"]
+        assert entries[1].vector == [0.5, 0.6]
+        assert entries[1].meta == {}
+
+    def test_existing_ids(self):
+        client = Mock()
+        client.mget.return_value = {
+            "docs": [
+                {"_id": "foo", "found": True, "_source": {"namespace": "company"}},
+                {"_id": "bar", "found": False},
+                {"_id": "baz", "found": True, "_source": {"namespace": "other"}},
+            ]
+        }
+        driver = OpenSearchVectorStoreDriver(
+            host="localhost", index_name="test", client=client, embedding_driver=MockEmbeddingDriver()
+        )
+
+        assert driver.existing_ids(["foo", "bar", "baz"], namespace="company") == {"foo"}
+        client.mget.assert_called_once_with(
+            index="test", body={"docs": [{"_id": i, "_source": ["namespace"]} for i in ["foo", "bar", "baz"]]}
+        )
+
+    def test_iter_entries(self):
+        client = Mock()
+        driver = OpenSearchVectorStoreDriver(
+            host="localhost", index_name="test", client=client, embedding_driver=MockEmbeddingDriver()
+        )
+        hits = [
+            {"_id": "foo", "_source": {"vector": [0.1, 0.2], "namespace": "company", "metadata": {"foo": "bar"}}},
+            {"_id": "bar", "_source": {"vector": [0.3, 0.4], "namespace": "company"}},
+        ]
+
+        with patch("opensearchpy.helpers.scan", return_value=iter(hits)) as scan:
+            entries = list(driver.iter_entries(namespace="company", page_size=50))
+
+        scan.assert_called_once_with(
+            client, query={"query": {"match": {"namespace": "company"}}}, index="test", size=50
+        )
+        client.search.assert_not_called()
+        assert [e.id for e in entries] == ["foo", "bar"]
+        assert entries[0].vector == [0.1, 0.2]
+        assert entries[0].meta == {"foo": "bar"}
+        assert entries[1].meta is None
+        assert entries[1].namespace == "company"
+
     def test_query(self, driver):
         mock_result = Mock()
         mock_result.id = "query_result"
@@ -48,3 +153,41 @@ class TestOpenSearchVectorStoreDriver:
             results = driver.query(query_string, count=5, namespace="company")
             assert len(results) == 1, "Expected results from the query"
             assert results[0].id == "query_result", "Expected a result id"
+
+    def test_query_many(self):
+        client = Mock()
+        client.msearch.return_value = {
+            "responses": [
+                {
+                    "hits": {
+                        "hits": [{"_id": "foo", "_score": 0.9, "_source": {"namespace": "company", "metadata": {}}}]
+                    }
+                },
+                {"hits": {"hits": []}},
+            ]
+        }
+        driver = OpenSearchVectorStoreDriver(
+            host="localhost", index_name="test", client=client, embedding_driver=MockEmbeddingDriver()
+        )
+
+        results = driver.query_many(["foo", [0.3, 0.4]], count=3, namespace="company")
+
+        client.msearch.assert_called_once()
+        client.search.assert_not_called()
+        body = client.msearch.call_args.kwargs["body"]
+        assert body[0] == {"index": "test"}
+        assert body[1]["size"] == 3
+        assert body[1]["query"]["bool"]["must"][1]["knn"]["vector"]["vector"] == [0, 1]
+        assert body[3]["query"]["bool"]["must"][1]["knn"]["vector"]["vector"] == [0.3, 0.4]
+        assert [[e.id for e in r] for r in results] == [["foo"], []]
+        assert results[0][0].namespace == "company"
+
+    def test_query_many_error(self):
+        client = Mock()
+        client.msearch.return_value = {"responses": [{"error": {"type": "index_not_found_exception"}}]}
+        driver = OpenSearchVectorStoreDriver(
+            host="localhost", index_name="test", client=client, embedding_driver=MockEmbeddingDriver()
+        )
+
+        with pytest.raises(RuntimeError):
+            driver.query_many([[0.3, 0.4]])
@@ -0,0 +1,276 @@
+import tempfile
+import numpy as np
+import pytest
+from griptape.artifacts import TextArtifact
+from griptape.drivers import BaseVectorStoreDriver, LocalVectorStoreDriver
+from griptape.drivers.vector.local_ivf_index import LocalIvfIndex
+from griptape.drivers.vector.local_vector_log import LocalVectorLog
+from tests.mocks.mock_embedding_driver import MockEmbeddingDriver
+from tests.unit.drivers.vector.test_base_local_vector_store_driver import BaseLocalVectorStoreDriver
+
+
+class TestPersistentDirLocalVectorStoreDriver(BaseLocalVectorStoreDriver):
+    @pytest.fixture
+    def temp_dir(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            yield temp_dir
+
+    @pytest.fixture
+    def driver(self, temp_dir):
+        driver = LocalVectorStoreDriver(embedding_driver=MockEmbeddingDriver(), persist_dir=temp_dir)
+
+        yield driver
+
+        driver.close()
+
+    def test_persistence(self, driver, temp_dir):
+        driver.upsert_text_artifact(TextArtifact("persistent foobar"), namespace="foo")
+
+        new_driver = LocalVectorStoreDriver(embedding_driver=MockEmbeddingDriver(), persist_dir=temp_dir)
+
+        assert new_driver.query("persistent foobar")[0].to_artifact().value == "persistent foobar"
+        assert new_driver.load_entries("foo")[0].vector == [0, 1]
+
+    def test_persistence_memory_maps_vectors(self, driver, temp_dir):
+        driver.upsert_vector([0.0, 1.0], vector_id="foo")
+        driver.upsert_vector([1.0, 0.0], vector_id="bar")
+
+        new_driver = LocalVectorStoreDriver(embedding_driver=MockEmbeddingDriver(), persist_dir=temp_dir)
+
+        assert isinstance(new_driver._indexes[None].matrix, np.memmap)
+        # Norms are computed by the first query rather than when the driver starts.
+        assert new_driver._indexes[None]._norms is None
+        assert [r.id for r in new_driver.query("foo")] == ["foo", "bar"]
+        assert new_driver._indexes[None]._ensure_norms() is new_driver._snapshot.partitions[None][0]._norms
+
+        new_driver.upsert_vector([1.0, 1.0], vector_id="baz")
+
+        assert [r.id for r in new_driver.query("foo")] == ["foo", "baz", "bar"]
+
+    def test_persistence_keeps_namespaces_and_ids_apart(self, driver, temp_dir):
+        driver.upsert_vector([0.0, 1.0], vector_id="b-c", namespace="a")
+        driver.upsert_vector([1.0, 0.0], vector_id="c", namespace="a-b")
+
+        new_driver = LocalVectorStoreDriver(embedding_driver=MockEmbeddingDriver(), persist_dir=temp_dir)
+
+        assert new_driver.load_entry("b-c", namespace="a").vector == [0.0, 1.0]
+        assert new_driver.load_entry("c", namespace="a-b").vector == [1.0, 0.0]
+
+        new_driver.delete_vector("c", namespace="a-b")
+        new_driver.close()
+        new_driver = LocalVectorStoreDriver(embedding_driver=MockEmbeddingDriver(), persist_dir=temp_dir)
+
+        assert new_driver.load_entry("b-c", namespace="a") is not None
+        assert new_driver.load_entry("c", namespace="a-b") is None
+
+    def test_persistence_entries(self, driver, temp_dir):
+        driver.upsert_vector([0.0, 1.0], vector_id="foo", namespace="a")
+        driver.entries = {"bar": BaseVectorStoreDriver.Entry(id="bar", vector=[1.0, 0.0])}
+
+        new_driver = LocalVectorStoreDriver(embedding_driver=MockEmbeddingDriver(), persist_dir=temp_dir)
+
+        assert [(e.id, e.vector, e.namespace) for e in new_driver.load_entries()] == [("bar", [1.0, 0.0], None)]
+
+    def test_persistence_latest_upsert_wins(self, driver, temp_dir):
+        driver.compaction_threshold = None
+        driver.upsert_vector([0.0, 1.0], vector_id="foo", meta={"version": 1})
+        driver.upsert_vector([1.0, 0.0], vector_id="foo", meta={"version": 2})
+
+        new_driver = LocalVectorStoreDriver(embedding_driver=MockEmbeddingDriver(), persist_dir=temp_dir)
+
+        assert len(new_driver.entries) == 1
+        assert new_driver.load_entry("foo").vector == [1.0, 0.0]
+        assert new_driver.load_entry("foo").meta == {"version": 2}
+
+    def test_compaction(self, driver, temp_dir):
+        driver.upsert_vector([0.0, 1.0], vector_id="foo")
+        driver.upsert_vector([1.0, 0.0], vector_id="foo")
+
+        assert driver._log.record_count == 2
+
+        driver.upsert_vector([1.0, 1.0], vector_id="foo")
+
+        assert driver._log.record_count == 1
+        assert driver._log.row_count == 1
+
+        new_driver = LocalVectorStoreDriver(embedding_driver=MockEmbeddingDriver(), persist_dir=temp_dir)
+
+        assert new_driver.load_entry("foo").vector == [1.0, 1.0]
+
+    def test_compact_without_persist_dir(self):
+        with pytest.raises(ValueError):
+            LocalVectorStoreDriver(embedding_driver=MockEmbeddingDriver()).compact()
+
+    def test_persist_file_and_persist_dir(self, temp_dir):
+        with pytest.raises(ValueError):
+            LocalVectorStoreDriver(
+                embedding_driver=MockEmbeddingDriver(), persist_file=f"{temp_dir}/store.json", persist_dir=temp_dir
+            )
+
+    def test_persistence_drop_namespace(self, driver, temp_dir):
+        driver.compaction_threshold = None
+        driver.upsert_vectors(
+            [
+                BaseVectorStoreDriver.Entry(id="foo", vector=[1.0, 0.0], namespace="a"),
+                BaseVectorStoreDriver.Entry(id="bar", vector=[0.0, 1.0], namespace="b"),
+            ]
+        )
+        driver.drop_namespace("a")
+        driver.upsert_vector([1.0, 1.0], vector_id="baz", namespace="a")
+
+        new_driver = LocalVectorStoreDriver(embedding_driver=MockEmbeddingDriver(), persist_dir=temp_dir)
+
+        assert [e.id for e in new_driver.load_entries("a")] == ["baz"]
+        assert [e.id for e in new_driver.load_entries("b")] == ["bar"]
+
+    def test_compaction_groups_namespaces(self, driver, temp_dir):
+        driver.compaction_threshold = None
+        driver.upsert_vector([1.0, 0.0], vector_id="foo", namespace="a")
+        driver.upsert_vector([0.0, 1.0], vector_id="bar", namespace="b")
+        driver.upsert_vector([1.0, 1.0], vector_id="baz", namespace="a")
+        driver.compact()
+
+        new_driver = LocalVectorStoreDriver(embedding_driver=MockEmbeddingDriver(), persist_dir=temp_dir)
+
+        assert isinstance(new_driver._indexes["a"].matrix, np.memmap)
+        assert isinstance(new_driver._indexes["b"].matrix, np.memmap)
+        assert new_driver.load_entry("baz", namespace="a").vector == [1.0, 1.0]
+
+    def test_persistence_ann_index(self, temp_dir):
+        def ann_index_fn():
+            return LocalIvfIndex(list_count=2, nprobe=1, min_train_size=4)
+
+        driver = LocalVectorStoreDriver(
+            embedding_driver=MockEmbeddingDriver(), persist_dir=temp_dir, ann_index_fn=ann_index_fn
+        )
+        driver.upsert_vector([1.0, 0.0], vector_id="x")
+        driver.upsert_vector([1.0, 0.1], vector_id="x2")
+        driver.upsert_vector([0.0, 1.0], vector_id="y")
+        driver.upsert_vector([0.1, 1.0], vector_id="y2")
+
+        assert [r.id for r in driver.query("foo")] == ["y", "y2"]
+        assert [r.id for r in driver.query("foo", nprobe=2)] == ["y", "y2", "x2", "x"]
+
+        driver.upsert_vector([0.2, 1.0], vector_id="y3")
+
+        new_driver = LocalVectorStoreDriver(
+            embedding_driver=MockEmbeddingDriver(), persist_dir=temp_dir, ann_index_fn=ann_index_fn
+        )
+        ann_index = new_driver._indexes[None].ann_index
+
+        assert ann_index.trained_size == 4
+        assert ann_index.centroids.tolist() == driver._indexes[None].ann_index.centroids.tolist()
+        assert [r.id for r in new_driver.query("foo")] == ["y", "y2", "y3"]
+
+    def test_persistence_compressed_vectors(self, temp_dir):
+        driver = LocalVectorStoreDriver(
+            embedding_driver=MockEmbeddingDriver(), persist_dir=temp_dir, vector_dtype="int8"
+        )
+        driver.upsert_vector([0.001, 1.0], vector_id="foo")
+        driver.upsert_vector([0.002, 1.0], vector_id="bar")
+
+        assert driver._indexes[None].matrix.dtype == np.int8
+        assert driver.load_entry("bar").vector == pytest.approx([0.002, 1.0])
+        assert [r.id for r in driver.query_vector([1.0, 0.0], count=2)] == ["bar", "foo"]
+
+        driver.compact()
+        new_driver = LocalVectorStoreDriver(
+            embedding_driver=MockEmbeddingDriver(), persist_dir=temp_dir, vector_dtype="int8"
+        )
+
+        assert new_driver.load_entry("bar").vector == pytest.approx([0.002, 1.0])
+        assert new_driver.query_vector([1.0, 0.0], count=1, include_vectors=True)[0].vector == pytest.approx(
+            [0.002, 1.0]
+        )
+
+    def test_compressed_initial_entries(self, temp_dir):
+        driver = LocalVectorStoreDriver(
+            embedding_driver=MockEmbeddingDriver(),
+            persist_dir=temp_dir,
+            vector_dtype="float16",
+            entries={"foo": BaseVectorStoreDriver.Entry(id="foo", vector=[0.1234567, 1.0])},
+        )
+
+        assert driver.load_entry("foo").vector == pytest.approx([0.1234567, 1.0], abs=1e-7)
+
+    def test_persistence_metadata_index(self, driver, temp_dir):
+        driver.upsert_vector([1.0, 0.0], vector_id="foo", namespace="a", meta={"type": "a"})
+        driver.upsert_vector([0.0, 1.0], vector_id="bar", namespace="a", meta={"type": "b"})
+        driver.upsert_vector([0.0, 1.0], vector_id="foo", namespace="b", meta={"type": "a"})
+
+        new_driver = LocalVectorStoreDriver(
+            embedding_driver=MockEmbeddingDriver(), persist_dir=temp_dir, indexed_meta_keys=["type"]
+        )
+
+        assert [(r.id, r.namespace) for r in new_driver.query("foobar", filter={"type": "a"})] == [
+            ("foo", "b"),
+            ("foo", "a"),
+        ]
+        assert [r.id for r in new_driver.query("foobar", namespace="a", filter={"type": "b"})] == ["bar"]
+
+    def test_persistence_delete_vector(self, driver, temp_dir):
+        driver.tombstone_threshold = None
+        driver.upsert_vector([1.0, 0.0], vector_id="foo", namespace="a")
+        driver.upsert_vector([0.0, 1.0], vector_id="bar", namespace="a")
+
+        driver.delete_vector("foo", namespace="a")
+
+        new_driver = LocalVectorStoreDriver(embedding_driver=MockEmbeddingDriver(), persist_dir=temp_dir)
+
+        assert [e.id for e in new_driver.load_entries()] == ["bar"]
+
+        driver.compact()
+        new_driver = LocalVectorStoreDriver(embedding_driver=MockEmbeddingDriver(), persist_dir=temp_dir)
+
+        assert [e.id for e in new_driver.load_entries()] == ["bar"]
+        assert new_driver.load_entry("bar", namespace="a").vector == [0.0, 1.0]
+        assert np.load(f"{temp_dir}/vectors.npy").tolist() == [[0.0, 1.0]]
+
+    def test_persistence_background_compaction(self, temp_dir):
+        driver = LocalVectorStoreDriver(
+            embedding_driver=MockEmbeddingDriver(), persist_dir=temp_dir, vector_dtype="int8", compaction_threshold=None
+        )
+        driver.upsert_vectors([BaseVectorStoreDriver.Entry(id=str(i), vector=[1.0, i / 10]) for i in range(4)])
+
+        driver.delete_vector("0")
+        driver.delete_vector("2")
+        driver.wait_for_compaction()
+
+        assert np.allclose(np.load(f"{temp_dir}/vectors.npy"), [[1.0, 0.1], [1.0, 0.3]])
+        assert driver.load_entry("3").vector == pytest.approx([1.0, 0.3])
+        assert driver._indexes[None].source_rows.tolist() == [0, 1]
+
+        driver.upsert_vector([1.0, 0.5], vector_id="4")
+        new_driver = LocalVectorStoreDriver(embedding_driver=MockEmbeddingDriver(), persist_dir=temp_dir)
+
+        assert [e.id for e in new_driver.load_entries()] == ["1", "3", "4"]
+        assert new_driver.load_entry("4").vector == pytest.approx([1.0, 0.5])
+
+    def test_background_compaction_keeps_concurrent_writes(self, driver, temp_dir, mocker):
+        driver.tombstone_threshold = None
+        driver.upsert_vectors([BaseVectorStoreDriver.Entry(id=str(i), vector=[1.0, float(i)]) for i in range(4)])
+        driver.delete_vector("0")
+        write_compaction = LocalVectorLog.write_compaction
+
+        def write_compaction_with_writes(log, records, vectors):
+            row_count = write_compaction(log, records, vectors)
+            # Writes that happen while the compacted log is written must survive the compaction.
+            driver.upsert_vector([1.0, 9.0], vector_id="1")
+            driver.delete_vector("2")
+            driver.upsert_vector([1.0, 5.0], vector_id="5")
+
+            return row_count
+
+        mocker.patch.object(LocalVectorLog, "write_compaction", autospec=True, side_effect=write_compaction_with_writes)
+        driver._compact_in_background()
+
+        assert [e.id for e in driver.load_entries()] == ["1", "3", "5"]
+        assert driver.load_entry("1").vector == [1.0, 9.0]
+
+        new_driver = LocalVectorStoreDriver(embedding_driver=MockEmbeddingDriver(), persist_dir=temp_dir)
+
+        assert {e.id: e.vector for e in new_driver.load_entries()} == {
+            "1": [1.0, 9.0],
+            "3": [1.0, 3.0],
+            "5": [1.0, 5.0],
+        }
@@ -1,3 +1,4 @@
+import json
 import os
 import tempfile
 import pytest
@@ -17,7 +18,11 @@ class TestPersistentLocalVectorStoreDriver(BaseLocalVectorStoreDriver):
     def driver(self, temp_dir):
         persist_file = os.path.join(temp_dir, "store.json")
 
-        return LocalVectorStoreDriver(embedding_driver=MockEmbeddingDriver(), persist_file=persist_file)
+        driver = LocalVectorStoreDriver(embedding_driver=MockEmbeddingDriver(), persist_file=persist_file)
+
+        yield driver
+
+        driver.close()
 
     def test_persistence(self, driver, temp_dir):
         persist_file = os.path.join(temp_dir, "store.json")
@@ -27,3 +32,31 @@ class TestPersistentLocalVectorStoreDriver(BaseLocalVectorStoreDriver):
         new_driver = LocalVectorStoreDriver(embedding_driver=MockEmbeddingDriver(), persist_file=persist_file)
 
         assert new_driver.query("persistent foobar")[0].to_artifact().value == "persistent foobar"
+
+    def test_persistence_keeps_namespaces_and_ids_apart(self, driver, temp_dir):
+        persist_file = os.path.join(temp_dir, "store.json")
+
+        driver.upsert_vector([0.0, 1.0], vector_id="b-c", namespace="a")
+        driver.upsert_vector([1.0, 0.0], vector_id="c", namespace="a-b")
+
+        new_driver = LocalVectorStoreDriver(embedding_driver=MockEmbeddingDriver(), persist_file=persist_file)
+
+        assert new_driver.load_entry("b-c", namespace="a").vector == [0.0, 1.0]
+        assert new_driver.load_entry("c", namespace="a-b").vector == [1.0, 0.0]
+
+    def test_persistence_reads_namespaced_id_keys(self, temp_dir):
+        persist_file = os.path.join(temp_dir, "store.json")
+
+        with open(persist_file, "w") as file:
+            json.dump(
+                {
+                    "foo": {"id": "foo", "vector": [0.0, 1.0], "score": None, "meta": None, "namespace": None},
+                    "a-bar": {"id": "bar", "vector": [1.0, 0.0], "score": None, "meta": {"baz": 1}, "namespace": "a"},
+                },
+                file,
+            )
+
+        driver = LocalVectorStoreDriver(embedding_driver=MockEmbeddingDriver(), persist_file=persist_file)
+
+        assert driver.load_entry("foo").vector == [0.0, 1.0]
+        assert driver.load_entry("bar", namespace="a").meta == {"baz": 1}
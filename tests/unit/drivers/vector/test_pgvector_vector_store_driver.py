@@ -2,9 +2,10 @@ from typing import Any
 import uuid
 import pytest
 from unittest.mock import MagicMock, Mock
-from griptape.drivers import PgVectorVectorStoreDriver
+from griptape.drivers import BaseVectorStoreDriver, PgVectorVectorStoreDriver
 from tests.mocks.mock_embedding_driver import MockEmbeddingDriver
 from sqlalchemy import create_engine
+from sqlalchemy.dialects import postgresql
 
 
 class TestPgVectorVectorStoreDriver:
@@ -41,18 +42,108 @@ class TestPgVectorVectorStoreDriver:
             embedding_driver=embedding_driver, connection_string=self.connection_string, table_name=self.table_name
         )
 
+    def test_initialize_sizes_pool(self, embedding_driver, mocker):
+        create_engine = mocker.patch("griptape.drivers.vector.pgvector_vector_store_driver.create_engine")
+
+        PgVectorVectorStoreDriver(
+            embedding_driver=embedding_driver,
+            connection_string=self.connection_string,
+            table_name=self.table_name,
+            pool_size=20,
+            create_engine_params={"max_overflow": 0, "pool_pre_ping": True},
+        )
+
+        create_engine.assert_called_once_with(self.connection_string, pool_size=20, max_overflow=0, pool_pre_ping=True)
+
     def test_upsert_vector(self, mock_session, mock_engine):
         test_id = str(uuid.uuid4())
-        mock_session.merge.return_value = Mock(id=test_id)
 
         driver = PgVectorVectorStoreDriver(
             embedding_driver=MockEmbeddingDriver(), engine=mock_engine, table_name=self.table_name
         )
 
-        returned_id = driver.upsert_vector([1.0, 2.0, 3.0])
+        returned_id = driver.upsert_vector([1.0, 2.0, 3.0], vector_id=test_id, namespace="foo")
 
         assert returned_id == test_id
-        mock_session.merge.assert_called_once()
+        mock_session.merge.assert_not_called()
+        mock_session.execute.assert_called_once()
+        mock_session.commit.assert_called_once()
+        statement = mock_session.execute.call_args.args[0]
+        assert "ON CONFLICT (id) DO UPDATE" in str(statement.compile(dialect=postgresql.dialect()))
+        assert isinstance(uuid.UUID(driver.upsert_vector([1.0, 2.0, 3.0])), uuid.UUID)
+
+    def test_setup_creates_indexes(self, mock_engine):
+        driver = PgVectorVectorStoreDriver(
+            embedding_driver=MockEmbeddingDriver(), engine=mock_engine, table_name=self.table_name, dimensions=3
+        )
+
+        driver.setup(
+            create_schema=False,
+            install_uuid_extension=False,
+            install_vector_extension=False,
+            index_type="hnsw",
+            distance_metrics=["cosine_distance", "inner_product"],
+            m=32,
+            ef_construction=128,
+        )
+
+        assert [call.args[0] for call in mock_engine.execute.call_args_list] == [
+            'CREATE INDEX IF NOT EXISTS "griptape_vectors_vector_vector_cosine_ops_hnsw_idx" ON "griptape_vectors" '
+            "USING hnsw (vector vector_cosine_ops) WITH (m = 32, ef_construction = 128);",
+            'CREATE INDEX IF NOT EXISTS "griptape_vectors_vector_vector_ip_ops_hnsw_idx" ON "griptape_vectors" '
+            "USING hnsw (vector vector_ip_ops) WITH (m = 32, ef_construction = 128);",
+        ]
+
+    def test_create_index_ivfflat(self, mock_engine):
+        driver = PgVectorVectorStoreDriver(
+            embedding_driver=MockEmbeddingDriver(), engine=mock_engine, table_name=self.table_name, dimensions=3
+        )
+
+        driver.create_index("ivfflat", ["l2_distance"], lists=50)
+
+        mock_engine.execute.assert_called_once_with(
+            'CREATE INDEX IF NOT EXISTS "griptape_vectors_vector_vector_l2_ops_ivfflat_idx" ON "griptape_vectors" '
+            "USING ivfflat (vector vector_l2_ops) WITH (lists = 50);"
+        )
+
+    def test_create_index_invalid(self, mock_engine):
+        driver = PgVectorVectorStoreDriver(
+            embedding_driver=MockEmbeddingDriver(), engine=mock_engine, table_name=self.table_name, dimensions=3
+        )
+
+        with pytest.raises(ValueError):
+            driver.create_index("invalid")
+
+        with pytest.raises(ValueError):
+            driver.create_index("hnsw", ["invalid"])
+
+        with pytest.raises(ValueError):
+            PgVectorVectorStoreDriver(
+                embedding_driver=MockEmbeddingDriver(), engine=mock_engine, table_name=self.table_name
+            ).create_index("hnsw")
+
+        mock_engine.execute.assert_not_called()
+
+    def test_upsert_vectors(self, mock_session, mock_engine):
+        test_id = str(uuid.uuid4())
+        driver = PgVectorVectorStoreDriver(
+            embedding_driver=MockEmbeddingDriver(), engine=mock_engine, table_name=self.table_name
+        )
+
+        returned_ids = driver.upsert_vectors(
+            [
+                BaseVectorStoreDriver.Entry(id=test_id, vector=[1.0, 2.0, 3.0]),
+                BaseVectorStoreDriver.Entry(id=None, vector=[4.0, 5.0, 6.0], namespace="foo"),
+                BaseVectorStoreDriver.Entry(id=None, vector=[7.0, 8.0, 9.0]),
+            ],
+            batch_size=2,
+        )
+
+        assert len(returned_ids) == 3
+        assert returned_ids[0] == test_id
+        assert uuid.UUID(returned_ids[1])
+        assert mock_session.execute.call_count == 2
+        mock_session.merge.assert_not_called()
         mock_session.commit.assert_called_once()
 
     def test_load_entry(self, mock_session, mock_engine):
@@ -79,7 +170,7 @@ class TestPgVectorVectorStoreDriver:
         test_namespaces = [str(uuid.uuid4()), str(uuid.uuid4())]
         test_metas = [{"key": "value1"}, {"key": "value2"}]
         mock_query = MagicMock()
-        mock_query.all.return_value = [
+        mock_query.yield_per.return_value = [
             Mock(id=test_ids[0], vector=test_vecs[0], namespace=test_namespaces[0], meta=test_metas[0]),
             Mock(id=test_ids[1], vector=test_vecs[1], namespace=test_namespaces[1], meta=test_metas[1]),
         ]
@@ -91,6 +182,8 @@ class TestPgVectorVectorStoreDriver:
 
         entries = driver.load_entries()
 
+        mock_query.yield_per.assert_called_once_with(BaseVectorStoreDriver.DEFAULT_PAGE_SIZE)
+        mock_query.all.assert_not_called()
         assert entries[0].id == test_ids[0]
         assert entries[1].id == test_ids[1]
         assert entries[0].vector == test_vecs[0]
@@ -100,6 +193,56 @@ class TestPgVectorVectorStoreDriver:
         assert entries[0].meta == test_metas[0]
         assert entries[1].meta == test_metas[1]
 
+    def test_load_entries_by_ids(self, mock_session, mock_engine):
+        test_ids = [str(uuid.uuid4()), str(uuid.uuid4()), str(uuid.uuid4())]
+        mock_query = mock_session.query.return_value.filter.return_value
+        mock_query.filter_by.return_value.all.return_value = [
+            Mock(id=uuid.UUID(test_ids[2]), vector=[0.5, 0.6], namespace="a", meta=None),
+            Mock(id=uuid.UUID(test_ids[0]), vector=[0.1, 0.2], namespace="a", meta={"foo": "bar"}),
+        ]
+
+        driver = PgVectorVectorStoreDriver(
+            embedding_driver=MockEmbeddingDriver(), engine=mock_engine, table_name=self.table_name
+        )
+
+        entries = driver.load_entries_by_ids(test_ids, namespace="a")
+
+        clause = mock_session.query.return_value.filter.call_args.args[0]
+        assert str(clause.compile(dialect=postgresql.dialect())) == "griptape_vectors.id = ANY (%(vector_ids)s::UUID[])"
+        assert clause.compile().params == {"vector_ids": test_ids}
+        mock_query.filter_by.assert_called_once_with(namespace="a")
+        assert [e.id for e in entries] == [test_ids[0], test_ids[2]]
+        assert entries[0].meta == {"foo": "bar"}
+
+    def test_existing_ids(self, mock_session, mock_engine):
+        test_ids = [str(uuid.uuid4()), str(uuid.uuid4())]
+        mock_session.query.return_value.filter.return_value.all.return_value = [Mock(id=uuid.UUID(test_ids[1]))]
+
+        driver = PgVectorVectorStoreDriver(
+            embedding_driver=MockEmbeddingDriver(), engine=mock_engine, table_name=self.table_name
+        )
+
+        assert driver.existing_ids(test_ids) == {test_ids[1]}
+        mock_session.query.assert_called_once_with(driver._model.id)
+
+    def test_iter_entries(self, mock_session, mock_engine):
+        mock_query = MagicMock()
+        mock_query.filter_by.return_value.yield_per.return_value = iter(
+            [Mock(id="foo", vector=[0.1, 0.2], namespace="a", meta=None)]
+        )
+        mock_session.query.return_value = mock_query
+
+        driver = PgVectorVectorStoreDriver(
+            embedding_driver=MockEmbeddingDriver(), engine=mock_engine, table_name=self.table_name
+        )
+
+        entries = list(driver.iter_entries(namespace="a", page_size=10))
+
+        mock_query.filter_by.assert_called_once_with(namespace="a")
+        mock_query.filter_by.return_value.yield_per.assert_called_once_with(10)
+        assert [e.id for e in entries] == ["foo"]
+        assert entries[0].namespace == "a"
+
     def test_query_invalid_distance_metric(self, mock_engine):
         driver = PgVectorVectorStoreDriver(
             embedding_driver=MockEmbeddingDriver(), engine=mock_engine, table_name=self.table_name
@@ -134,6 +277,21 @@ class TestPgVectorVectorStoreDriver:
         assert result[0].meta == test_metas[0]
         assert result[1].meta == test_metas[1]
 
+    def test_query_sets_search_parameters(self, mock_session, mock_engine):
+        mock_session.query().order_by().limit().all.return_value = []
+
+        driver = PgVectorVectorStoreDriver(
+            embedding_driver=MockEmbeddingDriver(), engine=mock_engine, table_name=self.table_name, ef_search=100
+        )
+
+        driver.query("some query", probes=10)
+
+        settings = [call.args[0].compile().params for call in mock_session.execute.call_args_list]
+        assert [list(params.values()) for params in settings] == [
+            ["hnsw.ef_search", "100", True],
+            ["ivfflat.probes", "10", True],
+        ]
+
     def test_query_filter(self, mock_session, mock_engine):
         test_ids = [str(uuid.uuid4()), str(uuid.uuid4())]
         test_vecs = [[0.1, 0.2, 0.3], [0.4, 0.5, 0.6]]
@@ -154,3 +312,13 @@ class TestPgVectorVectorStoreDriver:
         assert result[0].vector == test_vecs[0]
         assert result[0].namespace == test_namespaces[0]
         assert result[0].meta == test_metas[0]
+
+    def test_delete_vector(self, mock_session, mock_engine):
+        driver = PgVectorVectorStoreDriver(
+            embedding_driver=MockEmbeddingDriver(), engine=mock_engine, table_name=self.table_name
+        )
+
+        driver.delete_vector(str(uuid.uuid4()))
+
+        mock_session.execute.assert_called_once()
+        mock_session.commit.assert_called_once()
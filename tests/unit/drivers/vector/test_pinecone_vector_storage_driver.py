@@ -1,8 +1,9 @@
+from unittest.mock import MagicMock
 import pytest
 
 from griptape import utils
 from griptape.artifacts import TextArtifact
-from griptape.drivers import PineconeVectorStoreDriver
+from griptape.drivers import BaseVectorStoreDriver, PineconeVectorStoreDriver
 from tests.mocks.mock_embedding_driver import MockEmbeddingDriver
 
 
@@ -49,3 +50,49 @@ class TestPineconeVectorStorageDriver:
 
         assert results[0].vector == [0, 1, 0]
         assert results[0].id == "foo"
+
+    def test_iter_entries(self, driver):
+        vectors = {
+            "foo": {"id": "foo", "values": [0, 1, 0], "metadata": {"foo": "bar"}},
+            "baz": {"id": "baz", "values": [1, 0, 0]},
+        }
+        driver.index.list.return_value = iter([["foo", "bar"], ["baz"]])
+        driver.index.fetch.side_effect = lambda ids, namespace: MagicMock(
+            to_dict=lambda: {"vectors": {i: vectors[i] for i in ids if i in vectors}, "namespace": namespace}
+        )
+
+        entries = list(driver.iter_entries(namespace="foobar", page_size=2))
+
+        driver.index.list.assert_called_once_with(namespace="foobar", limit=2)
+        assert driver.index.fetch.call_count == 2
+        assert [e.id for e in entries] == ["foo", "baz"]
+        assert entries[0].vector == [0, 1, 0]
+        assert entries[0].meta == {"foo": "bar"}
+        assert entries[1].meta is None
+        assert entries[0].namespace == "foobar"
+
+    def test_load_entries_by_ids(self, driver, mocker):
+        vectors = {"foo": {"id": "foo", "values": [0, 1, 0], "metadata": {"foo": "bar"}}}
+        driver.index.fetch.side_effect = lambda ids, namespace: MagicMock(
+            to_dict=lambda: {"vectors": {i: vectors[i] for i in ids if i in vectors}, "namespace": namespace}
+        )
+        mocker.patch.object(BaseVectorStoreDriver, "DEFAULT_PAGE_SIZE", 2)
+
+        entries = driver.load_entries_by_ids(["bar", "baz", "foo"], namespace="foobar")
+
+        assert [call.kwargs["ids"] for call in driver.index.fetch.call_args_list] == [["bar", "baz"], ["foo"]]
+        assert [e.id for e in entries] == ["foo"]
+        assert entries[0].meta == {"foo": "bar"}
+        assert entries[0].namespace == "foobar"
+        assert driver.existing_ids(["foo", "bar"], namespace="foobar") == {"foo"}
+        assert driver.load_entry("foo", namespace="foobar").vector == [0, 1, 0]
+
+    def test_upsert_vectors(self, driver):
+        entries = [
+            BaseVectorStoreDriver.Entry(id="foo", vector=[0, 1, 0], namespace="a"),
+            BaseVectorStoreDriver.Entry(id="bar", vector=[1, 0, 0], namespace="b"),
+            BaseVectorStoreDriver.Entry(id="baz", vector=[0, 0, 1], namespace="a"),
+        ]
+
+        assert driver.upsert_vectors(entries, batch_size=1) == ["foo", "bar", "baz"]
+        assert driver.index.upsert.call_count == 3
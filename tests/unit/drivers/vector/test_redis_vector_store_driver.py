@@ -1,8 +1,8 @@
-from unittest.mock import MagicMock
 import pytest
 import redis
 from tests.mocks.mock_embedding_driver import MockEmbeddingDriver
-from griptape.drivers import RedisVectorStoreDriver
+from griptape.artifacts import TextArtifact
+from griptape.drivers import BaseVectorStoreDriver, RedisVectorStoreDriver
 
 
 class TestRedisVectorStorageDriver:
@@ -11,9 +11,14 @@ class TestRedisVectorStorageDriver:
         return mocker.patch("redis.Redis").return_value
 
     @pytest.fixture
-    def mock_keys(self, mock_client):
-        mock_client.keys.return_value = [b"some_vector_id"]
-        return mock_client.keys
+    def mock_scan_iter(self, mock_client):
+        mock_client.scan_iter.side_effect = lambda match, count: iter(
+            [b"some_vector_id"] if match == "*" else [b"some_namespace:some_vector_id"]
+        )
+        mock_client.pipeline.return_value.execute.side_effect = lambda: [
+            {b"vector": b"\x00\x00\x80?\x00\x00\x00@\x00\x00@@", b"metadata": b'{"foo": "bar"}'}
+        ]
+        return mock_client.scan_iter
 
     @pytest.fixture
     def mock_hgetall(self, mock_client):
@@ -31,21 +36,45 @@ class TestRedisVectorStorageDriver:
 
     @pytest.fixture
     def mock_search(self, mock_client):
-        mock_client.ft.return_value.search.return_value.docs = [
-            MagicMock(
-                id="some_namespace:some_vector_id",
-                score="0.456198036671",
-                metadata='{"foo": "bar"}',
-                vec_string="[1.0, 2.0, 3.0]",
-            )
+        pipeline = mock_client.ft.return_value.pipeline.return_value
+        pipeline.execute.return_value = [
+            [
+                1,
+                b"some_namespace:some_vector_id",
+                [
+                    b"score",
+                    b"0.456198036671",
+                    b"metadata",
+                    b'{"foo": "bar"}',
+                    b"vector",
+                    b"\x00\x00\x80?\x00\x00\x00@\x00\x00@@",
+                ],
+            ]
         ]
-        return mock_client.ft.return_value.search
+        return pipeline.search
 
-    def test_upsert_vector(self, driver):
+    def test_upsert_vector(self, driver, mock_client):
         assert (
             driver.upsert_vector([1.0, 2.0, 3.0], vector_id="some_vector_id", namespace="some_namespace")
             == "some_vector_id"
         )
+        mock_client.hset.assert_called_once_with(
+            "some_namespace:some_vector_id",
+            mapping={"vector": b"\x00\x00\x80?\x00\x00\x00@\x00\x00@@", "namespace": "some_namespace"},
+        )
+
+    def test_upsert_vectors(self, driver, mock_client):
+        pipeline = mock_client.pipeline.return_value
+        entries = [
+            BaseVectorStoreDriver.Entry(id="foo", vector=[1.0, 2.0, 3.0], namespace="some_namespace"),
+            BaseVectorStoreDriver.Entry(id="bar", vector=[3.0, 2.0, 1.0]),
+            BaseVectorStoreDriver.Entry(id="baz", vector=[1.0, 1.0, 1.0]),
+        ]
+
+        assert driver.upsert_vectors(entries, batch_size=2) == ["foo", "bar", "baz"]
+        assert pipeline.hset.call_count == 3
+        assert pipeline.execute.call_count == 2
+        mock_client.hset.assert_not_called()
 
     def test_load_entry(self, driver, mock_hgetall):
         entry = driver.load_entry("some_vector_id")
@@ -61,25 +90,83 @@ class TestRedisVectorStorageDriver:
         assert entry.vector == [1.0, 2.0, 3.0]
         assert entry.meta == {"foo": "bar"}
 
-    def test_load_entries(self, driver, mock_keys, mock_hgetall):
+    def test_load_entries(self, driver, mock_client, mock_scan_iter):
         entries = driver.load_entries()
-        mock_keys.assert_called_once_with("*")
-        mock_hgetall.assert_called_once_with("some_vector_id")
+        mock_scan_iter.assert_called_once_with(match="*", count=BaseVectorStoreDriver.DEFAULT_PAGE_SIZE)
+        mock_client.pipeline.return_value.hgetall.assert_called_once_with(b"some_vector_id")
+        mock_client.hgetall.assert_not_called()
         assert len(entries) == 1
+        assert entries[0].id == "some_vector_id"
+        assert entries[0].namespace is None
         assert entries[0].vector == [1.0, 2.0, 3.0]
         assert entries[0].meta == {"foo": "bar"}
 
-    def test_load_entries_with_namespace(self, driver, mock_keys, mock_hgetall):
+    def test_load_entries_with_namespace(self, driver, mock_client, mock_scan_iter):
         entries = driver.load_entries(namespace="some_namespace")
-        mock_keys.assert_called_once_with("some_namespace:*")
-        mock_hgetall.assert_called_once_with("some_namespace:some_vector_id")
+        mock_scan_iter.assert_called_once_with(match="some_namespace:*", count=BaseVectorStoreDriver.DEFAULT_PAGE_SIZE)
+        mock_client.pipeline.return_value.hgetall.assert_called_once_with(b"some_namespace:some_vector_id")
         assert len(entries) == 1
+        assert entries[0].id == "some_vector_id"
+        assert entries[0].namespace == "some_namespace"
         assert entries[0].vector == [1.0, 2.0, 3.0]
         assert entries[0].meta == {"foo": "bar"}
 
-    def test_query(self, driver, mock_search):
+    def test_load_entries_by_ids(self, driver, mock_client):
+        pipeline = mock_client.pipeline.return_value
+        pipeline.execute.return_value = [{}, {b"vector": b"\x00\x00\x80?", b"metadata": b'{"foo": "bar"}'}]
+
+        entries = driver.load_entries_by_ids(["foo", "bar"], namespace="a")
+
+        assert [call.args for call in pipeline.hgetall.call_args_list] == [("a:foo",), ("a:bar",)]
+        pipeline.execute.assert_called_once()
+        mock_client.hgetall.assert_not_called()
+        assert len(entries) == 1
+        assert entries[0].id == "bar"
+        assert entries[0].namespace == "a"
+        assert entries[0].vector == [1.0]
+        assert entries[0].meta == {"foo": "bar"}
+
+    def test_existing_ids(self, driver, mock_client):
+        pipeline = mock_client.pipeline.return_value
+        pipeline.execute.return_value = [1, 0, 1]
+
+        assert driver.existing_ids(["foo", "bar", "baz"]) == {"foo", "baz"}
+        assert [call.args for call in pipeline.exists.call_args_list] == [("foo",), ("bar",), ("baz",)]
+        pipeline.execute.assert_called_once()
+
+    def test_upsert_text_artifacts(self, driver, mock_client):
+        pipeline = mock_client.pipeline.return_value
+        pipeline.execute.side_effect = [[1, 0], [True]]
+
+        driver.upsert_text_artifacts({"a": [TextArtifact("foo"), TextArtifact("bar")]})
+
+        assert pipeline.exists.call_count == 2
+        assert pipeline.hset.call_count == 1
+        assert pipeline.execute.call_count == 2
+        mock_client.hgetall.assert_not_called()
+
+    def test_iter_entries(self, driver, mock_client):
+        pipeline = mock_client.pipeline.return_value
+        mock_client.scan_iter.return_value = iter([b"a:foo", b"a:bar", b"a:baz"])
+        pipeline.execute.side_effect = [
+            [{b"vector": b"\x00\x00\x80?", b"metadata": b'{"foo": "bar"}'}, {}],
+            [{b"vector": b"\x00\x00\x00@"}],
+        ]
+
+        entries = list(driver.iter_entries(namespace="a", page_size=2))
+
+        mock_client.scan_iter.assert_called_once_with(match="a:*", count=2)
+        assert pipeline.execute.call_count == 2
+        assert [e.id for e in entries] == ["foo", "baz"]
+        assert [e.vector for e in entries] == [[1.0], [2.0]]
+        assert entries[0].meta == {"foo": "bar"}
+        assert entries[1].meta is None
+
+    def test_query(self, driver, mock_client, mock_search):
         results = driver.query("Some query")
         mock_search.assert_called_once()
+        mock_client.ft.return_value.search.assert_not_called()
+        assert mock_search.call_args.args[0]._return_fields == ["score", "metadata"]
         assert len(results) == 1
         assert results[0].namespace == "some_namespace"
         assert results[0].id == "some_vector_id"
@@ -90,9 +177,69 @@ class TestRedisVectorStorageDriver:
     def test_query_with_include_vectors(self, driver, mock_search):
         results = driver.query("Some query", include_vectors=True)
         mock_search.assert_called_once()
+        assert mock_search.call_args.args[0]._return_fields == ["score", "metadata", "vector"]
         assert len(results) == 1
         assert results[0].namespace == "some_namespace"
         assert results[0].id == "some_vector_id"
         assert results[0].score == 0.456198036671
         assert results[0].meta == {"foo": "bar"}
         assert results[0].vector == [1.0, 2.0, 3.0]
+
+    def test_query_vector(self, driver, mock_search):
+        results = driver.query_vector([1.0, 2.0, 3.0], count=3)
+
+        query, params = mock_search.call_args.args
+        assert query.query_string() == "*=>[KNN 3 @vector $vector as score]"
+        assert params == {"vector": b"\x00\x00\x80?\x00\x00\x00@\x00\x00@@"}
+        assert results[0].id == "some_vector_id"
+
+    def test_query_many(self, driver, mock_client):
+        pipeline = mock_client.ft.return_value.pipeline.return_value
+        pipeline.execute.return_value = [
+            [1, b"some_namespace:some_vector_id", [b"score", b"0.5", b"metadata", b'{"foo": "bar"}']],
+            [0],
+        ]
+
+        results = driver.query_many(["Some query", [1.0, 2.0, 3.0]], namespace="some_namespace")
+
+        assert pipeline.search.call_count == 2
+        pipeline.execute.assert_called_once()
+        mock_client.ft.return_value.search.assert_not_called()
+        assert len(results) == 2
+        assert results[0][0].id == "some_vector_id"
+        assert results[0][0].namespace == "some_namespace"
+        assert results[0][0].score == 0.5
+        assert results[0][0].meta == {"foo": "bar"}
+        assert results[1] == []
+
+    def test_delete_vector(self, driver, mock_client):
+        driver.delete_vector("some_vector_id", namespace="some_namespace")
+
+        mock_client.delete.assert_called_once_with("some_namespace:some_vector_id")
+
+    def test_create_index(self, driver, mock_client):
+        driver.create_index(1536, prefixes=["some_namespace:"], M=32, EF_CONSTRUCTION=400)
+
+        fields, definition = (
+            mock_client.ft.return_value.create_index.call_args.args[0],
+            mock_client.ft.return_value.create_index.call_args.kwargs["definition"],
+        )
+        mock_client.ft.assert_called_with("test_index")
+        assert fields[0].name == "namespace"
+        assert fields[1].name == "vector"
+        assert fields[1].args == [
+            "VECTOR",
+            "HNSW",
+            10,
+            "TYPE",
+            "FLOAT32",
+            "DIM",
+            1536,
+            "DISTANCE_METRIC",
+            "COSINE",
+            "M",
+            32,
+            "EF_CONSTRUCTION",
+            400,
+        ]
+        assert definition.args[:5] == ["ON", "HASH", "PREFIX", 1, "some_namespace:"]
@@ -0,0 +1,250 @@
+import os
+import tempfile
+from concurrent import futures
+import pytest
+from griptape.artifacts import TextArtifact
+from griptape.drivers import BaseVectorStoreDriver, ShardedLocalVectorStoreDriver
+from griptape.drivers.vector.local_metadata_index import LocalMetadataIndex
+from griptape.drivers.vector.local_vector_shard import LocalVectorShardView
+from tests.mocks.mock_embedding_driver import MockEmbeddingDriver
+
+
+class TestShardedLocalVectorStoreDriver:
+    @pytest.fixture
+    def driver(self):
+        driver = ShardedLocalVectorStoreDriver(
+            embedding_driver=MockEmbeddingDriver(),
+            shard_count=3,
+            initial_shard_capacity=2,
+            query_executor_fn=lambda: futures.ThreadPoolExecutor(),
+        )
+
+        yield driver
+
+        driver.close()
+
+    def test_invalid_shard_count(self):
+        with pytest.raises(ValueError):
+            ShardedLocalVectorStoreDriver(embedding_driver=MockEmbeddingDriver(), shard_count=0)
+
+    def test_upsert_vectors_balances_shards(self, driver):
+        driver.upsert_vectors([BaseVectorStoreDriver.Entry(id=str(i), vector=[float(i), 1.0]) for i in range(7)])
+
+        assert [shard.size for shard in driver._shards] == [3, 2, 2]
+        assert [e.id for e in driver.load_entries()] == [str(i) for i in range(7)]
+
+    def test_iter_entries(self, driver):
+        driver.upsert_vectors(
+            [BaseVectorStoreDriver.Entry(id=str(i), vector=[float(i), 1.0], namespace="a") for i in range(5)]
+            + [BaseVectorStoreDriver.Entry(id="foo", vector=[1.0, 0.0], namespace="b")]
+        )
+        entries = driver.iter_entries("a", page_size=2)
+
+        assert next(entries).id == "0"
+
+        driver.delete_vector("3", namespace="a")
+
+        assert [(e.id, e.vector) for e in entries] == [("1", [1.0, 1.0]), ("2", [2.0, 1.0]), ("4", [4.0, 1.0])]
+
+    def test_load_entries_by_ids(self, driver):
+        driver.upsert_vector([1.0, 0.0], vector_id="foo", namespace="a")
+        driver.upsert_vector([0.0, 1.0], vector_id="bar", namespace="a")
+        driver.upsert_vector([1.0, 1.0], vector_id="baz", namespace="b")
+
+        assert [(e.id, e.vector) for e in driver.load_entries_by_ids(["bar", "baz", "foo"], namespace="a")] == [
+            ("bar", [0.0, 1.0]),
+            ("foo", [1.0, 0.0]),
+        ]
+        assert driver.existing_ids(["foo", "bar", "baz"], namespace="b") == {"baz"}
+
+    def test_upsert_vector_overwrites(self, driver):
+        driver.upsert_vector([1.0, 0.0], vector_id="foo", meta={"foo": 1})
+        driver.upsert_vectors(
+            [
+                BaseVectorStoreDriver.Entry(id="foo", vector=[0.0, 1.0], meta={"foo": 2}),
+                BaseVectorStoreDriver.Entry(id="bar", vector=[1.0, 0.0]),
+                BaseVectorStoreDriver.Entry(id="bar", vector=[1.0, 1.0]),
+            ]
+        )
+
+        assert sum(shard.size for shard in driver._shards) == 2
+        assert driver.load_entry("foo") == BaseVectorStoreDriver.Entry(id="foo", vector=[0.0, 1.0], meta={"foo": 2})
+        assert driver.load_entry("bar").vector == [1.0, 1.0]
+
+    def test_upsert_text_artifacts(self, driver):
+        driver.upsert_text_artifacts({"foo": [TextArtifact("foo"), TextArtifact("bar")], "baz": [TextArtifact("baz")]})
+
+        assert [a.value for a in driver.load_artifacts("foo")] == ["foo", "bar"]
+        assert driver.namespaces == ["foo", "baz"]
+        assert driver.query("foo", count=1)[0].to_artifact().value in ("foo", "bar", "baz")
+
+    def test_query_merges_shards(self, driver):
+        for i in range(10):
+            driver.upsert_vector([float(i), 10.0], vector_id=str(i))
+
+        results = driver.query_vector([0.0, 1.0], count=4, include_vectors=True)
+
+        assert [r.id for r in results] == ["0", "1", "2", "3"]
+        assert results[0].vector == [0.0, 10.0]
+        assert results[0].score == pytest.approx(1.0)
+        assert [r.id for r in driver.query_vector([1.0, 0.0])] == [str(i) for i in range(9, -1, -1)]
+        assert driver.query_vector([0.0, 1.0], count=2)[0].vector == []
+
+    def test_query_many(self, driver):
+        driver.upsert_vector([1.0, 0.0], vector_id="foo")
+        driver.upsert_vector([0.0, 1.0], vector_id="bar")
+
+        assert [[r.id for r in results] for results in driver.query_many([[1.0, 0.0], "bar"], count=1)] == [
+            ["foo"],
+            ["bar"],
+        ]
+
+    def test_query_namespace(self, driver):
+        driver.upsert_vector([1.0, 0.0], vector_id="foo", namespace="a")
+        driver.upsert_vector([0.0, 1.0], vector_id="bar", namespace="b")
+        driver.upsert_vector([1.0, 1.0], vector_id="baz", namespace="a")
+
+        assert [r.id for r in driver.query_vector([0.0, 1.0], namespace="a")] == ["baz", "foo"]
+        assert [r.id for r in driver.query_vector([0.0, 1.0], namespace="c")] == []
+        assert [(r.id, r.namespace) for r in driver.query_vector([0.0, 1.0], count=2)] == [("bar", "b"), ("baz", "a")]
+
+    def test_query_with_filter(self, driver):
+        driver.upsert_vector([1.0, 0.0], vector_id="foo", meta={"type": "a"})
+        driver.upsert_vector([0.0, 1.0], vector_id="bar", meta={"type": "b"})
+        driver.upsert_vector([1.0, 1.0], vector_id="baz", meta={"type": "a"})
+
+        assert [r.id for r in driver.query_vector([0.0, 1.0], filter={"type": "a"})] == ["baz", "foo"]
+        assert driver.query_vector([0.0, 1.0], filter={"type": "c"}) == []
+
+    def test_query_with_indexed_filter(self, mocker):
+        driver = ShardedLocalVectorStoreDriver(
+            embedding_driver=MockEmbeddingDriver(),
+            shard_count=2,
+            indexed_meta_keys=["type"],
+            query_executor_fn=lambda: futures.ThreadPoolExecutor(),
+        )
+
+        try:
+            driver.upsert_vector([1.0, 0.0], vector_id="foo", meta={"type": "a", "color": "red"})
+            driver.upsert_vector([0.0, 1.0], vector_id="bar", meta={"type": "b", "color": "red"})
+            driver.upsert_vector([1.0, 1.0], vector_id="baz", meta={"type": "a", "color": "blue"})
+            driver.upsert_vector([1.0, 2.0], vector_id="qux", meta={"type": "b"})
+            matches = mocker.spy(LocalMetadataIndex, "matches")
+
+            assert [r.id for r in driver.query_vector([0.0, 1.0], filter={"type": "a"})] == ["baz", "foo"]
+            assert matches.call_count == 0
+            assert [r.id for r in driver.query_vector([0.0, 1.0], filter={"type": "a", "color": "red"})] == ["foo"]
+            # Only the entries that match the indexed key are checked against the other keys.
+            assert matches.call_count == 2
+
+            driver.upsert_vector([0.1, 1.0], vector_id="foo", meta={"type": "b"})
+            driver.delete_vector("baz")
+
+            assert driver.query_vector([0.0, 1.0], filter={"type": "a"}) == []
+            assert [r.id for r in driver.query_vector([0.0, 1.0], filter={"type": "b"})] == ["bar", "foo", "qux"]
+        finally:
+            driver.close()
+
+    def test_query_keeps_files_of_growing_shards(self, driver):
+        driver.upsert_vector([1.0, 0.0], vector_id="foo")
+        executor = futures.ThreadPoolExecutor()
+        submit = executor.submit
+
+        def submit_after_upsert(fn, *args):
+            # The shard grows to a new generation after the query took its view, but before the view is scored.
+            driver.upsert_vectors([BaseVectorStoreDriver.Entry(id=str(i), vector=[0.0, 1.0]) for i in range(6)])
+
+            return submit(fn, *args)
+
+        executor.submit = submit_after_upsert
+        driver._query_executor = executor
+        paths = LocalVectorShardView.file_paths(
+            driver._shards[0].path, driver._shards[0].uid, driver._shards[0].generation
+        )
+
+        assert [r.id for r in driver.query_vector([1.0, 0.0], count=1)] == ["foo"]
+        assert driver._shards[0].generation == 1
+        assert not any(os.path.isfile(path) for path in paths)
+
+    def test_delete_vector(self, driver):
+        driver.upsert_vector([1.0, 0.0], vector_id="foo")
+        driver.upsert_vector([0.0, 1.0], vector_id="bar")
+
+        driver.delete_vector("foo")
+        driver.delete_vector("does-not-exist")
+
+        assert driver.load_entry("foo") is None
+        assert [e.id for e in driver.load_entries()] == ["bar"]
+        assert [r.id for r in driver.query_vector([1.0, 0.0])] == ["bar"]
+
+        driver.upsert_vector([1.0, 0.0], vector_id="foo")
+
+        assert [r.id for r in driver.query_vector([1.0, 0.0])] == ["foo", "bar"]
+
+    def test_delete_vector_reuses_rows(self, driver):
+        driver.upsert_vectors([BaseVectorStoreDriver.Entry(id=str(i), vector=[float(i), 1.0]) for i in range(3)])
+        driver.delete_vector("1")
+        driver.upsert_vector([1.0, 0.0], vector_id="foo")
+
+        assert [shard.size for shard in driver._shards] == [1, 1, 1]
+        assert driver._rows[(None, "foo")] == (1, 0)
+        assert [r.id for r in driver.query_vector([1.0, 0.0], count=1)] == ["foo"]
+
+    def test_delete_vector_keeps_leased_rows(self, driver):
+        driver.upsert_vectors([BaseVectorStoreDriver.Entry(id=str(i), vector=[float(i), 1.0]) for i in range(3)])
+        driver.delete_vector("1")
+        view = driver._shards[1].view()
+        driver.upsert_vector([1.0, 0.0], vector_id="foo")
+
+        # Rows are not reused while a query holds a view of their shard.
+        assert driver._rows[(None, "foo")] == (1, 1)
+
+        driver._shards[1].release(view)
+
+    def test_query_skips_rows_deleted_while_scored(self, driver, mocker):
+        driver.upsert_vectors([BaseVectorStoreDriver.Entry(id=str(i), vector=[float(i), 1.0]) for i in range(3)])
+        top_k_many = LocalVectorShardView.top_k_many
+
+        def top_k_many_then_delete(view, *args):
+            results = top_k_many(view, *args)
+
+            # Entries deleted after a shard was scored, and rows upserted meanwhile, are not returned.
+            driver.delete_vector("2")
+            driver.upsert_vector([2.0, 1.0], vector_id="foo")
+
+            return results
+
+        mocker.patch.object(LocalVectorShardView, "top_k_many", autospec=True, side_effect=top_k_many_then_delete)
+
+        assert [r.id for r in driver.query_vector([1.0, 0.0])] == ["1", "0"]
+        assert driver._rows[(None, "foo")] == (2, 1)
+
+    def test_close_removes_shard_files(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            driver = ShardedLocalVectorStoreDriver(
+                embedding_driver=MockEmbeddingDriver(), shard_count=2, shard_dir=temp_dir
+            )
+            driver.upsert_vector([1.0, 0.0], vector_id="foo")
+
+            assert os.listdir(temp_dir)
+
+            driver.close()
+
+            assert os.listdir(temp_dir) == []
+
+    def test_query_with_process_pool(self):
+        driver = ShardedLocalVectorStoreDriver(embedding_driver=MockEmbeddingDriver(), shard_count=2)
+
+        try:
+            driver.upsert_vectors([BaseVectorStoreDriver.Entry(id=str(i), vector=[float(i), 1.0]) for i in range(5)])
+
+            assert driver._query_executor is None
+            assert [r.id for r in driver.query_vector([1.0, 0.0], count=2)] == ["4", "3"]
+            assert isinstance(driver._query_executor, futures.ProcessPoolExecutor)
+
+            # Workers pick up rows appended after their first query.
+            driver.upsert_vector([10.0, 0.0], vector_id="foo")
+
+            assert [r.id for r in driver.query_vector([1.0, 0.0], count=1)] == ["foo"]
+        finally:
+            driver.close()
@@ -1,4 +1,5 @@
 import pytest
+from griptape.artifacts import TextArtifact
 from griptape.engines.rag import RagContext
 from griptape.engines.rag.modules import PromptGenerationRagModule
 from tests.mocks.mock_prompt_driver import MockPromptDriver
@@ -23,3 +24,32 @@ class TestPromptGenerationRagModule:
         assert "*META*" in system_message
         assert "*TEXT SEGMENT 1*" in system_message
         assert "*TEXT SEGMENT 2*" in system_message
+
+    def test_run_packs_chunks(self, module, mocker):
+        chunks = [TextArtifact(str(i) * 1000) for i in range(10)]
+        generate_system_template = mocker.spy(module, "generate_system_template")
+        run = mocker.spy(module.prompt_driver, "run")
+
+        module.run(RagContext(initial_query="test", text_chunks=chunks))
+
+        system_prompt = run.call_args.args[0].inputs[0].content
+        assert [c.value in system_prompt for c in chunks] == [True] * 3 + [False] * 7
+        assert generate_system_template.call_count == 3
+        assert len(module.prompt_driver.prompt_stack_to_string(run.call_args.args[0])) + 400 < 4096
+
+    def test_run_packs_chunks_with_custom_template(self, mocker):
+        # Skipping empty chunks hides the tokens added around each chunk from the estimate.
+        module = PromptGenerationRagModule(
+            prompt_driver=MockPromptDriver(),
+            generate_system_template=lambda text_chunks, before, after: "\n".join(
+                f"Chunk: {c}" for c in text_chunks if c
+            ),
+        )
+        chunks = [TextArtifact("a" * 915) for _ in range(4)]
+        generate_system_template = mocker.spy(module, "generate_system_template")
+        run = mocker.spy(module.prompt_driver, "run")
+
+        module.run(RagContext(initial_query="test", text_chunks=chunks))
+
+        assert run.call_args.args[0].inputs[0].content.count("Chunk: ") == 3
+        assert generate_system_template.call_count == 4
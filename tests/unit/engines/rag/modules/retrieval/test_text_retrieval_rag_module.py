@@ -1,5 +1,5 @@
 from griptape.artifacts import TextArtifact
-from griptape.drivers import LocalVectorStoreDriver
+from griptape.drivers import LocalVectorStoreDriver, MarqoVectorStoreDriver
 from griptape.engines.rag import RagContext
 from griptape.engines.rag.modules import TextRetrievalRagModule
 from tests.mocks.mock_embedding_driver import MockEmbeddingDriver
@@ -18,3 +18,56 @@ class TestTextRetrievalRagModule:
         assert len(result) == 2
         assert result[0].value == "foobar1"
         assert result[1].value == "foobar2"
+
+    def test_run_batches_queries(self, mocker):
+        vector_store_driver = LocalVectorStoreDriver(embedding_driver=MockEmbeddingDriver())
+        module = TextRetrievalRagModule(vector_store_driver=vector_store_driver)
+        vector_store_driver.upsert_text_artifact(TextArtifact("foobar1"), namespace="test")
+
+        query_many = mocker.spy(LocalVectorStoreDriver, "query_many")
+        embed_string = mocker.spy(MockEmbeddingDriver, "embed_string")
+        embed_strings = mocker.spy(MockEmbeddingDriver, "embed_strings")
+
+        result = module.run(RagContext(initial_query="test", alternative_queries=["foo", "bar"]))
+
+        assert query_many.call_count == 1
+        assert query_many.call_args.args[1] == [[0, 1], [0, 1], [0, 1]]
+        assert embed_string.call_count == 0
+        assert embed_strings.call_count == 1
+        assert embed_strings.call_args.args[1] == ["test", "foo", "bar"]
+        assert [a.value for a in result] == ["foobar1", "foobar1", "foobar1"]
+
+    def test_run_reuses_context_embeddings(self, mocker):
+        vector_store_driver = LocalVectorStoreDriver(embedding_driver=MockEmbeddingDriver())
+        module = TextRetrievalRagModule(vector_store_driver=vector_store_driver)
+        context = RagContext(initial_query="test")
+        context.embed_queries(vector_store_driver.embedding_driver, ["test"])
+
+        embed_strings = mocker.spy(MockEmbeddingDriver, "embed_strings")
+
+        module.run(context)
+
+        assert module.query_embedding_driver is vector_store_driver.embedding_driver
+        assert embed_strings.call_count == 0
+
+    def test_run_with_driver_that_embeds_queries(self, mocker):
+        mock_client = mocker.Mock()
+        mock_client.index.return_value.search.return_value = {
+            "hits": [{"_id": "foo", "_score": 1.0, "artifact": TextArtifact("foobar1").to_json()}]
+        }
+        vector_store_driver = MarqoVectorStoreDriver(
+            api_key="foobar",
+            url="http://localhost:8000",
+            index="test",
+            mq=mock_client,
+            embedding_driver=MockEmbeddingDriver(),
+        )
+        module = TextRetrievalRagModule(vector_store_driver=vector_store_driver)
+        embed_strings = mocker.spy(MockEmbeddingDriver, "embed_strings")
+
+        result = module.run(RagContext(initial_query="test", alternative_queries=["foo"]))
+
+        assert module.query_embedding_driver is None
+        assert embed_strings.call_count == 0
+        assert sorted(call.args[0] for call in mock_client.index.return_value.search.call_args_list) == ["foo", "test"]
+        assert [a.value for a in result] == ["foobar1", "foobar1"]
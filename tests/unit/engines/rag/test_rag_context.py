@@ -0,0 +1,20 @@
+from griptape.engines.rag import RagContext
+from tests.mocks.mock_embedding_driver import MockEmbeddingDriver
+
+
+class TestRagContext:
+    def test_queries(self):
+        assert RagContext(initial_query="foo", alternative_queries=["bar"]).queries == ["foo", "bar"]
+
+    def test_embed_queries(self, mocker):
+        embedding_driver = MockEmbeddingDriver()
+        context = RagContext(initial_query="foo")
+        embed_strings = mocker.spy(MockEmbeddingDriver, "embed_strings")
+
+        assert context.embed_queries(embedding_driver, ["foo", "bar", "foo"]) == [[0, 1], [0, 1], [0, 1]]
+        assert context.embed_queries(embedding_driver, ["bar", "baz"]) == [[0, 1], [0, 1]]
+        assert [call.args[1] for call in embed_strings.call_args_list] == [["foo", "bar"], ["baz"]]
+
+        context.embed_queries(MockEmbeddingDriver(), ["foo"])
+
+        assert embed_strings.call_count == 3
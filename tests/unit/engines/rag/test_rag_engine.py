@@ -28,3 +28,24 @@ class TestRagEngine:
 
     def test_process(self, engine):
         assert engine.process(RagContext(initial_query="test")).output.value == "mock output"
+
+    def test_process_embeds_queries_once(self, mocker):
+        embedding_driver = MockEmbeddingDriver()
+        engine = RagEngine(
+            retrieval_stage=RetrievalRagStage(
+                retrieval_modules=[
+                    TextRetrievalRagModule(
+                        vector_store_driver=LocalVectorStoreDriver(embedding_driver=embedding_driver)
+                    ),
+                    TextRetrievalRagModule(
+                        vector_store_driver=LocalVectorStoreDriver(embedding_driver=embedding_driver)
+                    ),
+                ]
+            )
+        )
+        embed_strings = mocker.spy(MockEmbeddingDriver, "embed_strings")
+
+        engine.process(RagContext(initial_query="test", alternative_queries=["foo", "test"]))
+
+        assert embed_strings.call_count == 1
+        assert embed_strings.call_args.args[1] == ["test", "foo"]
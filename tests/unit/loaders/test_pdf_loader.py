@@ -3,7 +3,9 @@ from pathlib import Path
 from typing import IO
 import pytest
 from griptape import utils
+from griptape.chunkers import PdfChunker
 from griptape.loaders import PdfLoader
+from tests.mocks.mock_tokenizer import MockTokenizer
 from tests.mocks.mock_embedding_driver import MockEmbeddingDriver
 
 MAX_TOKENS = 50
@@ -44,3 +46,16 @@ class TestPdfLoader:
             assert artifact[0].value.startswith("Bitcoin: A Peer-to-Peer")
             assert artifact[-1].value.endswith('its applications," 1957.\n9')
             assert artifact[0].embedding == [0, 1]
+
+    def test_iter_load(self, create_source):
+        chunker = PdfChunker(tokenizer=MockTokenizer(model="foo"), max_tokens=MAX_TOKENS * 4)
+        loader = PdfLoader(chunker=chunker, embedding_driver=MockEmbeddingDriver())
+
+        artifacts = list(loader.iter_load(create_source("bitcoin.pdf")))
+
+        assert artifacts[0].value.startswith("Bitcoin: A Peer-to-Peer")
+        assert artifacts[-1].value.endswith('its applications," 1957.\n9')
+        assert artifacts[0].embedding == [0, 1]
+
+        for artifact in artifacts:
+            assert chunker.tokenizer.count_tokens(artifact.value) <= MAX_TOKENS * 4
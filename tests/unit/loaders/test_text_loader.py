@@ -1,6 +1,8 @@
 import pytest
 from griptape.loaders.text_loader import TextLoader
+from griptape.chunkers import TextChunker
 from tests.mocks.mock_embedding_driver import MockEmbeddingDriver
+from tests.mocks.mock_tokenizer import MockTokenizer
 
 MAX_TOKENS = 50
 
@@ -44,3 +46,24 @@ class TestTextLoader:
         artifact = artifacts[0]
         assert artifact.embedding == [0, 1]
         assert artifact.encoding == loader.encoding
+
+    def test_iter_load(self, str_from_resource_path, bytes_from_resource_path):
+        chunker = TextChunker(tokenizer=MockTokenizer(model="foo"), max_tokens=MAX_TOKENS * 4)
+        embedding_driver = MockEmbeddingDriver(max_batch_size=2)
+        loader = TextLoader(chunker=chunker, embedding_driver=embedding_driver)
+        text = str_from_resource_path("test.txt")
+        expected = [c.value for c in chunker.iter_chunks([text])]
+
+        artifacts = list(loader.iter_load(text))
+
+        assert [a.value for a in artifacts] == expected
+        assert all(a.embedding == [0, 1] for a in artifacts)
+        assert all(a.encoding == "utf-8" for a in artifacts)
+
+        lines = bytes_from_resource_path("test.txt").splitlines(keepends=True)
+
+        assert [a.value for a in loader.iter_load(lines)] == expected
+
+    def test_iter_load_unsupported_source(self, loader):
+        with pytest.raises(ValueError):
+            next(loader.iter_load(bytearray(b"foo")))
@@ -166,3 +166,36 @@ class TestConversationMemory:
         assert prompt_stack.inputs[2].content == "bar2"
         assert prompt_stack.inputs[-2].content == "foo"
         assert prompt_stack.inputs[-1].content == "bar"
+
+    def test_add_to_prompt_stack_autopruning_counts_each_input_once(self, mocker):
+        tokenizer = MockTokenizer(model="foo", max_input_tokens=160)
+        agent = Agent(prompt_driver=MockPromptDriver(tokenizer=tokenizer))
+        memory = ConversationMemory(autoprune=True, runs=[Run(input=f"foo{i}", output=f"bar{i}") for i in range(1, 6)])
+        memory.structure = agent
+        prompt_stack = PromptStack()
+        prompt_stack.add_system_input("fizz")
+        prompt_stack.add_user_input("foo")
+        prompt_stack.add_assistant_input("bar")
+        spy = mocker.spy(MockTokenizer, "count_tokens")
+        memory.add_to_prompt_stack(prompt_stack, 1)
+
+        counted = [call.args[1] for call in spy.call_args_list]
+
+        assert len(prompt_stack.inputs) == 11
+        assert len(counted) == len(set(counted))
+
+    def test_add_to_prompt_stack_autopruning_checks_exact_count(self, mocker):
+        prompt_driver = MockPromptDriver(tokenizer=MockTokenizer(model="foo", max_input_tokens=160))
+        agent = Agent(prompt_driver=prompt_driver)
+        memory = ConversationMemory(autoprune=True, runs=[Run(input=f"foo{i}", output=f"bar{i}") for i in range(1, 6)])
+        memory.structure = agent
+        prompt_stack = PromptStack()
+        prompt_stack.add_system_input("fizz")
+        prompt_stack.add_user_input("foo")
+        prompt_stack.add_assistant_input("bar")
+        # An estimate that undercounts lets every run fit, which the exact count doesn't.
+        mocker.patch.object(prompt_driver, "count_prompt_stack_tokens", return_value=0)
+        memory.add_to_prompt_stack(prompt_stack, 1)
+
+        assert len(prompt_stack.inputs) == 11
+        assert prompt_driver.tokenizer.count_tokens(prompt_driver.prompt_stack_to_string(prompt_stack)) < 160
@@ -14,6 +14,15 @@ class TestTextArtifactStorage:
 
         assert storage.load_artifacts("test").value[0].value == "foo"
 
+    def test_store_artifacts(self, storage):
+        storage.store_artifacts("test", [TextArtifact("foo"), TextArtifact("bar")])
+
+        assert [a.value for a in storage.load_artifacts("test").value] == ["foo", "bar"]
+
+    def test_store_artifacts_with_invalid_artifact(self, storage):
+        with pytest.raises(ValueError):
+            storage.store_artifacts("test", [TextArtifact("foo"), BlobArtifact(b"bar")])
+
     def test_load_artifacts(self, storage):
         artifact = TextArtifact("foo", name="foo")
         storage.store_artifact("test", artifact)
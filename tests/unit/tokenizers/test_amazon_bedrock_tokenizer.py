@@ -45,3 +45,8 @@ class TestAmazonBedrockTokenizer:
     )
     def test_output_tokens_left(self, tokenizer, expected):
         assert tokenizer.count_output_tokens_left("foo bar huzzah") == expected
+
+    def test_token_offsets(self):
+        tokenizer = AmazonBedrockTokenizer(model="amazon.titan-text-express-v1")
+
+        assert tokenizer.token_offsets("foo bar baz") == [0, 4, 8]
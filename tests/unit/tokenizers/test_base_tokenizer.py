@@ -1,4 +1,5 @@
 import logging
+from griptape.tokenizers import DummyTokenizer
 from tests.mocks.mock_tokenizer import MockTokenizer
 
 
@@ -11,3 +12,12 @@ class TestBaseTokenizer:
             assert tokenizer.max_output_tokens == 1000
 
             assert "gpt2 not found" in caplog.text
+
+    def test_token_offsets(self):
+        assert DummyTokenizer().token_offsets("ab  cd") is None
+
+    def test_word_token_offsets(self):
+        tokenizer = MockTokenizer(model="foo")
+
+        assert tokenizer._word_token_offsets("ab  cd") == [0, 1, 2, 3, 4, 5]
+        assert tokenizer._word_token_offsets("") == []
@@ -1,5 +1,6 @@
 import pytest
 from griptape.tokenizers import OpenAiTokenizer
+from griptape.tokenizers.openai_tokenizer import _encoding_for_model
 
 
 class TestOpenAiTokenizer:
@@ -105,3 +106,60 @@ class TestOpenAiTokenizer:
     )
     def test_output_tokens_left(self, tokenizer, expected):
         assert tokenizer.count_output_tokens_left("foo bar huzzah") == expected
+
+    @pytest.fixture
+    def mock_encoding_for_model(self, mocker):
+        _encoding_for_model.cache_clear()
+        encoding_for_model = mocker.patch("tiktoken.encoding_for_model")
+        encoding_for_model.return_value.encode.side_effect = lambda text, **kwargs: text.split()
+
+        yield encoding_for_model
+
+        _encoding_for_model.cache_clear()
+
+    def test_encoding_is_resolved_once(self, mock_encoding_for_model):
+        tokenizer = OpenAiTokenizer(model="gpt-4o")
+
+        tokenizer.count_tokens("foo bar huzzah")
+        tokenizer.count_tokens("foo bar")
+        OpenAiTokenizer(model="gpt-4o").count_tokens("foo")
+
+        mock_encoding_for_model.assert_called_once_with("gpt-4o")
+
+    def test_count_cache(self, mock_encoding_for_model):
+        tokenizer = OpenAiTokenizer(model="gpt-4o", count_cache_size=2)
+        encode = mock_encoding_for_model.return_value.encode
+
+        assert tokenizer.count_tokens("foo bar huzzah") == 3
+        assert tokenizer.count_tokens("foo bar huzzah") == 3
+        assert encode.call_count == 1
+        assert tokenizer.count_cache_hits == 1
+        assert tokenizer.count_cache_misses == 1
+
+        tokenizer.count_tokens("foo")
+        tokenizer.count_tokens("bar")
+        tokenizer.count_tokens("foo bar huzzah")
+
+        assert encode.call_count == 4
+        assert tokenizer.count_cache_misses == 4
+
+        tokenizer.clear_count_cache()
+
+        assert tokenizer.count_cache_hits == 0
+        assert tokenizer.count_cache_misses == 0
+
+    def test_count_cache_disabled(self, mock_encoding_for_model):
+        tokenizer = OpenAiTokenizer(model="gpt-4o")
+
+        tokenizer.count_tokens("foo bar huzzah")
+        tokenizer.count_tokens("foo bar huzzah")
+
+        assert mock_encoding_for_model.return_value.encode.call_count == 2
+        assert tokenizer.count_cache_misses == 0
+
+    def test_token_offsets(self, mock_encoding_for_model):
+        tokenizer = OpenAiTokenizer(model="gpt-4o")
+        mock_encoding_for_model.return_value.decode_with_offsets.return_value = ("foo bar", [0, 3])
+
+        assert tokenizer.token_offsets("foo bar") == [0, 3]
+        mock_encoding_for_model.return_value.decode_with_offsets.assert_called_once_with(["foo", "bar"])
@@ -15,3 +15,6 @@ class TestSimpleTokenizer:
 
     def test_output_tokens_left(self, tokenizer):
         assert tokenizer.count_output_tokens_left("foo bar huzzah") == 4093
+
+    def test_token_offsets(self, tokenizer):
+        assert tokenizer.token_offsets("foo bar huzzah") == [0, 6, 12]
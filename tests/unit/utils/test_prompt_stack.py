@@ -1,5 +1,6 @@
 import pytest
 from griptape.utils import PromptStack
+from tests.mocks.mock_tokenizer import MockTokenizer
 
 
 class TestPromptStack:
@@ -39,3 +40,29 @@ class TestPromptStack:
 
         assert prompt_stack.inputs[0].role == "assistant"
         assert prompt_stack.inputs[0].content == "foo"
+
+    def test_input_token_count(self, mocker):
+        tokenizer = MockTokenizer(model="foo")
+        spy = mocker.spy(MockTokenizer, "count_tokens")
+        prompt_input = PromptStack.Input("foo", role="user")
+
+        assert prompt_input.token_count(tokenizer) == 3
+        assert prompt_input.token_count(tokenizer) == 3
+        assert spy.call_count == 1
+
+        prompt_input.content = "foobar"
+
+        assert prompt_input.token_count(tokenizer) == 6
+        assert spy.call_count == 2
+        assert prompt_input.token_count(MockTokenizer(model="bar")) == 6
+        assert spy.call_count == 3
+
+    def test_count_tokens(self, prompt_stack):
+        tokenizer = MockTokenizer(model="foo")
+        prompt_stack.add_system_input("fizz")
+        prompt_stack.add_user_input("foo")
+
+        assert prompt_stack.count_tokens(tokenizer) == 4 + 3 + 2 * PromptStack.DEFAULT_INPUT_OVERHEAD + 3
+        assert prompt_stack.count_tokens(tokenizer, input_overheads={"user": 8}, prompt_overhead=10) == (
+            4 + 3 + PromptStack.DEFAULT_INPUT_OVERHEAD + 8 + 10
+        )